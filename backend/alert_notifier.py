@@ -0,0 +1,174 @@
+"""
+Alert digests for DevLens
+Buffers snapshot-diff alert events (engine/alerts.py) per manager and mails them
+as one digest once the oldest unsent event is older than the digest window, so a
+bulk load that re-scores everything produces one email per manager rather than
+one per change. Each manager is capped at a number of digests per day; events
+held back by the cap roll into the next digest. Due digests are sent in batches
+over the pooled SMTP connections and any that fail are handed to the email
+outbox, which retries them with backoff.
+
+Every API process runs a notifier. A digest is claimed before it is rendered by
+moving the manager's cursor with a conditional update, so only one process
+sends each range of events.
+"""
+
+import threading
+from typing import Dict, List
+
+from email_outbox import utc_timestamp
+
+
+def _timestamp(value) -> str:
+    """created_at as 'YYYY-MM-DD HH:MM:SS' (SQLite returns text, Postgres a datetime)"""
+    return str(value)[:19]
+
+
+class AlertNotifier:
+    def __init__(self, db, email_service, outbox, window: float = 900.0, max_per_day: int = 6,
+                 batch_size: int = 100, interval: float = 30.0):
+        """
+        Args:
+            db: DevLensDB holding alert_events, the digest state and the managers' settings
+            email_service: EmailService the digests are rendered and sent with (send_many)
+            outbox: EmailOutbox that retries digests whose first send failed
+            window: Seconds an event is buffered so later events join the same digest
+            max_per_day: Digests a manager receives in any 24 hours (0 for no cap)
+            batch_size: Digests handed to send_many at a time
+            interval: Seconds between flushes
+        """
+        self.db = db
+        self.email_service = email_service
+        self.outbox = outbox
+        self.window = window
+        self.max_per_day = max_per_day
+        self.batch_size = batch_size
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+
+    def flush(self) -> Dict[str, int]:
+        """Send every digest that is due; returns counts of sent, queued (for retry) and capped managers"""
+        window_start = utc_timestamp(-self.window)
+        sent_today = self.db.count_alert_digests_since(utc_timestamp(-86400)) if self.max_per_day else {}
+
+        by_company = {}
+        for recipient in self.db.get_alert_digest_recipients():
+            by_company.setdefault(recipient["company_id"], []).append(recipient)
+
+        digests, cursors, capped = [], {}, 0
+        for company_id, recipients in by_company.items():
+            # Managers first seen now start from the company's latest event
+            for recipient in recipients:
+                if recipient["last_event_id"] is None:
+                    cursors[recipient["manager_id"]] = recipient["latest_event_id"] or 0
+            waiting = [r for r in recipients if r["last_event_id"] is not None
+                       and (r["latest_event_id"] or 0) > r["last_event_id"]]
+            if not waiting:
+                continue
+
+            # One read covers every manager of the company
+            events = self.db.get_alert_events_after(company_id, min(r["last_event_id"] for r in waiting))
+            for recipient in waiting:
+                pending = [event for event in events if event["id"] > recipient["last_event_id"]]
+                digest = self._digest(recipient, pending, window_start)
+                if digest is None:
+                    continue
+                if digest == "skip":
+                    # Nothing this manager subscribes to: just move past it
+                    cursors[recipient["manager_id"]] = pending[-1]["id"]
+                elif self.max_per_day and sent_today.get(recipient["manager_id"], 0) >= self.max_per_day:
+                    capped += 1
+                else:
+                    digests.append(digest)
+
+        counts = {"sent": 0, "queued": 0, "capped": capped}
+        if cursors:
+            self.db.advance_alert_cursors(cursors)
+        for start in range(0, len(digests), self.batch_size):
+            batch = self._claim(digests[start:start + self.batch_size])
+            if not batch:
+                continue
+            sent, queued = self._send_batch(batch)
+            counts["sent"] += sent
+            counts["queued"] += queued
+        return counts
+
+    def _claim(self, digests: List[Dict]) -> List[Dict]:
+        """The digests this process won the claim for, each with its alert_digests id"""
+        digest_ids = self.db.claim_alert_digests([
+            (
+                digest["recipient"]["manager_id"], digest["recipient"]["last_event_id"], digest["last_event_id"],
+                digest["email_type"], len(digest["events"]), digest["events"][0]["id"], digest["events"][-1]["id"]
+            )
+            for digest in digests
+        ])
+        return [{**digest, "digest_id": digest_id} for digest, digest_id in zip(digests, digest_ids) if digest_id]
+
+    def _digest(self, recipient: Dict, pending: List[Dict], window_start: str):
+        """The digest due for a manager, None while it is still buffering, or 'skip'"""
+        if not pending:
+            return None
+        events = [
+            event for event in pending
+            if recipient["performance_alerts"] or (recipient["critical_issues"] and event["severity"] == "critical")
+        ]
+        if not events:
+            return "skip"
+        if _timestamp(events[0]["created_at"]) > window_start:
+            return None
+
+        critical = recipient["critical_issues"] and any(event["severity"] == "critical" for event in events)
+        return {
+            "recipient": recipient,
+            "events": events,
+            "email_type": "critical" if critical else "performance",
+            "last_event_id": pending[-1]["id"]
+        }
+
+    def _send_batch(self, batch: List[Dict]) -> tuple:
+        emails = []
+        for digest in batch:
+            recipient = digest["recipient"]
+            subject, html_content = self.email_service.renderer.render_alerts(
+                recipient["manager_name"], recipient["company_name"], digest["events"],
+                digest["email_type"] == "critical"
+            )
+            emails.append((recipient["email_address"], subject, html_content))
+        results = self.email_service.send_many(emails)
+
+        statuses, queued = [], 0
+        for digest, ok in zip(batch, results):
+            recipient = digest["recipient"]
+            if not ok:
+                event_ids = [event["id"] for event in digest["events"]]
+                self.outbox.enqueue(recipient["manager_id"], digest["email_type"], recipient["email_address"],
+                                    {"alert_event_ids": event_ids})
+                queued += 1
+            statuses.append(("sent" if ok else "queued", digest["digest_id"]))
+        self.db.finish_alert_digests(statuses)
+        return len(batch) - queued, queued
+
+    def start(self):
+        if self._thread:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="alert-digests", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(5)
+            self._thread = None
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                counts = self.flush()
+                if counts["sent"] or counts["queued"]:
+                    print(f"🔔 Alert digests: {counts['sent']} sent, {counts['queued']} queued for retry, "
+                          f"{counts['capped']} managers at their daily cap")
+            except Exception as e:
+                print(f"❌ Alert digest flush failed: {e}")
+            self._stop.wait(self.interval)
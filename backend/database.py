@@ -1,92 +1,449 @@
-import sqlite3
 import json
 import hashlib
+import re
 from datetime import datetime
+from storage import create_backend
+
+# Daily rollup columns filled by the GitHub sync, keyed by sync metric. GitHub commits
+# get their own column: commits is added to by the data loader and the git ingestor.
+GITHUB_SYNC_COLUMNS = {
+    "commits": "github_commits",
+    "pull_requests": "pull_requests",
+    "reviews_given": "reviews_given",
+    "issues_created": "issues_created"
+}
+GITHUB_ACTIVITY_COLUMNS = list(GITHUB_SYNC_COLUMNS.values())
+
+# Review response times (hours) kept with each developer's GitHub metrics
+REVIEW_LATENCY_COLUMNS = ["avg_review_response_hours", "review_response_p50_hours", "review_response_p90_hours"]
+
+def _identity_key(name):
+    """Letters and digits of a name or login, lowercased, for identity matching"""
+    return re.sub(r"[^a-z0-9]", "", name.lower())
+
+def _json_default(value):
+    """Serialize numpy scalars that end up in scored developer payloads"""
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _decode_alert_event(row):
+    """alert_events row as a dict with details decoded"""
+    event = dict(row)
+    event["details"] = json.loads(event.pop("details_json") or "{}")
+    return event
 
 class DevLensDB:
-    def __init__(self, db_path="devlens.db"):
+    def __init__(self, db_path="devlens.db", backend=None):
         self.db_path = db_path
+        # Storage engine is selected by DEVLENS_DATABASE_URL (SQLite file by default)
+        self.backend = backend or create_backend(default_path=db_path)
         self.init_database()
     
     def get_connection(self):
-        return sqlite3.connect(self.db_path)
+        """Raw SQLite connection for maintenance scripts (SQLite backend only)"""
+        if self.backend.dialect != "sqlite":
+            raise RuntimeError("Direct connections are only available on the SQLite backend")
+        return self.backend.connect()
     
     def init_database(self):
         """Initialize the database with required tables"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        # Companies table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS companies (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT UNIQUE NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
-        ''')
-        
-        # Managers table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS managers (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                email TEXT UNIQUE NOT NULL,
-                password_hash TEXT NOT NULL,
-                name TEXT NOT NULL,
-                role TEXT NOT NULL,
-                company_id INTEGER NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (company_id) REFERENCES companies (id)
-            )
-        ''')
-        
-        # Teams table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS teams (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                company_id INTEGER NOT NULL,
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (company_id) REFERENCES companies (id)
-            )
-        ''')
-        
-        # Developers table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS developers (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                name TEXT NOT NULL,
-                team_id INTEGER NOT NULL,
-                company_id INTEGER NOT NULL,
-                commits INTEGER DEFAULT 0,
-                entropy REAL DEFAULT 0.0,
-                meetings INTEGER DEFAULT 0,
-                messages TEXT DEFAULT '[]',
-                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (team_id) REFERENCES teams (id),
-                FOREIGN KEY (company_id) REFERENCES companies (id)
-            )
-        ''')
-        
-        # Settings table
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS settings (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                manager_id INTEGER NOT NULL,
-                email_address TEXT NOT NULL,
-                email_alerts BOOLEAN DEFAULT 1,
-                performance_alerts BOOLEAN DEFAULT 1,
-                weekly_reports BOOLEAN DEFAULT 0,
-                team_updates BOOLEAN DEFAULT 1,
-                critical_issues BOOLEAN DEFAULT 1,
-                settings_json TEXT DEFAULT '{}',
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY (manager_id) REFERENCES managers (id)
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        
+        with self.backend.transaction() as tx:
+            # Companies table
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS companies (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT UNIQUE NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+            
+            # Managers table
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS managers (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    email TEXT UNIQUE NOT NULL,
+                    password_hash TEXT NOT NULL,
+                    name TEXT NOT NULL,
+                    role TEXT NOT NULL,
+                    company_id INTEGER NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (company_id) REFERENCES companies (id)
+                )
+            ''')
+            
+            # Teams table
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS teams (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    company_id INTEGER NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (company_id) REFERENCES companies (id)
+                )
+            ''')
+            
+            # Developers table
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS developers (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    name TEXT NOT NULL,
+                    team_id INTEGER NOT NULL,
+                    company_id INTEGER NOT NULL,
+                    commits INTEGER DEFAULT 0,
+                    entropy REAL DEFAULT 0.0,
+                    meetings INTEGER DEFAULT 0,
+                    messages TEXT DEFAULT '[]',
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (team_id) REFERENCES teams (id),
+                    FOREIGN KEY (company_id) REFERENCES companies (id)
+                )
+            ''')
+            
+            # Settings table
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS settings (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    manager_id INTEGER NOT NULL,
+                    email_address TEXT NOT NULL,
+                    email_alerts BOOLEAN DEFAULT 1,
+                    performance_alerts BOOLEAN DEFAULT 1,
+                    weekly_reports BOOLEAN DEFAULT 0,
+                    team_updates BOOLEAN DEFAULT 1,
+                    critical_issues BOOLEAN DEFAULT 1,
+                    settings_json TEXT DEFAULT '{}',
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (manager_id) REFERENCES managers (id)
+                )
+            ''')
+            
+            # Daily activity rollups (one row per developer per day)
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS developer_activity_daily (
+                    developer_id INTEGER NOT NULL,
+                    company_id INTEGER NOT NULL,
+                    activity_date TEXT NOT NULL,
+                    commits INTEGER DEFAULT 0,
+                    entropy_sum REAL DEFAULT 0.0,
+                    messages INTEGER DEFAULT 0,
+                    meetings INTEGER DEFAULT 0,
+                    pull_requests INTEGER DEFAULT 0,
+                    reviews_given INTEGER DEFAULT 0,
+                    issues_created INTEGER DEFAULT 0,
+                    github_commits INTEGER DEFAULT 0,
+                    PRIMARY KEY (developer_id, activity_date),
+                    FOREIGN KEY (developer_id) REFERENCES developers (id),
+                    FOREIGN KEY (company_id) REFERENCES companies (id)
+                )
+            ''')
+            tx.execute('''
+                CREATE INDEX IF NOT EXISTS idx_activity_daily_company_date
+                ON developer_activity_daily (company_id, activity_date)
+            ''')
+
+            # Dated messages, so windowed views score visibility on the window's messages
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS developer_messages_daily (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    developer_id INTEGER NOT NULL,
+                    company_id INTEGER NOT NULL,
+                    activity_date TEXT NOT NULL,
+                    content TEXT NOT NULL,
+                    FOREIGN KEY (developer_id) REFERENCES developers (id),
+                    FOREIGN KEY (company_id) REFERENCES companies (id)
+                )
+            ''')
+            tx.execute('''
+                CREATE INDEX IF NOT EXISTS idx_messages_daily_company_date
+                ON developer_messages_daily (company_id, activity_date)
+            ''')
+
+            # Score snapshots (one row per scoring run of a company)
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS score_snapshots (
+                    company_id INTEGER NOT NULL,
+                    snapshot_version INTEGER NOT NULL,
+                    source_fingerprint TEXT NOT NULL,
+                    developer_count INTEGER DEFAULT 0,
+                    impact_median REAL DEFAULT 0.0,
+                    visibility_median REAL DEFAULT 0.0,
+                    impact_std REAL DEFAULT 1.0,
+                    visibility_std REAL DEFAULT 1.0,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (company_id, snapshot_version),
+                    FOREIGN KEY (company_id) REFERENCES companies (id)
+                )
+            ''')
+
+            # Materialized developer scores for each snapshot
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS developer_scores (
+                    company_id INTEGER NOT NULL,
+                    snapshot_version INTEGER NOT NULL,
+                    developer_id INTEGER NOT NULL,
+                    name TEXT NOT NULL,
+                    team TEXT NOT NULL,
+                    impact_score REAL DEFAULT 0.0,
+                    visibility_score REAL DEFAULT 0.0,
+                    imp_z REAL DEFAULT 0.0,
+                    vis_z REAL DEFAULT 0.0,
+                    quadrant INTEGER NOT NULL,
+                    is_hidden_gem BOOLEAN DEFAULT 0,
+                    risk_level TEXT DEFAULT 'Low',
+                    overall_performance_score REAL DEFAULT 0.0,
+                    attendance_rate REAL DEFAULT 0.0,
+                    risk_factors TEXT DEFAULT '[]',
+                    payload TEXT NOT NULL,
+                    PRIMARY KEY (company_id, snapshot_version, developer_id),
+                    FOREIGN KEY (company_id) REFERENCES companies (id),
+                    FOREIGN KEY (developer_id) REFERENCES developers (id)
+                )
+            ''')
+            tx.execute('''
+                CREATE INDEX IF NOT EXISTS idx_developer_scores_developer
+                ON developer_scores (developer_id, snapshot_version)
+            ''')
+            tx.execute('''
+                CREATE INDEX IF NOT EXISTS idx_developer_scores_hidden_gems
+                ON developer_scores (company_id, snapshot_version, is_hidden_gem)
+            ''')
+
+            # GitHub sync high-water marks (one row per org, user and metric)
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS github_sync_state (
+                    org TEXT NOT NULL,
+                    username TEXT NOT NULL,
+                    metric TEXT NOT NULL,
+                    last_synced_at TEXT NOT NULL,
+                    PRIMARY KEY (org, username, metric)
+                )
+            ''')
+
+            # GitHub logins mapped to DevLens developers, per organization
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS developer_identities (
+                    org TEXT NOT NULL,
+                    github_login TEXT NOT NULL,
+                    developer_id INTEGER NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (org, github_login),
+                    FOREIGN KEY (developer_id) REFERENCES developers (id)
+                )
+            ''')
+
+            # Latest GitHub collaboration metrics of each developer
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS developer_github_metrics (
+                    developer_id INTEGER NOT NULL,
+                    org TEXT NOT NULL,
+                    start_date TEXT NOT NULL,
+                    end_date TEXT NOT NULL,
+                    commits INTEGER DEFAULT 0,
+                    entropy REAL DEFAULT 0.0,
+                    pull_requests INTEGER DEFAULT 0,
+                    reviews_given INTEGER DEFAULT 0,
+                    reviews_received INTEGER DEFAULT 0,
+                    issues_created INTEGER DEFAULT 0,
+                    issues_commented INTEGER DEFAULT 0,
+                    mentoring_activities INTEGER DEFAULT 0,
+                    cross_repo_contributions INTEGER DEFAULT 0,
+                    avg_review_response_hours REAL DEFAULT 0.0,
+                    review_response_p50_hours REAL DEFAULT 0.0,
+                    review_response_p90_hours REAL DEFAULT 0.0,
+                    synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    PRIMARY KEY (developer_id, org),
+                    FOREIGN KEY (developer_id) REFERENCES developers (id)
+                )
+            ''')
+
+            # Org-wide GitHub sync runs and the progress of each member
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS github_sync_runs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    org TEXT NOT NULL,
+                    company_id INTEGER NOT NULL,
+                    start_date TEXT NOT NULL,
+                    end_date TEXT NOT NULL,
+                    mode TEXT DEFAULT 'graphql',
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    total_members INTEGER DEFAULT 0,
+                    synced_members INTEGER DEFAULT 0,
+                    failed_members INTEGER DEFAULT 0,
+                    unmapped_members INTEGER DEFAULT 0,
+                    error TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    finished_at TIMESTAMP,
+                    FOREIGN KEY (company_id) REFERENCES companies (id)
+                )
+            ''')
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS github_sync_run_members (
+                    run_id INTEGER NOT NULL,
+                    github_login TEXT NOT NULL,
+                    developer_id INTEGER,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    error TEXT,
+                    PRIMARY KEY (run_id, github_login),
+                    FOREIGN KEY (run_id) REFERENCES github_sync_runs (id)
+                )
+            ''')
+
+            # Local git ingest: author emails mapped to developers, per-author daily
+            # totals per repository and the last ingested commit of each repository
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS developer_git_authors (
+                    email TEXT PRIMARY KEY,
+                    developer_id INTEGER NOT NULL,
+                    FOREIGN KEY (developer_id) REFERENCES developers (id)
+                )
+            ''')
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS git_author_activity (
+                    repo TEXT NOT NULL,
+                    author_email TEXT NOT NULL,
+                    activity_date TEXT NOT NULL,
+                    commits INTEGER DEFAULT 0,
+                    entropy_sum REAL DEFAULT 0.0,
+                    PRIMARY KEY (repo, author_email, activity_date)
+                )
+            ''')
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS git_ingest_state (
+                    repo TEXT PRIMARY KEY,
+                    last_sha TEXT NOT NULL,
+                    commits_ingested INTEGER DEFAULT 0,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            ''')
+
+            # Queued notification emails; next_attempt_at is a UTC
+            # 'YYYY-MM-DD HH:MM:SS' string so it compares like CURRENT_TIMESTAMP
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS email_outbox (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    manager_id INTEGER NOT NULL,
+                    email_type TEXT NOT NULL,
+                    to_address TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'queued',
+                    attempts INTEGER DEFAULT 0,
+                    max_attempts INTEGER DEFAULT 5,
+                    next_attempt_at TEXT NOT NULL,
+                    payload_json TEXT,
+                    last_error TEXT,
+                    claimed_at TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    sent_at TIMESTAMP,
+                    FOREIGN KEY (manager_id) REFERENCES managers (id)
+                )
+            ''')
+            tx.execute('''
+                CREATE INDEX IF NOT EXISTS idx_email_outbox_due
+                ON email_outbox (status, next_attempt_at)
+            ''')
+
+            # Scheduled report fan-outs with their per-company timings; slot is the
+            # schedule time a run was claimed for (NULL for runs started by hand)
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS report_runs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    report_type TEXT NOT NULL,
+                    slot TEXT,
+                    claimed_at TEXT,
+                    status TEXT NOT NULL DEFAULT 'running',
+                    companies INTEGER DEFAULT 0,
+                    recipients INTEGER DEFAULT 0,
+                    sent INTEGER DEFAULT 0,
+                    failed INTEGER DEFAULT 0,
+                    duration_seconds REAL DEFAULT 0.0,
+                    timings_json TEXT DEFAULT '[]',
+                    error TEXT,
+                    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    finished_at TIMESTAMP
+                )
+            ''')
+
+            # Changes between consecutive score snapshots, and the last snapshot
+            # of each company that was diffed
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS alert_events (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    company_id INTEGER NOT NULL,
+                    developer_id INTEGER NOT NULL,
+                    previous_version INTEGER NOT NULL,
+                    snapshot_version INTEGER NOT NULL,
+                    alert_type TEXT NOT NULL,
+                    severity TEXT NOT NULL,
+                    details_json TEXT DEFAULT '{}',
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE (company_id, snapshot_version, developer_id, alert_type),
+                    FOREIGN KEY (company_id) REFERENCES companies (id),
+                    FOREIGN KEY (developer_id) REFERENCES developers (id)
+                )
+            ''')
+            tx.execute('''
+                CREATE INDEX IF NOT EXISTS idx_alert_events_company
+                ON alert_events (company_id, id)
+            ''')
+            # Alert digests: the last event each manager has been sent and a log of
+            # the digests sent (for per-manager send caps)
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS alert_digest_state (
+                    manager_id INTEGER PRIMARY KEY,
+                    last_event_id INTEGER NOT NULL,
+                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (manager_id) REFERENCES managers (id)
+                )
+            ''')
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS alert_digests (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    manager_id INTEGER NOT NULL,
+                    email_type TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    event_count INTEGER DEFAULT 0,
+                    first_event_id INTEGER,
+                    last_event_id INTEGER,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (manager_id) REFERENCES managers (id)
+                )
+            ''')
+            tx.execute('''
+                CREATE INDEX IF NOT EXISTS idx_alert_digests_manager
+                ON alert_digests (manager_id, created_at)
+            ''')
+            tx.execute('''
+                CREATE TABLE IF NOT EXISTS alert_diff_state (
+                    company_id INTEGER PRIMARY KEY,
+                    snapshot_version INTEGER NOT NULL,
+                    diffed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    FOREIGN KEY (company_id) REFERENCES companies (id)
+                )
+            ''')
+
+        # Tables created by earlier versions lack the newer columns
+        for table, columns, column_type in (
+            ("developer_activity_daily", GITHUB_ACTIVITY_COLUMNS, "INTEGER DEFAULT 0"),
+            ("developer_github_metrics", REVIEW_LATENCY_COLUMNS, "REAL DEFAULT 0.0"),
+            ("email_outbox", ["payload_json", "claimed_at"], "TEXT"),
+            ("report_runs", ["slot", "claimed_at"], "TEXT"),
+            ("github_sync_runs", ["mode"], "TEXT DEFAULT 'graphql'")
+        ):
+            existing_columns = self.backend.table_columns(table)
+            missing_columns = [column for column in columns if column not in existing_columns]
+            if missing_columns:
+                with self.backend.transaction() as tx:
+                    for column in missing_columns:
+                        tx.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+
+        # Needs report_runs.slot, which older databases only have after the loop above
+        with self.backend.transaction() as tx:
+            tx.execute('''
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_report_runs_slot
+                ON report_runs (report_type, slot)
+            ''')
+
         # Insert initial data if tables are empty
         self.insert_initial_data()
     
@@ -96,275 +453,1209 @@ class DevLensDB:
     
     def insert_initial_data(self):
         """Insert initial companies, managers, teams, and developers"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
         # Check if data already exists
-        cursor.execute("SELECT COUNT(*) FROM companies")
-        if cursor.fetchone()[0] > 0:
-            conn.close()
+        if self.backend.fetchone("SELECT COUNT(*) FROM companies")[0] > 0:
             return
         
-        # Insert companies
-        companies = [
-            "TechCorp Inc.",
-            "Innovate Solutions", 
-            "StartupIO"
-        ]
-        
-        company_ids = {}
-        for company in companies:
-            cursor.execute("INSERT INTO companies (name) VALUES (?)", (company,))
-            company_ids[company] = cursor.lastrowid
-        
-        # Insert managers
-        managers = [
-            {
-                "email": "john.smith@techcorp.com",
-                "password": "admin123",
-                "name": "John Smith",
-                "role": "Engineering Manager",
-                "company": "TechCorp Inc."
-            },
-            {
-                "email": "sarah.johnson@innovate.com", 
-                "password": "manager456",
-                "name": "Sarah Johnson",
-                "role": "Development Director",
-                "company": "Innovate Solutions"
-            },
-            {
-                "email": "mike.chen@startup.io",
-                "password": "startup789", 
-                "name": "Mike Chen",
-                "role": "CTO",
-                "company": "StartupIO"
-            }
-        ]
-        
-        manager_ids = {}
-        for manager in managers:
-            password_hash = self.hash_password(manager["password"])
-            cursor.execute('''
-                INSERT INTO managers (email, password_hash, name, role, company_id) 
-                VALUES (?, ?, ?, ?, ?)
-            ''', (
-                manager["email"],
-                password_hash,
-                manager["name"], 
-                manager["role"],
-                company_ids[manager["company"]]
-            ))
-            manager_ids[manager["email"]] = cursor.lastrowid
-        
-        # Insert teams
-        teams_data = [
-            {"name": "Backend", "company": "TechCorp Inc."},
-            {"name": "Frontend", "company": "TechCorp Inc."},
-            {"name": "DevOps", "company": "TechCorp Inc."},
-            {"name": "Frontend", "company": "Innovate Solutions"},
-            {"name": "QA", "company": "Innovate Solutions"},
-            {"name": "Mobile", "company": "Innovate Solutions"},
-            {"name": "Full Stack", "company": "StartupIO"},
-            {"name": "Data Science", "company": "StartupIO"}
-        ]
-        
-        team_ids = {}
-        for team in teams_data:
-            cursor.execute('''
-                INSERT INTO teams (name, company_id) VALUES (?, ?)
-            ''', (team["name"], company_ids[team["company"]]))
-            team_key = f"{team['name']}_{team['company']}"
-            team_ids[team_key] = cursor.lastrowid
-        
-        # Insert developers with more varied and realistic data
-        developers_data = [
-            # TechCorp Inc. - Traditional Enterprise (Conservative, Process-Heavy)
-            {"name": "Alex", "team": "Backend", "company": "TechCorp Inc.", "commits": 14, "entropy": 0.95, "meetings": 2, "messages": ["Fixed memory leak in payment service", "Optimized database queries", "Security patch deployed"]},
-            {"name": "Jordan", "team": "Frontend", "company": "TechCorp Inc.", "commits": 8, "entropy": 0.45, "meetings": 15, "messages": ["Daily standup notes", "UI review meeting", "Coordinating with design team", "Sprint planning discussion"]},
-            {"name": "Sam", "team": "Backend", "company": "TechCorp Inc.", "commits": 22, "entropy": 0.88, "meetings": 6, "messages": ["Microservices architecture update", "API performance improvements", "Code review completed"]},
-            {"name": "Taylor", "team": "Frontend", "company": "TechCorp Inc.", "commits": 6, "entropy": 0.35, "meetings": 12, "messages": ["Learning React patterns", "Component library updates", "Accessibility improvements"]},
-            {"name": "Casey", "team": "DevOps", "company": "TechCorp Inc.", "commits": 16, "entropy": 0.92, "meetings": 3, "messages": ["CI/CD pipeline optimization", "Infrastructure as code", "Monitoring setup complete"]},
-            {"name": "Morgan", "team": "Backend", "company": "TechCorp Inc.", "commits": 11, "entropy": 0.72, "meetings": 8, "messages": ["Database migration scripts", "API documentation", "Integration testing"]},
-            {"name": "Riley", "team": "Frontend", "company": "TechCorp Inc.", "commits": 18, "entropy": 0.65, "meetings": 7, "messages": ["Component refactoring", "Performance optimization", "Cross-browser testing"]},
-            {"name": "Avery", "team": "DevOps", "company": "TechCorp Inc.", "commits": 9, "entropy": 0.78, "meetings": 11, "messages": ["Infrastructure planning", "Security compliance", "Deployment automation"]},
+        with self.backend.transaction() as tx:
+            # Insert companies
+            companies = [
+                "TechCorp Inc.",
+                "Innovate Solutions", 
+                "StartupIO"
+            ]
             
-            # Innovate Solutions - Modern Agile Startup (High Communication, Collaborative)
-            {"name": "Emma", "team": "Frontend", "company": "Innovate Solutions", "commits": 25, "entropy": 0.92, "meetings": 4, "messages": ["React 18 migration complete", "New design system implementation", "Performance metrics improved by 40%"]},
-            {"name": "Liam", "team": "QA", "company": "Innovate Solutions", "commits": 12, "entropy": 0.55, "meetings": 16, "messages": ["Test automation framework", "Bug triage meeting", "Quality metrics review", "Cross-team collaboration"]},
-            {"name": "Sophia", "team": "Frontend", "company": "Innovate Solutions", "commits": 19, "entropy": 0.78, "meetings": 9, "messages": ["Mobile-first responsive design", "CSS-in-JS optimization", "User experience improvements"]},
-            {"name": "Noah", "team": "Mobile", "company": "Innovate Solutions", "commits": 21, "entropy": 0.89, "meetings": 5, "messages": ["Flutter app performance tuning", "iOS deployment pipeline", "Native module integration"]},
-            {"name": "Olivia", "team": "QA", "company": "Innovate Solutions", "commits": 7, "entropy": 0.42, "meetings": 18, "messages": ["Manual testing protocols", "User acceptance testing", "Quality assurance meetings", "Bug reporting system"]},
-            {"name": "William", "team": "Mobile", "company": "Innovate Solutions", "commits": 17, "entropy": 0.83, "meetings": 8, "messages": ["React Native optimization", "App store deployment", "Cross-platform compatibility"]},
-            {"name": "Charlotte", "team": "Frontend", "company": "Innovate Solutions", "commits": 13, "entropy": 0.68, "meetings": 11, "messages": ["Component library maintenance", "Design system updates", "Accessibility compliance"]},
-            {"name": "Mason", "team": "QA", "company": "Innovate Solutions", "commits": 9, "entropy": 0.48, "meetings": 14, "messages": ["Automated testing suite", "Performance testing", "Quality gate reviews"]},
+            company_ids = {}
+            for company in companies:
+                company_ids[company] = tx.insert("INSERT INTO companies (name) VALUES (?)", (company,))
             
-            # StartupIO - Lean Tech Startup (High Performance, Low Process)
-            {"name": "Ava", "team": "Full Stack", "company": "StartupIO", "commits": 28, "entropy": 0.96, "meetings": 2, "messages": ["Full-stack feature shipped", "Database optimization complete", "System architecture redesign"]},
-            {"name": "James", "team": "Data Science", "company": "StartupIO", "commits": 15, "entropy": 0.91, "meetings": 6, "messages": ["ML model deployment", "Data pipeline optimization", "Analytics dashboard v2.0"]},
-            {"name": "Isabella", "team": "Full Stack", "company": "StartupIO", "commits": 24, "entropy": 0.87, "meetings": 4, "messages": ["API gateway implementation", "Real-time features", "Scalability improvements"]},
-            {"name": "Benjamin", "team": "Data Science", "company": "StartupIO", "commits": 11, "entropy": 0.85, "meetings": 8, "messages": ["Statistical analysis complete", "Predictive model training", "Data visualization tools"]},
-            {"name": "Mia", "team": "Full Stack", "company": "StartupIO", "commits": 26, "entropy": 0.94, "meetings": 3, "messages": ["Microservices architecture", "Performance monitoring", "Zero-downtime deployment"]},
-            {"name": "Lucas", "team": "Data Science", "company": "StartupIO", "commits": 8, "entropy": 0.76, "meetings": 12, "messages": ["Research on new algorithms", "Data quality assessment", "Model validation"]},
-            {"name": "Amelia", "team": "Full Stack", "company": "StartupIO", "commits": 20, "entropy": 0.82, "meetings": 5, "messages": ["Frontend optimization", "Backend API improvements", "Integration testing"]}
-        ]
-        
-        for dev in developers_data:
-            team_key = f"{dev['team']}_{dev['company']}"
-            messages_json = json.dumps(dev["messages"])
-            cursor.execute('''
-                INSERT INTO developers (name, team_id, company_id, commits, entropy, meetings, messages)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                dev["name"],
-                team_ids[team_key],
-                company_ids[dev["company"]],
-                dev["commits"],
-                dev["entropy"],
-                dev["meetings"],
-                messages_json
-            ))
-        
-        conn.commit()
-        conn.close()
+            # Insert managers
+            managers = [
+                {
+                    "email": "john.smith@techcorp.com",
+                    "password": "admin123",
+                    "name": "John Smith",
+                    "role": "Engineering Manager",
+                    "company": "TechCorp Inc."
+                },
+                {
+                    "email": "sarah.johnson@innovate.com", 
+                    "password": "manager456",
+                    "name": "Sarah Johnson",
+                    "role": "Development Director",
+                    "company": "Innovate Solutions"
+                },
+                {
+                    "email": "mike.chen@startup.io",
+                    "password": "startup789", 
+                    "name": "Mike Chen",
+                    "role": "CTO",
+                    "company": "StartupIO"
+                }
+            ]
+            
+            manager_ids = {}
+            for manager in managers:
+                password_hash = self.hash_password(manager["password"])
+                manager_ids[manager["email"]] = tx.insert('''
+                    INSERT INTO managers (email, password_hash, name, role, company_id) 
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (
+                    manager["email"],
+                    password_hash,
+                    manager["name"], 
+                    manager["role"],
+                    company_ids[manager["company"]]
+                ))
+            
+            # Insert teams
+            teams_data = [
+                {"name": "Backend", "company": "TechCorp Inc."},
+                {"name": "Frontend", "company": "TechCorp Inc."},
+                {"name": "DevOps", "company": "TechCorp Inc."},
+                {"name": "Frontend", "company": "Innovate Solutions"},
+                {"name": "QA", "company": "Innovate Solutions"},
+                {"name": "Mobile", "company": "Innovate Solutions"},
+                {"name": "Full Stack", "company": "StartupIO"},
+                {"name": "Data Science", "company": "StartupIO"}
+            ]
+            
+            team_ids = {}
+            for team in teams_data:
+                team_key = f"{team['name']}_{team['company']}"
+                team_ids[team_key] = tx.insert('''
+                    INSERT INTO teams (name, company_id) VALUES (?, ?)
+                ''', (team["name"], company_ids[team["company"]]))
+            
+            # Insert developers with more varied and realistic data
+            developers_data = [
+                # TechCorp Inc. - Traditional Enterprise (Conservative, Process-Heavy)
+                {"name": "Alex", "team": "Backend", "company": "TechCorp Inc.", "commits": 14, "entropy": 0.95, "meetings": 2, "messages": ["Fixed memory leak in payment service", "Optimized database queries", "Security patch deployed"]},
+                {"name": "Jordan", "team": "Frontend", "company": "TechCorp Inc.", "commits": 8, "entropy": 0.45, "meetings": 15, "messages": ["Daily standup notes", "UI review meeting", "Coordinating with design team", "Sprint planning discussion"]},
+                {"name": "Sam", "team": "Backend", "company": "TechCorp Inc.", "commits": 22, "entropy": 0.88, "meetings": 6, "messages": ["Microservices architecture update", "API performance improvements", "Code review completed"]},
+                {"name": "Taylor", "team": "Frontend", "company": "TechCorp Inc.", "commits": 6, "entropy": 0.35, "meetings": 12, "messages": ["Learning React patterns", "Component library updates", "Accessibility improvements"]},
+                {"name": "Casey", "team": "DevOps", "company": "TechCorp Inc.", "commits": 16, "entropy": 0.92, "meetings": 3, "messages": ["CI/CD pipeline optimization", "Infrastructure as code", "Monitoring setup complete"]},
+                {"name": "Morgan", "team": "Backend", "company": "TechCorp Inc.", "commits": 11, "entropy": 0.72, "meetings": 8, "messages": ["Database migration scripts", "API documentation", "Integration testing"]},
+                {"name": "Riley", "team": "Frontend", "company": "TechCorp Inc.", "commits": 18, "entropy": 0.65, "meetings": 7, "messages": ["Component refactoring", "Performance optimization", "Cross-browser testing"]},
+                {"name": "Avery", "team": "DevOps", "company": "TechCorp Inc.", "commits": 9, "entropy": 0.78, "meetings": 11, "messages": ["Infrastructure planning", "Security compliance", "Deployment automation"]},
+                
+                # Innovate Solutions - Modern Agile Startup (High Communication, Collaborative)
+                {"name": "Emma", "team": "Frontend", "company": "Innovate Solutions", "commits": 25, "entropy": 0.92, "meetings": 4, "messages": ["React 18 migration complete", "New design system implementation", "Performance metrics improved by 40%"]},
+                {"name": "Liam", "team": "QA", "company": "Innovate Solutions", "commits": 12, "entropy": 0.55, "meetings": 16, "messages": ["Test automation framework", "Bug triage meeting", "Quality metrics review", "Cross-team collaboration"]},
+                {"name": "Sophia", "team": "Frontend", "company": "Innovate Solutions", "commits": 19, "entropy": 0.78, "meetings": 9, "messages": ["Mobile-first responsive design", "CSS-in-JS optimization", "User experience improvements"]},
+                {"name": "Noah", "team": "Mobile", "company": "Innovate Solutions", "commits": 21, "entropy": 0.89, "meetings": 5, "messages": ["Flutter app performance tuning", "iOS deployment pipeline", "Native module integration"]},
+                {"name": "Olivia", "team": "QA", "company": "Innovate Solutions", "commits": 7, "entropy": 0.42, "meetings": 18, "messages": ["Manual testing protocols", "User acceptance testing", "Quality assurance meetings", "Bug reporting system"]},
+                {"name": "William", "team": "Mobile", "company": "Innovate Solutions", "commits": 17, "entropy": 0.83, "meetings": 8, "messages": ["React Native optimization", "App store deployment", "Cross-platform compatibility"]},
+                {"name": "Charlotte", "team": "Frontend", "company": "Innovate Solutions", "commits": 13, "entropy": 0.68, "meetings": 11, "messages": ["Component library maintenance", "Design system updates", "Accessibility compliance"]},
+                {"name": "Mason", "team": "QA", "company": "Innovate Solutions", "commits": 9, "entropy": 0.48, "meetings": 14, "messages": ["Automated testing suite", "Performance testing", "Quality gate reviews"]},
+                
+                # StartupIO - Lean Tech Startup (High Performance, Low Process)
+                {"name": "Ava", "team": "Full Stack", "company": "StartupIO", "commits": 28, "entropy": 0.96, "meetings": 2, "messages": ["Full-stack feature shipped", "Database optimization complete", "System architecture redesign"]},
+                {"name": "James", "team": "Data Science", "company": "StartupIO", "commits": 15, "entropy": 0.91, "meetings": 6, "messages": ["ML model deployment", "Data pipeline optimization", "Analytics dashboard v2.0"]},
+                {"name": "Isabella", "team": "Full Stack", "company": "StartupIO", "commits": 24, "entropy": 0.87, "meetings": 4, "messages": ["API gateway implementation", "Real-time features", "Scalability improvements"]},
+                {"name": "Benjamin", "team": "Data Science", "company": "StartupIO", "commits": 11, "entropy": 0.85, "meetings": 8, "messages": ["Statistical analysis complete", "Predictive model training", "Data visualization tools"]},
+                {"name": "Mia", "team": "Full Stack", "company": "StartupIO", "commits": 26, "entropy": 0.94, "meetings": 3, "messages": ["Microservices architecture", "Performance monitoring", "Zero-downtime deployment"]},
+                {"name": "Lucas", "team": "Data Science", "company": "StartupIO", "commits": 8, "entropy": 0.76, "meetings": 12, "messages": ["Research on new algorithms", "Data quality assessment", "Model validation"]},
+                {"name": "Amelia", "team": "Full Stack", "company": "StartupIO", "commits": 20, "entropy": 0.82, "meetings": 5, "messages": ["Frontend optimization", "Backend API improvements", "Integration testing"]}
+            ]
+            
+            for dev in developers_data:
+                team_key = f"{dev['team']}_{dev['company']}"
+                messages_json = json.dumps(dev["messages"])
+                tx.execute('''
+                    INSERT INTO developers (name, team_id, company_id, commits, entropy, meetings, messages)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    dev["name"],
+                    team_ids[team_key],
+                    company_ids[dev["company"]],
+                    dev["commits"],
+                    dev["entropy"],
+                    dev["meetings"],
+                    messages_json
+                ))
     
     def authenticate_manager(self, email, password_hash, company_name):
         """Authenticate manager login - expects pre-hashed password"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
+        result = self.backend.fetchone('''
             SELECT m.id, m.email, m.name, m.role, c.name as company_name
             FROM managers m
             JOIN companies c ON m.company_id = c.id
             WHERE m.email = ? AND m.password_hash = ? AND c.name = ?
         ''', (email, password_hash, company_name))
         
-        result = cursor.fetchone()
-        conn.close()
-        
         if result:
             return {
-                "id": result[0],
-                "email": result[1],
-                "name": result[2],
-                "role": result[3],
-                "company": result[4]
+                "id": result["id"],
+                "email": result["email"],
+                "name": result["name"],
+                "role": result["role"],
+                "company": result["company_name"]
             }
         return None
     
-    def get_company_developers(self, company_name):
-        """Get all developers for a specific company"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            SELECT d.name, t.name as team, d.commits, d.entropy, d.meetings, d.messages
-            FROM developers d
-            JOIN teams t ON d.team_id = t.id
-            JOIN companies c ON d.company_id = c.id
-            WHERE c.name = ?
-        ''', (company_name,))
+    def get_company_developers(self, company_name, window=None):
+        """Get all developers for a specific company
         
-        results = cursor.fetchall()
-        conn.close()
+        Each developer carries its GitHub pull_requests, reviews_given and
+        issues_created totals. Commits and entropy come from git ingest or from
+        the developer's GitHub sync windows, whichever saw more. When a (start_date, end_date) window is given, each
+        developer also carries the daily activity rollups and the dated messages
+        that fall inside the window.
+        """
+        with self.backend.transaction() as tx:
+            results = tx.fetchall('''
+                SELECT d.id, d.name, t.name as team, d.commits, d.entropy, d.meetings, d.messages,
+                       COALESCE(g.pull_requests, 0) AS pull_requests,
+                       COALESCE(g.reviews_given, 0) AS reviews_given,
+                       COALESCE(g.issues_created, 0) AS issues_created,
+                       COALESCE(m.commits, 0) AS github_commits,
+                       COALESCE(m.entropy, 0.0) AS github_entropy
+                FROM developers d
+                JOIN teams t ON d.team_id = t.id
+                JOIN companies c ON d.company_id = c.id
+                LEFT JOIN (
+                    SELECT developer_id, SUM(pull_requests) AS pull_requests,
+                           SUM(reviews_given) AS reviews_given, SUM(issues_created) AS issues_created
+                    FROM developer_activity_daily
+                    WHERE company_id = (SELECT id FROM companies WHERE name = ?)
+                    GROUP BY developer_id
+                ) g ON g.developer_id = d.id
+                LEFT JOIN (
+                    SELECT developer_id, SUM(commits) AS commits, SUM(entropy) AS entropy
+                    FROM developer_github_metrics
+                    WHERE developer_id IN (
+                        SELECT id FROM developers WHERE company_id = (SELECT id FROM companies WHERE name = ?)
+                    )
+                    GROUP BY developer_id
+                ) m ON m.developer_id = d.id
+                WHERE c.name = ?
+            ''', (company_name, company_name, company_name))
+            
+            daily_activity = {}
+            if window:
+                start_date, end_date = window
+                rows = tx.fetchall('''
+                    SELECT a.developer_id, a.activity_date, a.commits, a.entropy_sum, a.messages, a.meetings,
+                           a.github_commits, a.pull_requests, a.reviews_given, a.issues_created
+                    FROM developer_activity_daily a
+                    JOIN companies c ON a.company_id = c.id
+                    WHERE c.name = ? AND a.activity_date BETWEEN ? AND ?
+                    ORDER BY a.activity_date
+                ''', (company_name, str(start_date), str(end_date)))
+                
+                for row in rows:
+                    daily_activity.setdefault(row["developer_id"], []).append({
+                        "activity_date": row["activity_date"],
+                        "commits": row["commits"],
+                        "entropy_sum": row["entropy_sum"],
+                        "messages": row["messages"],
+                        "meetings": row["meetings"],
+                        "github_commits": row["github_commits"],
+                        "pull_requests": row["pull_requests"],
+                        "reviews_given": row["reviews_given"],
+                        "issues_created": row["issues_created"]
+                    })
+            
+            daily_messages = {}
+            if window:
+                rows = tx.fetchall('''
+                    SELECT m.developer_id, m.activity_date, m.content
+                    FROM developer_messages_daily m
+                    JOIN companies c ON m.company_id = c.id
+                    WHERE c.name = ? AND m.activity_date BETWEEN ? AND ?
+                    ORDER BY m.id
+                ''', (company_name, str(start_date), str(end_date)))
+                
+                for row in rows:
+                    daily_messages.setdefault(row["developer_id"], []).append({
+                        "activity_date": row["activity_date"],
+                        "content": row["content"]
+                    })
         
         developers = []
         for row in results:
-            developers.append({
-                "name": row[0],
-                "team": row[1],
-                "commits": row[2],
-                "entropy": row[3],
-                "meetings": row[4],
-                "msgs": json.loads(row[5])
-            })
+            developer = {
+                "id": row["id"],
+                "name": row["name"],
+                "team": row["team"],
+                "commits": max(row["commits"], row["github_commits"]),
+                "entropy": max(row["entropy"], row["github_entropy"]),
+                "meetings": row["meetings"],
+                "msgs": json.loads(row["messages"]),
+                "pull_requests": row["pull_requests"],
+                "reviews_given": row["reviews_given"],
+                "issues_created": row["issues_created"]
+            }
+            if window:
+                developer["daily_activity"] = daily_activity.get(row["id"], [])
+                developer["daily_messages"] = daily_messages.get(row["id"], [])
+            developers.append(developer)
         
         return developers
     
-    def get_companies(self):
-        """Get all companies"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
+    def record_daily_activity(self, rows):
+        """Add per-day activity into the rollup table
         
-        cursor.execute("SELECT id, name FROM companies ORDER BY name")
-        results = cursor.fetchall()
-        conn.close()
+        Each row is a dict with developer_id, company_id, activity_date and any of
+        commits, entropy_sum, messages, meetings. Rows for a day that already exists
+        are added to the stored totals, so repeated ingests can merge deltas.
+        """
+        self.backend.executemany('''
+            INSERT INTO developer_activity_daily
+                (developer_id, company_id, activity_date, commits, entropy_sum, messages, meetings)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (developer_id, activity_date) DO UPDATE SET
+                commits = developer_activity_daily.commits + excluded.commits,
+                entropy_sum = developer_activity_daily.entropy_sum + excluded.entropy_sum,
+                messages = developer_activity_daily.messages + excluded.messages,
+                meetings = developer_activity_daily.meetings + excluded.meetings
+        ''', [
+            (
+                row["developer_id"],
+                row["company_id"],
+                str(row["activity_date"]),
+                row.get("commits", 0),
+                float(row.get("entropy_sum", 0.0)),
+                row.get("messages", 0),
+                row.get("meetings", 0)
+            )
+            for row in rows
+        ])
+    
+    def record_daily_messages(self, rows):
+        """Store dated message texts for windowed visibility scoring
         
-        return results  # Return tuples of (id, name)
+        Each row is a dict with developer_id, company_id, activity_date and content.
+        """
+        self.backend.executemany('''
+            INSERT INTO developer_messages_daily (developer_id, company_id, activity_date, content)
+            VALUES (?, ?, ?, ?)
+        ''', [
+            (row["developer_id"], row["company_id"], str(row["activity_date"]), row["content"])
+            for row in rows
+        ])
+    
+    def get_github_sync_state(self, org, username):
+        """Get a GitHub user's high-water marks as {metric: last_synced_at}"""
+        rows = self.backend.fetchall(
+            "SELECT metric, last_synced_at FROM github_sync_state WHERE org = ? AND username = ?",
+            (org, username)
+        )
+        return {row["metric"]: row["last_synced_at"] for row in rows}
+
+    def apply_github_sync(self, org, username, developer_id, company_id, metric,
+                          start_date, end_date, day_counts, synced_at):
+        """Replace one GitHub metric's daily rollups over a date range and advance its mark
+
+        Days in the range without events are reset to 0, so re-fetching a range
+        (such as the partially synced day of the previous run) never double counts.
+        Only the metric's GitHub column (GITHUB_SYNC_COLUMNS) is written, so
+        activity recorded by other sources is left alone.
+        """
+        column = GITHUB_SYNC_COLUMNS.get(metric)
+        if column is None:
+            raise ValueError(f"Unknown GitHub activity metric: {metric}")
+
+        with self.backend.transaction() as tx:
+            tx.execute(f'''
+                UPDATE developer_activity_daily SET {column} = 0
+                WHERE developer_id = ? AND activity_date BETWEEN ? AND ?
+            ''', (developer_id, str(start_date), str(end_date)))
+
+            tx.executemany(f'''
+                INSERT INTO developer_activity_daily (developer_id, company_id, activity_date, {column})
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (developer_id, activity_date) DO UPDATE SET {column} = excluded.{column}
+            ''', [
+                (developer_id, company_id, str(activity_date), count)
+                for activity_date, count in sorted(day_counts.items())
+            ])
+
+            tx.execute('''
+                INSERT INTO github_sync_state (org, username, metric, last_synced_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (org, username, metric) DO UPDATE SET last_synced_at = excluded.last_synced_at
+            ''', (org, username, metric, synced_at))
+
+    def map_github_members(self, org, company_id, logins):
+        """Map GitHub logins of an org to developers of a company
+
+        Known identities are used first. Other logins are matched to a developer
+        whose name has the same letters and digits (alice-johnson -> Alice Johnson)
+        and the match is remembered in developer_identities.
+
+        Returns:
+            dict: login -> developer_id, or None for logins without a developer
+        """
+        with self.backend.transaction() as tx:
+            known = {
+                row["github_login"]: row["developer_id"]
+                for row in tx.fetchall('''
+                    SELECT i.github_login, i.developer_id
+                    FROM developer_identities i
+                    JOIN developers d ON i.developer_id = d.id
+                    WHERE i.org = ? AND d.company_id = ?
+                ''', (org, company_id))
+            }
+            taken = set(known.values())
+            by_name = {}
+            for row in tx.fetchall("SELECT id, name FROM developers WHERE company_id = ?", (company_id,)):
+                if row["id"] not in taken:
+                    by_name.setdefault(_identity_key(row["name"]), row["id"])
+
+            mapping = {}
+            new_identities = []
+            for login in logins:
+                developer_id = known.get(login)
+                if developer_id is None:
+                    developer_id = by_name.pop(_identity_key(login), None)
+                    if developer_id is not None:
+                        new_identities.append((org, login, developer_id))
+                mapping[login] = developer_id
+
+            tx.executemany(
+                "INSERT INTO developer_identities (org, github_login, developer_id) VALUES (?, ?, ?)",
+                new_identities
+            )
+
+        return mapping
+
+    def set_developer_identity(self, org, github_login, developer_id):
+        """Map a GitHub login to a developer explicitly, replacing any earlier mapping"""
+        with self.backend.transaction() as tx:
+            tx.execute('''
+                INSERT INTO developer_identities (org, github_login, developer_id)
+                VALUES (?, ?, ?)
+                ON CONFLICT (org, github_login) DO UPDATE SET developer_id = excluded.developer_id
+            ''', (org, github_login, developer_id))
+
+    def create_github_sync_run(self, org, company_id, start_date, end_date, mode="graphql"):
+        """Create a pending org sync run and return its id; mode is kept for resuming"""
+        with self.backend.transaction() as tx:
+            return tx.insert('''
+                INSERT INTO github_sync_runs (org, company_id, start_date, end_date, mode)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (org, company_id, start_date, end_date, mode))
+
+    def get_github_sync_run(self, run_id):
+        """Get an org sync run with its progress counters, or None"""
+        row = self.backend.fetchone("SELECT * FROM github_sync_runs WHERE id = ?", (run_id,))
+        return dict(row) if row else None
+
+    def find_resumable_github_sync_run(self, org, company_id, start_date, end_date, mode="graphql"):
+        """Id of the newest unfinished run for the same org, company, period and mode, or None"""
+        row = self.backend.fetchone('''
+            SELECT id FROM github_sync_runs
+            WHERE org = ? AND company_id = ? AND start_date = ? AND end_date = ? AND mode = ?
+                AND status != 'completed'
+            ORDER BY id DESC
+            LIMIT 1
+        ''', (org, company_id, start_date, end_date, mode))
+        return row["id"] if row else None
+
+    def set_github_sync_run_status(self, run_id, status, error=None):
+        """Update a run's status; completed and failed runs get a finish time"""
+        finished = status in ("completed", "failed")
+        with self.backend.transaction() as tx:
+            tx.execute(f'''
+                UPDATE github_sync_runs
+                SET status = ?, error = ?, updated_at = CURRENT_TIMESTAMP
+                    {", finished_at = CURRENT_TIMESTAMP" if finished else ""}
+                WHERE id = ?
+            ''', (status, error, run_id))
+
+    def add_github_sync_members(self, run_id, mapping):
+        """Record the members of a run; unmapped logins are kept but never synced"""
+        with self.backend.transaction() as tx:
+            tx.executemany('''
+                INSERT INTO github_sync_run_members (run_id, github_login, developer_id, status)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (run_id, github_login) DO NOTHING
+            ''', [
+                (run_id, login, developer_id, "pending" if developer_id is not None else "unmapped")
+                for login, developer_id in mapping.items()
+            ])
+            self._update_github_sync_counts(tx, run_id)
+
+    def get_github_sync_members(self, run_id, statuses=("pending", "failed")):
+        """Get (github_login, developer_id) of a run's members in the given statuses"""
+        placeholders = ", ".join("?" for _ in statuses)
+        rows = self.backend.fetchall(f'''
+            SELECT github_login, developer_id FROM github_sync_run_members
+            WHERE run_id = ? AND status IN ({placeholders})
+            ORDER BY github_login
+        ''', (run_id, *statuses))
+        return [(row["github_login"], row["developer_id"]) for row in rows]
+
+    def record_github_sync_batch(self, run_id, org, start_date, end_date, results, failures):
+        """Write one batch of an org sync in a single transaction
+
+        Args:
+            results: {developer_id: metrics} for members collected successfully;
+                their commits and entropy are kept apart from the git-ingested
+                totals in developers and combined when developers are read
+            failures: {github_login: error message}
+        """
+        with self.backend.transaction() as tx:
+            tx.executemany('''
+                INSERT INTO developer_github_metrics
+                    (developer_id, org, start_date, end_date, commits, entropy, pull_requests,
+                     reviews_given, reviews_received, issues_created, issues_commented,
+                     mentoring_activities, cross_repo_contributions, avg_review_response_hours,
+                     review_response_p50_hours, review_response_p90_hours, synced_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT (developer_id, org) DO UPDATE SET
+                    start_date = excluded.start_date,
+                    end_date = excluded.end_date,
+                    commits = excluded.commits,
+                    entropy = excluded.entropy,
+                    pull_requests = excluded.pull_requests,
+                    reviews_given = excluded.reviews_given,
+                    reviews_received = excluded.reviews_received,
+                    issues_created = excluded.issues_created,
+                    issues_commented = excluded.issues_commented,
+                    mentoring_activities = excluded.mentoring_activities,
+                    cross_repo_contributions = excluded.cross_repo_contributions,
+                    avg_review_response_hours = excluded.avg_review_response_hours,
+                    review_response_p50_hours = excluded.review_response_p50_hours,
+                    review_response_p90_hours = excluded.review_response_p90_hours,
+                    synced_at = excluded.synced_at
+            ''', [
+                (
+                    developer_id, org, start_date, end_date,
+                    metrics["commits"],
+                    metrics["entropy"],
+                    metrics["pull_requests_created"],
+                    metrics["code_reviews_given"],
+                    metrics["code_reviews_received"],
+                    metrics["issues_created"],
+                    metrics["issues_commented"],
+                    metrics["mentoring_activities"],
+                    metrics["cross_repo_contributions"],
+                    metrics["avg_review_response_time_hours"],
+                    metrics["review_response_time_p50_hours"],
+                    metrics["review_response_time_p90_hours"]
+                )
+                for developer_id, metrics in results.items()
+            ])
+
+            tx.executemany(
+                "UPDATE github_sync_run_members SET status = 'done', error = NULL WHERE run_id = ? AND developer_id = ?",
+                [(run_id, developer_id) for developer_id in results]
+            )
+            tx.executemany(
+                "UPDATE github_sync_run_members SET status = 'failed', error = ? WHERE run_id = ? AND github_login = ?",
+                [(error, run_id, login) for login, error in failures.items()]
+            )
+            self._update_github_sync_counts(tx, run_id)
+
+    def _update_github_sync_counts(self, tx, run_id):
+        tx.execute('''
+            UPDATE github_sync_runs SET
+                total_members = (SELECT COUNT(*) FROM github_sync_run_members WHERE run_id = ?),
+                synced_members = (SELECT COUNT(*) FROM github_sync_run_members WHERE run_id = ? AND status = 'done'),
+                failed_members = (SELECT COUNT(*) FROM github_sync_run_members WHERE run_id = ? AND status = 'failed'),
+                unmapped_members = (SELECT COUNT(*) FROM github_sync_run_members WHERE run_id = ? AND status = 'unmapped'),
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        ''', (run_id, run_id, run_id, run_id, run_id))
+
+    def get_git_ingest_state(self, repo):
+        """Last ingested commit SHA of a repository, or None"""
+        row = self.backend.fetchone("SELECT last_sha FROM git_ingest_state WHERE repo = ?", (repo,))
+        return row["last_sha"] if row else None
+
+    def set_developer_git_author(self, email, developer_id):
+        """Map a git author email to a developer explicitly
+
+        Commits already ingested for a previously unmapped email are credited to
+        the developer. An email that is already mapped keeps its earlier history
+        and only new commits go to the new developer.
+        """
+        email = email.lower()
+        with self.backend.transaction() as tx:
+            previous = tx.fetchone("SELECT developer_id FROM developer_git_authors WHERE email = ?", (email,))
+            tx.execute('''
+                INSERT INTO developer_git_authors (email, developer_id) VALUES (?, ?)
+                ON CONFLICT (email) DO UPDATE SET developer_id = excluded.developer_id
+            ''', (email, developer_id))
+            if previous:
+                return
+
+            days = tx.fetchall('''
+                SELECT activity_date, SUM(commits) AS commits, SUM(entropy_sum) AS entropy_sum
+                FROM git_author_activity WHERE author_email = ?
+                GROUP BY activity_date
+            ''', (email,))
+            if not days:
+                return
+
+            tx.executemany('''
+                INSERT INTO developer_activity_daily (developer_id, company_id, activity_date, commits, entropy_sum)
+                SELECT id, company_id, ?, ?, ? FROM developers WHERE id = ?
+                ON CONFLICT (developer_id, activity_date) DO UPDATE SET
+                    commits = developer_activity_daily.commits + excluded.commits,
+                    entropy_sum = developer_activity_daily.entropy_sum + excluded.entropy_sum
+            ''', [(day["activity_date"], day["commits"], day["entropy_sum"], developer_id) for day in days])
+            tx.execute(
+                "UPDATE developers SET commits = commits + ?, entropy = entropy + ? WHERE id = ?",
+                (sum(day["commits"] for day in days), sum(day["entropy_sum"] for day in days), developer_id)
+            )
+
+    def map_git_authors(self, company_id, authors):
+        """Map git authors ({email: name}) to developers of a company
+
+        Known emails are used first. Other authors are matched to a developer
+        by name, or by the local part of their email (alex.chen@ -> Alex Chen),
+        and the match is remembered in developer_git_authors.
+
+        Returns:
+            dict: email -> developer_id, or None for authors without a developer
+        """
+        with self.backend.transaction() as tx:
+            known = {
+                row["email"]: row["developer_id"]
+                for row in tx.fetchall('''
+                    SELECT a.email, a.developer_id
+                    FROM developer_git_authors a
+                    JOIN developers d ON a.developer_id = d.id
+                    WHERE d.company_id = ?
+                ''', (company_id,))
+            }
+            by_name = {}
+            for row in tx.fetchall("SELECT id, name FROM developers WHERE company_id = ?", (company_id,)):
+                by_name.setdefault(_identity_key(row["name"]), row["id"])
+
+            mapping = {}
+            new_authors = []
+            for email, name in authors.items():
+                email = email.lower()
+                developer_id = known.get(email)
+                if developer_id is None:
+                    developer_id = by_name.get(_identity_key(name)) or by_name.get(_identity_key(email.split("@")[0]))
+                    if developer_id is not None:
+                        new_authors.append((email, developer_id))
+                mapping[email] = developer_id
+
+            tx.executemany('''
+                INSERT INTO developer_git_authors (email, developer_id) VALUES (?, ?)
+                ON CONFLICT (email) DO NOTHING
+            ''', new_authors)
+
+        return mapping
+
+    def apply_git_ingest(self, repo, head_sha, commit_count, company_id, author_days, mapping):
+        """Add one repository's newly ingested commits and advance its last SHA
+
+        Runs in one transaction, so a repository's commits are counted exactly
+        once even if the ingest is interrupted.
+
+        Args:
+            author_days: {(email, activity_date): (commits, entropy_sum)}
+            mapping: email -> developer_id (None for unmapped authors, whose
+                totals are still kept in git_author_activity)
+        """
+        developer_days = {}
+        developer_totals = {}
+        for (email, activity_date), (commits, entropy_sum) in author_days.items():
+            developer_id = mapping.get(email)
+            if developer_id is None:
+                continue
+            day = developer_days.setdefault((developer_id, activity_date), [0, 0.0])
+            day[0] += commits
+            day[1] += entropy_sum
+            total = developer_totals.setdefault(developer_id, [0, 0.0])
+            total[0] += commits
+            total[1] += entropy_sum
+
+        with self.backend.transaction() as tx:
+            tx.executemany('''
+                INSERT INTO git_author_activity (repo, author_email, activity_date, commits, entropy_sum)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (repo, author_email, activity_date) DO UPDATE SET
+                    commits = git_author_activity.commits + excluded.commits,
+                    entropy_sum = git_author_activity.entropy_sum + excluded.entropy_sum
+            ''', [
+                (repo, email, activity_date, commits, entropy_sum)
+                for (email, activity_date), (commits, entropy_sum) in author_days.items()
+            ])
+
+            tx.executemany('''
+                INSERT INTO developer_activity_daily (developer_id, company_id, activity_date, commits, entropy_sum)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (developer_id, activity_date) DO UPDATE SET
+                    commits = developer_activity_daily.commits + excluded.commits,
+                    entropy_sum = developer_activity_daily.entropy_sum + excluded.entropy_sum
+            ''', [
+                (developer_id, company_id, activity_date, commits, entropy_sum)
+                for (developer_id, activity_date), (commits, entropy_sum) in developer_days.items()
+            ])
+
+            tx.executemany(
+                "UPDATE developers SET commits = commits + ?, entropy = entropy + ? WHERE id = ?",
+                [(commits, entropy_sum, developer_id) for developer_id, (commits, entropy_sum) in developer_totals.items()]
+            )
+
+            tx.execute('''
+                INSERT INTO git_ingest_state (repo, last_sha, commits_ingested) VALUES (?, ?, ?)
+                ON CONFLICT (repo) DO UPDATE SET
+                    last_sha = excluded.last_sha,
+                    commits_ingested = git_ingest_state.commits_ingested + excluded.commits_ingested,
+                    updated_at = CURRENT_TIMESTAMP
+            ''', (repo, head_sha, commit_count))
+
+    def enqueue_email(self, manager_id, email_type, to_address, next_attempt_at, max_attempts=5, payload=None):
+        """Queue a notification email for the outbox workers and return its job id
+
+        payload (optional) is stored as JSON for the renderer, e.g. the alert events to report.
+        """
+        with self.backend.transaction() as tx:
+            return tx.insert('''
+                INSERT INTO email_outbox (manager_id, email_type, to_address, next_attempt_at, max_attempts, payload_json)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (manager_id, email_type, to_address, next_attempt_at, max_attempts,
+                  json.dumps(payload) if payload is not None else None))
+
+    def get_email_job(self, job_id):
+        """Get an outbox job with its status and attempts, or None"""
+        row = self.backend.fetchone("SELECT * FROM email_outbox WHERE id = ?", (job_id,))
+        return dict(row) if row else None
+
+    def claim_email_job(self, now):
+        """Claim the oldest queued job due at `now` for sending, or return None
+
+        The claim is a conditional UPDATE, so concurrent workers never send the
+        same job twice. claimed_at records `now` as the start of the claim's lease.
+        """
+        while True:
+            row = self.backend.fetchone('''
+                SELECT id FROM email_outbox
+                WHERE status = 'queued' AND next_attempt_at <= ?
+                ORDER BY next_attempt_at, id
+                LIMIT 1
+            ''', (now,))
+            if not row:
+                return None
+
+            with self.backend.transaction() as tx:
+                claimed = tx.execute('''
+                    UPDATE email_outbox
+                    SET status = 'sending', attempts = attempts + 1, claimed_at = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE id = ? AND status = 'queued'
+                ''', (now, row["id"]))
+                if claimed:
+                    return dict(tx.fetchone("SELECT * FROM email_outbox WHERE id = ?", (row["id"],)))
+
+    def complete_email_job(self, job_id):
+        """Mark a claimed job as sent"""
+        with self.backend.transaction() as tx:
+            tx.execute('''
+                UPDATE email_outbox
+                SET status = 'sent', last_error = NULL, updated_at = CURRENT_TIMESTAMP, sent_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            ''', (job_id,))
+
+    def fail_email_job(self, job_id, error, next_attempt_at=None):
+        """Record a failed attempt: requeue the job for next_attempt_at, or give up when it is None"""
+        with self.backend.transaction() as tx:
+            tx.execute('''
+                UPDATE email_outbox
+                SET status = ?, last_error = ?, next_attempt_at = COALESCE(?, next_attempt_at),
+                    updated_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            ''', ("queued" if next_attempt_at else "failed", error, next_attempt_at, job_id))
+
+    def requeue_stale_email_jobs(self, claimed_before):
+        """Return jobs left 'sending' by a stopped process to the queue; returns how many
+
+        Only claims older than `claimed_before` (their lease has run out) are
+        requeued, so jobs other processes are still sending are left alone.
+        """
+        with self.backend.transaction() as tx:
+            return tx.execute('''
+                UPDATE email_outbox SET status = 'queued', updated_at = CURRENT_TIMESTAMP
+                WHERE status = 'sending' AND (claimed_at IS NULL OR claimed_at < ?)
+            ''', (claimed_before,))
+
+    def get_snapshot_score_rows(self, company_id, snapshot_version):
+        """Score columns (no payloads) of every developer in a snapshot"""
+        rows = self.backend.fetchall('''
+            SELECT developer_id, name, team, imp_z, vis_z, quadrant, attendance_rate, risk_factors
+            FROM developer_scores
+            WHERE company_id = ? AND snapshot_version = ?
+        ''', (company_id, snapshot_version))
+        return [dict(row) for row in rows]
+
+    def get_recent_snapshot_versions(self, company_id, limit=2):
+        """Newest snapshot versions of a company, newest first"""
+        rows = self.backend.fetchall('''
+            SELECT snapshot_version FROM score_snapshots
+            WHERE company_id = ?
+            ORDER BY snapshot_version DESC
+            LIMIT ?
+        ''', (company_id, limit))
+        return [row["snapshot_version"] for row in rows]
+
+    def get_alert_diff_version(self, company_id):
+        """Last snapshot version of a company that alerts were computed for, or None"""
+        row = self.backend.fetchone(
+            "SELECT snapshot_version FROM alert_diff_state WHERE company_id = ?", (company_id,)
+        )
+        return row["snapshot_version"] if row else None
+
+    def record_alert_diff(self, company_id, previous_version, snapshot_version, events):
+        """Store the alert events of one snapshot diff and advance the company's diff marker
+
+        Events already stored for the same snapshot are skipped, so a repeated
+        diff never produces duplicate alerts.
+        """
+        with self.backend.transaction() as tx:
+            tx.executemany('''
+                INSERT INTO alert_events
+                    (company_id, developer_id, previous_version, snapshot_version, alert_type, severity, details_json)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (company_id, snapshot_version, developer_id, alert_type) DO NOTHING
+            ''', [
+                (company_id, event["developer_id"], previous_version, snapshot_version,
+                 event["alert_type"], event["severity"], json.dumps(event["details"], default=_json_default))
+                for event in events
+            ])
+            tx.execute('''
+                INSERT INTO alert_diff_state (company_id, snapshot_version) VALUES (?, ?)
+                ON CONFLICT (company_id) DO UPDATE SET
+                    snapshot_version = excluded.snapshot_version,
+                    diffed_at = CURRENT_TIMESTAMP
+            ''', (company_id, snapshot_version))
+
+    def get_alert_events_after(self, company_id, after_event_id):
+        """Alert events of a company with an id above after_event_id, oldest first"""
+        rows = self.backend.fetchall('''
+            SELECT * FROM alert_events
+            WHERE company_id = ? AND id > ?
+            ORDER BY id
+        ''', (company_id, after_event_id))
+        return [_decode_alert_event(row) for row in rows]
+
+    def get_alert_events(self, event_ids):
+        """Alert events by id, oldest first"""
+        if not event_ids:
+            return []
+        placeholders = ", ".join("?" for _ in event_ids)
+        rows = self.backend.fetchall(
+            f"SELECT * FROM alert_events WHERE id IN ({placeholders}) ORDER BY id", tuple(event_ids)
+        )
+        return [_decode_alert_event(row) for row in rows]
+
+    def get_alert_digest_recipients(self):
+        """Managers with alert emails enabled, with their company, flags and digest cursor
+
+        last_event_id is None for managers that have never been considered for a digest.
+        """
+        rows = self.backend.fetchall('''
+            SELECT m.id AS manager_id, m.name AS manager_name, s.email_address,
+                   c.id AS company_id, c.name AS company_name,
+                   s.performance_alerts, s.critical_issues, d.last_event_id,
+                   (SELECT MAX(id) FROM alert_events e WHERE e.company_id = c.id) AS latest_event_id
+            FROM settings s
+            JOIN managers m ON m.id = s.manager_id
+            JOIN companies c ON c.id = m.company_id
+            LEFT JOIN alert_digest_state d ON d.manager_id = m.id
+            WHERE s.email_alerts = ? AND (s.performance_alerts = ? OR s.critical_issues = ?)
+            ORDER BY c.id, m.id
+        ''', (True, True, True))
+        return [
+            {**dict(row), "performance_alerts": bool(row["performance_alerts"]),
+             "critical_issues": bool(row["critical_issues"])}
+            for row in rows
+        ]
+
+    def count_alert_digests_since(self, since):
+        """Digests sent or queued per manager since a UTC 'YYYY-MM-DD HH:MM:SS' time"""
+        rows = self.backend.fetchall('''
+            SELECT manager_id, COUNT(*) AS digests FROM alert_digests
+            WHERE CAST(created_at AS TEXT) >= ?
+            GROUP BY manager_id
+        ''', (since,))
+        return {row["manager_id"]: row["digests"] for row in rows}
+
+    def advance_alert_cursors(self, cursors):
+        """Move managers' digest cursors ({manager_id: last_event_id}) forward
+
+        A cursor never moves back, so a flush working from an older read cannot
+        undo a digest another process has already claimed.
+        """
+        self.backend.executemany('''
+            INSERT INTO alert_digest_state (manager_id, last_event_id) VALUES (?, ?)
+            ON CONFLICT (manager_id) DO UPDATE SET
+                last_event_id = CASE
+                    WHEN excluded.last_event_id > alert_digest_state.last_event_id THEN excluded.last_event_id
+                    ELSE alert_digest_state.last_event_id
+                END,
+                updated_at = CURRENT_TIMESTAMP
+        ''', list(cursors.items()))
+
+    def claim_alert_digests(self, claims):
+        """Claim digests for sending in one transaction
+
+        Each claim moves a manager's cursor from the value the digest was built
+        from to its last event with a conditional UPDATE and logs the digest as
+        'sending'. A claim whose cursor another process moved first is lost, so
+        each event range is sent by exactly one process.
+
+        Args:
+            claims: (manager_id, from_event_id, to_event_id, email_type, event_count,
+                first_event_id, last_event_id) tuples
+
+        Returns:
+            list: alert_digests id per claim, or None for claims that were lost
+        """
+        digest_ids = []
+        with self.backend.transaction() as tx:
+            for manager_id, from_event_id, to_event_id, email_type, event_count, first_event_id, last_event_id in claims:
+                moved = tx.execute('''
+                    UPDATE alert_digest_state SET last_event_id = ?, updated_at = CURRENT_TIMESTAMP
+                    WHERE manager_id = ? AND last_event_id = ?
+                ''', (to_event_id, manager_id, from_event_id))
+                digest_ids.append(tx.insert('''
+                    INSERT INTO alert_digests
+                        (manager_id, email_type, status, event_count, first_event_id, last_event_id)
+                    VALUES (?, ?, 'sending', ?, ?, ?)
+                ''', (manager_id, email_type, event_count, first_event_id, last_event_id)) if moved else None)
+        return digest_ids
+
+    def finish_alert_digests(self, statuses):
+        """Record how claimed digests went: (status, digest_id) tuples, status 'sent' or 'queued'"""
+        self.backend.executemany(
+            "UPDATE alert_digests SET status = ? WHERE id = ?", statuses
+        )
+
+    def get_weekly_report_recipients(self):
+        """Managers with weekly reports enabled, with their report address and company"""
+        rows = self.backend.fetchall('''
+            SELECT m.id AS manager_id, m.name AS manager_name, s.email_address,
+                   c.id AS company_id, c.name AS company_name
+            FROM settings s
+            JOIN managers m ON m.id = s.manager_id
+            JOIN companies c ON c.id = m.company_id
+            WHERE s.weekly_reports = ?
+            ORDER BY c.id, m.id
+        ''', (True,))
+        return [dict(row) for row in rows]
+
+    def create_report_run(self, report_type):
+        """Start a report run and return its id"""
+        with self.backend.transaction() as tx:
+            return tx.insert("INSERT INTO report_runs (report_type) VALUES (?)", (report_type,))
+
+    def claim_report_slot(self, report_type, slot, now, claimed_before):
+        """Start the run of a scheduled slot and return its id, or None if it was already claimed
+
+        The unique (report_type, slot) index makes the claim atomic, so of several
+        processes sharing the schedule exactly one runs each slot. claimed_at records
+        `now` as the start of the claim's lease: a slot still 'running' under a claim
+        older than `claimed_before` was abandoned by a stopped process and is taken
+        over with a conditional UPDATE, so only one process reclaims it.
+        """
+        with self.backend.transaction() as tx:
+            claimed = tx.execute('''
+                INSERT INTO report_runs (report_type, slot, claimed_at) VALUES (?, ?, ?)
+                ON CONFLICT (report_type, slot) DO NOTHING
+            ''', (report_type, slot, now))
+            if not claimed:
+                claimed = tx.execute('''
+                    UPDATE report_runs SET claimed_at = ?, started_at = CURRENT_TIMESTAMP
+                    WHERE report_type = ? AND slot = ? AND status = 'running'
+                        AND (claimed_at IS NULL OR claimed_at < ?)
+                ''', (now, report_type, slot, claimed_before))
+            if not claimed:
+                return None
+            return tx.fetchone(
+                "SELECT id FROM report_runs WHERE report_type = ? AND slot = ?", (report_type, slot)
+            )["id"]
+
+    def finish_report_run(self, run_id, status, companies=0, recipients=0, sent=0, failed=0,
+                          duration_seconds=0.0, timings=None, error=None):
+        """Record the outcome and timings of a report run"""
+        with self.backend.transaction() as tx:
+            tx.execute('''
+                UPDATE report_runs
+                SET status = ?, companies = ?, recipients = ?, sent = ?, failed = ?,
+                    duration_seconds = ?, timings_json = ?, error = ?, finished_at = CURRENT_TIMESTAMP
+                WHERE id = ?
+            ''', (status, companies, recipients, sent, failed, duration_seconds,
+                  json.dumps(timings or []), error, run_id))
+
+    def get_report_run(self, run_id):
+        """One report run with its timings decoded, or None"""
+        row = self.backend.fetchone("SELECT * FROM report_runs WHERE id = ?", (run_id,))
+        if not row:
+            return None
+        run = dict(row)
+        run["timings"] = json.loads(run.pop("timings_json") or "[]")
+        return run
+
+    def get_report_runs(self, report_type=None, limit=20):
+        """Newest report runs first, with timings decoded"""
+        rows = self.backend.fetchall(f'''
+            SELECT * FROM report_runs
+            {"WHERE report_type = ?" if report_type else ""}
+            ORDER BY id DESC
+            LIMIT ?
+        ''', (report_type, limit) if report_type else (limit,))
+
+        runs = []
+        for row in rows:
+            run = dict(row)
+            run["timings"] = json.loads(run.pop("timings_json") or "[]")
+            runs.append(run)
+        return runs
+
+    def get_companies(self):
+        """Get all companies"""
+        # Rows allow both row[0] and row["name"] access
+        return self.backend.fetchall("SELECT id, name FROM companies ORDER BY name")
     
     def get_manager_by_id(self, manager_id):
         """Get manager by ID"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM managers WHERE id = ?", (manager_id,))
-        result = cursor.fetchone()
-        conn.close()
-        
-        return result
+        return self.backend.fetchone("SELECT * FROM managers WHERE id = ?", (manager_id,))
+    
+    def get_manager_with_company(self, manager_id):
+        """Get a manager's name together with their company name"""
+        return self.backend.fetchone('''
+            SELECT m.id, m.name, m.email, m.company_id, c.name as company_name
+            FROM managers m
+            JOIN companies c ON m.company_id = c.id
+            WHERE m.id = ?
+        ''', (manager_id,))
     
     def get_company_by_id(self, company_id):
         """Get company by ID"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
-        cursor.execute("SELECT * FROM companies WHERE id = ?", (company_id,))
-        result = cursor.fetchone()
-        conn.close()
-        
-        return result
-    
+        return self.backend.fetchone("SELECT * FROM companies WHERE id = ?", (company_id,))
+
+    def get_company_by_name(self, company_name):
+        """Get company by name"""
+        return self.backend.fetchone("SELECT * FROM companies WHERE name = ?", (company_name,))
+
+    def get_latest_score_snapshot(self, company_id):
+        """Get the newest score snapshot header for a company"""
+        return self.backend.fetchone('''
+            SELECT * FROM score_snapshots
+            WHERE company_id = ?
+            ORDER BY snapshot_version DESC
+            LIMIT 1
+        ''', (company_id,))
+
+    def save_score_snapshot(self, company_id, source_fingerprint, developers, stats):
+        """Persist scored developers as the next snapshot version of a company
+
+        Returns the new snapshot version.
+        """
+        with self.backend.transaction() as tx:
+            latest = tx.fetchone(
+                "SELECT MAX(snapshot_version) FROM score_snapshots WHERE company_id = ?",
+                (company_id,)
+            )
+            snapshot_version = (latest[0] or 0) + 1
+
+            tx.execute('''
+                INSERT INTO score_snapshots
+                    (company_id, snapshot_version, source_fingerprint, developer_count,
+                     impact_median, visibility_median, impact_std, visibility_std)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', (
+                company_id,
+                snapshot_version,
+                source_fingerprint,
+                len(developers),
+                float(stats["impact_median"]),
+                float(stats["visibility_median"]),
+                float(stats["impact_std"]),
+                float(stats["visibility_std"])
+            ))
+
+            tx.executemany('''
+                INSERT INTO developer_scores
+                    (company_id, snapshot_version, developer_id, name, team,
+                     impact_score, visibility_score, imp_z, vis_z, quadrant, is_hidden_gem,
+                     risk_level, overall_performance_score, attendance_rate, risk_factors, payload)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [
+                (
+                    company_id,
+                    snapshot_version,
+                    dev["id"],
+                    dev["name"],
+                    dev["team"],
+                    float(dev.get("impact_score", dev.get("raw_impact", 0.0))),
+                    float(dev.get("visibility_score", dev.get("raw_visibility", 0.0))),
+                    float(dev.get("imp_z", 0.0)),
+                    float(dev.get("vis_z", 0.0)),
+                    int(dev.get("quadrant", 4)),
+                    bool(dev.get("is_hidden_gem", False)),
+                    dev.get("risk_level", "Low"),
+                    float(dev.get("overall_performance_score", 0.0)),
+                    float(dev.get("attendance_rate", 0.0)),
+                    json.dumps(dev.get("risk_factors", [])),
+                    json.dumps(dev, default=_json_default)
+                )
+                for dev in developers
+            ])
+
+        return snapshot_version
+
+    def get_developer_scores(self, company_id, snapshot_version, hidden_gems_only=False):
+        """Get the materialized developer payloads of a snapshot, best performers first"""
+        query = '''
+            SELECT payload FROM developer_scores
+            WHERE company_id = ? AND snapshot_version = ?
+        '''
+        params = [company_id, snapshot_version]
+        if hidden_gems_only:
+            query += " AND is_hidden_gem = ?"
+            params.append(True)
+        query += " ORDER BY overall_performance_score DESC"
+
+        return [json.loads(row["payload"]) for row in self.backend.fetchall(query, params)]
+
+    def get_developer(self, developer_id):
+        """Get a single developer by primary key, with team and company names
+        and the same commit and GitHub totals as get_company_developers"""
+        row = self.backend.fetchone('''
+            SELECT d.id, d.name, t.name as team, d.company_id, c.name as company_name,
+                   d.commits, d.entropy, d.meetings, d.messages,
+                   COALESCE(g.pull_requests, 0) AS pull_requests,
+                   COALESCE(g.reviews_given, 0) AS reviews_given,
+                   COALESCE(g.issues_created, 0) AS issues_created,
+                   COALESCE(m.commits, 0) AS github_commits,
+                   COALESCE(m.entropy, 0.0) AS github_entropy
+            FROM developers d
+            JOIN teams t ON d.team_id = t.id
+            JOIN companies c ON d.company_id = c.id
+            LEFT JOIN (
+                SELECT developer_id, SUM(pull_requests) AS pull_requests,
+                       SUM(reviews_given) AS reviews_given, SUM(issues_created) AS issues_created
+                FROM developer_activity_daily
+                WHERE developer_id = ?
+                GROUP BY developer_id
+            ) g ON g.developer_id = d.id
+            LEFT JOIN (
+                SELECT developer_id, SUM(commits) AS commits, SUM(entropy) AS entropy
+                FROM developer_github_metrics
+                WHERE developer_id = ?
+                GROUP BY developer_id
+            ) m ON m.developer_id = d.id
+            WHERE d.id = ?
+        ''', (developer_id, developer_id, developer_id))
+
+        if not row:
+            return None
+
+        return {
+            "id": row["id"],
+            "name": row["name"],
+            "team": row["team"],
+            "company_id": row["company_id"],
+            "company": row["company_name"],
+            "commits": max(row["commits"], row["github_commits"]),
+            "entropy": max(row["entropy"], row["github_entropy"]),
+            "meetings": row["meetings"],
+            "msgs": json.loads(row["messages"]),
+            "pull_requests": row["pull_requests"],
+            "reviews_given": row["reviews_given"],
+            "issues_created": row["issues_created"]
+        }
+
+    def get_latest_developer_score(self, developer_id):
+        """Get a developer's newest materialized score with the stats of its snapshot
+
+        Returns a dict with snapshot_version, stats and the developer payload, or None
+        if the developer has never been scored.
+        """
+        row = self.backend.fetchone('''
+            SELECT s.snapshot_version, s.payload,
+                   ss.impact_median, ss.visibility_median, ss.impact_std, ss.visibility_std
+            FROM developer_scores s
+            JOIN score_snapshots ss
+                ON ss.company_id = s.company_id AND ss.snapshot_version = s.snapshot_version
+            WHERE s.developer_id = ?
+            ORDER BY s.snapshot_version DESC
+            LIMIT 1
+        ''', (developer_id,))
+
+        if not row:
+            return None
+
+        return {
+            "snapshot_version": row["snapshot_version"],
+            "stats": {
+                "impact_median": row["impact_median"],
+                "visibility_median": row["visibility_median"],
+                "impact_std": row["impact_std"],
+                "visibility_std": row["visibility_std"]
+            },
+            "developer": json.loads(row["payload"])
+        }
+
+    def get_company_daily_activity(self, company_id):
+        """Get every daily activity rollup of a company, ordered by developer and day"""
+        return self.backend.fetchall('''
+            SELECT developer_id, company_id, activity_date, commits, entropy_sum, messages, meetings
+            FROM developer_activity_daily
+            WHERE company_id = ?
+            ORDER BY developer_id, activity_date
+        ''', (company_id,))
+
+    def get_company_score_history(self, company_id):
+        """Get the developer scores of every snapshot version of a company"""
+        return self.backend.fetchall('''
+            SELECT s.company_id, s.snapshot_version, ss.created_at, s.developer_id, s.name, s.team,
+                   s.impact_score, s.visibility_score, s.imp_z, s.vis_z, s.quadrant, s.is_hidden_gem,
+                   s.risk_level, s.overall_performance_score, s.attendance_rate, s.risk_factors
+            FROM developer_scores s
+            JOIN score_snapshots ss
+                ON ss.company_id = s.company_id AND ss.snapshot_version = s.snapshot_version
+            WHERE s.company_id = ?
+            ORDER BY s.snapshot_version, s.developer_id
+        ''', (company_id,))
+
     def create_company_and_manager(self, company_name, manager_email, manager_password, manager_name):
         """Create a new company and manager"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
         try:
-            # Check if company already exists
-            cursor.execute("SELECT id FROM companies WHERE name = ?", (company_name,))
-            company_result = cursor.fetchone()
-            
-            if not company_result:
-                # Create company
-                cursor.execute("INSERT INTO companies (name) VALUES (?)", (company_name,))
-                company_id = cursor.lastrowid
-                is_new_company = True
-            else:
-                company_id = company_result[0]
-                is_new_company = False
-            
-            # Create manager (password should already be hashed)
-            cursor.execute('''
-                INSERT INTO managers (email, password_hash, name, role, company_id)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (manager_email, manager_password, manager_name, "Manager", company_id))
-            
-            manager_id = cursor.lastrowid
-            
-            # If it's a new company, create sample teams and employees
-            if is_new_company:
-                self._create_sample_data_for_company(cursor, company_id, company_name)
-            
-            conn.commit()
-            conn.close()
+            with self.backend.transaction() as tx:
+                # Check if company already exists
+                company_result = tx.fetchone("SELECT id FROM companies WHERE name = ?", (company_name,))
+                
+                if not company_result:
+                    # Create company
+                    company_id = tx.insert("INSERT INTO companies (name) VALUES (?)", (company_name,))
+                    is_new_company = True
+                else:
+                    company_id = company_result["id"]
+                    is_new_company = False
+                
+                # Create manager (password should already be hashed)
+                manager_id = tx.insert('''
+                    INSERT INTO managers (email, password_hash, name, role, company_id)
+                    VALUES (?, ?, ?, ?, ?)
+                ''', (manager_email, manager_password, manager_name, "Manager", company_id))
+                
+                # If it's a new company, create sample teams and employees
+                if is_new_company:
+                    self._create_sample_data_for_company(tx, company_id, company_name)
             
             # Create default email settings for the manager
             self.create_default_settings_for_manager(manager_id, manager_email)
             
             return manager_id
-            
-        except sqlite3.IntegrityError as e:
-            conn.close()
-            if "UNIQUE constraint failed" in str(e):
+        
+        except self.backend.IntegrityError as e:
+            if "UNIQUE constraint failed" in str(e) or "duplicate key" in str(e):
                 raise Exception("UNIQUE constraint failed: managers.email")
             else:
                 raise Exception("Registration failed")
-        except Exception as e:
-            conn.close()
-            raise e
     
-    def _create_sample_data_for_company(self, cursor, company_id, company_name):
+    def _create_sample_data_for_company(self, tx, company_id, company_name):
         """Create sample teams and employees for a new company"""
         import random
         
@@ -380,8 +1671,7 @@ class DevLensDB:
         
         team_ids = {}
         for team_name in selected_teams:
-            cursor.execute("INSERT INTO teams (name, company_id) VALUES (?, ?)", (team_name, company_id))
-            team_ids[team_name] = cursor.lastrowid
+            team_ids[team_name] = tx.insert("INSERT INTO teams (name, company_id) VALUES (?, ?)", (team_name, company_id))
         
         # Generate diverse employee names
         first_names = [
@@ -491,89 +1781,74 @@ class DevLensDB:
             
             # Insert employee
             messages_json = json.dumps(messages)
-            cursor.execute('''
+            tx.execute('''
                 INSERT INTO developers (name, team_id, company_id, commits, entropy, meetings, messages)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
             ''', (name, team_id, company_id, commits, entropy, meetings, messages_json))
     
     def add_developer(self, name, team_name, company_name, commits=0, entropy=0.0, meetings=0, messages=None):
         """Add a new developer"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
         if messages is None:
             messages = []
         
         try:
-            # Get company ID
-            cursor.execute("SELECT id FROM companies WHERE name = ?", (company_name,))
-            company_id = cursor.fetchone()[0]
-            
-            # Get or create team
-            cursor.execute("SELECT id FROM teams WHERE name = ? AND company_id = ?", (team_name, company_id))
-            team_result = cursor.fetchone()
-            
-            if not team_result:
-                cursor.execute("INSERT INTO teams (name, company_id) VALUES (?, ?)", (team_name, company_id))
-                team_id = cursor.lastrowid
-            else:
-                team_id = team_result[0]
-            
-            # Add developer
-            messages_json = json.dumps(messages)
-            cursor.execute('''
-                INSERT INTO developers (name, team_id, company_id, commits, entropy, meetings, messages)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (name, team_id, company_id, commits, entropy, meetings, messages_json))
+            with self.backend.transaction() as tx:
+                # Get company ID
+                company_id = tx.fetchone("SELECT id FROM companies WHERE name = ?", (company_name,))[0]
+                
+                # Get or create team
+                team_result = tx.fetchone("SELECT id FROM teams WHERE name = ? AND company_id = ?", (team_name, company_id))
+                
+                if not team_result:
+                    team_id = tx.insert("INSERT INTO teams (name, company_id) VALUES (?, ?)", (team_name, company_id))
+                else:
+                    team_id = team_result[0]
+                
+                # Add developer
+                messages_json = json.dumps(messages)
+                tx.execute('''
+                    INSERT INTO developers (name, team_id, company_id, commits, entropy, meetings, messages)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', (name, team_id, company_id, commits, entropy, meetings, messages_json))
             
-            conn.commit()
-            conn.close()
             return True
-            
+        
         except Exception as e:
-            conn.close()
             return False
     
     def get_manager_settings(self, manager_id):
         """Get manager's email settings"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
         try:
             # Check if the new columns exist
-            cursor.execute("PRAGMA table_info(settings)")
-            columns = [column[1] for column in cursor.fetchall()]
+            columns = self.backend.table_columns("settings")
             
             if 'email_address' in columns:
                 # New schema with email columns
-                cursor.execute('''
-                    SELECT email_address, email_alerts, performance_alerts, weekly_reports, 
+                result = self.backend.fetchone('''
+                    SELECT email_address, email_alerts, performance_alerts, weekly_reports,
                            team_updates, critical_issues, settings_json
                     FROM settings WHERE manager_id = ?
                 ''', (manager_id,))
                 
-                result = cursor.fetchone()
-                
                 if result:
                     return {
-                        'email_address': result[0],
-                        'email_alerts': bool(result[1]),
-                        'performance_alerts': bool(result[2]),
-                        'weekly_reports': bool(result[3]),
-                        'team_updates': bool(result[4]),
-                        'critical_issues': bool(result[5]),
-                        'settings_json': result[6]
+                        'email_address': result['email_address'],
+                        'email_alerts': bool(result['email_alerts']),
+                        'performance_alerts': bool(result['performance_alerts']),
+                        'weekly_reports': bool(result['weekly_reports']),
+                        'team_updates': bool(result['team_updates']),
+                        'critical_issues': bool(result['critical_issues']),
+                        'settings_json': result['settings_json']
                     }
             else:
                 # Old schema - get manager email as default
-                cursor.execute('''
+                manager_result = self.backend.fetchone('''
                     SELECT m.email FROM managers m WHERE m.id = ?
                 ''', (manager_id,))
                 
-                manager_result = cursor.fetchone()
                 if manager_result:
                     return {
-                        'email_address': manager_result[0],
+                        'email_address': manager_result['email'],
                         'email_alerts': True,
                         'performance_alerts': True,
                         'weekly_reports': False,
@@ -581,64 +1856,54 @@ class DevLensDB:
                         'critical_issues': True,
                         'settings_json': '{}'
                     }
-            
+        
         except Exception as e:
             print(f"Error getting manager settings: {str(e)}")
-        finally:
-            conn.close()
         
         return None
     
-    def update_manager_settings(self, manager_id, email_address, email_alerts=True, 
-                              performance_alerts=True, weekly_reports=False, 
+    def update_manager_settings(self, manager_id, email_address, email_alerts=True,
+                              performance_alerts=True, weekly_reports=False,
                               team_updates=True, critical_issues=True, settings_json='{}'):
         """Update manager's email settings"""
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        
         try:
             # Check if the new columns exist
-            cursor.execute("PRAGMA table_info(settings)")
-            columns = [column[1] for column in cursor.fetchall()]
+            columns = self.backend.table_columns("settings")
             
             if 'email_address' not in columns:
                 # Need to migrate database first
                 print("⚠️  Database needs migration. Please run: python migrate_database.py")
                 return False
             
-            # Check if settings exist
-            cursor.execute("SELECT id FROM settings WHERE manager_id = ?", (manager_id,))
-            exists = cursor.fetchone()
-            
-            if exists:
-                # Update existing settings
-                cursor.execute('''
-                    UPDATE settings SET 
-                        email_address = ?, email_alerts = ?, performance_alerts = ?,
-                        weekly_reports = ?, team_updates = ?, critical_issues = ?,
-                        settings_json = ?, updated_at = CURRENT_TIMESTAMP
-                    WHERE manager_id = ?
-                ''', (email_address, email_alerts, performance_alerts, weekly_reports,
-                      team_updates, critical_issues, settings_json, manager_id))
-            else:
-                # Insert new settings
-                cursor.execute('''
-                    INSERT INTO settings (manager_id, email_address, email_alerts, 
-                                        performance_alerts, weekly_reports, team_updates, 
-                                        critical_issues, settings_json)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (manager_id, email_address, email_alerts, performance_alerts,
-                      weekly_reports, team_updates, critical_issues, settings_json))
+            with self.backend.transaction() as tx:
+                # Check if settings exist
+                exists = tx.fetchone("SELECT id FROM settings WHERE manager_id = ?", (manager_id,))
+                
+                if exists:
+                    # Update existing settings
+                    tx.execute('''
+                        UPDATE settings SET
+                            email_address = ?, email_alerts = ?, performance_alerts = ?,
+                            weekly_reports = ?, team_updates = ?, critical_issues = ?,
+                            settings_json = ?, updated_at = CURRENT_TIMESTAMP
+                        WHERE manager_id = ?
+                    ''', (email_address, email_alerts, performance_alerts, weekly_reports,
+                          team_updates, critical_issues, settings_json, manager_id))
+                else:
+                    # Insert new settings
+                    tx.execute('''
+                        INSERT INTO settings (manager_id, email_address, email_alerts,
+                                            performance_alerts, weekly_reports, team_updates,
+                                            critical_issues, settings_json)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ''', (manager_id, email_address, email_alerts, performance_alerts,
+                          weekly_reports, team_updates, critical_issues, settings_json))
             
-            conn.commit()
             return True
-            
+        
         except Exception as e:
             print(f"Error updating manager settings: {str(e)}")
-            conn.rollback()
             return False
-        finally:
-            conn.close()
     
     def create_default_settings_for_manager(self, manager_id, manager_email):
         """Create default settings for a new manager"""
@@ -650,4 +1915,4 @@ class DevLensDB:
             weekly_reports=False,
             team_updates=True,
             critical_issues=True
-        )
\ No newline at end of file
+        )
@@ -0,0 +1,183 @@
+"""
+Email outbox for DevLens
+Notification emails are queued in the email_outbox table and sent by a pool of
+worker threads, so API requests never wait on scoring or on the SMTP server.
+A failed send is retried with exponential backoff until max_attempts is reached.
+
+A claimed job holds a lease: if its process stops mid-send, the job is requeued
+once the lease has run out, by the next worker (of any process) that looks.
+"""
+
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+
+from engine.snapshots import get_company_snapshot
+
+# email_type -> settings flag that must be on (None: always allowed)
+EMAIL_TYPES = {
+    "test": None,
+    "performance": "performance_alerts",
+    "weekly": "weekly_reports",
+    "critical": "critical_issues"
+}
+
+
+def utc_timestamp(delay_seconds: float = 0.0) -> str:
+    """UTC time `delay_seconds` from now in CURRENT_TIMESTAMP format"""
+    return (datetime.utcnow() + timedelta(seconds=delay_seconds)).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class EmailOutbox:
+    def __init__(self, db, email_service, workers: int = 4, max_attempts: int = 5,
+                 base_delay: float = 30.0, max_delay: float = 3600.0, poll_interval: float = 1.0,
+                 lease_seconds: float = 900.0):
+        """
+        Args:
+            db: DevLensDB holding the outbox
+            email_service: EmailService used to render and send
+            workers: Sending threads
+            max_attempts: Attempts per email before it is marked failed
+            base_delay: Seconds before the first retry; doubled for each further attempt
+            max_delay: Upper bound for the retry delay in seconds
+            poll_interval: Seconds an idle worker waits before checking for due retries
+            lease_seconds: Seconds a claimed job may stay 'sending' before it is
+                considered abandoned; must exceed the longest render and send
+        """
+        self.db = db
+        self.email_service = email_service
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self._next_requeue = 0.0
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._threads = []
+
+    def enqueue(self, manager_id: int, email_type: str, to_address: str, payload: Optional[Dict] = None) -> int:
+        """Queue an email for sending now and return its job id"""
+        job_id = self.db.enqueue_email(manager_id, email_type, to_address, utc_timestamp(), self.max_attempts, payload)
+        self._wake.set()
+        return job_id
+
+    def start(self):
+        """Start the worker threads, first requeueing jobs a previous process left mid-send"""
+        if self._threads:
+            return
+        self.requeue_expired()
+
+        self._stop.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"email-outbox-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 10.0):
+        """Stop the workers after their current email"""
+        self._stop.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def requeue_expired(self) -> int:
+        """Requeue jobs whose lease ran out while 'sending'; returns how many"""
+        self._next_requeue = time.monotonic() + self.lease_seconds / 4
+        stale = self.db.requeue_stale_email_jobs(utc_timestamp(-self.lease_seconds))
+        if stale:
+            print(f"📧 Requeued {stale} emails whose sender stopped mid-send")
+        return stale
+
+    def retry_delay(self, attempts: int) -> float:
+        """Seconds to wait after the given number of failed attempts"""
+        return min(self.max_delay, self.base_delay * 2 ** (attempts - 1))
+
+    def process_next(self) -> bool:
+        """Send the next due email, if any; returns False when nothing was due"""
+        job = self.db.claim_email_job(utc_timestamp())
+        if not job:
+            return False
+
+        try:
+            sent = self._deliver(job)
+            error = None if sent else "SMTP send failed"
+        except Exception as e:
+            sent = False
+            error = f"{type(e).__name__}: {e}"
+
+        if sent:
+            self.db.complete_email_job(job["id"])
+        elif job["attempts"] < job["max_attempts"]:
+            delay = self.retry_delay(job["attempts"])
+            self.db.fail_email_job(job["id"], error, utc_timestamp(delay))
+            print(f"📧 Email #{job['id']} failed ({error}), retrying in {delay:.0f}s")
+        else:
+            self.db.fail_email_job(job["id"], error)
+            print(f"❌ Email #{job['id']} failed after {job['attempts']} attempts: {error}")
+        return True
+
+    def _work(self):
+        while not self._stop.is_set():
+            try:
+                if time.monotonic() >= self._next_requeue:
+                    self.requeue_expired()
+                if self.process_next():
+                    continue
+            except Exception as e:
+                # A database hiccup must not kill the worker
+                print(f"❌ Email outbox worker error: {e}")
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def _deliver(self, job: Dict) -> bool:
+        """Render and send one email; the company is scored at send time"""
+        if job["email_type"] not in EMAIL_TYPES:
+            raise ValueError(f"Unknown email type: {job['email_type']}")
+        manager = self.db.get_manager_with_company(job["manager_id"])
+        if not manager:
+            raise ValueError(f"Manager not found: {job['manager_id']}")
+
+        to_address = job["to_address"]
+        manager_name = manager["name"]
+        company_name = manager["company_name"]
+        if job["email_type"] == "test":
+            return self.email_service.send_test_email(to_address, manager_name)
+
+        # Alert emails report the snapshot-diff events they were queued for
+        payload = json.loads(job["payload_json"]) if job.get("payload_json") else {}
+        if payload.get("alert_event_ids"):
+            events = self.db.get_alert_events(payload["alert_event_ids"])
+            return self.email_service.send_alert_events(
+                to_address, manager_name, company_name, events, critical=job["email_type"] == "critical"
+            )
+
+        snapshot = get_company_snapshot(self.db, company_name)
+        developers = snapshot["developers"] if snapshot else []
+        snapshot_version = snapshot["snapshot_version"] if snapshot else None
+        send = {
+            "performance": self.email_service.send_performance_alert,
+            "weekly": self.email_service.send_weekly_report,
+            "critical": self.email_service.send_critical_issue_alert
+        }[job["email_type"]]
+        return send(to_address, manager_name, company_name, developers, snapshot_version)
+
+    @staticmethod
+    def job_status(job: Dict) -> Dict:
+        """Public view of an outbox job for the status endpoint"""
+        return {
+            "job_id": job["id"],
+            "email_type": job["email_type"],
+            "to_address": job["to_address"],
+            "status": job["status"],
+            "attempts": job["attempts"],
+            "max_attempts": job["max_attempts"],
+            "next_attempt_at": job["next_attempt_at"] if job["status"] == "queued" else None,
+            "last_error": job["last_error"],
+            "created_at": job["created_at"],
+            "sent_at": job["sent_at"]
+        }
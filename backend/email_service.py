@@ -1,415 +1,295 @@
+import os
 import smtplib
 import ssl
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from datetime import datetime, timedelta
 import json
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from email_templates import ReportRenderer
+
+class SMTPConnectionPool:
+    """
+    Authenticated SMTP connections kept open between messages
+    
+    A session takes an idle connection (or opens one: connect, STARTTLS, login)
+    and returns it to the pool afterwards, so consecutive messages skip the
+    handshake. A connection the server has dropped is replaced transparently.
+    While connections are idle, a reaper thread closes those unused for longer
+    than max_idle, so the server is not left holding them.
+    """
+    
+    def __init__(self, host: str, port: int, username: str = "", password: str = "",
+                 starttls: bool = True, size: int = 4, max_idle: float = 60.0, timeout: float = 30.0):
+        """
+        Args:
+            size: Connections open at most; further sessions wait for a free one
+            max_idle: Seconds an unused connection is kept before it is closed
+        """
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.size = size
+        self.max_idle = max_idle
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._idle = []  # (smtp, returned_at)
+        self._reaper = None
+        self._closing = threading.Event()
+    
+    def connect(self) -> smtplib.SMTP:
+        """Open a new connection and authenticate it"""
+        print(f"📧 Connecting to SMTP server {self.host}:{self.port}")
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.starttls:
+                smtp.starttls(context=ssl.create_default_context())
+            if self.username:
+                smtp.login(self.username, self.password)
+        except Exception:
+            self._close(smtp)
+            raise
+        return smtp
+    
+    @contextmanager
+    def session(self):
+        """A _PooledSession holding one connection until the block exits"""
+        self._slots.acquire()
+        session = _PooledSession(self, self._take_idle())
+        try:
+            yield session
+        finally:
+            if session.smtp is not None:
+                with self._lock:
+                    self._idle.append((session.smtp, time.monotonic()))
+                    if self._reaper is None:
+                        self._reaper = threading.Thread(target=self._reap, name="smtp-pool-reaper", daemon=True)
+                        self._reaper.start()
+            self._slots.release()
+    
+    def close(self):
+        """Close all idle connections and stop the reaper"""
+        with self._lock:
+            reaper, self._reaper = self._reaper, None
+        if reaper is not None:
+            self._closing.set()
+            reaper.join()
+            self._closing.clear()
+        
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for smtp, _ in idle:
+            self._close(smtp)
+    
+    def reap_idle(self):
+        """Close the connections idle for longer than max_idle"""
+        now = time.monotonic()
+        with self._lock:
+            expired = [smtp for smtp, returned_at in self._idle if now - returned_at > self.max_idle]
+            self._idle = [(smtp, returned_at) for smtp, returned_at in self._idle if now - returned_at <= self.max_idle]
+        for smtp in expired:
+            self._close(smtp)
+    
+    def _reap(self):
+        # Runs while connections are idle; the next returned connection restarts it
+        while not self._closing.wait(self.max_idle / 2):
+            self.reap_idle()
+            with self._lock:
+                if not self._idle:
+                    self._reaper = None
+                    return
+    
+    def _take_idle(self) -> Optional[smtplib.SMTP]:
+        now = time.monotonic()
+        with self._lock:
+            while self._idle:
+                smtp, returned_at = self._idle.pop()
+                if now - returned_at <= self.max_idle:
+                    return smtp
+                self._close(smtp)
+        return None
+    
+    @staticmethod
+    def _close(smtp: smtplib.SMTP):
+        try:
+            smtp.quit()
+        except Exception:
+            smtp.close()
+
+class _PooledSession:
+    def __init__(self, pool: SMTPConnectionPool, smtp: Optional[smtplib.SMTP]):
+        self.pool = pool
+        self.smtp = smtp
+    
+    def sendmail(self, sender: str, recipient: str, message: str):
+        """Send one message, reconnecting once if the server dropped the connection"""
+        if self.smtp is None:
+            self.smtp = self.pool.connect()
+        try:
+            self.smtp.sendmail(sender, recipient, message)
+        except smtplib.SMTPServerDisconnected:
+            self.smtp.close()
+            self.smtp = None
+            self.smtp = self.pool.connect()
+            self.smtp.sendmail(sender, recipient, message)
+        except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError):
+            # The server rejected this message but the session is still usable
+            raise
+        except Exception:
+            # Anything else leaves the session in an unknown state
+            self.pool._close(self.smtp)
+            self.smtp = None
+            raise
 
 class EmailService:
-    def __init__(self):
-        # Gmail SMTP configuration (you can change this to other providers)
-        self.smtp_server = "smtp.gmail.com"
-        self.port = 587
+    def __init__(self, smtp_server: str = None, port: int = None, sender_email: str = None,
+                 sender_password: str = None, starttls: bool = None, pool_size: int = None):
+        # Gmail SMTP configuration by default; SMTP_* environment variables select
+        # another provider or a local SMTP stand-in (SMTP_STARTTLS=false, no password)
+        self.smtp_server = smtp_server or os.environ.get("SMTP_HOST", "smtp.gmail.com")
+        self.port = int(port or os.environ.get("SMTP_PORT", "587"))
+        if starttls is None:
+            starttls = os.environ.get("SMTP_STARTTLS", "true").lower() not in ("0", "false", "no")
+        self.starttls = starttls
         
         # IMPORTANT: Replace with your Gmail App Password (16 characters)
         # Get this from: Google Account → Security → App passwords → Mail
-        self.sender_email = "lokheshnk@gmail.com"
-        self.sender_password = "ooop cgzt rxoy iixu"  # Replace with your actual App Password
+        self.sender_email = sender_email or os.environ.get("SMTP_SENDER", "lokheshnk@gmail.com")
+        if sender_password is None:
+            sender_password = os.environ.get("SMTP_PASSWORD", "ooop cgzt rxoy iixu")  # Replace with your actual App Password
+        self.sender_password = sender_password
+        
+        self.pool = SMTPConnectionPool(
+            self.smtp_server, self.port, self.sender_email if self.sender_password else "",
+            self.sender_password, starttls=self.starttls,
+            size=int(pool_size or os.environ.get("SMTP_POOL_SIZE", "4"))
+        )
         
+        # Compiled templates; renders are shared by managers of the same company snapshot
+        self.renderer = ReportRenderer()
+    
+    def build_message(self, to_email: str, subject: str, html_content: str, text_content: str = None) -> str:
+        """Serialized MIME message with a plain text part (optional) and an HTML part"""
+        message = MIMEMultipart("alternative")
+        message["Subject"] = subject
+        message["From"] = f"DevLens Analytics <{self.sender_email}>"
+        message["To"] = to_email
+        
+        if text_content:
+            message.attach(MIMEText(text_content, "plain"))
+        message.attach(MIMEText(html_content, "html"))
+        return message.as_string()
+    
     def send_email(self, to_email: str, subject: str, html_content: str, text_content: str = None):
-        """Send an email with HTML content"""
-        try:
-            # Create message
-            message = MIMEMultipart("alternative")
-            message["Subject"] = subject
-            message["From"] = f"DevLens Analytics <{self.sender_email}>"
-            message["To"] = to_email
-            
-            # Create text and HTML parts
-            if text_content:
-                text_part = MIMEText(text_content, "plain")
-                message.attach(text_part)
-            
-            html_part = MIMEText(html_content, "html")
-            message.attach(html_part)
-            
-            # Create secure connection and send email
-            context = ssl.create_default_context()
-            
-            print(f"🔄 Attempting to send email to: {to_email}")
-            print(f"📧 Using SMTP server: {self.smtp_server}:{self.port}")
-            print(f"📤 From: {self.sender_email}")
-            
-            with smtplib.SMTP(self.smtp_server, self.port) as server:
-                print("🔐 Starting TLS...")
-                server.starttls(context=context)
-                
-                print("� LSogging in...")
-                server.login(self.sender_email, self.sender_password)
-                
-                print("📨 Sending email...")
-                server.sendmail(self.sender_email, to_email, message.as_string())
-                
-                print(f"✅ EMAIL SENT SUCCESSFULLY TO: {to_email}")
-                print(f"📧 SUBJECT: {subject}")
-                
-            return True
-            
-        except smtplib.SMTPAuthenticationError as e:
-            print(f"❌ Authentication Error: {str(e)}")
+        """Send an email with HTML content over a pooled connection"""
+        return self.send_many([(to_email, subject, html_content, text_content)])[0]
+    
+    def send_many(self, emails: List[tuple]) -> List[bool]:
+        """
+        Send many emails, reusing a few authenticated connections
+        
+        Args:
+            emails: (to_email, subject, html_content[, text_content]) tuples
+        
+        Returns:
+            list: True or False per email, in input order
+        """
+        results = [False] * len(emails)
+        if not emails:
+            return results
+        
+        sessions = min(self.pool.size, len(emails))
+        
+        def send_share(offset):
+            # Every sessions-th email, sent back to back over one connection
+            pending = deque(range(offset, len(emails), sessions))
+            for attempt in range(2):
+                try:
+                    with self.pool.session() as session:
+                        while pending:
+                            index = pending[0]
+                            to_email, subject = emails[index][0], emails[index][1]
+                            try:
+                                session.sendmail(self.sender_email, to_email, self.build_message(*emails[index]))
+                                results[index] = True
+                                print(f"✅ EMAIL SENT SUCCESSFULLY TO: {to_email} ({subject})")
+                            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as e:
+                                self._report_error(to_email, e)
+                            pending.popleft()
+                    return
+                except Exception as e:
+                    # The connection failed during this email, which may or may not have
+                    # been delivered: it stays failed and the rest of the share is
+                    # retried once on a fresh connection
+                    if pending:
+                        self._report_error(emails[pending.popleft()][0], e)
+        
+        if sessions == 1:
+            send_share(0)
+        else:
+            with ThreadPoolExecutor(max_workers=sessions) as executor:
+                list(executor.map(send_share, range(sessions)))
+        
+        return results
+    
+    def close(self):
+        """Close the pooled SMTP connections"""
+        self.pool.close()
+    
+    def _report_error(self, to_email: str, error: Exception):
+        if isinstance(error, smtplib.SMTPAuthenticationError):
+            print(f"❌ Authentication Error: {str(error)}")
             print("💡 Tips:")
             print("   1. Make sure you're using an App Password (not your regular Gmail password)")
             print("   2. Enable 2-Factor Authentication on your Gmail account")
             print("   3. Generate App Password: Google Account → Security → App passwords")
-            return False
-            
-        except smtplib.SMTPRecipientsRefused as e:
-            print(f"❌ Recipient Error: {str(e)}")
+        elif isinstance(error, smtplib.SMTPRecipientsRefused):
+            print(f"❌ Recipient Error ({to_email}): {str(error)}")
             print("💡 Check the recipient email address is valid")
-            return False
-            
-        except smtplib.SMTPServerDisconnected as e:
-            print(f"❌ Server Connection Error: {str(e)}")
+        elif isinstance(error, (smtplib.SMTPServerDisconnected, OSError)):
+            print(f"❌ Server Connection Error: {str(error)}")
             print("💡 Check your internet connection and SMTP settings")
-            return False
-            
-        except Exception as e:
-            print(f"❌ Unexpected Error: {str(e)}")
-            print(f"❌ Error Type: {type(e).__name__}")
-            return False
-    
-    def generate_performance_alert_email(self, manager_name: str, company: str, developers: List[Dict], alert_type: str):
-        """Generate performance alert email content"""
-        
-        if alert_type == "performance_change":
-            subject = f"🚨 Performance Alert - {company}"
-            
-            # Find developers with significant changes (simulated)
-            high_performers = [d for d in developers if d.get('imp_z', 0) > 1.5]
-            low_performers = [d for d in developers if d.get('imp_z', 0) < -0.5]
-            
-            html_content = f"""
-            <html>
-            <head>
-                <style>
-                    body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                    .header {{ background-color: #16a34a; color: white; padding: 20px; text-align: center; }}
-                    .content {{ padding: 20px; }}
-                    .alert {{ background-color: #fef3c7; border-left: 4px solid #f59e0b; padding: 15px; margin: 15px 0; }}
-                    .metric {{ background-color: #f3f4f6; padding: 10px; margin: 10px 0; border-radius: 5px; }}
-                    .high-performer {{ color: #16a34a; font-weight: bold; }}
-                    .low-performer {{ color: #dc2626; font-weight: bold; }}
-                    .footer {{ background-color: #f9fafb; padding: 15px; text-align: center; font-size: 12px; color: #6b7280; }}
-                </style>
-            </head>
-            <body>
-                <div class="header">
-                    <h1>🛡️ DevLens Performance Alert</h1>
-                    <p>Performance insights for {company}</p>
-                </div>
-                
-                <div class="content">
-                    <p>Hello {manager_name},</p>
-                    
-                    <div class="alert">
-                        <strong>⚠️ Performance Alert Triggered</strong><br>
-                        We've detected significant performance changes in your team that require attention.
-                    </div>
-                    
-                    <h3>📊 Key Metrics Summary</h3>
-                    <div class="metric">
-                        <strong>Total Developers:</strong> {len(developers)}<br>
-                        <strong>High Performers:</strong> <span class="high-performer">{len(high_performers)} developers</span><br>
-                        <strong>Needs Attention:</strong> <span class="low-performer">{len(low_performers)} developers</span>
-                    </div>
-                    
-                    <h3>🏆 Top Performers This Week</h3>
-                    <ul>
-            """
-            
-            # Add top performers
-            top_performers = sorted(developers, key=lambda x: x.get('commits', 0), reverse=True)[:3]
-            for dev in top_performers:
-                html_content += f"""
-                        <li><strong>{dev['name']}</strong> ({dev['team']}) - {dev['commits']} commits, {dev['entropy']:.2f} complexity</li>
-                """
-            
-            html_content += """
-                    </ul>
-                    
-                    <h3>📈 Recommendations</h3>
-                    <ul>
-                        <li>Schedule 1:1s with developers showing performance changes</li>
-                        <li>Review workload distribution across teams</li>
-                        <li>Consider pair programming for knowledge sharing</li>
-                        <li>Celebrate high performers and share best practices</li>
-                    </ul>
-                    
-                    <p>
-                        <a href="http://localhost:3000" style="background-color: #16a34a; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px;">
-                            View Full Dashboard
-                        </a>
-                    </p>
-                </div>
-                
-                <div class="footer">
-                    <p>This is an automated alert from DevLens Analytics. You can manage your notification preferences in the dashboard settings.</p>
-                </div>
-            </body>
-            </html>
-            """
-            
-        elif alert_type == "weekly_report":
-            subject = f"📊 Weekly Team Report - {company}"
-            
-            # Calculate weekly metrics
-            total_commits = sum(d.get('commits', 0) for d in developers)
-            avg_complexity = sum(d.get('entropy', 0) for d in developers) / len(developers) if developers else 0
-            total_meetings = sum(d.get('meetings', 0) for d in developers)
-            
-            # Group by teams
-            teams = {}
-            for dev in developers:
-                team = dev.get('team', 'Unknown')
-                if team not in teams:
-                    teams[team] = []
-                teams[team].append(dev)
-            
-            html_content = f"""
-            <html>
-            <head>
-                <style>
-                    body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                    .header {{ background-color: #16a34a; color: white; padding: 20px; text-align: center; }}
-                    .content {{ padding: 20px; }}
-                    .summary {{ background-color: #f0f9ff; border: 1px solid #0ea5e9; padding: 15px; margin: 15px 0; border-radius: 5px; }}
-                    .team-section {{ background-color: #f9fafb; padding: 15px; margin: 15px 0; border-radius: 5px; }}
-                    .metric-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 15px 0; }}
-                    .metric-card {{ background-color: white; padding: 15px; border-radius: 5px; border: 1px solid #e5e7eb; text-align: center; }}
-                    .metric-value {{ font-size: 24px; font-weight: bold; color: #16a34a; }}
-                    .footer {{ background-color: #f9fafb; padding: 15px; text-align: center; font-size: 12px; color: #6b7280; }}
-                </style>
-            </head>
-            <body>
-                <div class="header">
-                    <h1>📊 Weekly Team Report</h1>
-                    <p>{company} - Week of {datetime.now().strftime('%B %d, %Y')}</p>
-                </div>
-                
-                <div class="content">
-                    <p>Hello {manager_name},</p>
-                    
-                    <div class="summary">
-                        <h3>📈 Weekly Summary</h3>
-                        <p>Here's how your team performed this week across key metrics.</p>
-                    </div>
-                    
-                    <div class="metric-grid">
-                        <div class="metric-card">
-                            <div class="metric-value">{total_commits}</div>
-                            <div>Total Commits</div>
-                        </div>
-                        <div class="metric-card">
-                            <div class="metric-value">{avg_complexity:.2f}</div>
-                            <div>Avg Complexity</div>
-                        </div>
-                        <div class="metric-card">
-                            <div class="metric-value">{len(developers)}</div>
-                            <div>Active Developers</div>
-                        </div>
-                        <div class="metric-card">
-                            <div class="metric-value">{total_meetings}</div>
-                            <div>Total Meetings</div>
-                        </div>
-                    </div>
-                    
-                    <h3>👥 Team Breakdown</h3>
-            """
-            
-            # Add team sections
-            for team_name, team_devs in teams.items():
-                team_commits = sum(d.get('commits', 0) for d in team_devs)
-                team_avg_complexity = sum(d.get('entropy', 0) for d in team_devs) / len(team_devs) if team_devs else 0
-                
-                html_content += f"""
-                    <div class="team-section">
-                        <h4>{team_name} Team ({len(team_devs)} developers)</h4>
-                        <p><strong>Commits:</strong> {team_commits} | <strong>Avg Complexity:</strong> {team_avg_complexity:.2f}</p>
-                        <ul>
-                """
-                
-                for dev in team_devs:
-                    html_content += f"""
-                            <li>{dev['name']} - {dev.get('commits', 0)} commits, {dev.get('meetings', 0)} meetings</li>
-                    """
-                
-                html_content += """
-                        </ul>
-                    </div>
-                """
-            
-            html_content += f"""
-                    <h3>🎯 Key Insights</h3>
-                    <ul>
-                        <li>Team productivity is {"above" if total_commits > len(developers) * 10 else "at"} expected levels</li>
-                        <li>Code complexity indicates {"high technical challenges" if avg_complexity > 0.7 else "standard development work"}</li>
-                        <li>Meeting load is {"high" if total_meetings > len(developers) * 8 else "balanced"} across the team</li>
-                    </ul>
-                    
-                    <p>
-                        <a href="http://localhost:3000" style="background-color: #16a34a; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px;">
-                            View Detailed Analytics
-                        </a>
-                    </p>
-                </div>
-                
-                <div class="footer">
-                    <p>DevLens Weekly Report • Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-                </div>
-            </body>
-            </html>
-            """
-        
-        elif alert_type == "critical_issue":
-            subject = f"🚨 Critical Performance Issue - {company}"
-            
-            # Find critical issues (simulated)
-            critical_devs = [d for d in developers if d.get('commits', 0) == 0 or d.get('meetings', 0) > 20]
-            
-            html_content = f"""
-            <html>
-            <head>
-                <style>
-                    body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                    .header {{ background-color: #dc2626; color: white; padding: 20px; text-align: center; }}
-                    .content {{ padding: 20px; }}
-                    .critical {{ background-color: #fef2f2; border-left: 4px solid #dc2626; padding: 15px; margin: 15px 0; }}
-                    .action-item {{ background-color: #fff7ed; border-left: 4px solid #f59e0b; padding: 10px; margin: 10px 0; }}
-                    .footer {{ background-color: #f9fafb; padding: 15px; text-align: center; font-size: 12px; color: #6b7280; }}
-                </style>
-            </head>
-            <body>
-                <div class="header">
-                    <h1>🚨 Critical Alert</h1>
-                    <p>Immediate attention required - {company}</p>
-                </div>
-                
-                <div class="content">
-                    <p>Hello {manager_name},</p>
-                    
-                    <div class="critical">
-                        <strong>🚨 Critical Performance Issue Detected</strong><br>
-                        We've identified performance patterns that require immediate attention.
-                    </div>
-                    
-                    <h3>⚠️ Issues Identified</h3>
-            """
-            
-            if critical_devs:
-                html_content += "<ul>"
-                for dev in critical_devs:
-                    if dev.get('commits', 0) == 0:
-                        html_content += f"<li><strong>{dev['name']}</strong> - No commits this week</li>"
-                    elif dev.get('meetings', 0) > 20:
-                        html_content += f"<li><strong>{dev['name']}</strong> - Excessive meeting load ({dev['meetings']} meetings)</li>"
-                html_content += "</ul>"
-            
-            html_content += """
-                    <h3>🎯 Immediate Actions Required</h3>
-                    <div class="action-item">
-                        <strong>1. Schedule immediate 1:1 meetings</strong> with affected team members
-                    </div>
-                    <div class="action-item">
-                        <strong>2. Review workload distribution</strong> and remove blockers
-                    </div>
-                    <div class="action-item">
-                        <strong>3. Assess meeting efficiency</strong> and reduce unnecessary meetings
-                    </div>
-                    
-                    <p>
-                        <a href="http://localhost:3000" style="background-color: #dc2626; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px;">
-                            View Dashboard Now
-                        </a>
-                    </p>
-                </div>
-                
-                <div class="footer">
-                    <p>Critical Alert from DevLens Analytics • Immediate action recommended</p>
-                </div>
-            </body>
-            </html>
-            """
-        
-        return subject, html_content
+        else:
+            print(f"❌ Unexpected Error ({to_email}): {str(error)}")
+            print(f"❌ Error Type: {type(error).__name__}")
+
+    def generate_performance_alert_email(self, manager_name: str, company: str, developers: List[Dict], alert_type: str,
+                                         snapshot_version: int = None):
+        """Generate performance alert email content (memoized per company snapshot when snapshot_version is given)"""
+        return self.renderer.render(alert_type, manager_name, company, developers, snapshot_version)
     
-    def send_performance_alert(self, to_email: str, manager_name: str, company: str, developers: List[Dict]):
+    def send_performance_alert(self, to_email: str, manager_name: str, company: str, developers: List[Dict],
+                               snapshot_version: int = None):
         """Send performance alert email"""
-        subject, html_content = self.generate_performance_alert_email(manager_name, company, developers, "performance_change")
+        subject, html_content = self.generate_performance_alert_email(manager_name, company, developers, "performance_change", snapshot_version)
         return self.send_email(to_email, subject, html_content)
     
-    def send_weekly_report(self, to_email: str, manager_name: str, company: str, developers: List[Dict]):
+    def send_weekly_report(self, to_email: str, manager_name: str, company: str, developers: List[Dict],
+                           snapshot_version: int = None):
         """Send weekly report email"""
-        subject, html_content = self.generate_performance_alert_email(manager_name, company, developers, "weekly_report")
+        subject, html_content = self.generate_performance_alert_email(manager_name, company, developers, "weekly_report", snapshot_version)
         return self.send_email(to_email, subject, html_content)
     
-    def send_critical_issue_alert(self, to_email: str, manager_name: str, company: str, developers: List[Dict]):
+    def send_critical_issue_alert(self, to_email: str, manager_name: str, company: str, developers: List[Dict],
+                                  snapshot_version: int = None):
         """Send critical issue alert email"""
-        subject, html_content = self.generate_performance_alert_email(manager_name, company, developers, "critical_issue")
+        subject, html_content = self.generate_performance_alert_email(manager_name, company, developers, "critical_issue", snapshot_version)
+        return self.send_email(to_email, subject, html_content)
+    
+    def send_alert_events(self, to_email: str, manager_name: str, company: str, events: List[Dict], critical: bool = False):
+        """Send an alert email listing what changed between score snapshots"""
+        subject, html_content = self.renderer.render_alerts(manager_name, company, events, critical)
         return self.send_email(to_email, subject, html_content)
     
     def send_test_email(self, to_email: str, manager_name: str):
         """Send a test email to verify email configuration"""
-        subject = "✅ DevLens Email Test - Configuration Successful"
-        
-        html_content = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-                .header {{ background-color: #16a34a; color: white; padding: 20px; text-align: center; }}
-                .content {{ padding: 20px; }}
-                .success {{ background-color: #f0f9ff; border-left: 4px solid #16a34a; padding: 15px; margin: 15px 0; }}
-                .footer {{ background-color: #f9fafb; padding: 15px; text-align: center; font-size: 12px; color: #6b7280; }}
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>✅ Email Configuration Test</h1>
-                <p>DevLens Analytics</p>
-            </div>
-            
-            <div class="content">
-                <p>Hello {manager_name},</p>
-                
-                <div class="success">
-                    <strong>🎉 Success!</strong><br>
-                    Your email notifications are now configured and working properly.
-                </div>
-                
-                <h3>📧 What You'll Receive</h3>
-                <ul>
-                    <li><strong>Performance Alerts:</strong> When significant changes are detected in team performance</li>
-                    <li><strong>Weekly Reports:</strong> Comprehensive team analytics every week</li>
-                    <li><strong>Critical Issues:</strong> Immediate alerts for urgent performance issues</li>
-                    <li><strong>Team Updates:</strong> Notifications about team member changes</li>
-                </ul>
-                
-                <h3>⚙️ Manage Preferences</h3>
-                <p>You can customize your notification preferences anytime in the DevLens dashboard settings.</p>
-                
-                <p>
-                    <a href="http://localhost:3000" style="background-color: #16a34a; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px;">
-                        Go to Dashboard
-                    </a>
-                </p>
-            </div>
-            
-            <div class="footer">
-                <p>DevLens Analytics • Test email sent on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-            </div>
-        </body>
-        </html>
-        """
-        
+        subject, html_content = self.renderer.render_test(manager_name)
         return self.send_email(to_email, subject, html_content)
\ No newline at end of file
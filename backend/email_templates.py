@@ -0,0 +1,439 @@
+"""
+Email templates for DevLens
+The page skeleton, styles, headers and footers of every email are compiled once
+at import; only the sections that depend on the company's developers are built
+per render. A rendered report depends on the company snapshot, not on the
+manager, so it is memoized per (company, snapshot_version, report_type, day)
+and the managers of one company share a single render.
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import date, datetime
+from string import Template
+from typing import Dict, List, Optional, Tuple
+
+from engine.alerts import describe_alert
+
+DASHBOARD_URL = "http://localhost:3000"
+
+BASE_STYLE = """
+                    body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+                    .header { background-color: #16a34a; color: white; padding: 20px; text-align: center; }
+                    .content { padding: 20px; }
+                    .footer { background-color: #f9fafb; padding: 15px; text-align: center; font-size: 12px; color: #6b7280; }"""
+
+# Extra styles per report type, appended to BASE_STYLE once at import
+REPORT_STYLES = {
+    "performance_change": """
+                    .alert { background-color: #fef3c7; border-left: 4px solid #f59e0b; padding: 15px; margin: 15px 0; }
+                    .metric { background-color: #f3f4f6; padding: 10px; margin: 10px 0; border-radius: 5px; }
+                    .high-performer { color: #16a34a; font-weight: bold; }
+                    .low-performer { color: #dc2626; font-weight: bold; }""",
+    "weekly_report": """
+                    .summary { background-color: #f0f9ff; border: 1px solid #0ea5e9; padding: 15px; margin: 15px 0; border-radius: 5px; }
+                    .team-section { background-color: #f9fafb; padding: 15px; margin: 15px 0; border-radius: 5px; }
+                    .metric-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 15px; margin: 15px 0; }
+                    .metric-card { background-color: white; padding: 15px; border-radius: 5px; border: 1px solid #e5e7eb; text-align: center; }
+                    .metric-value { font-size: 24px; font-weight: bold; color: #16a34a; }""",
+    "critical_issue": """
+                    .header { background-color: #dc2626; }
+                    .critical { background-color: #fef2f2; border-left: 4px solid #dc2626; padding: 15px; margin: 15px 0; }
+                    .action-item { background-color: #fff7ed; border-left: 4px solid #f59e0b; padding: 10px; margin: 10px 0; }""",
+    "test": """
+                    .success { background-color: #f0f9ff; border-left: 4px solid #16a34a; padding: 15px; margin: 15px 0; }"""
+}
+
+# Static <head> of each report type
+HEADS = {
+    report_type: f"""
+            <html>
+            <head>
+                <style>{BASE_STYLE}{style}
+                </style>
+            </head>
+            <body>"""
+    for report_type, style in REPORT_STYLES.items()
+}
+
+SUBJECTS = {
+    "performance_change": Template("🚨 Performance Alert - $company"),
+    "weekly_report": Template("📊 Weekly Team Report - $company"),
+    "critical_issue": Template("🚨 Critical Performance Issue - $company"),
+    "test": Template("✅ DevLens Email Test - Configuration Successful")
+}
+
+HEADERS = {
+    "performance_change": Template("""
+                <div class="header">
+                    <h1>🛡️ DevLens Performance Alert</h1>
+                    <p>Performance insights for $company</p>
+                </div>"""),
+    "weekly_report": Template("""
+                <div class="header">
+                    <h1>📊 Weekly Team Report</h1>
+                    <p>$company - Week of $week</p>
+                </div>"""),
+    "critical_issue": Template("""
+                <div class="header">
+                    <h1>🚨 Critical Alert</h1>
+                    <p>Immediate attention required - $company</p>
+                </div>"""),
+    "test": Template("""
+                <div class="header">
+                    <h1>✅ Email Configuration Test</h1>
+                    <p>DevLens Analytics</p>
+                </div>""")
+}
+
+FOOTERS = {
+    "performance_change": Template("""
+                <div class="footer">
+                    <p>This is an automated alert from DevLens Analytics. You can manage your notification preferences in the dashboard settings.</p>
+                </div>
+            </body>
+            </html>"""),
+    "weekly_report": Template("""
+                <div class="footer">
+                    <p>DevLens Weekly Report • Generated on $generated_at</p>
+                </div>
+            </body>
+            </html>"""),
+    "critical_issue": Template("""
+                <div class="footer">
+                    <p>Critical Alert from DevLens Analytics • Immediate action recommended</p>
+                </div>
+            </body>
+            </html>"""),
+    "test": Template("""
+                <div class="footer">
+                    <p>DevLens Analytics • Test email sent on $generated_at</p>
+                </div>
+            </body>
+            </html>""")
+}
+
+BUTTON = Template("""
+                    <p>
+                        <a href="$url" style="background-color: $color; color: white; padding: 10px 20px; text-decoration: none; border-radius: 5px;">
+                            $label
+                        </a>
+                    </p>""")
+
+PERFORMANCE_BODY = Template("""
+                    <div class="alert">
+                        <strong>⚠️ Performance Alert Triggered</strong><br>
+                        We've detected significant performance changes in your team that require attention.
+                    </div>
+
+                    <h3>📊 Key Metrics Summary</h3>
+                    <div class="metric">
+                        <strong>Total Developers:</strong> $total<br>
+                        <strong>High Performers:</strong> <span class="high-performer">$high developers</span><br>
+                        <strong>Needs Attention:</strong> <span class="low-performer">$low developers</span>
+                    </div>
+
+                    <h3>🏆 Top Performers This Week</h3>
+                    <ul>$top_performers
+                    </ul>
+
+                    <h3>📈 Recommendations</h3>
+                    <ul>
+                        <li>Schedule 1:1s with developers showing performance changes</li>
+                        <li>Review workload distribution across teams</li>
+                        <li>Consider pair programming for knowledge sharing</li>
+                        <li>Celebrate high performers and share best practices</li>
+                    </ul>
+                    $button""")
+
+WEEKLY_BODY = Template("""
+                    <div class="summary">
+                        <h3>📈 Weekly Summary</h3>
+                        <p>Here's how your team performed this week across key metrics.</p>
+                    </div>
+
+                    <div class="metric-grid">
+                        <div class="metric-card">
+                            <div class="metric-value">$total_commits</div>
+                            <div>Total Commits</div>
+                        </div>
+                        <div class="metric-card">
+                            <div class="metric-value">$avg_complexity</div>
+                            <div>Avg Complexity</div>
+                        </div>
+                        <div class="metric-card">
+                            <div class="metric-value">$developer_count</div>
+                            <div>Active Developers</div>
+                        </div>
+                        <div class="metric-card">
+                            <div class="metric-value">$total_meetings</div>
+                            <div>Total Meetings</div>
+                        </div>
+                    </div>
+
+                    <h3>👥 Team Breakdown</h3>$teams
+
+                    <h3>🎯 Key Insights</h3>
+                    <ul>
+                        <li>Team productivity is $productivity expected levels</li>
+                        <li>Code complexity indicates $complexity</li>
+                        <li>Meeting load is $meeting_load across the team</li>
+                    </ul>
+                    $button""")
+
+TEAM_SECTION = Template("""
+                    <div class="team-section">
+                        <h4>$team Team ($count developers)</h4>
+                        <p><strong>Commits:</strong> $commits | <strong>Avg Complexity:</strong> $complexity</p>
+                        <ul>$members
+                        </ul>
+                    </div>""")
+
+CRITICAL_BODY = Template("""
+                    <div class="critical">
+                        <strong>🚨 Critical Performance Issue Detected</strong><br>
+                        We've identified performance patterns that require immediate attention.
+                    </div>
+
+                    <h3>⚠️ Issues Identified</h3>$issues
+
+                    <h3>🎯 Immediate Actions Required</h3>
+                    <div class="action-item">
+                        <strong>1. Schedule immediate 1:1 meetings</strong> with affected team members
+                    </div>
+                    <div class="action-item">
+                        <strong>2. Review workload distribution</strong> and remove blockers
+                    </div>
+                    <div class="action-item">
+                        <strong>3. Assess meeting efficiency</strong> and reduce unnecessary meetings
+                    </div>
+                    $button""")
+
+TEST_BODY = f"""
+                    <div class="success">
+                        <strong>🎉 Success!</strong><br>
+                        Your email notifications are now configured and working properly.
+                    </div>
+
+                    <h3>📧 What You'll Receive</h3>
+                    <ul>
+                        <li><strong>Performance Alerts:</strong> When significant changes are detected in team performance</li>
+                        <li><strong>Weekly Reports:</strong> Comprehensive team analytics every week</li>
+                        <li><strong>Critical Issues:</strong> Immediate alerts for urgent performance issues</li>
+                        <li><strong>Team Updates:</strong> Notifications about team member changes</li>
+                    </ul>
+
+                    <h3>⚙️ Manage Preferences</h3>
+                    <p>You can customize your notification preferences anytime in the DevLens dashboard settings.</p>
+                    {BUTTON.substitute(url=DASHBOARD_URL, color="#16a34a", label="Go to Dashboard")}"""
+
+# Buttons never change, so they are rendered once
+BUTTONS = {
+    "performance_change": BUTTON.substitute(url=DASHBOARD_URL, color="#16a34a", label="View Full Dashboard"),
+    "weekly_report": BUTTON.substitute(url=DASHBOARD_URL, color="#16a34a", label="View Detailed Analytics"),
+    "critical_issue": BUTTON.substitute(url=DASHBOARD_URL, color="#dc2626", label="View Dashboard Now")
+}
+
+ALERT_BODY = Template("""
+                    <div class="$box_class">
+                        <strong>$headline</strong><br>
+                        $count changes were detected since the previous scoring of your team.
+                    </div>
+                    $sections
+                    $button""")
+
+ALERT_SECTION = Template("""
+                    <h3>$title</h3>
+                    <ul>$items
+                    </ul>""")
+
+ALERT_TITLES = {
+    "new_risk": "⚠️ New Risk Factors",
+    "attendance_drop": "📉 Attendance Drops",
+    "quadrant_change": "🔀 Quadrant Changes",
+    "impact_swing": "📊 Impact Swings",
+    "visibility_swing": "👁️ Visibility Swings"
+}
+
+GREETING_START = """
+                <div class="content">
+                    <p>Hello """
+GREETING_END = """,</p>
+                    """
+CONTENT_END = """
+                </div>
+                """
+
+
+def _performance_body(developers: List[Dict]) -> str:
+    high_performers = sum(1 for d in developers if d.get('imp_z', 0) > 1.5)
+    low_performers = sum(1 for d in developers if d.get('imp_z', 0) < -0.5)
+    top_performers = sorted(developers, key=lambda x: x.get('commits', 0), reverse=True)[:3]
+    return PERFORMANCE_BODY.substitute(
+        total=len(developers),
+        high=high_performers,
+        low=low_performers,
+        top_performers="".join(
+            f"\n                        <li><strong>{dev['name']}</strong> ({dev['team']}) - "
+            f"{dev['commits']} commits, {dev['entropy']:.2f} complexity</li>"
+            for dev in top_performers
+        ),
+        button=BUTTONS["performance_change"]
+    )
+
+
+def _weekly_body(developers: List[Dict]) -> str:
+    total_commits = sum(d.get('commits', 0) for d in developers)
+    avg_complexity = sum(d.get('entropy', 0) for d in developers) / len(developers) if developers else 0
+    total_meetings = sum(d.get('meetings', 0) for d in developers)
+
+    teams = {}
+    for dev in developers:
+        teams.setdefault(dev.get('team', 'Unknown'), []).append(dev)
+
+    sections = []
+    for team_name, team_devs in teams.items():
+        team_complexity = sum(d.get('entropy', 0) for d in team_devs) / len(team_devs)
+        sections.append(TEAM_SECTION.substitute(
+            team=team_name,
+            count=len(team_devs),
+            commits=sum(d.get('commits', 0) for d in team_devs),
+            complexity=f"{team_complexity:.2f}",
+            members="".join(
+                f"\n                            <li>{dev['name']} - {dev.get('commits', 0)} commits, "
+                f"{dev.get('meetings', 0)} meetings</li>"
+                for dev in team_devs
+            )
+        ))
+
+    return WEEKLY_BODY.substitute(
+        total_commits=total_commits,
+        avg_complexity=f"{avg_complexity:.2f}",
+        developer_count=len(developers),
+        total_meetings=total_meetings,
+        teams="".join(sections),
+        productivity="above" if total_commits > len(developers) * 10 else "at",
+        complexity="high technical challenges" if avg_complexity > 0.7 else "standard development work",
+        meeting_load="high" if total_meetings > len(developers) * 8 else "balanced",
+        button=BUTTONS["weekly_report"]
+    )
+
+
+def _critical_body(developers: List[Dict]) -> str:
+    items = []
+    for dev in developers:
+        if dev.get('commits', 0) == 0:
+            items.append(f"<li><strong>{dev['name']}</strong> - No commits this week</li>")
+        elif dev.get('meetings', 0) > 20:
+            items.append(f"<li><strong>{dev['name']}</strong> - Excessive meeting load ({dev['meetings']} meetings)</li>")
+    return CRITICAL_BODY.substitute(
+        issues=f"<ul>{''.join(items)}</ul>" if items else "",
+        button=BUTTONS["critical_issue"]
+    )
+
+
+BODIES = {
+    "performance_change": _performance_body,
+    "weekly_report": _weekly_body,
+    "critical_issue": _critical_body
+}
+
+
+class ReportRenderer:
+    """Renders report emails, reusing one render per company snapshot and report type"""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, report_type: str, manager_name: str, company: str, developers: List[Dict],
+               snapshot_version: Optional[int] = None) -> Tuple[str, str]:
+        """
+        Subject and HTML of a report
+
+        Renders are memoized only when snapshot_version identifies the
+        developers; the day is part of the key because reports are dated.
+        """
+        if report_type not in BODIES:
+            raise ValueError(f"Unknown report type: {report_type}")
+
+        key = None
+        if snapshot_version is not None:
+            key = (company, snapshot_version, report_type, date.today().isoformat())
+            with self._lock:
+                parts = self._cache.get(key)
+                if parts:
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    return self._assemble(parts, manager_name)
+
+        parts = self._render_parts(report_type, company, developers)
+        if key:
+            with self._lock:
+                self.misses += 1
+                self._cache[key] = parts
+                while len(self._cache) > self.max_entries:
+                    self._cache.popitem(last=False)
+        return self._assemble(parts, manager_name)
+
+    def render_test(self, manager_name: str) -> Tuple[str, str]:
+        """Subject and HTML of the configuration test email"""
+        return SUBJECTS["test"].substitute(), self._assemble((
+            SUBJECTS["test"].substitute(),
+            HEADS["test"] + HEADERS["test"].substitute() + GREETING_START,
+            GREETING_END + TEST_BODY + CONTENT_END + FOOTERS["test"].substitute(generated_at=_now())
+        ), manager_name)
+
+    def render_alerts(self, manager_name: str, company: str, events: List[Dict], critical: bool = False) -> Tuple[str, str]:
+        """Subject and HTML of an alert email listing snapshot-diff events"""
+        report_type = "critical_issue" if critical else "performance_change"
+        grouped = {}
+        for event in events:
+            grouped.setdefault(event["alert_type"], []).append(event)
+
+        sections = "".join(
+            ALERT_SECTION.substitute(
+                title=ALERT_TITLES.get(alert_type, alert_type),
+                items="".join(
+                    f"\n                        <li>{describe_alert(event)}</li>" for event in grouped[alert_type]
+                )
+            )
+            # Most serious kinds of change first
+            for alert_type in [kind for kind in ALERT_TITLES if kind in grouped]
+        )
+        body = ALERT_BODY.substitute(
+            box_class="critical" if critical else "alert",
+            headline="🚨 Critical Performance Issue Detected" if critical else "⚠️ Performance Alert Triggered",
+            count=len(events),
+            sections=sections,
+            button=BUTTONS[report_type]
+        )
+        header = HEADERS[report_type].substitute(company=company)
+        return self._assemble((
+            SUBJECTS[report_type].substitute(company=company),
+            HEADS[report_type] + header + GREETING_START,
+            GREETING_END + body + CONTENT_END + FOOTERS[report_type].substitute()
+        ), manager_name)
+
+    @staticmethod
+    def _render_parts(report_type: str, company: str, developers: List[Dict]) -> Tuple[str, str, str]:
+        """Subject plus the HTML before and after the manager's name"""
+        header = HEADERS[report_type].substitute(company=company, week=datetime.now().strftime('%B %d, %Y'))
+        footer = FOOTERS[report_type].substitute(generated_at=_now())
+        return (
+            SUBJECTS[report_type].substitute(company=company),
+            HEADS[report_type] + header + GREETING_START,
+            GREETING_END + BODIES[report_type](developers) + CONTENT_END + footer
+        )
+
+    @staticmethod
+    def _assemble(parts: Tuple[str, str, str], manager_name: str) -> Tuple[str, str]:
+        subject, before, after = parts
+        return subject, before + manager_name + after
+
+
+def _now() -> str:
+    return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
@@ -0,0 +1,159 @@
+"""
+Snapshot-diff alerts for DevLens
+Compares two persisted score snapshots of a company in one vectorized pass over
+their score columns and reports what actually changed for each developer:
+quadrant transitions, impact/visibility z-score swings, new risk factors and
+attendance drops. A company whose inputs did not change gets no new snapshot,
+so it never produces alerts.
+"""
+
+import json
+import numpy as np
+import pandas as pd
+
+QUADRANT_NAMES = {1: "Star Performer", 2: "Hidden Gem", 3: "Team Connector", 4: "Needs Support"}
+
+# A z-score move of at least this many standard deviations is a swing
+Z_SCORE_SWING = 1.0
+
+# Attendance rate drop (0..1) that raises an alert
+ATTENDANCE_DROP = 0.10
+
+# New risk factors that make an alert critical
+CRITICAL_RISK_FACTORS = {"No Code Contributions", "Critical Attendance Issue"}
+
+SCORE_COLUMNS = ["developer_id", "name", "team", "imp_z", "vis_z", "quadrant", "attendance_rate", "risk_factors"]
+
+
+def diff_snapshots(previous_rows, current_rows, z_swing=Z_SCORE_SWING, attendance_drop=ATTENDANCE_DROP):
+    """
+    Alert events between two snapshots of the same company
+
+    Developers present in only one of the snapshots are not compared.
+
+    Args:
+        previous_rows, current_rows: Score rows (SCORE_COLUMNS) of each snapshot;
+            risk_factors is the JSON list stored with the snapshot
+
+    Returns:
+        list: {developer_id, alert_type, severity, details} dicts, where
+        severity is 'info', 'warning' or 'critical'
+    """
+    previous = pd.DataFrame.from_records(previous_rows, columns=SCORE_COLUMNS)
+    current = pd.DataFrame.from_records(current_rows, columns=SCORE_COLUMNS)
+    merged = current.merge(previous, on="developer_id", suffixes=("", "_prev"))
+    if merged.empty:
+        return []
+
+    developer_ids = merged["developer_id"].to_numpy()
+    names = merged["name"].to_numpy()
+    teams = merged["team"].to_numpy()
+    events = []
+
+    def emit(mask, alert_type, severities, details):
+        for i in np.flatnonzero(mask):
+            events.append({
+                "developer_id": int(developer_ids[i]),
+                "alert_type": alert_type,
+                "severity": severities[i],
+                "details": {"name": names[i], "team": teams[i], **details(i)}
+            })
+
+    # Quadrant transitions; falling into "Needs Support" is a warning
+    quadrant = merged["quadrant"].to_numpy()
+    quadrant_prev = merged["quadrant_prev"].to_numpy()
+    emit(
+        quadrant != quadrant_prev, "quadrant_change",
+        np.where(quadrant == 4, "warning", "info"),
+        lambda i: {
+            "from": QUADRANT_NAMES.get(int(quadrant_prev[i]), str(quadrant_prev[i])),
+            "to": QUADRANT_NAMES.get(int(quadrant[i]), str(quadrant[i]))
+        }
+    )
+
+    # Z-score swings; a drop is a warning, a rise is informational
+    for column, alert_type in (("imp_z", "impact_swing"), ("vis_z", "visibility_swing")):
+        now = merged[column].to_numpy(dtype=float)
+        before = merged[f"{column}_prev"].to_numpy(dtype=float)
+        delta = now - before
+        emit(
+            np.abs(delta) >= z_swing, alert_type,
+            np.where(delta < 0, "warning", "info"),
+            lambda i, now=now, before=before, delta=delta: {
+                "from": round(float(before[i]), 2), "to": round(float(now[i]), 2), "change": round(float(delta[i]), 2)
+            }
+        )
+
+    # Attendance drops; falling below 50% is critical
+    attendance = merged["attendance_rate"].to_numpy(dtype=float)
+    attendance_prev = merged["attendance_rate_prev"].to_numpy(dtype=float)
+    emit(
+        attendance_prev - attendance >= attendance_drop, "attendance_drop",
+        np.where(attendance < 0.5, "critical", "warning"),
+        lambda i: {"from": round(float(attendance_prev[i]), 3), "to": round(float(attendance[i]), 3)}
+    )
+
+    # New risk factors: the stored JSON is compared as text first, so only
+    # developers whose list changed are decoded
+    risks = merged["risk_factors"].fillna("[]").to_numpy()
+    risks_prev = merged["risk_factors_prev"].fillna("[]").to_numpy()
+    for i in np.flatnonzero(risks != risks_prev):
+        known = set(json.loads(risks_prev[i]))
+        added = [factor for factor in json.loads(risks[i]) if factor not in known]
+        if added:
+            events.append({
+                "developer_id": int(developer_ids[i]),
+                "alert_type": "new_risk",
+                "severity": "critical" if CRITICAL_RISK_FACTORS.intersection(added) else "warning",
+                "details": {"name": names[i], "team": teams[i], "risk_factors": added}
+            })
+
+    return events
+
+
+def detect_snapshot_alerts(db, company_id):
+    """
+    Diff the company's newest snapshot against the last one alerts were computed
+    for (or its predecessor the first time) and store the resulting events
+
+    Returns:
+        int: Number of alert events found (0 when there is nothing new to compare)
+    """
+    versions = db.get_recent_snapshot_versions(company_id)
+    if not versions:
+        return 0
+
+    latest = versions[0]
+    previous = db.get_alert_diff_version(company_id)
+    if previous is None:
+        previous = versions[1] if len(versions) > 1 else None
+    if previous is None or previous >= latest:
+        if previous is None:
+            # First snapshot of the company: it becomes the baseline
+            db.record_alert_diff(company_id, latest, latest, [])
+        return 0
+
+    events = diff_snapshots(
+        db.get_snapshot_score_rows(company_id, previous),
+        db.get_snapshot_score_rows(company_id, latest)
+    )
+    db.record_alert_diff(company_id, previous, latest, events)
+    return len(events)
+
+
+def describe_alert(event):
+    """One-line description of an alert event for emails"""
+    details = event["details"]
+    who = f"{details.get('name', 'Developer')} ({details.get('team', 'Unknown')})"
+    kind = event["alert_type"]
+    if kind == "quadrant_change":
+        return f"{who} moved from {details['from']} to {details['to']}"
+    if kind == "impact_swing":
+        return f"{who} impact z-score changed from {details['from']} to {details['to']}"
+    if kind == "visibility_swing":
+        return f"{who} visibility z-score changed from {details['from']} to {details['to']}"
+    if kind == "attendance_drop":
+        return f"{who} attendance dropped from {details['from']:.0%} to {details['to']:.0%}"
+    if kind == "new_risk":
+        return f"{who} has new risk factors: {', '.join(details['risk_factors'])}"
+    return f"{who}: {kind}"
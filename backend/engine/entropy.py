@@ -0,0 +1,48 @@
+"""
+Commit entropy for DevLens
+A commit's entropy is the Shannon entropy of its changed lines across files, so
+a change spread evenly over many files scores higher than a one-file edit.
+"""
+
+import math
+
+
+def calculate_shannon_entropy(file_changes):
+    """
+    Calculate Shannon entropy based on distribution of effort across files
+    H(X) = -Σ(Pi * log2(Pi))
+    where Pi = (additions + deletions for file i) / total changes
+
+    Args:
+        file_changes (dict): File path -> changed lines
+
+    Returns:
+        float: Entropy in bits (0.0 for an empty commit)
+    """
+    total_changes = sum(file_changes.values())
+    if total_changes <= 0:
+        return 0.0
+
+    entropy = 0.0
+    for changes in file_changes.values():
+        if changes > 0:
+            pi = changes / total_changes
+            entropy -= pi * math.log2(pi)
+
+    return entropy
+
+
+def file_distribution(file_stats):
+    """
+    Changed lines per file of a commit, the file_distribution of devlens_meta
+
+    Args:
+        file_stats: Iterable of (path, additions, deletions); binary files count 0
+
+    Returns:
+        dict: File path -> additions + deletions
+    """
+    distribution = {}
+    for path, additions, deletions in file_stats:
+        distribution[path] = distribution.get(path, 0) + additions + deletions
+    return distribution
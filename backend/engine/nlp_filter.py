@@ -2,6 +2,24 @@ import re
 import json
 import numpy as np
 
+class KeywordMatcher:
+    """
+    Finds which of a fixed set of keywords occur in a text as whole words
+    (case-insensitive). All keywords are compiled into one regular expression,
+    so a text is scanned once instead of once per keyword.
+    """
+    
+    def __init__(self, keywords):
+        self.keywords = [keyword.lower() for keyword in keywords]
+        # Longest first, so a phrase wins over a keyword it starts with
+        alternation = "|".join(re.escape(keyword) for keyword in sorted(self.keywords, key=len, reverse=True))
+        self.pattern = re.compile(rf'\b(?:{alternation})\b', re.IGNORECASE)
+    
+    def find(self, text):
+        """Set of keywords present in the text"""
+        if not text: return set()
+        return {match.group(0).lower() for match in self.pattern.finditer(text)}
+
 class TechFilter:
     def __init__(self):
         self.tech_weights = {
@@ -13,6 +31,8 @@ class TechFilter:
             "optimize": 2.0, "performance": 1.8, "security": 2.2,
             "config": 1.5, "setup": 1.3, "install": 1.0, "upgrade": 1.5
         }
+        # \b ensures we match 'api' but NOT 'tapioca'
+        self.matcher = KeywordMatcher(self.tech_weights)
         
     def clean_text(self, raw_html):
         """Strips HTML and prepares text for keyword analysis."""
@@ -23,13 +43,8 @@ class TechFilter:
 
     def get_technical_score(self, text):
         """Calculates a weighted score based on keyword presence."""
-        score = 0.0
         clean = self.clean_text(text)
-        
-        for word, weight in self.tech_weights.items():
-            # \b ensures we match 'api' but NOT 'tapioca'
-            if re.search(rf'\b{word}\b', clean):
-                score += weight
+        score = sum(self.tech_weights[word] for word in self.matcher.find(clean))
                 
         if "http" in clean or "github.com" in clean:
             score += 1.5
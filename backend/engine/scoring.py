@@ -145,6 +145,26 @@ class DevLensKeywordScorer:
         
         return max(0.1, impact_score)  # Ensure minimum impact
 
+    def calculate_collaboration_impact(self, pull_requests, reviews_given, issues_created):
+        """
+        Impact added for GitHub collaboration: pull requests opened, reviews given
+        and issues filed
+        
+        Args:
+            pull_requests (int): Pull requests opened
+            reviews_given (int): Reviews submitted on others' pull requests
+            issues_created (int): Issues filed
+            
+        Returns:
+            float: Impact bonus (0 without GitHub activity)
+        """
+        # Logarithmic like commit impact; reviews weigh most as the least visible work
+        return (
+            np.log1p(pull_requests) * 0.3 +
+            np.log1p(reviews_given) * 0.4 +
+            np.log1p(issues_created) * 0.1
+        )
+
     def calculate_meeting_engagement_score(self, meetings):
         """
         Calculate meeting engagement score with optimal range detection
@@ -187,14 +207,18 @@ class DevLensKeywordScorer:
             entropy = dev.get('entropy', 0.0)
             meetings = dev.get('meetings', 0)
             messages = dev.get('msgs', [])
+            pull_requests = dev.get('pull_requests', 0)
+            reviews_given = dev.get('reviews_given', 0)
+            issues_created = dev.get('issues_created', 0)
             
             # Calculate visibility from communication using NLP analysis (including meeting hours)
             meeting_hours = meetings * 1.5  # Assume 1.5 hours per meeting on average
             visibility_analysis = self.get_visibility_weight_from_messages(messages, meeting_hours)
             visibility_weight = visibility_analysis['visibility_score']
             
-            # Calculate impact from commits and entropy
-            impact_score = self.calculate_sophisticated_impact_from_commits(commits, entropy)
+            # Calculate impact from commits and entropy, plus GitHub collaboration
+            collaboration_impact = self.calculate_collaboration_impact(pull_requests, reviews_given, issues_created)
+            impact_score = self.calculate_sophisticated_impact_from_commits(commits, entropy) + collaboration_impact
             
             # Calculate meeting engagement
             meeting_data = self.calculate_meeting_engagement_score(meetings)
@@ -206,6 +230,10 @@ class DevLensKeywordScorer:
                 'avg_entropy_per_commit': entropy / max(1, commits),
                 'total_meetings': meetings,
                 'total_messages': len(messages),
+                'pull_requests': pull_requests,
+                'reviews_given': reviews_given,
+                'issues_created': issues_created,
+                'collaboration_impact': collaboration_impact,
                 'sophisticated_impact': impact_score,
                 'meeting_engagement': meeting_data["score"],
                 'meeting_quality': meeting_data["quality"],
@@ -316,13 +344,177 @@ class DevLensKeywordScorer:
         
         return team_info
 
-def process_metrics(developers):
+def apply_activity_window(developers, window):
+    """
+    Replace cumulative totals with range sums over each developer's daily rollups
+    
+    Args:
+        developers (list): Developer dictionaries carrying 'daily_activity' and
+            'daily_messages' lists
+        window (tuple): Inclusive (start_date, end_date) as ISO dates or date objects
+        
+    Returns:
+        list: Copies of the developers with commits, entropy, meetings, GitHub
+            activity and the messages (msgs) of the window
+    """
+    start_date, end_date = (str(bound) for bound in window)
+    
+    windowed_developers = []
+    for dev in developers:
+        windowed_dev = dev.copy()
+        days = [
+            day for day in windowed_dev.pop('daily_activity', [])
+            if start_date <= day['activity_date'] <= end_date
+        ]
+        
+        # Ingested and GitHub-synced commits describe the same work: a day counts
+        # whichever source saw more
+        windowed_dev['commits'] = sum(max(day['commits'], day.get('github_commits', 0)) for day in days)
+        windowed_dev['entropy'] = sum(day['entropy_sum'] for day in days)
+        windowed_dev['meetings'] = sum(day['meetings'] for day in days)
+        windowed_dev['message_count'] = sum(day['messages'] for day in days)
+        for column in ('pull_requests', 'reviews_given', 'issues_created'):
+            windowed_dev[column] = sum(day.get(column, 0) for day in days)
+        windowed_dev['msgs'] = [
+            message['content'] for message in windowed_dev.pop('daily_messages', [])
+            if start_date <= message['activity_date'] <= end_date
+        ]
+        windowed_dev['active_days'] = len(days)
+        
+        windowed_developers.append(windowed_dev)
+    
+    return windowed_developers
+
+def classify_developer(dev, impact_median, visibility_median, impact_std, visibility_std):
+    """
+    Place an attendance-adjusted developer against company medians and spreads
+    
+    Args:
+        dev (dict): Developer carrying the adjusted scores built by process_metrics
+        impact_median (float): Company median of adjusted technical impact
+        visibility_median (float): Company median of adjusted visibility
+        impact_std (float): Company standard deviation of adjusted impact (non-zero)
+        visibility_std (float): Company standard deviation of adjusted visibility (non-zero)
+        
+    Returns:
+        dict: The same developer, updated with quadrant, z-scores and risk assessment
+    """
+    impact = dev['adjusted_technical_impact']
+    visibility = dev['adjusted_visibility_score']
+    attendance = dev['attendance_rate']
+    
+    # Determine quadrant based on median thresholds
+    if impact >= impact_median and visibility >= visibility_median:
+        quadrant = 1  # High Impact, High Visibility - "Stars"
+        archetype = "Star Performer"
+    elif impact >= impact_median and visibility < visibility_median:
+        quadrant = 2  # High Impact, Low Visibility - "Hidden Gems"
+        archetype = "Hidden Gem"
+    elif impact < impact_median and visibility >= visibility_median:
+        quadrant = 3  # Low Impact, High Visibility - "Communicators"
+        archetype = "Team Connector"
+    else:
+        quadrant = 4  # Low Impact, Low Visibility - "Needs Support"
+        archetype = "Needs Support"
+    
+    # Hidden Gem criteria: Quadrant 2 AND good attendance (>= 75%)
+    is_hidden_gem = (quadrant == 2 and attendance >= 0.75)
+    
+    print(f"Debug: {dev['name']} - Impact: {impact:.2f}, Visibility: {visibility:.2f}, Quadrant: {quadrant}, Hidden Gem: {is_hidden_gem}")
+    
+    # 6. Additional attendance-based risk factors
+    risk_factors = []
+    if dev['commits'] == 0:
+        risk_factors.append("No Code Contributions")
+    if dev['comm_score'] == 0:
+        risk_factors.append("No Communication")
+    if dev['meetings'] == 0:
+        risk_factors.append("No Meeting Attendance")
+    if dev['commits'] > 0 and dev['entropy'] / dev['commits'] < 0.1:
+        risk_factors.append("Potential Micro-commits")
+    if dev['meetings'] > 30:
+        risk_factors.append("Meeting Overload")
+    
+    # ATTENDANCE-SPECIFIC RISK FACTORS
+    if attendance < 0.5:
+        risk_factors.append("Critical Attendance Issue")
+    elif attendance < 0.7:
+        risk_factors.append("Poor Attendance")
+    elif attendance < 0.8:
+        risk_factors.append("Below Average Attendance")
+    
+    # Calculate additional metrics
+    entropy_per_commit = dev['entropy'] / max(1, dev['commits'])
+    commits_per_meeting = dev['commits'] / max(1, dev['meetings'])
+    communication_efficiency = dev['comm_score'] / max(1, dev['meetings'])
+    
+    # Update developer with all calculated metrics
+    dev.update({
+        # Core scores (now attendance-adjusted)
+        'impact_score': round(impact, 2),
+        'visibility_score': round(visibility, 2),
+        'overall_performance_score': round(dev['overall_performance_score'], 2),
+        
+        # Original scores (for reference)
+        'raw_technical_impact': round(dev['raw_technical_impact'], 2),
+        'raw_visibility_score': round(dev['raw_visibility_score'], 2),
+        
+        # Attendance metrics
+        'attendance_factor': round(dev['attendance_factor'], 3),
+        'attendance_penalty': round(dev['attendance_penalty'], 3),
+        
+        # Sophisticated metrics
+        'technical_impact': round(impact, 2),
+        'communication_impact': round(dev['comm_score'] * 1.5, 2),
+        'meeting_score': round(0, 2),  # Placeholder
+        
+        # Quality indicators
+        'entropy_per_commit': round(entropy_per_commit, 3),
+        'meeting_quality': 'Unknown',
+        
+        # Performance metrics
+        'archetype': archetype,
+        'commits_per_meeting': round(commits_per_meeting, 2),
+        'communication_efficiency': round(communication_efficiency, 2),
+        
+        # Risk assessment (now includes attendance risks)
+        'risk_factors': risk_factors,
+        'risk_level': 'High' if len(risk_factors) >= 3 else 'Medium' if len(risk_factors) >= 2 else 'Low',
+        
+        # Quadrant positioning (for scatter plot) - using adjusted scores
+        'imp_z': (impact - impact_median) / impact_std,  # Z-score for plot
+        'vis_z': (visibility - visibility_median) / visibility_std,
+        'raw_impact': impact,  # Use adjusted scores for quadrant calculation
+        'raw_visibility': visibility,
+        
+        # Quadrant classification
+        'quadrant': quadrant,
+        'quadrant_name': archetype,
+        'is_hidden_gem': is_hidden_gem,  # This is the key field for frontend
+        
+        # Detailed quadrant description
+        'quadrant_description': (
+            "High Impact, High Visibility - Star performers who deliver results and communicate well"
+            if quadrant == 1 else
+            "High Impact, Low Visibility - Hidden gems who deliver great work but need more recognition"
+            if quadrant == 2 else
+            "Low Impact, High Visibility - Great communicators who could focus more on technical delivery"
+            if quadrant == 3 else
+            "Low Impact, Low Visibility - Team members who need support and development"
+        )
+    })
+    
+    return dev
+
+def process_metrics(developers, window=None):
     """
     Advanced processing of developer metrics using sophisticated scoring algorithms
     Now includes attendance as a critical performance factor
     
     Args:
         developers (list): List of developer dictionaries from database
+        window (tuple, optional): Inclusive (start_date, end_date); when given, commits,
+            entropy, meetings and messages are taken from the developers' daily rollups
         
     Returns:
         list: Processed developers with calculated scores, quadrant classifications, and metrics
@@ -330,6 +522,9 @@ def process_metrics(developers):
     if not developers:
         return []
     
+    if window:
+        developers = apply_activity_window(developers, window)
+    
     # Initialize the scorer with database data
     scorer = DevLensKeywordScorer(developers)
     
@@ -425,112 +620,12 @@ def process_metrics(developers):
         
         print(f"Debug: Impact median = {impact_median:.2f}, Visibility median = {visibility_median:.2f}")
         
+        impact_std = np.std(impact_scores) or 1.0
+        visibility_std = np.std(visibility_scores) or 1.0
+        
         # Assign quadrants to each developer
         for dev in processed_developers:
-            impact = dev['adjusted_technical_impact']
-            visibility = dev['adjusted_visibility_score']
-            attendance = dev['attendance_rate']
-            
-            # Determine quadrant based on median thresholds
-            if impact >= impact_median and visibility >= visibility_median:
-                quadrant = 1  # High Impact, High Visibility - "Stars"
-                archetype = "Star Performer"
-            elif impact >= impact_median and visibility < visibility_median:
-                quadrant = 2  # High Impact, Low Visibility - "Hidden Gems"
-                archetype = "Hidden Gem"
-            elif impact < impact_median and visibility >= visibility_median:
-                quadrant = 3  # Low Impact, High Visibility - "Communicators"
-                archetype = "Team Connector"
-            else:
-                quadrant = 4  # Low Impact, Low Visibility - "Needs Support"
-                archetype = "Needs Support"
-            
-            # Hidden Gem criteria: Quadrant 2 AND good attendance (>= 75%)
-            is_hidden_gem = (quadrant == 2 and attendance >= 0.75)
-            
-            print(f"Debug: {dev['name']} - Impact: {impact:.2f}, Visibility: {visibility:.2f}, Quadrant: {quadrant}, Hidden Gem: {is_hidden_gem}")
-            
-            # 6. Additional attendance-based risk factors
-            risk_factors = []
-            if dev['commits'] == 0:
-                risk_factors.append("No Code Contributions")
-            if dev['comm_score'] == 0:
-                risk_factors.append("No Communication")
-            if dev['meetings'] == 0:
-                risk_factors.append("No Meeting Attendance")
-            if dev['commits'] > 0 and dev['entropy'] / dev['commits'] < 0.1:
-                risk_factors.append("Potential Micro-commits")
-            if dev['meetings'] > 30:
-                risk_factors.append("Meeting Overload")
-            
-            # ATTENDANCE-SPECIFIC RISK FACTORS
-            if attendance < 0.5:
-                risk_factors.append("Critical Attendance Issue")
-            elif attendance < 0.7:
-                risk_factors.append("Poor Attendance")
-            elif attendance < 0.8:
-                risk_factors.append("Below Average Attendance")
-            
-            # Calculate additional metrics
-            entropy_per_commit = dev['entropy'] / max(1, dev['commits'])
-            commits_per_meeting = dev['commits'] / max(1, dev['meetings'])
-            communication_efficiency = dev['comm_score'] / max(1, dev['meetings'])
-            
-            # Update developer with all calculated metrics
-            dev.update({
-                # Core scores (now attendance-adjusted)
-                'impact_score': round(impact, 2),
-                'visibility_score': round(visibility, 2),
-                'overall_performance_score': round(dev['overall_performance_score'], 2),
-                
-                # Original scores (for reference)
-                'raw_technical_impact': round(dev['raw_technical_impact'], 2),
-                'raw_visibility_score': round(dev['raw_visibility_score'], 2),
-                
-                # Attendance metrics
-                'attendance_factor': round(dev['attendance_factor'], 3),
-                'attendance_penalty': round(dev['attendance_penalty'], 3),
-                
-                # Sophisticated metrics
-                'technical_impact': round(impact, 2),
-                'communication_impact': round(dev['comm_score'] * 1.5, 2),
-                'meeting_score': round(0, 2),  # Placeholder
-                
-                # Quality indicators
-                'entropy_per_commit': round(entropy_per_commit, 3),
-                'meeting_quality': 'Unknown',
-                
-                # Performance metrics
-                'archetype': archetype,
-                'commits_per_meeting': round(commits_per_meeting, 2),
-                'communication_efficiency': round(communication_efficiency, 2),
-                
-                # Risk assessment (now includes attendance risks)
-                'risk_factors': risk_factors,
-                'risk_level': 'High' if len(risk_factors) >= 3 else 'Medium' if len(risk_factors) >= 2 else 'Low',
-                
-                # Quadrant positioning (for scatter plot) - using adjusted scores
-                'imp_z': (impact - impact_median) / (np.std(impact_scores) or 1.0),  # Z-score for plot
-                'vis_z': (visibility - visibility_median) / (np.std(visibility_scores) or 1.0),
-                'raw_impact': impact,  # Use adjusted scores for quadrant calculation
-                'raw_visibility': visibility,
-                
-                # Quadrant classification
-                'quadrant': quadrant,
-                'quadrant_name': archetype,
-                'is_hidden_gem': is_hidden_gem,  # This is the key field for frontend
-                
-                # Detailed quadrant description
-                'quadrant_description': (
-                    "High Impact, High Visibility - Star performers who deliver results and communicate well"
-                    if quadrant == 1 else
-                    "High Impact, Low Visibility - Hidden gems who deliver great work but need more recognition"
-                    if quadrant == 2 else
-                    "Low Impact, High Visibility - Great communicators who could focus more on technical delivery"
-                    if quadrant == 3 else
-                    "Low Impact, Low Visibility - Team members who need support and development"
-                )
-            })
+            classify_developer(dev, impact_median, visibility_median, impact_std, visibility_std)
     else:
         # Single developer case
         dev = processed_developers[0]
@@ -0,0 +1,276 @@
+"""
+Company score snapshots for DevLens
+Runs the full scoring pipeline (communication score, process_metrics, attendance)
+once per change in the underlying data and persists the result, so dashboards
+read materialized scores instead of re-scoring the company on every request.
+"""
+
+import hashlib
+import json
+import os
+import numpy as np
+from .alerts import detect_snapshot_alerts
+from .nlp_filter import analyze_communication
+from .scoring import apply_activity_window, classify_developer, process_metrics
+
+ATTENDANCE_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "activity_based_metrics.json"
+)
+
+def load_attendance_data(path=ATTENDANCE_FILE):
+    """Load activity-based attendance metrics keyed by developer name"""
+    attendance_data = {}
+    try:
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                for att in json.load(f):
+                    attendance_data[att['name']] = att
+    except Exception as e:
+        print(f"Could not load attendance data: {e}")
+
+    return attendance_data
+
+def attach_attendance(processed_data, attendance_data):
+    """Add attendance fields to scored developers (85% default when unknown)"""
+    for dev in processed_data:
+        if dev['name'] in attendance_data:
+            att_info = attendance_data[dev['name']]
+            dev['attendance_rate'] = att_info['attendance_metrics']['attendance_rate']
+            dev['days_present'] = att_info['attendance_metrics']['days_present']
+            dev['total_work_days'] = att_info['attendance_metrics']['total_work_days']
+            dev['behavioral_summary'] = att_info.get('behavioral_summary', {})
+        else:
+            # Default attendance if not found
+            dev['attendance_rate'] = 0.85  # Default 85%
+            dev['days_present'] = 17
+            dev['total_work_days'] = 20
+            dev['behavioral_summary'] = {}
+
+    return processed_data
+
+def score_developers(developers, window=None, attendance_data=None):
+    """Run the complete scoring pipeline over a company's developers"""
+    # Window first so comm_score and visibility see only the window's messages
+    if window:
+        developers = apply_activity_window(developers, window)
+
+    for dev in developers:
+        dev["comm_score"] = analyze_communication(dev["msgs"])
+
+    processed_data = process_metrics(developers)
+
+    if attendance_data is None:
+        attendance_data = load_attendance_data()
+
+    return attach_attendance(processed_data, attendance_data)
+
+def snapshot_stats(processed_data):
+    """Medians and standard deviations that the z-scores were computed against"""
+    if len(processed_data) < 2:
+        return {"impact_median": 0.0, "visibility_median": 0.0, "impact_std": 1.0, "visibility_std": 1.0}
+
+    impacts = [dev['raw_impact'] for dev in processed_data]
+    visibilities = [dev['raw_visibility'] for dev in processed_data]
+
+    return {
+        "impact_median": float(np.median(impacts)),
+        "visibility_median": float(np.median(visibilities)),
+        "impact_std": float(np.std(impacts) or 1.0),
+        "visibility_std": float(np.std(visibilities) or 1.0)
+    }
+
+def compute_fingerprint(developers, attendance_data):
+    """Hash of every scoring input, used to decide whether a snapshot is stale"""
+    digest = hashlib.sha256()
+    for dev in sorted(developers, key=lambda d: d['id']):
+        digest.update(json.dumps(
+            [dev['id'], dev['name'], dev['team'], dev['commits'], dev['entropy'], dev['meetings'], dev['msgs'],
+             dev['pull_requests'], dev['reviews_given'], dev['issues_created']]
+        ).encode())
+    digest.update(json.dumps(attendance_data, sort_keys=True).encode())
+    return digest.hexdigest()
+
+def get_company_snapshot(db, company_name, window=None):
+    """
+    Get scored developers for a company, reusing the latest persisted snapshot
+    when the inputs have not changed since it was written
+
+    Windowed views are scored on demand and not persisted; the snapshot history
+    tracks the full-range scores.
+
+    Returns:
+        dict: company_id, snapshot_version (None for windowed views), stats, developers
+              or None if the company has no developers
+    """
+    developers = db.get_company_developers(company_name, window)
+    if not developers:
+        return None
+
+    attendance_data = load_attendance_data()
+
+    if window:
+        processed_data = score_developers(developers, window, attendance_data)
+        return {
+            "company_id": None,
+            "snapshot_version": None,
+            "stats": snapshot_stats(processed_data),
+            "developers": processed_data
+        }
+
+    company = db.get_company_by_name(company_name)
+    company_id = company["id"]
+    fingerprint = compute_fingerprint(developers, attendance_data)
+
+    latest = db.get_latest_score_snapshot(company_id)
+    if latest and latest["source_fingerprint"] == fingerprint:
+        return {
+            "company_id": company_id,
+            "snapshot_version": latest["snapshot_version"],
+            "stats": {
+                "impact_median": latest["impact_median"],
+                "visibility_median": latest["visibility_median"],
+                "impact_std": latest["impact_std"],
+                "visibility_std": latest["visibility_std"]
+            },
+            "developers": db.get_developer_scores(company_id, latest["snapshot_version"])
+        }
+
+    processed_data = score_developers(developers, attendance_data=attendance_data)
+    stats = snapshot_stats(processed_data)
+
+    try:
+        snapshot_version = db.save_score_snapshot(company_id, fingerprint, processed_data, stats)
+    except db.backend.IntegrityError:
+        # Another worker persisted the same version first; serve what it wrote
+        latest = db.get_latest_score_snapshot(company_id)
+        snapshot_version = latest["snapshot_version"]
+    else:
+        # A new snapshot means the inputs changed: record what changed for alerts
+        try:
+            detect_snapshot_alerts(db, company_id)
+        except Exception as e:
+            print(f"Could not compute snapshot alerts: {e}")
+
+    return {
+        "company_id": company_id,
+        "snapshot_version": snapshot_version,
+        "stats": stats,
+        "developers": processed_data
+    }
+
+def get_hidden_gems(db, company_name, window=None):
+    """
+    Get a company's Hidden Gems, best impact first
+
+    Reads only the hidden-gem rows of the latest persisted snapshot with an
+    indexed query instead of re-scoring the company; the snapshot is rebuilt
+    first if it is missing or its inputs have changed. Windowed views are
+    scored on demand.
+
+    Returns:
+        dict: snapshot_version, total_developers, hidden_gems
+              or None if the company has no developers
+    """
+    if window:
+        snapshot = get_company_snapshot(db, company_name, window)
+        if not snapshot:
+            return None
+        hidden_gems = [dev for dev in snapshot["developers"] if dev.get("is_hidden_gem", False)]
+        total_developers = len(snapshot["developers"])
+        snapshot_version = None
+    else:
+        company = db.get_company_by_name(company_name)
+        if not company:
+            return None
+        developers = db.get_company_developers(company_name)
+        if not developers:
+            return None
+        fingerprint = compute_fingerprint(developers, load_attendance_data())
+        latest = db.get_latest_score_snapshot(company["id"])
+        if not latest or latest["source_fingerprint"] != fingerprint:
+            # Same staleness check as the dashboard, so both serve one snapshot
+            get_company_snapshot(db, company_name)
+            latest = db.get_latest_score_snapshot(company["id"])
+        hidden_gems = db.get_developer_scores(company["id"], latest["snapshot_version"], hidden_gems_only=True)
+        total_developers = latest["developer_count"]
+        snapshot_version = latest["snapshot_version"]
+
+    hidden_gems.sort(key=lambda dev: dev.get("raw_impact", 0), reverse=True)
+    return {
+        "snapshot_version": snapshot_version,
+        "total_developers": total_developers,
+        "hidden_gems": hidden_gems
+    }
+
+def score_developer_against_snapshot(developer, stats, attendance_data=None):
+    """
+    Score one developer and place them against a stored company snapshot
+
+    Quadrant and z-scores use the snapshot's medians and standard deviations, so a
+    single profile is scored without re-scoring the rest of the company.
+    """
+    developer["comm_score"] = analyze_communication(developer["msgs"])
+    processed_dev = process_metrics([developer])[0]
+    classify_developer(
+        processed_dev,
+        stats["impact_median"],
+        stats["visibility_median"],
+        stats["impact_std"],
+        stats["visibility_std"]
+    )
+
+    if attendance_data is None:
+        attendance_data = load_attendance_data()
+
+    return attach_attendance([processed_dev], attendance_data)[0]
+
+def _same_inputs(scored_dev, developer):
+    """Whether a stored score was computed from the developer's current metrics"""
+    return all(
+        scored_dev.get(key) == developer[key]
+        for key in ("commits", "entropy", "meetings", "msgs", "pull_requests", "reviews_given", "issues_created")
+    )
+
+def get_developer_profile(db, developer_id):
+    """
+    Get one developer's scores without re-scoring their company
+
+    Serves the developer's latest materialized score when their metrics have not
+    changed since it was written; otherwise scores only this developer against
+    the stored snapshot stats. A company without any snapshot is scored once.
+
+    Returns:
+        dict: company_id, company, snapshot_version, stats, developer
+              or None if the developer does not exist
+    """
+    developer = db.get_developer(developer_id)
+    if not developer:
+        return None
+
+    company_id = developer.pop("company_id")
+    company_name = developer.pop("company")
+
+    cached = db.get_latest_developer_score(developer_id)
+    if cached is None:
+        snapshot = get_company_snapshot(db, company_name)
+        scored_dev = next((dev for dev in snapshot["developers"] if dev["id"] == developer_id), None)
+        return {
+            "company_id": company_id,
+            "company": company_name,
+            "snapshot_version": snapshot["snapshot_version"],
+            "stats": snapshot["stats"],
+            "developer": scored_dev
+        }
+
+    if _same_inputs(cached["developer"], developer):
+        scored_dev = cached["developer"]
+    else:
+        scored_dev = score_developer_against_snapshot(developer, cached["stats"])
+
+    return {
+        "company_id": company_id,
+        "company": company_name,
+        "snapshot_version": cached["snapshot_version"],
+        "stats": cached["stats"],
+        "developer": scored_dev
+    }
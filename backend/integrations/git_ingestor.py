@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Local git repository ingestor for DevLens
+Streams `git log --numstat` from local clones, computes each commit's
+file_distribution and Shannon entropy (the devlens_meta of the exec data) and
+adds commit counts and entropy per author to DevLensDB.
+
+Each repository is read in its own worker process and reduced to per-author
+daily totals there, so only small aggregates cross process boundaries. The
+parent writes one repository at a time together with its new last SHA, and the
+next run only reads commits after that SHA.
+"""
+
+import multiprocessing
+import os
+import subprocess
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from engine.entropy import calculate_shannon_entropy, file_distribution
+
+# Commit header line: unit separator, then SHA, author email, name and ISO date
+# (numstat lines start with a digit or "-", so the separator marks headers)
+GIT_LOG_FORMAT = "%x1f%H%x1f%aE%x1f%aN%x1f%aI"
+
+
+def git_log_command(repo_path: str, head_sha: str, since_sha: Optional[str] = None) -> List[str]:
+    """git log invocation for the commits reachable from head_sha but not since_sha"""
+    revision = f"{since_sha}..{head_sha}" if since_sha else head_sha
+    return [
+        "git", "-C", repo_path, "-c", "core.quotepath=off", "log",
+        "--numstat", "--no-merges", "--no-renames", f"--format={GIT_LOG_FORMAT}", revision
+    ]
+
+
+def _build_commit(header: List[str], files: List[Tuple[str, int, int]]) -> Dict:
+    sha, email, name, date = header
+    distribution = file_distribution(files)
+    return {
+        "sha": sha,
+        "commit": {"author": {"name": name, "email": email, "date": date}},
+        "devlens_meta": {
+            "files_changed": len(distribution),
+            "file_distribution": distribution,
+            "stats": {
+                "additions": sum(additions for _, additions, _ in files),
+                "deletions": sum(deletions for _, _, deletions in files),
+                "total_entropy": calculate_shannon_entropy(distribution)
+            }
+        }
+    }
+
+
+def parse_git_log(lines: Iterable[str]) -> Iterator[Dict]:
+    """
+    Commits from `git log --numstat --format=GIT_LOG_FORMAT` output, one at a time
+
+    Each commit has the shape of the exec data commits: sha, commit.author and
+    devlens_meta with files_changed, file_distribution and stats.
+    """
+    header = None
+    files = []
+
+    for line in lines:
+        if line.startswith("\x1f"):
+            if header:
+                yield _build_commit(header, files)
+            header = line[1:].rstrip("\n").split("\x1f")
+            files = []
+        elif header and line.strip():
+            additions, deletions, path = line.rstrip("\n").split("\t", 2)
+            # Binary files are listed as "-\t-\tpath"
+            files.append((
+                path,
+                int(additions) if additions != "-" else 0,
+                int(deletions) if deletions != "-" else 0
+            ))
+
+    if header:
+        yield _build_commit(header, files)
+
+
+def _git(repo_path: str, *args: str) -> str:
+    result = subprocess.run(["git", "-C", repo_path, *args], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"git {' '.join(args)} failed")
+    return result.stdout.strip()
+
+
+def ingest_repository(repo_path: str, since_sha: Optional[str] = None, ref: str = "HEAD") -> Dict:
+    """
+    Per-author daily commit counts and entropy for the new commits of a repository
+
+    Returns:
+        dict: head (SHA read up to), commits, authors ({email: name}) and
+        days ({(email, YYYY-MM-DD): [commits, entropy_sum]})
+    """
+    head_sha = _git(repo_path, "rev-parse", "--verify", f"{ref}^{{commit}}")
+    result = {"head": head_sha, "commits": 0, "authors": {}, "days": {}}
+    if since_sha == head_sha:
+        return result
+    if since_sha:
+        try:
+            _git(repo_path, "cat-file", "-e", f"{since_sha}^{{commit}}")
+        except RuntimeError:
+            raise RuntimeError(f"last ingested commit {since_sha} is no longer in the repository")
+
+    process = subprocess.Popen(
+        git_log_command(repo_path, head_sha, since_sha),
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, encoding="utf-8", errors="replace",
+        bufsize=1 << 20
+    )
+    authors = result["authors"]
+    days = result["days"]
+    for commit in parse_git_log(process.stdout):
+        author = commit["commit"]["author"]
+        email = author["email"].lower()
+        authors.setdefault(email, author["name"])
+        day = days.setdefault((email, author["date"][:10]), [0, 0.0])
+        day[0] += 1
+        day[1] += commit["devlens_meta"]["stats"]["total_entropy"]
+        result["commits"] += 1
+
+    stderr = process.stderr.read()
+    if process.wait() != 0:
+        raise RuntimeError(stderr.strip() or "git log failed")
+    return result
+
+
+def _ingest_task(task: Tuple[str, Optional[str], str]):
+    """Worker entry point: never raises, so one bad repository does not stop the pool"""
+    repo_path, since_sha, ref = task
+    try:
+        return repo_path, ingest_repository(repo_path, since_sha, ref), None
+    except Exception as e:
+        return repo_path, None, str(e)
+
+
+class GitIngestor:
+    def __init__(self, db, company_id: int, workers: Optional[int] = None, ref: str = "HEAD"):
+        """
+        Args:
+            db: DevLensDB receiving commit counts and entropy
+            company_id: DevLens company whose developers the authors map to
+            workers: Worker processes (default: one per CPU, at most one per repository)
+            ref: Branch or ref to ingest in every repository
+        """
+        self.db = db
+        self.company_id = company_id
+        self.workers = workers or os.cpu_count() or 1
+        self.ref = ref
+
+    def run(self, repo_paths: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Ingest the new commits of every repository
+
+        Returns:
+            dict: repository path -> {'commits', 'authors', 'unmapped', 'head'} or {'error'}
+        """
+        tasks = []
+        for repo_path in repo_paths:
+            repo = os.path.realpath(repo_path)
+            tasks.append((repo, self.db.get_git_ingest_state(repo), self.ref))
+        if not tasks:
+            return {}
+
+        summary = {}
+        with multiprocessing.Pool(min(self.workers, len(tasks))) as pool:
+            for repo, result, error in pool.imap_unordered(_ingest_task, tasks):
+                if error:
+                    print(f"❌ {repo}: {error}")
+                    summary[repo] = {"error": error}
+                    continue
+
+                mapping = self.db.map_git_authors(self.company_id, result["authors"]) if result["authors"] else {}
+                self.db.apply_git_ingest(
+                    repo, result["head"], result["commits"], self.company_id, result["days"], mapping
+                )
+
+                unmapped = sorted(email for email, developer_id in mapping.items() if developer_id is None)
+                summary[repo] = {
+                    "commits": result["commits"],
+                    "authors": len(result["authors"]),
+                    "unmapped": unmapped,
+                    "head": result["head"]
+                }
+                print(f"✅ {repo}: {result['commits']} new commits from {len(result['authors'])} authors"
+                      f"{f' ({len(unmapped)} unmapped)' if unmapped else ''}")
+
+        return summary
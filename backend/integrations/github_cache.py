@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Local caches for GitHub data
+ReviewCountCache and ReviewLatencyCache remember per-PR results together with
+the PR's updated_at, so a PR that has not changed is never fetched again.
+HTTPResponseCache keeps GET responses with their ETag/Last-Modified validators,
+so expired entries are revalidated with conditional requests (a 304 does not
+count against the rate limit).
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, Optional, Tuple
+
+DEFAULT_CACHE_PATH = os.environ.get("DEVLENS_GITHUB_CACHE", "github_cache.db")
+
+# Seconds a response is served without revalidation, by path prefix (longest match wins)
+DEFAULT_TTLS = {
+    '/search/': 300,
+    '/repos/': 900,
+    '/orgs/': 3600,
+    '': 300
+}
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Response headers needed to rebuild a cached response (Link drives pagination)
+CACHED_HEADERS = ['content-type', 'etag', 'last-modified', 'link']
+
+# Keeps "(repo = ? AND number = ?) OR ..." lookups under SQLite's variable limit
+LOOKUP_CHUNK = 400
+
+
+class _PullRequestCache:
+    """Values per (repository, PR number), valid while the PR's updated_at is unchanged"""
+
+    table = None
+    value_column = None
+    value_type = None
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(f'''
+            CREATE TABLE IF NOT EXISTS {self.table} (
+                repo TEXT NOT NULL,
+                number INTEGER NOT NULL,
+                updated_at TEXT NOT NULL,
+                {self.value_column} {self.value_type} NOT NULL,
+                PRIMARY KEY (repo, number)
+            )
+        ''')
+        self._conn.commit()
+
+    def _decode(self, value):
+        return value
+
+    def _encode(self, value):
+        return value
+
+    def get_many(self, keys: Iterable[Tuple[str, int, str]]) -> Dict[Tuple[str, int], object]:
+        """
+        Cached values for (repo, number, updated_at) keys
+
+        Returns:
+            dict: (repo, number) -> value for PRs cached at that updated_at
+        """
+        keys = list(keys)
+        wanted = {(repo, number): updated_at for repo, number, updated_at in keys}
+        found = {}
+
+        for i in range(0, len(keys), LOOKUP_CHUNK):
+            chunk = keys[i:i + LOOKUP_CHUNK]
+            condition = " OR ".join(["(repo = ? AND number = ?)"] * len(chunk))
+            params = [value for repo, number, _ in chunk for value in (repo, number)]
+            rows = self._conn.execute(
+                f"SELECT repo, number, updated_at, {self.value_column} FROM {self.table} WHERE {condition}",
+                params
+            )
+            for repo, number, updated_at, value in rows:
+                if wanted.get((repo, number)) == updated_at:
+                    found[(repo, number)] = self._decode(value)
+
+        return found
+
+    def put_many(self, rows: Iterable[Tuple[str, int, str, object]]):
+        """Store (repo, number, updated_at, value) rows, replacing older entries"""
+        self._conn.executemany(f'''
+            INSERT INTO {self.table} (repo, number, updated_at, {self.value_column})
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (repo, number) DO UPDATE SET
+                updated_at = excluded.updated_at,
+                {self.value_column} = excluded.{self.value_column}
+        ''', [(repo, number, updated_at, self._encode(value)) for repo, number, updated_at, value in rows])
+        self._conn.commit()
+
+    def close(self):
+        self._conn.close()
+
+
+class ReviewCountCache(_PullRequestCache):
+    """Review counts per (repository, PR number), valid while updated_at is unchanged"""
+
+    table = "pr_review_counts"
+    value_column = "review_count"
+    value_type = "INTEGER"
+
+
+class ReviewLatencyCache(_PullRequestCache):
+    """Review request latencies per PR as {reviewer login: [hours]}, valid while updated_at is unchanged"""
+
+    table = "pr_review_latencies"
+    value_column = "latencies"
+    value_type = "TEXT"
+
+    def _decode(self, value):
+        return json.loads(value)
+
+    def _encode(self, value):
+        return json.dumps(value)
+
+
+class CachedResponse:
+    def __init__(self, row):
+        self.key, self.status, headers, self.body, self.stored_at = row
+        self.headers = json.loads(headers)
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get('etag')
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get('last-modified')
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.stored_at < ttl
+
+
+class HTTPResponseCache:
+    """
+    On-disk cache of GitHub GET responses with least-recently-used eviction
+
+    Keys combine the full request URL with a hash of the token, because GitHub
+    answers differently depending on what the token can see.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES,
+                 ttls: Optional[Dict[str, float]] = None):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS http_cache (
+                key TEXT PRIMARY KEY,
+                status INTEGER NOT NULL,
+                headers TEXT NOT NULL,
+                body BLOB NOT NULL,
+                stored_at REAL NOT NULL,
+                last_used REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        ''')
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_http_cache_last_used ON http_cache (last_used)")
+        self._conn.commit()
+        self.total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+
+    @staticmethod
+    def key(url: str, token: str) -> str:
+        token_hash = hashlib.sha256(token.encode()).hexdigest()[:16]
+        return hashlib.sha256(f"{token_hash} {url}".encode()).hexdigest()
+
+    def ttl_for(self, path: str) -> float:
+        prefix = max((prefix for prefix in self.ttls if path.startswith(prefix)), key=len)
+        return self.ttls[prefix]
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        row = self._conn.execute(
+            "SELECT key, status, headers, body, stored_at FROM http_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if not row:
+            return None
+
+        self._conn.execute("UPDATE http_cache SET last_used = ? WHERE key = ?", (time.time(), key))
+        self._conn.commit()
+        return CachedResponse(row)
+
+    def put(self, key: str, status: int, headers: Dict[str, str], body: bytes):
+        headers = {name: headers[name] for name in CACHED_HEADERS if name in headers}
+        now = time.time()
+
+        previous = self._conn.execute("SELECT size FROM http_cache WHERE key = ?", (key,)).fetchone()
+        self._conn.execute('''
+            INSERT INTO http_cache (key, status, headers, body, stored_at, last_used, size)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (key) DO UPDATE SET
+                status = excluded.status,
+                headers = excluded.headers,
+                body = excluded.body,
+                stored_at = excluded.stored_at,
+                last_used = excluded.last_used,
+                size = excluded.size
+        ''', (key, status, json.dumps(headers), body, now, now, len(body)))
+        self.total_bytes += len(body) - (previous[0] if previous else 0)
+
+        self._evict()
+        self._conn.commit()
+
+    def refresh(self, key: str):
+        """Mark a revalidated (304) entry as fresh again"""
+        now = time.time()
+        self._conn.execute("UPDATE http_cache SET stored_at = ?, last_used = ? WHERE key = ?", (now, now, key))
+        self._conn.commit()
+
+    def _evict(self):
+        """Drop least recently used entries until the cache fits in max_bytes"""
+        while self.total_bytes > self.max_bytes:
+            rows = self._conn.execute(
+                "SELECT key, size FROM http_cache ORDER BY last_used LIMIT 100"
+            ).fetchall()
+            if not rows:
+                self.total_bytes = 0
+                break
+
+            for key, size in rows:
+                self._conn.execute("DELETE FROM http_cache WHERE key = ?", (key,))
+                self.total_bytes -= size
+                if self.total_bytes <= self.max_bytes:
+                    break
+
+    def close(self):
+        self._conn.close()
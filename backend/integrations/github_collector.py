@@ -0,0 +1,831 @@
+#!/usr/bin/env python3
+"""
+Concurrent GitHub metrics collector for DevLens
+Gathers the collaboration metrics of GitHubIntegration for many users at once
+over a single pooled HTTP client with bounded concurrency.
+
+Two fetch modes produce the same metric dicts:
+    rest     one REST search request per metric per user
+    graphql  the search counts of a whole batch of users in one aliased GraphQL
+             query (with cursor pagination for PR review counts), falling back
+             to REST for a batch whose GraphQL request fails
+"""
+
+import asyncio
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import httpx
+
+from engine.entropy import calculate_shannon_entropy
+from engine.nlp_filter import KeywordMatcher
+
+from .github_cache import HTTPResponseCache, ReviewCountCache, ReviewLatencyCache
+from .github_scheduler import INTERACTIVE, RequestScheduler, shared_scheduler_loop
+from .review_latency import LogHistogram, review_request_latencies
+
+GITHUB_API_URL = "https://api.github.com"
+
+MENTORING_KEYWORDS = [
+    'explained', 'helped', 'guided', 'taught', 'mentored',
+    'walkthrough', 'pair programming', 'code review feedback',
+    'learning', 'tutorial', 'best practice'
+]
+
+MENTORING_MATCHER = KeywordMatcher(MENTORING_KEYWORDS)
+
+# A user's comments, newest first, across every repository they commented in
+USER_COMMENTS_QUERY = '''
+query($login: String!, $after: String) {
+  user(login: $login) {
+    issueComments(first: 100, after: $after, orderBy: {field: UPDATED_AT, direction: DESC}) {
+      pageInfo { hasNextPage endCursor }
+      nodes { body url createdAt updatedAt repository { owner { login } } }
+    }
+  }
+}
+'''
+
+# Search metrics that only need a count
+COUNT_METRICS = ['reviews_given', 'issues_created', 'issues_commented']
+
+PR_NODE_FIELDS = 'number updatedAt repository { name } reviews { totalCount }'
+
+# Pull requests per GraphQL nodes() lookup (the API maximum)
+NODES_PER_QUERY = 100
+
+# GitHub search never returns more than 1000 results (10 pages of 100)
+MAX_PAGES = 10
+
+# Organization member lists are not capped like search results
+MAX_MEMBER_PAGES = 1000
+
+# Timelines of very long-lived PRs are read up to this many pages
+MAX_TIMELINE_PAGES = 10
+
+# Latency cache rows written per commit while timelines stream in
+LATENCY_FLUSH_ROWS = 100
+
+# Metrics that can be collected as dated events: search endpoint, search query and the
+# event timestamp. Reviews are dated by each review's submitted_at instead (see
+# collect_daily_counts), so their search finds the PRs updated since the range started.
+DAILY_METRICS = {
+    'commits': ('/search/commits', 'commits', lambda item: item['commit']['author']['date'][:10]),
+    'pull_requests': ('/search/issues', 'pull_requests', lambda item: item['created_at'][:10]),
+    'reviews_given': ('/search/issues', 'reviewed_prs', None),
+    'issues_created': ('/search/issues', 'issues_created', lambda item: item['created_at'][:10])
+}
+
+
+class GraphQLError(Exception):
+    """GraphQL request failed or returned errors"""
+
+
+def empty_collaboration_metrics() -> Dict:
+    """Metric dict returned for every user, zeroed"""
+    return {
+        'code_reviews_given': 0,
+        'code_reviews_received': 0,
+        'pull_requests_created': 0,
+        'issues_created': 0,
+        'issues_commented': 0,
+        'avg_review_response_time_hours': 0,
+        'review_response_time_p50_hours': 0,
+        'review_response_time_p90_hours': 0,
+        'cross_repo_contributions': 0,
+        'mentoring_activities': 0
+    }
+
+
+def _pr_cache_key(pr: Dict) -> Tuple[str, int, str]:
+    """(owner/repo, number, updated_at) of a PR search result"""
+    owner_repo = "/".join(pr['repository_url'].split('/')[-2:])
+    return owner_repo, pr['number'], pr.get('updated_at', '')
+
+
+def _set_response_times(metrics: Dict, latency: Dict):
+    metrics['avg_review_response_time_hours'] = latency['mean']
+    metrics['review_response_time_p50_hours'] = latency['p50']
+    metrics['review_response_time_p90_hours'] = latency['p90']
+
+
+def search_queries(organization: str, username: str, start_date: str, end_date: str) -> Dict:
+    """GitHub search strings behind each metric, shared by the REST and GraphQL modes"""
+    return {
+        'reviews_given': f'type:pr reviewed-by:{username} org:{organization} created:{start_date}..{end_date}',
+        'reviewed_prs': f'type:pr reviewed-by:{username} org:{organization} updated:{start_date}..{end_date}',
+        'pull_requests': f'type:pr author:{username} org:{organization} created:{start_date}..{end_date}',
+        'issues_created': f'type:issue author:{username} org:{organization} created:{start_date}..{end_date}',
+        'issues_commented': f'type:issue commenter:{username} org:{organization} updated:{start_date}..{end_date}',
+        'commits': f'author:{username} org:{organization} author-date:{start_date}..{end_date}',
+        'comments': f'commenter:{username} org:{organization} updated:{start_date}..{end_date}'
+    }
+
+
+class AsyncGitHubCollector:
+    """
+    Collects GitHub collaboration metrics with asyncio
+
+    One httpx.AsyncClient (keep-alive connection pool) is shared by every request.
+    Requests go through a RequestScheduler, which applies per-endpoint rate limits
+    and concurrency caps at this collector's priority. Pass the process-wide
+    scheduler (shared_scheduler_loop().scheduler, on its loop) so that other
+    jobs' requests are ordered against this one's; without it the collector
+    gets a private scheduler. Use as an async context manager, or call close()
+    when done.
+    """
+
+    def __init__(self, github_token: str, organization: str, max_concurrency: int = 10,
+                 base_url: str = GITHUB_API_URL, transport: Optional[httpx.AsyncBaseTransport] = None,
+                 timeout: float = 30.0, mode: str = "graphql", graphql_batch_size: int = 5,
+                 graphql_url: Optional[str] = None, review_cache: Optional[ReviewCountCache] = None,
+                 latency_cache: Optional[ReviewLatencyCache] = None,
+                 review_fanout: int = 8, commit_fanout: int = 8, scheduler: Optional[RequestScheduler] = None,
+                 priority: int = INTERACTIVE, http_cache: Optional[HTTPResponseCache] = None):
+        if mode not in ("rest", "graphql"):
+            raise ValueError(f"Unknown GitHub fetch mode: {mode}")
+
+        self.token = github_token
+        self.org = organization
+        self.base_url = base_url.rstrip('/')
+        self.mode = mode
+        self.graphql_batch_size = graphql_batch_size
+        self.graphql_url = graphql_url or f"{self.base_url}/graphql"
+        self.headers = {'Accept': 'application/vnd.github.v3+json'}
+        # Without a token requests are anonymous (lower rate limits, public data only)
+        if github_token:
+            self.headers['Authorization'] = f'token {github_token}'
+        self.request_count = 0
+        self._comments = {}
+        self.cache_hits = 0
+        self.revalidated = 0
+        self.http_cache = http_cache
+        # Review counts survive across runs only when a file-backed cache is passed in
+        self.review_cache = review_cache or ReviewCountCache(":memory:")
+        self.latency_cache = latency_cache or ReviewLatencyCache(":memory:")
+        self.scheduler = scheduler or RequestScheduler(max_concurrency=max_concurrency)
+        self.priority = priority
+        # Caps the per-PR fan-out (reviews, comment threads)
+        self._pr_semaphore = asyncio.Semaphore(review_fanout)
+        self._commit_semaphore = asyncio.Semaphore(commit_fanout)
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=timeout,
+            transport=transport,
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        await self._client.aclose()
+
+    async def _request(self, method: str, url, **kwargs) -> httpx.Response:
+        if method != 'GET' or self.http_cache is None:
+            self.request_count += 1
+            return await self.scheduler.send(self._client, method, url, self.priority, **kwargs)
+        return await self._cached_get(url, **kwargs)
+
+    async def _cached_get(self, url, params: Optional[Dict] = None) -> httpx.Response:
+        """
+        GET through the HTTP cache: fresh entries are served without a request,
+        expired ones are revalidated with If-None-Match / If-Modified-Since
+        """
+        request = self._client.build_request('GET', url, params=params)
+        key = self.http_cache.key(str(request.url), self.token)
+        entry = self.http_cache.get(key)
+
+        if entry and entry.is_fresh(self.http_cache.ttl_for(request.url.path)):
+            self.cache_hits += 1
+            return httpx.Response(entry.status, headers=entry.headers, content=entry.body, request=request)
+
+        headers = {}
+        if entry and entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry and entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+
+        self.request_count += 1
+        response = await self.scheduler.send(self._client, 'GET', url, self.priority, params=params, headers=headers)
+
+        if response.status_code == 304 and entry:
+            self.revalidated += 1
+            self.http_cache.refresh(key)
+            return httpx.Response(entry.status, headers=entry.headers, content=entry.body, request=request)
+
+        if response.status_code == 200:
+            self.http_cache.put(key, response.status_code, response.headers, response.content)
+        return response
+
+    async def _get(self, path: str, params: Optional[Dict] = None):
+        """GET a JSON document, or None for a non-200 response"""
+        response = await self._request('GET', path, params=params)
+
+        if response.status_code != 200:
+            return None
+        return response.json()
+
+    async def _get_all(self, path: str, params: Optional[Dict] = None, max_pages: int = MAX_PAGES):
+        """
+        GET every page of a list or search endpoint by following Link: rel="next"
+
+        Returns the concatenated items (the 'items' of search results, or the list
+        bodies of list endpoints), or None if the first page fails.
+        """
+        _, items = await self._paginate(path, params, max_pages)
+        return items
+
+    async def _paginate(self, path: str, params: Optional[Dict], max_pages: int) -> Tuple[Optional[Dict], Optional[List]]:
+        """First page body (for search total_count) and the items of every page"""
+        first_body = None
+        items = []
+        url = path
+        for _ in range(max_pages):
+            response = await self._request('GET', url, params=params)
+            if response.status_code != 200:
+                return (first_body, items) if url != path else (None, None)
+
+            body = response.json()
+            if first_body is None:
+                first_body = body
+            items.extend(body.get('items', []) if isinstance(body, dict) else body)
+
+            url = response.links.get('next', {}).get('url')
+            if not url:
+                break
+            # The next link already carries the query string
+            params = None
+
+        return first_body, items
+
+    async def _search_all(self, username: str, metric: str, start_date: str, end_date: str) -> List[Dict]:
+        """
+        Every search result of one of DAILY_METRICS for a user over a date range
+
+        Date ranges holding more results than search can return (1000) are split
+        in half until every window is complete.
+        """
+        path, query_name, _ = DAILY_METRICS[metric]
+        results = []
+
+        async def collect_window(start: date, end: date):
+            query = search_queries(self.org, username, start.isoformat(), end.isoformat())[query_name]
+            first_body, items = await self._paginate(path, {'q': query, 'per_page': 100}, MAX_PAGES)
+            if first_body is None:
+                raise RuntimeError(f"GitHub search failed for {metric} of {username} ({start}..{end})")
+
+            if first_body.get('total_count', 0) > len(items) and start < end:
+                middle = start + (end - start) // 2
+                await asyncio.gather(
+                    collect_window(start, middle),
+                    collect_window(middle + timedelta(days=1), end)
+                )
+                return
+
+            results.extend(items)
+
+        await collect_window(date.fromisoformat(start_date), date.fromisoformat(end_date))
+        return results
+
+    async def collect_daily_counts(self, username: str, metric: str, start_date: str, end_date: str) -> Dict[str, int]:
+        """Count a user's events per day (YYYY-MM-DD) for one of DAILY_METRICS"""
+        if metric == 'reviews_given':
+            return await self._collect_daily_reviews(username, start_date, end_date)
+
+        event_date = DAILY_METRICS[metric][2]
+        items = await self._search_all(username, metric, start_date, end_date)
+        return dict(Counter(event_date(item) for item in items))
+
+    async def _collect_daily_reviews(self, username: str, start_date: str, end_date: str) -> Dict[str, int]:
+        """
+        Count a user's submitted reviews per day of their submitted_at
+
+        Submitting a review updates its PR, so every PR reviewed in the range was
+        updated between start_date and today. Each of those PRs' reviews are read
+        and only the user's reviews submitted inside the range are counted.
+        """
+        today = datetime.now(timezone.utc).date().isoformat()
+        prs = await self._search_all(username, 'reviews_given', start_date, max(end_date, today))
+        login = username.lower()
+
+        async def review_days(pr):
+            owner_repo = "/".join(pr['repository_url'].split('/')[-2:])
+            async with self._pr_semaphore:
+                reviews = await self._get_all(f"/repos/{owner_repo}/pulls/{pr['number']}/reviews", {'per_page': 100})
+            if reviews is None:
+                raise RuntimeError(f"Could not read reviews of {owner_repo}#{pr['number']}")
+            return [
+                review['submitted_at'][:10] for review in reviews
+                if (review.get('user') or {}).get('login', '').lower() == login
+                and review.get('submitted_at') and start_date <= review['submitted_at'][:10] <= end_date
+            ]
+
+        days = await asyncio.gather(*(review_days(pr) for pr in prs))
+        return dict(Counter(day for pr_days in days for day in pr_days))
+
+    async def collect_commit_stats(self, username: str, start_date: str, end_date: str) -> Dict:
+        """
+        Commit count and summed per-commit Shannon entropy for a user
+
+        Search results carry no file lists, so each commit is read once from
+        /repos/{owner}/{repo}/commits/{sha} (capped fan-out, HTTP-cached since a
+        commit never changes). Commits whose details fail still count, with 0 entropy.
+        """
+        commits = await self._search_all(username, 'commits', start_date, end_date)
+
+        async def commit_entropy(commit):
+            async with self._commit_semaphore:
+                detail = await self._get(f"/repos/{commit['repository']['full_name']}/commits/{commit['sha']}")
+            if not detail:
+                return 0.0
+            return calculate_shannon_entropy({
+                file['filename']: file.get('changes', 0) for file in detail.get('files', [])
+            })
+
+        entropies = await asyncio.gather(*(commit_entropy(commit) for commit in commits))
+        return {'commits': len(commits), 'entropy': sum(entropies)}
+
+    async def list_org_members(self) -> List[str]:
+        """Logins of every member of the organization"""
+        members = await self._get_all(f"/orgs/{self.org}/members", {'per_page': 100}, max_pages=MAX_MEMBER_PAGES)
+        if members is None:
+            raise RuntimeError(f"Could not list members of GitHub organization {self.org}")
+        return [member['login'] for member in members]
+
+    async def _graphql(self, query: str, variables: Dict) -> Dict:
+        """POST a GraphQL query and return its data, raising GraphQLError on any error"""
+        response = await self._request('POST', self.graphql_url, json={'query': query, 'variables': variables})
+
+        if response.status_code != 200:
+            raise GraphQLError(f"GraphQL request failed with HTTP {response.status_code}")
+
+        body = response.json()
+        if body.get('errors') or 'data' not in body:
+            messages = [error.get('message', str(error)) for error in body.get('errors', [])]
+            raise GraphQLError("; ".join(messages) or "GraphQL response has no data")
+        return body['data']
+
+    async def _search_count(self, query: str, per_page: int = 100) -> int:
+        data = await self._get('/search/issues', {'q': query, 'per_page': per_page})
+        return data.get('total_count', 0) if data else 0
+
+    async def collect_user_metrics(self, username: str, start_date: str, end_date: str) -> Dict:
+        """Get comprehensive collaboration metrics for a user from GitHub"""
+        if self.mode == "graphql":
+            return (await self.collect_org_metrics([username], start_date, end_date))[username]
+        return await self._collect_user_rest(username, start_date, end_date)
+
+    async def collect_org_metrics(self, usernames: Iterable[str], start_date: str, end_date: str) -> Dict[str, Dict]:
+        """Collaboration metrics for many users in parallel, keyed by username"""
+        usernames = list(usernames)
+
+        if self.mode == "rest":
+            results = await asyncio.gather(
+                *(self._collect_user_rest(username, start_date, end_date) for username in usernames)
+            )
+            return dict(zip(usernames, results))
+
+        batches = [
+            usernames[i:i + self.graphql_batch_size]
+            for i in range(0, len(usernames), self.graphql_batch_size)
+        ]
+        metrics = {}
+        for batch_metrics in await asyncio.gather(
+            *(self._collect_batch_graphql(batch, start_date, end_date) for batch in batches)
+        ):
+            metrics.update(batch_metrics)
+        return {username: metrics[username] for username in usernames}
+
+    async def _collect_user_rest(self, username: str, start_date: str, end_date: str) -> Dict:
+        """
+        Collect a user's metrics with REST searches
+
+        Every metric is requested concurrently; a metric whose requests fail is
+        reported and left at 0.
+        """
+        metrics = empty_collaboration_metrics()
+
+        results = await asyncio.gather(
+            self._get_reviews_given(username, start_date, end_date),
+            self._get_pull_requests(username, start_date, end_date),
+            self._get_issues_created(username, start_date, end_date),
+            self._get_issue_comments(username, start_date, end_date),
+            self._calculate_avg_response_time(username, start_date, end_date),
+            self._get_cross_repo_activity(username, start_date, end_date),
+            self._detect_mentoring_activity(username, start_date, end_date),
+            return_exceptions=True
+        )
+
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Error collecting GitHub metrics for {username}: {result}")
+
+        reviews_given, pr_data, issues_created, issues_commented, response_time, cross_repo, mentoring = [
+            None if isinstance(result, Exception) else result for result in results
+        ]
+
+        if reviews_given is not None:
+            metrics['code_reviews_given'] = reviews_given
+        if pr_data is not None:
+            metrics['pull_requests_created'] = len(pr_data)
+            metrics['code_reviews_received'] = sum(pr.get('review_count', 0) for pr in pr_data)
+        if issues_created is not None:
+            metrics['issues_created'] = issues_created
+        if issues_commented is not None:
+            metrics['issues_commented'] = issues_commented
+        if response_time is not None:
+            _set_response_times(metrics, response_time)
+        if cross_repo is not None:
+            metrics['cross_repo_contributions'] = cross_repo
+        if mentoring is not None:
+            metrics['mentoring_activities'] = mentoring
+
+        return metrics
+
+    async def _collect_batch_graphql(self, usernames: List[str], start_date: str, end_date: str) -> Dict[str, Dict]:
+        """Collect a batch of users with one aliased GraphQL search query (plus pagination)"""
+        try:
+            search_results = await self._graphql_search_batch(usernames, start_date, end_date)
+        except (GraphQLError, httpx.HTTPError) as e:
+            print(f"GraphQL batch failed ({e}); falling back to REST for {len(usernames)} users")
+            results = await asyncio.gather(
+                *(self._collect_user_rest(username, start_date, end_date) for username in usernames)
+            )
+            return dict(zip(usernames, results))
+
+        # Commit search, response times and comment analysis are not covered by the GraphQL search
+        rest_results = await asyncio.gather(*(
+            asyncio.gather(
+                self._calculate_avg_response_time(username, start_date, end_date),
+                self._get_cross_repo_activity(username, start_date, end_date),
+                self._detect_mentoring_activity(username, start_date, end_date),
+                return_exceptions=True
+            )
+            for username in usernames
+        ))
+
+        batch_metrics = {}
+        for username, (response_time, cross_repo, mentoring) in zip(usernames, rest_results):
+            counts = search_results[username]
+            metrics = empty_collaboration_metrics()
+            metrics.update({
+                'code_reviews_given': counts['reviews_given'],
+                'pull_requests_created': counts['pull_requests'],
+                'code_reviews_received': counts['reviews_received'],
+                'issues_created': counts['issues_created'],
+                'issues_commented': counts['issues_commented']
+            })
+            for name, value in (('response_times', response_time),
+                                ('cross_repo_contributions', cross_repo),
+                                ('mentoring_activities', mentoring)):
+                if isinstance(value, Exception):
+                    print(f"Error collecting GitHub metrics for {username}: {value}")
+                elif name == 'response_times':
+                    _set_response_times(metrics, value)
+                else:
+                    metrics[name] = value
+            batch_metrics[username] = metrics
+
+        return batch_metrics
+
+    async def _graphql_search_batch(self, usernames: List[str], start_date: str, end_date: str) -> Dict[str, Dict]:
+        """
+        Search counts for a batch of users from aliased GraphQL search fields
+
+        Each search string is passed as a variable, so keyword quoting never has to
+        be escaped into the document. PR searches page through their nodes with
+        cursors to sum reviews.totalCount.
+        """
+        fields = []
+        variables = {}
+        pr_aliases = {}
+
+        for i, username in enumerate(usernames):
+            queries = search_queries(self.org, username, start_date, end_date)
+
+            for metric in COUNT_METRICS:
+                alias = f"u{i}_{metric}"
+                variables[alias] = queries[metric]
+                fields.append(f"{alias}: search(type: ISSUE, query: ${alias}, first: 1) {{ issueCount }}")
+
+            alias = f"u{i}_pull_requests"
+            variables[alias] = queries['pull_requests']
+            pr_aliases[alias] = username
+            fields.append(
+                f"{alias}: search(type: ISSUE, query: ${alias}, first: 100) {{ issueCount "
+                f"pageInfo {{ hasNextPage endCursor }} nodes {{ ... on PullRequest {{ {PR_NODE_FIELDS} }} }} }}"
+            )
+
+        declarations = ", ".join(f"${name}: String!" for name in variables)
+        data = await self._graphql(f"query({declarations}) {{ {' '.join(fields)} }}", variables)
+
+        results = {}
+        for i, username in enumerate(usernames):
+            results[username] = {metric: data[f"u{i}_{metric}"]['issueCount'] for metric in COUNT_METRICS}
+            pr_search = data[f"u{i}_pull_requests"]
+            results[username]['pull_requests'] = pr_search['issueCount']
+            results[username]['reviews_received'] = sum(
+                node['reviews']['totalCount'] for node in pr_search['nodes'] if node
+            )
+
+        # Follow cursors for users with more than 100 PRs, all pending pages per query
+        pending = {
+            alias: (variables[alias], data[alias]['pageInfo']['endCursor'])
+            for alias in pr_aliases if data[alias]['pageInfo']['hasNextPage']
+        }
+        while pending:
+            page_fields = []
+            page_variables = {}
+            for alias, (query, cursor) in pending.items():
+                page_variables[alias] = query
+                page_variables[f"{alias}_after"] = cursor
+                page_fields.append(
+                    f"{alias}: search(type: ISSUE, query: ${alias}, first: 100, after: ${alias}_after) {{ "
+                    f"pageInfo {{ hasNextPage endCursor }} nodes {{ ... on PullRequest {{ {PR_NODE_FIELDS} }} }} }}"
+                )
+            declarations = ", ".join(
+                f"${name}: String" if name.endswith("_after") else f"${name}: String!" for name in page_variables
+            )
+            page = await self._graphql(f"query({declarations}) {{ {' '.join(page_fields)} }}", page_variables)
+
+            next_pending = {}
+            for alias, (query, _) in pending.items():
+                results[pr_aliases[alias]]['reviews_received'] += sum(
+                    node['reviews']['totalCount'] for node in page[alias]['nodes'] if node
+                )
+                if page[alias]['pageInfo']['hasNextPage']:
+                    next_pending[alias] = (query, page[alias]['pageInfo']['endCursor'])
+            pending = next_pending
+
+        return results
+
+    async def _get_reviews_given(self, username: str, start_date: str, end_date: str) -> int:
+        """Count code reviews given by user"""
+        return await self._search_count(search_queries(self.org, username, start_date, end_date)['reviews_given'])
+
+    async def _get_pull_requests(self, username: str, start_date: str, end_date: str) -> List[Dict]:
+        """Get pull requests created by user with review information"""
+        query = search_queries(self.org, username, start_date, end_date)['pull_requests']
+        prs = await self._get_all('/search/issues', {'q': query, 'per_page': 100})
+        if prs is None:
+            return []
+
+        await self._add_review_counts(prs)
+        return prs
+
+    async def _add_review_counts(self, prs: List[Dict]):
+        """
+        Set pr['review_count'] on search results without one request per PR
+
+        Counts cached at the PR's current updated_at are reused; the rest are read
+        in bulk through GraphQL nodes(ids:) and stored back in the cache.
+        """
+        keys = {id(pr): _pr_cache_key(pr) for pr in prs}
+        cached = self.review_cache.get_many(keys.values())
+
+        misses = [pr for pr in prs if keys[id(pr)][:2] not in cached]
+        fetched = await self._fetch_review_counts(misses) if misses else {}
+
+        rows = []
+        for pr in misses:
+            if id(pr) in fetched:
+                repo, number, updated_at = keys[id(pr)]
+                rows.append((repo, number, updated_at, fetched[id(pr)]))
+        self.review_cache.put_many(rows)
+
+        for pr in prs:
+            pr['review_count'] = cached.get(keys[id(pr)][:2], fetched.get(id(pr), 0))
+
+    async def _fetch_review_counts(self, prs: List[Dict]) -> Dict[int, int]:
+        """Review counts keyed by id(pr): GraphQL nodes() first, capped REST fan-out otherwise"""
+        counts = {}
+        with_node_ids = [pr for pr in prs if pr.get('node_id')]
+
+        for i in range(0, len(with_node_ids), NODES_PER_QUERY):
+            chunk = with_node_ids[i:i + NODES_PER_QUERY]
+            try:
+                data = await self._graphql(
+                    'query($ids: [ID!]!) { nodes(ids: $ids) { ... on PullRequest { id reviews { totalCount } } } }',
+                    {'ids': [pr['node_id'] for pr in chunk]}
+                )
+            except (GraphQLError, httpx.HTTPError) as e:
+                print(f"GraphQL review lookup failed ({e}); fetching reviews per PR")
+                break
+
+            totals = {node['id']: node['reviews']['totalCount'] for node in data['nodes'] if node}
+            for pr in chunk:
+                if pr['node_id'] in totals:
+                    counts[id(pr)] = totals[pr['node_id']]
+
+        async def fetch_reviews(pr):
+            owner_repo = "/".join(pr['repository_url'].split('/')[-2:])
+            async with self._pr_semaphore:
+                reviews = await self._get_all(f"/repos/{owner_repo}/pulls/{pr['number']}/reviews", {'per_page': 100})
+            if reviews is not None:
+                counts[id(pr)] = len(reviews)
+
+        await asyncio.gather(*(fetch_reviews(pr) for pr in prs if id(pr) not in counts))
+        return counts
+
+    async def _get_issues_created(self, username: str, start_date: str, end_date: str) -> int:
+        """Count issues created by user"""
+        return await self._search_count(search_queries(self.org, username, start_date, end_date)['issues_created'])
+
+    async def _get_issue_comments(self, username: str, start_date: str, end_date: str) -> int:
+        """Count issue comments by user"""
+        return await self._search_count(search_queries(self.org, username, start_date, end_date)['issues_commented'])
+
+    async def _calculate_avg_response_time(self, username: str, start_date: str, end_date: str) -> Dict:
+        """Review response time summary (hours) for the PRs the user reviewed"""
+        return await self.collect_review_latency(username, start_date, end_date)
+
+    async def collect_review_latency(self, username: str, start_date: str, end_date: str) -> Dict:
+        """
+        Hours from each review request to the user's first review after it
+
+        Latencies come from the timelines of the PRs the user reviewed in the
+        period. Timelines are processed as they arrive and summarized into a
+        LogHistogram; per-PR results are cached by updated_at, so unchanged PRs
+        are never fetched again.
+
+        Returns:
+            dict: count, mean, p50, p90 and p99 (hours)
+        """
+        prs = await self._search_all(username, 'reviews_given', start_date, end_date)
+        keys = [_pr_cache_key(pr) for pr in prs]
+        cached = self.latency_cache.get_many(keys)
+        histogram = LogHistogram()
+
+        def add(latencies):
+            for hours in latencies.get(username, []):
+                histogram.add(hours)
+
+        misses = []
+        for key in keys:
+            if key[:2] in cached:
+                add(cached[key[:2]])
+            else:
+                misses.append(key)
+
+        async def fetch_timeline(key):
+            owner_repo, number, _ = key
+            async with self._pr_semaphore:
+                events = await self._get_all(
+                    f"/repos/{owner_repo}/issues/{number}/timeline", {'per_page': 100}, max_pages=MAX_TIMELINE_PAGES
+                )
+            return key, (review_request_latencies(events) if events is not None else None)
+
+        rows = []
+        for next_timeline in asyncio.as_completed([fetch_timeline(key) for key in misses]):
+            (owner_repo, number, updated_at), latencies = await next_timeline
+            if latencies is None:
+                continue
+            add(latencies)
+            rows.append((owner_repo, number, updated_at, latencies))
+            if len(rows) >= LATENCY_FLUSH_ROWS:
+                self.latency_cache.put_many(rows)
+                rows = []
+        self.latency_cache.put_many(rows)
+
+        return histogram.summary()
+
+    async def _get_cross_repo_activity(self, username: str, start_date: str, end_date: str) -> int:
+        """Count contributions across different repositories"""
+        commits = await self._get_all('/search/commits', {
+            'q': search_queries(self.org, username, start_date, end_date)['commits'],
+            'per_page': 100
+        })
+        if commits is None:
+            return 0
+
+        return len({commit['repository']['name'] for commit in commits})
+
+    async def _detect_mentoring_activity(self, username: str, start_date: str, end_date: str) -> int:
+        """Count the user's PR/issue comments that mention any mentoring keyword"""
+        return len(await self.collect_mentoring_evidence(username, start_date, end_date))
+
+    async def collect_mentoring_evidence(self, username: str, start_date: str, end_date: str) -> List[Dict]:
+        """
+        The user's comments that mention mentoring keywords, one entry per comment
+
+        Every keyword is matched locally against each comment (so a comment
+        matching several keywords counts once), with the matched keywords kept as
+        evidence: [{'url', 'created_at', 'keywords'}].
+        """
+        evidence = []
+        for comment in await self._get_user_comments(username, start_date, end_date):
+            keywords = MENTORING_MATCHER.find(comment['body'])
+            if keywords:
+                evidence.append({
+                    'url': comment['url'],
+                    'created_at': comment['created_at'],
+                    'keywords': sorted(keywords)
+                })
+        return evidence
+
+    async def _get_user_comments(self, username: str, start_date: str, end_date: str) -> List[Dict]:
+        """
+        A user's comments on the organization's PRs and issues created in the period
+
+        Fetched once per (user, period) and memoized. GraphQL mode streams the
+        user's comments newest first and stops at the start of the period; REST
+        mode searches the threads the user commented on and reads their comments
+        (conditional, HTTP-cached requests).
+        """
+        key = (username, start_date, end_date)
+        if key not in self._comments:
+            comments = None
+            if self.mode == "graphql":
+                try:
+                    comments = await self._get_user_comments_graphql(username, start_date, end_date)
+                except (GraphQLError, httpx.HTTPError) as e:
+                    print(f"GraphQL comment lookup failed for {username} ({e}); using REST")
+            if comments is None:
+                comments = await self._get_user_comments_rest(username, start_date, end_date)
+            self._comments[key] = comments
+        return self._comments[key]
+
+    async def _get_user_comments_graphql(self, username: str, start_date: str, end_date: str) -> List[Dict]:
+        comments = []
+        cursor = None
+        while True:
+            data = await self._graphql(USER_COMMENTS_QUERY, {'login': username, 'after': cursor})
+            page = (data.get('user') or {}).get('issueComments')
+            if not page:
+                return comments
+
+            for node in page['nodes']:
+                if (node and node['repository']['owner']['login'].lower() == self.org.lower()
+                        and start_date <= node['createdAt'][:10] <= end_date):
+                    comments.append({'body': node['body'], 'url': node['url'], 'created_at': node['createdAt']})
+
+            # Ordered by last update, so nothing further back can have been created in the period
+            oldest = page['nodes'][-1]['updatedAt'][:10] if page['nodes'] else start_date
+            if not page['pageInfo']['hasNextPage'] or oldest < start_date:
+                return comments
+            cursor = page['pageInfo']['endCursor']
+
+    async def _get_user_comments_rest(self, username: str, start_date: str, end_date: str) -> List[Dict]:
+        threads = await self._get_all('/search/issues', {
+            'q': search_queries(self.org, username, start_date, end_date)['comments'],
+            'per_page': 100
+        })
+        if threads is None:
+            raise RuntimeError(f"GitHub comment search failed for {username}")
+        login = username.lower()
+
+        async def thread_comments(thread):
+            owner_repo = "/".join(thread['repository_url'].split('/')[-2:])
+            async with self._pr_semaphore:
+                comments = await self._get_all(
+                    f"/repos/{owner_repo}/issues/{thread['number']}/comments",
+                    {'since': f"{start_date}T00:00:00Z", 'per_page': 100}
+                )
+            return [
+                {'body': comment.get('body') or '', 'url': comment['html_url'], 'created_at': comment['created_at']}
+                for comment in comments or []
+                # Comments of deleted accounts have no user
+                if (comment.get('user') or {}).get('login', '').lower() == login
+                and start_date <= comment['created_at'][:10] <= end_date
+            ]
+
+        per_thread = await asyncio.gather(*(thread_comments(thread) for thread in threads))
+        return [comment for comments in per_thread for comment in comments]
+
+    async def get_innovation_metrics(self, username: str, start_date: str, end_date: str) -> Dict:
+        """Get innovation-related metrics"""
+        feature_proposals, bug_reports, documentation_improvements = await asyncio.gather(
+            # Feature proposals (issues with enhancement label)
+            self._search_count(f'type:issue author:{username} org:{self.org} label:enhancement created:{start_date}..{end_date}'),
+            # Bug reports
+            self._search_count(f'type:issue author:{username} org:{self.org} label:bug created:{start_date}..{end_date}'),
+            # Documentation improvements (PRs affecting .md files)
+            self._search_count(f'type:pr author:{username} org:{self.org} filename:*.md created:{start_date}..{end_date}')
+        )
+
+        return {
+            'feature_proposals': feature_proposals,
+            'bug_reports': bug_reports,
+            'documentation_improvements': documentation_improvements,
+            'process_improvements': 0
+        }
+
+
+def collect_org_metrics(github_token: str, organization: str, usernames: Iterable[str],
+                        start_date: str, end_date: str, max_concurrency: int = 10,
+                        mode: str = "graphql", priority: int = INTERACTIVE) -> Dict[str, Dict]:
+    """Synchronous entry point: collaboration metrics for every given user"""
+    scheduler_loop = shared_scheduler_loop()
+
+    async def run():
+        async with AsyncGitHubCollector(github_token, organization, max_concurrency, mode=mode,
+                                        scheduler=scheduler_loop.scheduler, priority=priority) as collector:
+            return await collector.collect_org_metrics(usernames, start_date, end_date)
+
+    return scheduler_loop.run(run())
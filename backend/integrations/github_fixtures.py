@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+"""
+Recorded GitHub API fixtures for offline verification
+RecordingTransport captures real API responses to a JSON file; ReplayTransport
+serves them back so the REST and GraphQL collection modes can be run and
+compared without network access or a token.
+
+Usage (from backend/):
+    python -m integrations.github_fixtures record fixture.json --org ORG --users a,b --token $GITHUB_TOKEN
+    python -m integrations.github_fixtures verify fixture.json --org ORG --users a,b
+
+tests/fixtures/github_two_users.json was recorded against the mock server:
+    python -m integrations.mock_github_server --org acme --members alice-johnson,bob-smith
+    python -m integrations.github_fixtures record tests/fixtures/github_two_users.json \
+        --org acme --users alice-johnson,bob-smith --base-url http://127.0.0.1:8765
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+from collections import defaultdict, deque
+from typing import Dict, Iterable, List
+
+import httpx
+
+from .github_collector import GITHUB_API_URL, AsyncGitHubCollector
+
+# Response headers worth keeping (credentials are never recorded)
+RECORDED_HEADERS = [
+    'content-type', 'etag', 'last-modified', 'link', 'retry-after',
+    'x-ratelimit-limit', 'x-ratelimit-remaining', 'x-ratelimit-reset', 'x-ratelimit-resource'
+]
+
+
+def fixture_key(request: httpx.Request) -> str:
+    """Identify a request by method, path, sorted query string and body hash"""
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.url.params.multi_items()))
+    body = request.content or b""
+    body_hash = hashlib.sha256(body).hexdigest()[:16] if body else ""
+    return f"{request.method} {request.url.path}?{query} {body_hash}".strip()
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Passes requests through to a real transport and records every response"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport = None):
+        self._transport = transport or httpx.AsyncHTTPTransport()
+        self.entries: List[Dict] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._transport.handle_async_request(request)
+        content = await response.aread()
+        headers = {name: response.headers[name] for name in RECORDED_HEADERS if name in response.headers}
+
+        self.entries.append({
+            'key': fixture_key(request),
+            'status': response.status_code,
+            'headers': headers,
+            'body': content.decode('utf-8')
+        })
+        return httpx.Response(response.status_code, headers=headers, content=content, request=request)
+
+    async def aclose(self):
+        await self._transport.aclose()
+
+    def save(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f)
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Serves recorded responses; repeated requests are answered in recorded order"""
+
+    def __init__(self, path: str):
+        with open(path, 'r', encoding='utf-8') as f:
+            entries = json.load(f)
+
+        self._responses = defaultdict(deque)
+        for entry in entries:
+            self._responses[entry['key']].append(entry)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = fixture_key(request)
+        recorded = self._responses.get(key)
+        if not recorded:
+            raise LookupError(f"No recorded response for {key}")
+
+        # Keep the last response around so re-runs of the same request still replay
+        entry = recorded.popleft() if len(recorded) > 1 else recorded[0]
+        return httpx.Response(
+            entry['status'], headers=entry['headers'], content=entry['body'].encode('utf-8'), request=request
+        )
+
+
+class _SharedTransport(httpx.AsyncBaseTransport):
+    """Lets several clients use one transport without closing it"""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+
+async def collect_both_modes(organization: str, usernames: Iterable[str], start_date: str, end_date: str,
+                             transport: httpx.AsyncBaseTransport, token: str = "fixture",
+                             base_url: str = GITHUB_API_URL) -> Dict[str, Dict]:
+    """Run the REST and GraphQL modes over the same transport"""
+    usernames = list(usernames)
+    results = {}
+    for mode in ("rest", "graphql"):
+        async with AsyncGitHubCollector(token, organization, base_url=base_url,
+                                        transport=_SharedTransport(transport), mode=mode) as collector:
+            results[mode] = await collector.collect_org_metrics(usernames, start_date, end_date)
+            results[f"{mode}_requests"] = collector.request_count
+    await transport.aclose()
+    return results
+
+
+def compare_modes(results: Dict[str, Dict]) -> List[str]:
+    """Differences between the REST and GraphQL metrics of each user"""
+    differences = []
+    for username, rest_metrics in results['rest'].items():
+        graphql_metrics = results['graphql'][username]
+        for metric, value in rest_metrics.items():
+            if graphql_metrics.get(metric) != value:
+                differences.append(f"{username}.{metric}: rest={value} graphql={graphql_metrics.get(metric)}")
+    return differences
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Record or verify GitHub API fixtures")
+    parser.add_argument("action", choices=["record", "verify"])
+    parser.add_argument("fixture", help="Fixture JSON file")
+    parser.add_argument("--org", required=True)
+    parser.add_argument("--users", required=True, help="Comma-separated GitHub usernames")
+    parser.add_argument("--start", default="2024-01-01")
+    parser.add_argument("--end", default="2024-03-31")
+    parser.add_argument("--token", default="fixture")
+    parser.add_argument("--base-url", default=GITHUB_API_URL, help="API to record from (e.g. the mock server)")
+    args = parser.parse_args()
+
+    usernames = [name.strip() for name in args.users.split(",") if name.strip()]
+
+    if args.action == "record":
+        transport = RecordingTransport()
+    else:
+        transport = ReplayTransport(args.fixture)
+
+    results = asyncio.run(collect_both_modes(args.org, usernames, args.start, args.end, transport, args.token,
+                                                 args.base_url))
+
+    if args.action == "record":
+        transport.save(args.fixture)
+        print(f"Recorded {len(transport.entries)} responses -> {args.fixture}")
+
+    print(f"REST requests: {results['rest_requests']}, GraphQL requests: {results['graphql_requests']}")
+    differences = compare_modes(results)
+    if differences:
+        print("Modes disagree:")
+        for difference in differences:
+            print(f"  {difference}")
+    else:
+        print("REST and GraphQL modes agree for every user")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Org-wide GitHub sync job for DevLens
+Enumerates the members of a GitHub organization, maps them to the developers of
+a DevLens company, collects their metrics concurrently at bulk priority and
+writes commits, entropy, reviews and mentoring counts to the database one batch
+(one transaction) at a time. Each batch also brings its members' daily rollups
+up to date with IncrementalGitHubSync, which fetches only what is new since
+each member's last sync.
+
+Progress is kept per member in github_sync_run_members, so an interrupted run
+picks up where it stopped: only pending and failed members are collected again.
+Jobs run on the process-wide scheduler loop, so concurrent syncs and interactive
+GitHub calls share one set of rate limits.
+"""
+
+import asyncio
+from typing import Callable, Dict, Optional
+
+from .github_cache import DEFAULT_CACHE_PATH, HTTPResponseCache, ReviewCountCache, ReviewLatencyCache
+from .github_collector import GITHUB_API_URL, AsyncGitHubCollector
+from .github_scheduler import BULK, SchedulerLoop, shared_scheduler_loop
+from .github_sync import IncrementalGitHubSync
+
+
+class OrgSyncJob:
+    def __init__(self, db, github_token: str, organization: str, company_id: int,
+                 start_date: str, end_date: str, base_url: str = GITHUB_API_URL,
+                 batch_size: int = 25, max_concurrency: int = 10, mode: str = "graphql",
+                 cache_path: str = DEFAULT_CACHE_PATH,
+                 progress: Optional[Callable[[Dict], None]] = None,
+                 scheduler_loop: Optional[SchedulerLoop] = None, **collector_options):
+        """
+        Args:
+            db: DevLensDB receiving the metrics and run progress
+            company_id: DevLens company whose developers the org members map to
+            batch_size: Members collected concurrently and written per transaction
+            progress: Called with the run row after every batch (prints by default)
+            scheduler_loop: SchedulerLoop the job runs on (default: the process-wide one)
+            collector_options: Extra AsyncGitHubCollector arguments (transport, ...)
+        """
+        self.db = db
+        self.token = github_token
+        self.org = organization
+        self.company_id = company_id
+        self.start_date = start_date
+        self.end_date = end_date
+        self.base_url = base_url
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+        self.mode = mode
+        self.cache_path = cache_path
+        self.progress = progress or self._print_progress
+        self.scheduler_loop = scheduler_loop or shared_scheduler_loop()
+        self.collector_options = collector_options
+
+    def start(self) -> int:
+        """Create the run (or reuse an unfinished one for the same period) and return its id"""
+        run_id = self.db.find_resumable_github_sync_run(
+            self.org, self.company_id, self.start_date, self.end_date, self.mode
+        )
+        if run_id is None:
+            run_id = self.db.create_github_sync_run(
+                self.org, self.company_id, self.start_date, self.end_date, self.mode
+            )
+        return run_id
+
+    def run(self, run_id: Optional[int] = None) -> Dict:
+        """Run (or resume) a sync to completion and return the final run row"""
+        if run_id is None:
+            run_id = self.start()
+
+        self.db.set_github_sync_run_status(run_id, "running")
+        try:
+            self.scheduler_loop.run(self._run(run_id))
+        except Exception as e:
+            self.db.set_github_sync_run_status(run_id, "failed", str(e))
+            raise
+
+        run = self.db.get_github_sync_run(run_id)
+        self.db.set_github_sync_run_status(
+            run_id, "completed",
+            f"{run['failed_members']} members failed" if run['failed_members'] else None
+        )
+        return self.db.get_github_sync_run(run_id)
+
+    async def _run(self, run_id: int):
+        review_cache = ReviewCountCache(self.cache_path)
+        latency_cache = ReviewLatencyCache(self.cache_path)
+        http_cache = HTTPResponseCache(self.cache_path)
+        try:
+            async with AsyncGitHubCollector(
+                self.token, self.org, self.max_concurrency, self.base_url, mode=self.mode,
+                review_cache=review_cache, latency_cache=latency_cache, http_cache=http_cache,
+                scheduler=self.scheduler_loop.scheduler, priority=BULK, **self.collector_options
+            ) as collector:
+                # A resumed run keeps the member list it was started with
+                if not self.db.get_github_sync_run(run_id)['total_members']:
+                    logins = await collector.list_org_members()
+                    self.db.add_github_sync_members(
+                        run_id, self.db.map_github_members(self.org, self.company_id, logins)
+                    )
+
+                pending = self.db.get_github_sync_members(run_id)
+                self.progress(self.db.get_github_sync_run(run_id))
+
+                # Members never synced before get daily rollups from the run's start date
+                daily_sync = IncrementalGitHubSync(self.db, collector, self.start_date)
+                for i in range(0, len(pending), self.batch_size):
+                    await self._sync_batch(collector, daily_sync, run_id, pending[i:i + self.batch_size])
+                    self.progress(self.db.get_github_sync_run(run_id))
+        finally:
+            review_cache.close()
+            latency_cache.close()
+            http_cache.close()
+
+    async def _sync_batch(self, collector: AsyncGitHubCollector, daily_sync: IncrementalGitHubSync,
+                          run_id: int, members):
+        developer_ids = dict(members)
+        logins = list(developer_ids)
+
+        # Daily metrics that fail keep their old marks and are fetched again next run
+        collaboration, commit_stats, _ = await asyncio.gather(
+            collector.collect_org_metrics(logins, self.start_date, self.end_date),
+            asyncio.gather(
+                *(collector.collect_commit_stats(login, self.start_date, self.end_date) for login in logins),
+                return_exceptions=True
+            ),
+            daily_sync.sync_users((login, developer_ids[login], self.company_id) for login in logins)
+        )
+
+        results = {}
+        failures = {}
+        for login, stats in zip(logins, commit_stats):
+            if isinstance(stats, Exception):
+                failures[login] = str(stats)
+            else:
+                results[developer_ids[login]] = {**collaboration[login], **stats}
+
+        self.db.record_github_sync_batch(run_id, self.org, self.start_date, self.end_date, results, failures)
+
+    @staticmethod
+    def _print_progress(run: Dict):
+        done = run['synced_members'] + run['failed_members']
+        mapped = run['total_members'] - run['unmapped_members']
+        print(f"GitHub sync #{run['id']} ({run['org']}): {done}/{mapped} members "
+              f"({run['failed_members']} failed, {run['unmapped_members']} unmapped)")
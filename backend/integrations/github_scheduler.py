@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+"""
+Rate-limit-aware request scheduling for the GitHub API
+Every request goes through a token bucket for its endpoint class (search, core,
+graphql) and a priority gate, so interactive syncs are served before bulk
+backfills. X-RateLimit-* headers, Retry-After and secondary rate limits pause
+the affected class instead of failing the sync with 403s.
+
+A process shares one scheduler (shared_scheduler_loop()): GitHub jobs run their
+coroutines on its event loop thread, so every collector of the process, bulk or
+interactive, competes at the same gates and token buckets.
+"""
+
+import asyncio
+import heapq
+import itertools
+import random
+import threading
+import time
+from typing import Dict, Optional
+
+import httpx
+
+INTERACTIVE = 0
+BULK = 1
+
+# (requests per second, burst capacity) per endpoint class. Search allows 30
+# requests a minute; core and GraphQL stay under the per-minute secondary limits.
+DEFAULT_LIMITS = {
+    'search': (30 / 60, 30),
+    'core': (900 / 60, 100),
+    'graphql': (1.0, 10)
+}
+
+RETRY_STATUSES = {403, 429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """Token bucket that can also be paused until a rate-limit window resets"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def take(self):
+        while True:
+            now = time.monotonic()
+            if now < self._paused_until:
+                await asyncio.sleep(self._paused_until - now)
+                continue
+
+            self._refill(now)
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        """Hand out no tokens for the next `seconds`"""
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        self.tokens = 0
+
+    def observe(self, remaining: Optional[int], reset_epoch: Optional[float]):
+        """Align the bucket with the server's view of the rate-limit window"""
+        if remaining is None:
+            return
+        self._refill(time.monotonic())
+        self.tokens = min(self.tokens, remaining)
+        if remaining == 0 and reset_epoch:
+            self.pause(max(0.0, reset_epoch - time.time()) + 1)
+
+
+class PriorityGate:
+    """Concurrency limit that admits waiting requests in priority order (FIFO within a priority)"""
+
+    def __init__(self, slots: int):
+        self._free = slots
+        self._waiters = []
+        self._order = itertools.count()
+
+    async def acquire(self, priority: int):
+        if self._free > 0 and not self._waiters:
+            self._free -= 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # A slot handed over just before cancellation must be passed on
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+
+    def release(self):
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._free += 1
+
+
+class _EndpointClass:
+    def __init__(self, rate: float, capacity: float, slots: int):
+        self.bucket = TokenBucket(rate, capacity)
+        self.gate = PriorityGate(slots)
+
+
+class RequestScheduler:
+    """
+    Schedules GitHub requests across endpoint classes
+
+    One scheduler can be shared by several collectors on the same event loop so
+    that their interactive and bulk requests compete through the same gates.
+    """
+
+    def __init__(self, limits: Optional[Dict] = None, max_concurrency: int = 10, max_retries: int = 5,
+                 secondary_backoff: float = 60.0, error_backoff: float = 1.0, max_backoff: float = 900.0):
+        limits = {**DEFAULT_LIMITS, **(limits or {})}
+        self.classes = {
+            name: _EndpointClass(rate, capacity, max_concurrency) for name, (rate, capacity) in limits.items()
+        }
+        self.max_retries = max_retries
+        self.secondary_backoff = secondary_backoff
+        self.error_backoff = error_backoff
+        self.max_backoff = max_backoff
+
+    @staticmethod
+    def endpoint_class(url) -> str:
+        path = httpx.URL(str(url)).path
+        if path.endswith('/graphql'):
+            return 'graphql'
+        if '/search/' in path:
+            return 'search'
+        return 'core'
+
+    async def send(self, client: httpx.AsyncClient, method: str, url, priority: int = BULK, **kwargs) -> httpx.Response:
+        """Send a request once its class has capacity, retrying rate-limited and failed attempts"""
+        endpoint = self.classes[self.endpoint_class(url)]
+
+        for attempt in range(self.max_retries + 1):
+            await endpoint.gate.acquire(priority)
+            try:
+                await endpoint.bucket.take()
+                response = await client.request(method, url, **kwargs)
+            finally:
+                endpoint.gate.release()
+
+            remaining = response.headers.get('x-ratelimit-remaining')
+            reset = response.headers.get('x-ratelimit-reset')
+            endpoint.bucket.observe(
+                int(remaining) if remaining is not None else None,
+                float(reset) if reset is not None else None
+            )
+
+            if response.status_code not in RETRY_STATUSES or attempt == self.max_retries:
+                return response
+
+            delay = self._retry_delay(response, attempt)
+            if delay is None:
+                return response
+
+            print(f"GitHub {response.status_code} for {httpx.URL(str(url)).path}; retrying in {delay:.1f}s")
+            endpoint.bucket.pause(delay)
+
+        return response
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying, or None if the response is final"""
+        retry_after = response.headers.get('retry-after')
+        if retry_after is not None:
+            try:
+                return float(retry_after)
+            except ValueError:
+                pass
+
+        if response.status_code in (403, 429):
+            if response.headers.get('x-ratelimit-remaining') == '0':
+                reset = float(response.headers.get('x-ratelimit-reset', time.time()))
+                return max(0.0, reset - time.time()) + 1
+            if 'secondary rate limit' in response.text.lower() or response.status_code == 429:
+                return min(self.max_backoff, self.secondary_backoff * 2 ** attempt)
+            # Permission errors are not retried
+            return None
+
+        # Server errors: exponential backoff with jitter
+        return min(self.max_backoff, self.error_backoff * 2 ** attempt) * (1 + random.random() * 0.1)
+
+
+class SchedulerLoop:
+    """
+    A RequestScheduler on its own event loop thread
+
+    The gates and buckets are asyncio objects, so they can only be shared by
+    coroutines on one loop. Synchronous callers (API background tasks, scripts)
+    hand their GitHub coroutines to run() instead of asyncio.run().
+    """
+
+    def __init__(self, **scheduler_options):
+        self.scheduler = RequestScheduler(**scheduler_options)
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="github-scheduler", daemon=True)
+        self._thread.start()
+
+    def run(self, coro):
+        """Run a coroutine on the scheduler's loop and wait for the result"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def close(self):
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+
+_shared_loop = None
+_shared_lock = threading.Lock()
+
+
+def shared_scheduler_loop() -> SchedulerLoop:
+    """The process-wide SchedulerLoop, created on first use"""
+    global _shared_loop
+    with _shared_lock:
+        if _shared_loop is None:
+            _shared_loop = SchedulerLoop()
+        return _shared_loop
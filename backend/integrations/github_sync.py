@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Incremental GitHub sync for DevLens
+Every (org, user, metric) keeps a high-water mark in github_sync_state. A run only
+searches from the day of that mark up to today and replaces those days in the
+developer_activity_daily rollups, so an hourly sync is a small delta query
+instead of a full-quarter resync.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from typing import Dict, Iterable, Tuple
+
+from .github_collector import DAILY_METRICS, AsyncGitHubCollector
+from .github_scheduler import shared_scheduler_loop
+
+SYNC_METRICS = list(DAILY_METRICS)
+
+
+class IncrementalGitHubSync:
+    def __init__(self, db, collector: AsyncGitHubCollector, initial_start_date: str):
+        """
+        Args:
+            db: DevLensDB receiving the rollups and sync state
+            collector: AsyncGitHubCollector for the organization being synced
+            initial_start_date: First day fetched for a user/metric that was never synced
+        """
+        self.db = db
+        self.collector = collector
+        self.initial_start_date = initial_start_date
+
+    async def sync_user(self, username: str, developer_id: int, company_id: int) -> Dict[str, int]:
+        """
+        Fetch a user's new events for every metric and merge them into the rollups
+
+        The day of the previous mark is fetched again and replaced as a whole, so
+        events that landed after the last run on that day are picked up without
+        double counting. A metric that fails keeps its old mark.
+
+        Returns:
+            dict: metric -> events counted in the synced range (failed metrics omitted)
+        """
+        org = self.collector.org
+        marks = self.db.get_github_sync_state(org, username)
+        synced_at = datetime.now(timezone.utc).isoformat(timespec='seconds')
+        today = synced_at[:10]
+
+        async def sync_metric(metric: str) -> Tuple[str, int]:
+            start_date = marks[metric][:10] if metric in marks else self.initial_start_date
+            day_counts = await self.collector.collect_daily_counts(username, metric, start_date, today)
+            self.db.apply_github_sync(
+                org, username, developer_id, company_id, metric, start_date, today, day_counts, synced_at
+            )
+            return metric, sum(day_counts.values())
+
+        results = await asyncio.gather(*(sync_metric(metric) for metric in SYNC_METRICS), return_exceptions=True)
+
+        synced = {}
+        for metric, result in zip(SYNC_METRICS, results):
+            if isinstance(result, Exception):
+                print(f"GitHub sync of {metric} for {username} failed: {result}")
+            else:
+                synced[metric] = result[1]
+        return synced
+
+    async def sync_users(self, users: Iterable[Tuple[str, int, int]]) -> Dict[str, Dict]:
+        """Sync (username, developer_id, company_id) tuples concurrently, keyed by username"""
+        users = list(users)
+        results = await asyncio.gather(
+            *(self.sync_user(username, developer_id, company_id) for username, developer_id, company_id in users)
+        )
+        return {username: result for (username, _, _), result in zip(users, results)}
+
+
+def sync_github_activity(db, github_token: str, organization: str, users: Iterable[Tuple[str, int, int]],
+                         initial_start_date: str, **collector_options) -> Dict[str, Dict]:
+    """Synchronous entry point: incremental sync of (username, developer_id, company_id) tuples"""
+    scheduler_loop = shared_scheduler_loop()
+
+    async def run():
+        async with AsyncGitHubCollector(github_token, organization, scheduler=scheduler_loop.scheduler,
+                                        **collector_options) as collector:
+            return await IncrementalGitHubSync(db, collector, initial_start_date).sync_users(users)
+
+    return scheduler_loop.run(run())
@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""
+Local mock of the GitHub API endpoints used by DevLens
+Serves deterministic data (seeded by login) for organization members, issue and
+commit search, commit details, PR reviews, issue comments and timelines, and the
+GraphQL search, nodes and user comment queries, with Link pagination and the
+1000-result search cap, so the org sync can be run end to end without network
+access or a token.
+
+Usage (from backend/):
+    python -m integrations.mock_github_server --org acme --company "DevLens Synthetic Corp"
+    python scripts/sync_github_org.py acme "DevLens Synthetic Corp" --base-url http://127.0.0.1:8765
+"""
+
+import argparse
+import hashlib
+import random
+import re
+from datetime import date, datetime, timedelta
+from typing import Dict, List
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+MOCK_REPOS = ['api', 'web', 'infra', 'docs']
+MOCK_FILES = ['src/app.py', 'src/models.py', 'src/api.js', 'tests/test_app.py', 'docs/README.md', 'deploy.yml']
+MOCK_START = date(2024, 1, 1)
+MOCK_DAYS = 366
+SEARCH_RESULT_CAP = 1000
+MOCK_COMMENTS = [
+    "LGTM, thanks!",
+    "Explained the retry logic above, hope that helps.",
+    "Happy to do some pair programming on this tomorrow.",
+    "Added a walkthrough of the migration and a best practice note for the next one.",
+    "Nit: rename this variable.",
+    "Helped debug the flaky test, see the tutorial linked in the docs.",
+    "Merging once CI is green.",
+    "Guided the new joiner through the deploy steps."
+]
+
+
+def _iso(moment: datetime) -> str:
+    return moment.strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+def mock_login(name: str) -> str:
+    """GitHub-style login for a developer name (Alice Johnson -> alice-johnson)"""
+    return re.sub(r"[^a-z0-9]+", "-", name.lower()).strip("-")
+
+
+class MockGitHubData:
+    """Deterministic events for every member, generated once"""
+
+    def __init__(self, org: str, logins: List[str]):
+        self.org = org
+        self.logins = list(logins)
+        self.pull_requests = {}
+        self.reviewed = {}
+        self.reviews_by_pr = {}
+        self.issues = {}
+        self.comments = {}
+        self.commits = {}
+        self.prs_by_node = {}
+        self.commits_by_sha = {}
+        self.threads = {}
+        self.timelines = {}
+
+        numbers = {repo: 0 for repo in MOCK_REPOS}
+
+        def timestamp(rng):
+            day = MOCK_START + timedelta(days=rng.randrange(MOCK_DAYS))
+            return f"{day.isoformat()}T{rng.randrange(24):02d}:{rng.randrange(60):02d}:00Z"
+
+        for login in self.logins:
+            rng = random.Random(login)
+
+            prs = []
+            for _ in range(rng.randint(5, 40)):
+                repo = rng.choice(MOCK_REPOS)
+                numbers[repo] += 1
+                created_at = timestamp(rng)
+                pr = {
+                    'number': numbers[repo],
+                    'node_id': f"PR_{repo}_{numbers[repo]}",
+                    'repo': repo,
+                    'created_at': created_at,
+                    'updated_at': created_at,
+                    'reviews': rng.randint(0, 3)
+                }
+                prs.append(pr)
+                self.prs_by_node[pr['node_id']] = pr
+            self.pull_requests[login] = prs
+
+
+            # PRs this member reviewed: requested shortly after opening, reviewed hours later
+            reviewed = []
+            for _ in range(rng.randint(3, 30)):
+                repo = rng.choice(MOCK_REPOS)
+                numbers[repo] += 1
+                created_at = timestamp(rng)
+                opened = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
+                requested = opened + timedelta(minutes=rng.randint(1, 60))
+                submitted = requested + timedelta(hours=rng.lognormvariate(1.5, 1.0))
+                timeline = [
+                    {'event': 'review_requested', 'created_at': _iso(requested), 'requested_reviewer': {'login': login}},
+                    {'event': 'reviewed', 'submitted_at': _iso(submitted), 'user': {'login': login}, 'state': 'commented'}
+                ]
+                pr = {'repo': repo, 'number': numbers[repo], 'created_at': created_at, 'updated_at': _iso(submitted)}
+                reviewed.append(pr)
+                self.timelines[(repo, pr['number'])] = timeline
+                self.reviews_by_pr[(repo, pr['number'])] = [
+                    {'user': {'login': login}, 'state': 'COMMENTED', 'submitted_at': _iso(submitted)}
+                ]
+            self.reviewed[login] = reviewed
+            self.issues[login] = [{'created_at': timestamp(rng)} for _ in range(rng.randint(0, 10))]
+
+            # Every comment is on its own PR or issue thread
+            comments = []
+            for _ in range(rng.randint(0, 25)):
+                repo = rng.choice(MOCK_REPOS)
+                numbers[repo] += 1
+                created_at = timestamp(rng)
+                comment = {
+                    'repo': repo,
+                    'number': numbers[repo],
+                    'type': rng.choice(['pr', 'issue']),
+                    'login': login,
+                    'body': rng.choice(MOCK_COMMENTS),
+                    'created_at': created_at,
+                    'updated_at': created_at,
+                    'html_url': f"https://github.com/{org}/{repo}/issues/{numbers[repo]}#comment-{len(self.threads)}"
+                }
+                comments.append(comment)
+                self.threads[(repo, comment['number'])] = [comment]
+            self.comments[login] = comments
+
+            commits = []
+            for i in range(rng.randint(10, 60)):
+                sha = hashlib.sha1(f"{login}:{i}".encode()).hexdigest()
+                files = rng.sample(MOCK_FILES, rng.randint(1, 4))
+                commit = {
+                    'sha': sha,
+                    'repo': rng.choice(MOCK_REPOS),
+                    'date': timestamp(rng),
+                    'files': [{'filename': name, 'changes': rng.randint(1, 120)} for name in files]
+                }
+                commits.append(commit)
+                self.commits_by_sha[sha] = commit
+            self.commits[login] = commits
+
+    def search(self, query: str) -> List[Dict]:
+        """Events matching a DevLens search string, as search result items"""
+        user = re.search(r"(?:author|reviewed-by|commenter):(\S+)", query).group(1)
+        dates = re.search(r"(?:created|updated|author-date):(\S+)\.\.(\S+)", query)
+        start, end = dates.group(1), dates.group(2)
+
+        def in_range(timestamp):
+            return start <= timestamp[:10] <= end
+
+        if query.startswith('author:'):
+            return [
+                {
+                    'sha': commit['sha'],
+                    'repository': {'name': commit['repo'], 'full_name': f"{self.org}/{commit['repo']}"},
+                    'commit': {'author': {'date': commit['date']}}
+                }
+                for commit in self.commits.get(user, []) if in_range(commit['date'])
+            ]
+
+        if 'reviewed-by:' in query:
+            field = 'updated_at' if 'updated:' in query else 'created_at'
+            return [
+                {
+                    'number': pr['number'],
+                    'created_at': pr['created_at'],
+                    'updated_at': pr['updated_at'],
+                    'repository_url': f"https://api.github.com/repos/{self.org}/{pr['repo']}"
+                }
+                for pr in self.reviewed.get(user, []) if in_range(pr[field])
+            ]
+        elif 'type:pr author:' in query:
+            return [
+                {
+                    'number': pr['number'],
+                    'node_id': pr['node_id'],
+                    'created_at': pr['created_at'],
+                    'updated_at': pr['updated_at'],
+                    'repository_url': f"https://api.github.com/repos/{self.org}/{pr['repo']}"
+                }
+                for pr in self.pull_requests.get(user, []) if in_range(pr['created_at'])
+            ]
+        elif 'commenter:' in query:
+            kind = re.search(r"type:(pr|issue)", query)
+            return [
+                {
+                    'number': comment['number'],
+                    'created_at': comment['created_at'],
+                    'updated_at': comment['updated_at'],
+                    'repository_url': f"https://api.github.com/repos/{self.org}/{comment['repo']}"
+                }
+                for comment in self.comments.get(user, [])
+                if (not kind or comment['type'] == kind.group(1)) and in_range(comment['updated_at'])
+            ]
+        else:
+            events = self.issues.get(user, [])
+
+        return [{'created_at': event['created_at']} for event in events if in_range(event['created_at'])]
+
+
+def paginated(request: Request, items: List, search: bool) -> JSONResponse:
+    per_page = min(int(request.query_params.get('per_page', 30)), 100)
+    page = int(request.query_params.get('page', 1))
+    reachable = items[:SEARCH_RESULT_CAP] if search else items
+    page_items = reachable[(page - 1) * per_page:page * per_page]
+
+    headers = {}
+    if page * per_page < len(reachable):
+        headers['link'] = f'<{request.url.include_query_params(page=page + 1)}>; rel="next"'
+
+    body = {'total_count': len(items), 'incomplete_results': False, 'items': page_items} if search else page_items
+    return JSONResponse(body, headers=headers)
+
+
+def create_app(data: MockGitHubData) -> FastAPI:
+    app = FastAPI(title="Mock GitHub API")
+
+    @app.get("/orgs/{org}/members")
+    def members(org: str, request: Request):
+        logins = data.logins if org == data.org else []
+        return paginated(request, [{'login': login} for login in logins], search=False)
+
+    @app.get("/search/issues")
+    def search_issues(q: str, request: Request):
+        return paginated(request, data.search(q), search=True)
+
+    @app.get("/search/commits")
+    def search_commits(q: str, request: Request):
+        return paginated(request, data.search(q), search=True)
+
+    @app.get("/repos/{owner}/{repo}/commits/{sha}")
+    def commit_detail(owner: str, repo: str, sha: str):
+        commit = data.commits_by_sha.get(sha)
+        if not commit:
+            return JSONResponse({'message': 'Not Found'}, status_code=404)
+        return {'sha': sha, 'files': commit['files']}
+
+    @app.get("/repos/{owner}/{repo}/pulls/{number}/reviews")
+    def reviews(owner: str, repo: str, number: int, request: Request):
+        if (repo, number) in data.reviews_by_pr:
+            return paginated(request, data.reviews_by_pr[(repo, number)], search=False)
+        pr = data.prs_by_node.get(f"PR_{repo}_{number}")
+        if not pr:
+            return JSONResponse({'message': 'Not Found'}, status_code=404)
+        return paginated(request, [{'state': 'APPROVED'}] * pr['reviews'], search=False)
+
+    @app.get("/repos/{owner}/{repo}/issues/{number}/timeline")
+    def timeline(owner: str, repo: str, number: int, request: Request):
+        return paginated(request, data.timelines.get((repo, number), []), search=False)
+
+    @app.get("/repos/{owner}/{repo}/issues/{number}/comments")
+    def issue_comments(owner: str, repo: str, number: int, request: Request):
+        since = request.query_params.get('since', '')
+        comments = [
+            {
+                'body': comment['body'],
+                'html_url': comment['html_url'],
+                'created_at': comment['created_at'],
+                'updated_at': comment['updated_at'],
+                # Deleted ("ghost") accounts come back without a user
+                'user': {'login': comment['login']} if comment['login'] else None
+            }
+            for comment in data.threads.get((repo, number), []) if comment['updated_at'] >= since
+        ]
+        return paginated(request, comments, search=False)
+
+    @app.post("/graphql")
+    async def graphql(request: Request):
+        variables = (await request.json()).get('variables', {})
+
+        if 'login' in variables:
+            comments = sorted(data.comments.get(variables['login'], []), key=lambda c: c['updated_at'], reverse=True)
+            start = int(variables.get('after') or 0)
+            return {'data': {'user': {'issueComments': {
+                'pageInfo': {'hasNextPage': start + 100 < len(comments), 'endCursor': str(start + 100)},
+                'nodes': [
+                    {
+                        'body': comment['body'],
+                        'url': comment['html_url'],
+                        'createdAt': comment['created_at'],
+                        'updatedAt': comment['updated_at'],
+                        'repository': {'owner': {'login': data.org}}
+                    }
+                    for comment in comments[start:start + 100]
+                ]
+            }}}}
+
+        if 'ids' in variables:
+            nodes = [data.prs_by_node.get(node_id) for node_id in variables['ids']]
+            return {'data': {'nodes': [
+                {'id': pr['node_id'], 'reviews': {'totalCount': pr['reviews']}} if pr else None for pr in nodes
+            ]}}
+
+        result = {}
+        for alias, query in variables.items():
+            if alias.endswith('_after'):
+                continue
+            items = data.search(query)
+            start = int(variables.get(f"{alias}_after") or 0)
+            page = items[start:start + 100] if alias.endswith('_pull_requests') else []
+            result[alias] = {
+                'issueCount': len(items),
+                'pageInfo': {'hasNextPage': bool(page) and start + 100 < len(items), 'endCursor': str(start + 100)},
+                'nodes': [
+                    {
+                        'number': item['number'],
+                        'updatedAt': item['updated_at'],
+                        'repository': {'name': item['repository_url'].rsplit('/', 1)[-1]},
+                        'reviews': {'totalCount': data.prs_by_node[item['node_id']]['reviews']}
+                    }
+                    for item in page
+                ]
+            }
+        return {'data': result}
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a mock GitHub API for DevLens")
+    parser.add_argument("--org", default="acme", help="Organization name")
+    parser.add_argument("--company", help="Use the developers of this DevLens company as members")
+    parser.add_argument("--members", default="", help="Comma-separated extra member logins")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    logins = [login for login in args.members.split(",") if login]
+    if args.company:
+        from database import DevLensDB
+        logins += [mock_login(dev["name"]) for dev in DevLensDB().get_company_developers(args.company)]
+    logins = list(dict.fromkeys(logins))
+
+    import uvicorn
+    print(f"Mock GitHub API for {args.org} with {len(logins)} members on http://{args.host}:{args.port}")
+    uvicorn.run(create_app(MockGitHubData(args.org, logins)), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Review response time for DevLens
+A review's latency runs from the review_requested event naming the reviewer to
+that reviewer's first review afterwards, read from the PR's timeline. Latencies
+are summarized with a log-bucketed histogram, so percentiles over thousands of
+PRs are computed in one pass with memory bounded by the number of buckets.
+"""
+
+import math
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+
+
+def _parse_timestamp(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+
+def review_request_latencies(events: Iterable[Dict]) -> Dict[str, List[float]]:
+    """
+    Hours from each review request to the requested reviewer's first review
+
+    Args:
+        events: Issue timeline events of a pull request, oldest first
+
+    Returns:
+        dict: reviewer login -> latencies in hours (one per answered request)
+    """
+    pending = {}
+    latencies = {}
+
+    for event in events:
+        kind = event.get('event')
+        if kind == 'review_requested':
+            reviewer = (event.get('requested_reviewer') or {}).get('login')
+            # A repeated request while one is open does not restart the clock
+            if reviewer and reviewer not in pending:
+                pending[reviewer] = _parse_timestamp(event['created_at'])
+        elif kind == 'review_request_removed':
+            pending.pop((event.get('requested_reviewer') or {}).get('login'), None)
+        elif kind == 'reviewed':
+            reviewer = (event.get('user') or {}).get('login')
+            requested_at = pending.pop(reviewer, None)
+            if requested_at and event.get('submitted_at'):
+                hours = (_parse_timestamp(event['submitted_at']) - requested_at).total_seconds() / 3600
+                latencies.setdefault(reviewer, []).append(max(0.0, hours))
+
+    return latencies
+
+
+class LogHistogram:
+    """
+    Streaming quantile estimates from log-spaced buckets
+
+    Bucket i covers [minimum * growth^i, minimum * growth^(i+1)), so quantiles are
+    within about (growth - 1) / 2 of the true value while a minute-to-a-year range
+    needs only a few hundred buckets. Values below `minimum` share bucket 0.
+    """
+
+    def __init__(self, growth: float = 1.05, minimum: float = 1 / 60):
+        self.growth = growth
+        self.minimum = minimum
+        self._log_growth = math.log(growth)
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, value: float):
+        index = 0
+        if value > self.minimum:
+            index = int(math.log(value / self.minimum) / self._log_growth)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += value
+
+    def merge(self, other: 'LogHistogram'):
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Value at quantile q (0..1), or None for an empty histogram"""
+        if not self.count:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen > rank:
+                # Geometric midpoint of the bucket
+                return self.minimum * self.growth ** (index + 0.5)
+        return self.minimum * self.growth ** (max(self.buckets) + 0.5)
+
+    def summary(self) -> Dict:
+        """Count, mean and p50/p90/p99 in the histogram's unit, rounded to 0.1"""
+        def rounded(value):
+            return round(value, 1) if value is not None else 0.0
+
+        return {
+            'count': self.count,
+            'mean': rounded(self.mean),
+            'p50': rounded(self.quantile(0.5)),
+            'p90': rounded(self.quantile(0.9)),
+            'p99': rounded(self.quantile(0.99))
+        }
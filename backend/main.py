@@ -1,16 +1,39 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import BackgroundTasks, FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Optional, List, Union
 import hashlib
 import json
+import os
+from contextlib import asynccontextmanager
 from database import DevLensDB
 from email_service import EmailService
+from email_outbox import EMAIL_TYPES, EmailOutbox
+from alert_notifier import AlertNotifier
+from weekly_reports import WeeklyReportJob, WeeklyReportScheduler, parse_schedule
 from engine.nlp_filter import analyze_communication
-from engine.scoring import process_metrics
+from engine.snapshots import get_company_snapshot, get_developer_profile, get_hidden_gems
 from engine.nlp_visibility_scorer import analyze_message_visibility
+from integrations.github_collector import GITHUB_API_URL
+from integrations.github_org_sync import OrgSyncJob
+from integrations.github_scheduler import shared_scheduler_loop
 
-app = FastAPI(title="DevLens API")
+@asynccontextmanager
+async def lifespan(app):
+    # Outbox workers, alert notifier and weekly report scheduler live as long as the API process
+    email_outbox.start()
+    alert_notifier.start()
+    if weekly_report_scheduler:
+        weekly_report_scheduler.start()
+    yield
+    if weekly_report_scheduler:
+        weekly_report_scheduler.stop()
+    alert_notifier.stop()
+    email_outbox.stop()
+    # Pooled SMTP connections are closed once the workers are done with them
+    email_service.close()
+
+app = FastAPI(title="DevLens API", lifespan=lifespan)
 
 # Enable CORS
 app.add_middleware(
@@ -24,6 +47,28 @@ app.add_middleware(
 db = DevLensDB()
 email_service = EmailService()
 
+# Notification emails are queued and sent by background workers
+email_outbox = EmailOutbox(db, email_service, workers=int(os.environ.get("EMAIL_WORKERS", "4")))
+
+# Changes between score snapshots are mailed to managers as alert digests
+alert_notifier = AlertNotifier(
+    db, email_service, email_outbox,
+    window=float(os.environ.get("ALERT_DIGEST_WINDOW", "900")),
+    max_per_day=int(os.environ.get("ALERT_DIGEST_MAX_PER_DAY", "6"))
+)
+
+# Weekly reports go out at WEEKLY_REPORT_SCHEDULE (UTC, e.g. "mon 08:00"; off by default)
+weekly_report_job = WeeklyReportJob(db, email_service)
+weekly_report_schedule = parse_schedule(os.environ.get("WEEKLY_REPORT_SCHEDULE", "off"))
+weekly_report_scheduler = WeeklyReportScheduler(weekly_report_job, *weekly_report_schedule) if weekly_report_schedule else None
+
+# GitHub org syncs run as background jobs; the API URL can point at a local mock server
+GITHUB_TOKEN = os.environ.get("GITHUB_TOKEN", "")
+GITHUB_BASE_URL = os.environ.get("GITHUB_API_URL", GITHUB_API_URL)
+active_github_syncs = set()
+# One scheduler per process: every sync and GitHub call shares its rate limits and priority gates
+github_scheduler_loop = shared_scheduler_loop()
+
 # Pydantic models for request/response
 class LoginRequest(BaseModel):
     email: str
@@ -54,6 +99,32 @@ class AnalyzeVisibilityRequest(BaseModel):
     developer_name: Optional[str] = None
     meeting_hours: Optional[float] = 0.0
 
+class GitHubSyncRequest(BaseModel):
+    organization: str
+    company_name: str
+    start_date: str
+    end_date: str
+    mode: str = "graphql"
+
+def parse_window(start_date: Optional[str], end_date: Optional[str]):
+    """Validate optional start/end query parameters into a (start, end) window"""
+    if not start_date and not end_date:
+        return None
+    if not (start_date and end_date):
+        raise HTTPException(status_code=400, detail="Both start_date and end_date are required for a window")
+    
+    from datetime import date
+    try:
+        start = date.fromisoformat(start_date)
+        end = date.fromisoformat(end_date)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Dates must be in YYYY-MM-DD format")
+    
+    if start > end:
+        raise HTTPException(status_code=400, detail="start_date must not be after end_date")
+    
+    return (start.isoformat(), end.isoformat())
+
 @app.get("/")
 def read_root():
     return {"status": "DevLens API is Running"}
@@ -64,7 +135,7 @@ def get_companies():
     companies = db.get_companies()
     return {
         "success": True,
-        "companies": [{"id": comp[0], "name": comp[1]} for comp in companies]
+        "companies": [{"id": comp["id"], "name": comp["name"]} for comp in companies]
     }
 
 @app.post("/api/login")
@@ -126,145 +197,75 @@ def create_manager(request: RegisterRequest):
     return register(request)
 
 @app.get("/api/dashboard/{company_name}")
-def get_dashboard_data(company_name: str):
+def get_dashboard_data(company_name: str, start_date: Optional[str] = None, end_date: Optional[str] = None):
     """Get dashboard data for a specific company (main endpoint used by frontend)"""
     # Decode URL-encoded company name
     from urllib.parse import unquote
     company_name = unquote(company_name)
+    window = parse_window(start_date, end_date)
     
-    # Get developers for this company
-    developers = db.get_company_developers(company_name)
+    # Get scored developers (materialized snapshot unless the data changed)
+    snapshot = get_company_snapshot(db, company_name, window)
     
-    if not developers:
+    if not snapshot:
         raise HTTPException(status_code=404, detail=f"No developers found for company: {company_name}")
     
-    # Process communication scores
-    for dev in developers:
-        dev["comm_score"] = analyze_communication(dev["msgs"])
-    
-    # Process metrics using the scoring engine
-    processed_data = process_metrics(developers)
-    
-    # Load attendance data if available
-    attendance_data = {}
-    try:
-        import os
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        attendance_file = os.path.join(script_dir, "data", "activity_based_metrics.json")
-        
-        if os.path.exists(attendance_file):
-            with open(attendance_file, 'r', encoding='utf-8') as f:
-                attendance_list = json.load(f)
-                # Convert to dict for easy lookup
-                for att in attendance_list:
-                    attendance_data[att['name']] = att
-    except Exception as e:
-        print(f"Could not load attendance data: {e}")
-    
-    # Add attendance data to processed developers
-    for dev in processed_data:
-        if dev['name'] in attendance_data:
-            att_info = attendance_data[dev['name']]
-            dev['attendance_rate'] = att_info['attendance_metrics']['attendance_rate']
-            dev['days_present'] = att_info['attendance_metrics']['days_present']
-            dev['total_work_days'] = att_info['attendance_metrics']['total_work_days']
-            dev['behavioral_summary'] = att_info.get('behavioral_summary', {})
-        else:
-            # Default attendance if not found
-            dev['attendance_rate'] = 0.85  # Default 85%
-            dev['days_present'] = 17
-            dev['total_work_days'] = 20
-            dev['behavioral_summary'] = {}
+    processed_data = snapshot["developers"]
     
     return {
         "company": company_name,
         "developers": processed_data,
-        "total_count": len(processed_data)
+        "total_count": len(processed_data),
+        "snapshot_version": snapshot["snapshot_version"] if snapshot else None,
+        "window": {"start_date": window[0], "end_date": window[1]} if window else None
     }
 
 @app.get("/api/dashboard/manager/{manager_id}")
-def get_dashboard_data_by_manager(manager_id: int):
+def get_dashboard_data_by_manager(manager_id: int, start_date: Optional[str] = None, end_date: Optional[str] = None):
     """Get dashboard data for a specific manager"""
+    window = parse_window(start_date, end_date)
+    
     # Get manager's company
     manager = db.get_manager_by_id(manager_id)
     if not manager:
         raise HTTPException(status_code=404, detail="Manager not found")
     
-    company_id = manager[5]  # company_id is at index 5
+    company_id = manager["company_id"]
     
     # Get company name
     company = db.get_company_by_id(company_id)
     if not company:
         raise HTTPException(status_code=404, detail="Company not found")
     
-    company_name = company[1]  # name is at index 1
+    company_name = company["name"]
     
-    # Get developers for this company
-    developers = db.get_company_developers(company_name)
-    
-    # Process communication scores
-    for dev in developers:
-        dev["comm_score"] = analyze_communication(dev["msgs"])
-    
-    # Process metrics using the scoring engine
-    processed_data = process_metrics(developers)
-    
-    # Load attendance data if available
-    attendance_data = {}
-    try:
-        import os
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        attendance_file = os.path.join(script_dir, "data", "activity_based_metrics.json")
-        
-        if os.path.exists(attendance_file):
-            with open(attendance_file, 'r', encoding='utf-8') as f:
-                attendance_list = json.load(f)
-                # Convert to dict for easy lookup
-                for att in attendance_list:
-                    attendance_data[att['name']] = att
-    except Exception as e:
-        print(f"Could not load attendance data: {e}")
-    
-    # Add attendance data to processed developers
-    for dev in processed_data:
-        if dev['name'] in attendance_data:
-            att_info = attendance_data[dev['name']]
-            dev['attendance_rate'] = att_info['attendance_metrics']['attendance_rate']
-            dev['days_present'] = att_info['attendance_metrics']['days_present']
-            dev['total_work_days'] = att_info['attendance_metrics']['total_work_days']
-            dev['behavioral_summary'] = att_info.get('behavioral_summary', {})
-        else:
-            # Default attendance if not found
-            dev['attendance_rate'] = 0.85  # Default 85%
-            dev['days_present'] = 17
-            dev['total_work_days'] = 20
-            dev['behavioral_summary'] = {}
+    # Get scored developers (materialized snapshot unless the data changed)
+    snapshot = get_company_snapshot(db, company_name, window)
+    processed_data = snapshot["developers"] if snapshot else []
     
     return {
         "company": company_name,
         "developers": processed_data,
-        "total_count": len(processed_data)
+        "total_count": len(processed_data),
+        "snapshot_version": snapshot["snapshot_version"] if snapshot else None,
+        "window": {"start_date": window[0], "end_date": window[1]} if window else None
     }
 
 @app.get("/api/team-analytics/{company_name}")
-def get_team_analytics_by_company(company_name: str):
+def get_team_analytics_by_company(company_name: str, start_date: Optional[str] = None, end_date: Optional[str] = None):
     """Get team analytics for a specific company"""
     # Decode URL-encoded company name
     from urllib.parse import unquote
     company_name = unquote(company_name)
+    window = parse_window(start_date, end_date)
     
-    # Get developers for this company
-    developers = db.get_company_developers(company_name)
+    # Get scored developers (materialized snapshot unless the data changed)
+    snapshot = get_company_snapshot(db, company_name, window)
     
-    if not developers:
+    if not snapshot:
         raise HTTPException(status_code=404, detail=f"No developers found for company: {company_name}")
     
-    # Process communication scores
-    for dev in developers:
-        dev["comm_score"] = analyze_communication(dev["msgs"])
-    
-    # Process metrics
-    processed_data = process_metrics(developers)
+    processed_data = snapshot["developers"]
     
     # Group by teams
     teams = {}
@@ -300,38 +301,130 @@ def get_team_analytics_by_company(company_name: str):
     }
 
 @app.get("/api/hidden-gems/{company_name}")
-def get_hidden_gems_by_company(company_name: str):
+def get_hidden_gems_by_company(company_name: str, start_date: Optional[str] = None, end_date: Optional[str] = None):
     """Get Hidden Gems (Quadrant 2 - High Impact, Low Visibility) for a specific company"""
     # Decode URL-encoded company name
     from urllib.parse import unquote
     company_name = unquote(company_name)
+    window = parse_window(start_date, end_date)
     
-    # Get developers for this company
-    developers = db.get_company_developers(company_name)
+    # Hidden Gems of the latest persisted snapshot (indexed read), sorted by impact
+    result = get_hidden_gems(db, company_name, window)
     
-    if not developers:
+    if not result:
         raise HTTPException(status_code=404, detail=f"No developers found for company: {company_name}")
     
-    # Process communication scores
-    for dev in developers:
-        dev["comm_score"] = analyze_communication(dev["msgs"])
-    
-    # Process metrics
-    processed_data = process_metrics(developers)
-    
-    # Filter only Hidden Gems (Quadrant 2)
-    hidden_gems = [dev for dev in processed_data if dev.get('is_hidden_gem', False)]
-    
-    # Sort Hidden Gems by impact score (descending)
-    hidden_gems.sort(key=lambda x: x.get('raw_impact', 0), reverse=True)
-    
     return {
         "company": company_name,
-        "hidden_gems": hidden_gems,
-        "total_hidden_gems": len(hidden_gems),
-        "total_developers": len(processed_data)
+        "hidden_gems": result["hidden_gems"],
+        "total_hidden_gems": len(result["hidden_gems"]),
+        "total_developers": result["total_developers"],
+        "snapshot_version": result["snapshot_version"]
+    }
+
+@app.get("/api/developers/{developer_id}")
+def get_developer_detail(developer_id: int):
+    """Get one developer's scores, placed against their company's latest snapshot"""
+    profile = get_developer_profile(db, developer_id)
+
+    if not profile or not profile["developer"]:
+        raise HTTPException(status_code=404, detail=f"Developer not found: {developer_id}")
+
+    return {
+        "company": profile["company"],
+        "snapshot_version": profile["snapshot_version"],
+        "company_stats": profile["stats"],
+        "developer": profile["developer"]
+    }
+
+@app.get("/api/developers/{developer_id}/visibility")
+def get_developer_visibility(developer_id: int):
+    """NLP visibility breakdown for one developer, with their standing in the company"""
+    profile = get_developer_profile(db, developer_id)
+
+    if not profile or not profile["developer"]:
+        raise HTTPException(status_code=404, detail=f"Developer not found: {developer_id}")
+
+    dev = profile["developer"]
+    stats = profile["stats"]
+
+    # Only this developer's messages are analyzed (including meeting hours)
+    meeting_hours = dev.get('meetings', 0) * 1.5  # Assume 1.5 hours per meeting
+    nlp_analysis = analyze_message_visibility(dev.get('msgs', []), meeting_hours)
+
+    return {
+        "developer_id": developer_id,
+        "developer_name": dev['name'],
+        "team": dev['team'],
+        "company": profile["company"],
+        "snapshot_version": profile["snapshot_version"],
+        "message_count": len(dev.get('msgs', [])),
+        "nlp_visibility_analysis": nlp_analysis,
+        "visibility_score": dev.get('visibility_score', dev.get('raw_visibility', 0.0)),
+        "vis_z": dev.get('vis_z', 0.0),
+        "company_visibility_median": stats["visibility_median"],
+        "company_visibility_std": stats["visibility_std"]
     }
 
+def run_github_sync(job, run_id):
+    """Background task: run an org sync, leaving failures in the run row"""
+    try:
+        job.run(run_id)
+    except Exception as e:
+        print(f"GitHub sync #{run_id} failed: {e}")
+    finally:
+        active_github_syncs.discard(run_id)
+
+def schedule_github_sync(job, run_id, background_tasks):
+    # A run left 'running' by a crashed process can be resumed; a live one cannot
+    if run_id in active_github_syncs:
+        raise HTTPException(status_code=409, detail=f"GitHub sync #{run_id} is already running")
+    
+    active_github_syncs.add(run_id)
+    background_tasks.add_task(run_github_sync, job, run_id)
+    return {"run_id": run_id, "status_url": f"/api/github/sync/{run_id}"}
+
+@app.post("/api/github/sync", status_code=202)
+def start_github_sync(request: GitHubSyncRequest, background_tasks: BackgroundTasks):
+    """Start (or resume) an org-wide GitHub sync in the background"""
+    company = db.get_company_by_name(request.company_name)
+    if not company:
+        raise HTTPException(status_code=404, detail=f"Company not found: {request.company_name}")
+    if request.mode not in ("graphql", "rest"):
+        raise HTTPException(status_code=400, detail="mode must be 'graphql' or 'rest'")
+    
+    start_date, end_date = parse_window(request.start_date, request.end_date)
+    job = OrgSyncJob(
+        db, GITHUB_TOKEN, request.organization, company["id"], start_date, end_date,
+        base_url=GITHUB_BASE_URL, mode=request.mode, scheduler_loop=github_scheduler_loop
+    )
+    return schedule_github_sync(job, job.start(), background_tasks)
+
+@app.get("/api/github/sync/{run_id}")
+def get_github_sync_status(run_id: int):
+    """Progress of an org-wide GitHub sync"""
+    run = db.get_github_sync_run(run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail=f"GitHub sync not found: {run_id}")
+    
+    run["active"] = run_id in active_github_syncs
+    return run
+
+@app.post("/api/github/sync/{run_id}/resume", status_code=202)
+def resume_github_sync(run_id: int, background_tasks: BackgroundTasks):
+    """Resume an interrupted or failed org sync; members already synced are skipped"""
+    run = db.get_github_sync_run(run_id)
+    if not run:
+        raise HTTPException(status_code=404, detail=f"GitHub sync not found: {run_id}")
+    if run["status"] == "completed" and not run["failed_members"]:
+        raise HTTPException(status_code=409, detail=f"GitHub sync #{run_id} is already complete")
+    
+    job = OrgSyncJob(
+        db, GITHUB_TOKEN, run["org"], run["company_id"], run["start_date"], run["end_date"],
+        base_url=GITHUB_BASE_URL, mode=run["mode"], scheduler_loop=github_scheduler_loop
+    )
+    return schedule_github_sync(job, run_id, background_tasks)
+
 @app.get("/api/settings/{manager_id}")
 def get_manager_settings(manager_id: int):
     """Get manager's email settings"""
@@ -363,62 +456,61 @@ def update_manager_settings(request: EmailSettingsRequest):
     else:
         raise HTTPException(status_code=400, detail="Failed to update settings")
 
-@app.post("/api/send-email")
+@app.post("/api/send-email", status_code=202)
 def send_email(request: SendEmailRequest):
-    """Send email notification"""
+    """Queue an email notification; poll the returned status_url for delivery"""
     # Get manager info and settings
     settings = db.get_manager_settings(request.manager_id)
     if not settings:
         raise HTTPException(status_code=404, detail="Email settings not found")
     
-    # Use the custom email address from settings
-    email_address = settings['email_address']
-    
-    # Get manager info for name and company
-    conn = db.get_connection()
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        SELECT m.name, c.name as company_name
-        FROM managers m
-        JOIN companies c ON m.company_id = c.id
-        WHERE m.id = ?
-    ''', (request.manager_id,))
-    
-    manager_result = cursor.fetchone()
-    conn.close()
-    
-    if not manager_result:
+    if not db.get_manager_with_company(request.manager_id):
         raise HTTPException(status_code=404, detail="Manager not found")
     
-    manager_name, company_name = manager_result
-    
-    # Get company developers for email content
-    developers = db.get_company_developers(company_name)
-    
-    # Process developers for email content
-    for dev in developers:
-        dev["comm_score"] = analyze_communication(dev["msgs"])
-    processed_data = process_metrics(developers)
-    
-    # Send appropriate email based on type
-    success = False
-    
-    if request.email_type == "test":
-        success = email_service.send_test_email(email_address, manager_name)
-    elif request.email_type == "performance" and settings['performance_alerts']:
-        success = email_service.send_performance_alert(email_address, manager_name, company_name, processed_data)
-    elif request.email_type == "weekly" and settings['weekly_reports']:
-        success = email_service.send_weekly_report(email_address, manager_name, company_name, processed_data)
-    elif request.email_type == "critical" and settings['critical_issues']:
-        success = email_service.send_critical_issue_alert(email_address, manager_name, company_name, processed_data)
-    else:
+    # Only known types whose notifications are enabled are queued
+    if request.email_type not in EMAIL_TYPES:
+        raise HTTPException(status_code=400, detail="Invalid email type or notifications disabled")
+    flag = EMAIL_TYPES[request.email_type]
+    if flag and not settings[flag]:
         raise HTTPException(status_code=400, detail="Invalid email type or notifications disabled")
     
-    if success:
-        return {"success": True, "message": f"Email sent successfully to {email_address}"}
-    else:
-        raise HTTPException(status_code=500, detail="Failed to send email")
+    # Use the custom email address from settings
+    email_address = settings['email_address']
+    job_id = email_outbox.enqueue(request.manager_id, request.email_type, email_address)
+    
+    return {
+        "success": True,
+        "job_id": job_id,
+        "status_url": f"/api/send-email/{job_id}",
+        "message": f"Email queued for {email_address}"
+    }
+
+@app.get("/api/send-email/{job_id}")
+def get_email_status(job_id: int):
+    """Delivery status of a queued email"""
+    job = db.get_email_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Email job not found: {job_id}")
+    
+    return email_outbox.job_status(job)
+
+def run_weekly_reports():
+    """Background task: send the weekly reports now"""
+    try:
+        weekly_report_job.run()
+    except Exception as e:
+        print(f"Weekly report run failed: {e}")
+
+@app.post("/api/reports/weekly/run", status_code=202)
+def trigger_weekly_reports(background_tasks: BackgroundTasks):
+    """Send the weekly reports now instead of waiting for the schedule"""
+    background_tasks.add_task(run_weekly_reports)
+    return {"success": True, "runs_url": "/api/reports/runs"}
+
+@app.get("/api/reports/runs")
+def get_report_runs(limit: int = 20):
+    """Recent report runs with counts and per-company timings"""
+    return {"runs": db.get_report_runs(limit=limit)}
 
 @app.post("/api/analyze-visibility")
 def analyze_visibility(request: AnalyzeVisibilityRequest):
@@ -2,26 +2,54 @@
 """
 Calculate attendance and behavioral metrics from actual Git and Communication data
 Instead of mock HR data, infer attendance from activity patterns
+
+The exports are streamed and processed column-wise in chunks: dates are parsed
+once per column, commits and messages are grouped by (user, day) and keyword
+flags are computed once per message, so the cost grows with the amount of
+activity rather than with users x messages, and memory with the number of
+people and days rather than with the size of the exports.
 """
 
 import json
+import random
+import numpy as np
 import pandas as pd
 import os
-from datetime import datetime, timedelta
-from collections import defaultdict
+from itertools import islice
 
-def parse_date(date_string):
-    """Parse ISO date string to datetime object"""
-    try:
-        # Handle different date formats
-        if 'T' in date_string:
-            dt = datetime.fromisoformat(date_string.replace('Z', '+00:00'))
-            # Convert to naive datetime for comparison
-            return dt.replace(tzinfo=None)
-        else:
-            return datetime.strptime(date_string, '%Y-%m-%d')
-    except:
-        return None
+from json_stream import iter_json_records
+
+# Message keywords that indicate knowledge sharing and innovation
+KNOWLEDGE_WORDS = ['help', 'explain', 'guide', 'tutorial', 'documentation']
+INNOVATION_WORDS = ['idea', 'proposal', 'improve', 'optimize', 'refactor']
+
+def parse_dates(date_strings):
+    """
+    Parse a column of date strings to naive datetimes (NaT where unparseable)
+
+    ISO timestamps keep their wall-clock time with the UTC offset dropped; values
+    without a time part must be 'YYYY-MM-DD'.
+    """
+    text = pd.Series(date_strings, dtype=object).astype(str)
+    has_time = text.str.contains('T', regex=False)
+    parsed = pd.Series(pd.NaT, index=text.index, dtype='datetime64[ns]')
+    if has_time.any():
+        stamps = text[has_time].str.replace(r'(Z|[+-]\d{2}:?\d{2})$', '', regex=True)
+        parsed[has_time] = pd.to_datetime(stamps, format='ISO8601', errors='coerce')
+    if (~has_time).any():
+        parsed[~has_time] = pd.to_datetime(text[~has_time], format='%Y-%m-%d', errors='coerce')
+    return parsed
+
+def keyword_scores(counts):
+    """0.1 per matching message, capped at 1.0
+
+    The scores used to be accumulated one message at a time; np.cumsum adds in the
+    same order, so the capped values (and the int() estimates derived from them)
+    are unchanged.
+    """
+    counts = np.asarray(counts, dtype=np.int64)
+    steps = np.concatenate(([0.0], np.cumsum(np.full(int(counts.max(initial=0)), 0.1))))
+    return np.minimum(steps[counts], 1.0)
 
 def get_activity_based_metrics():
     """
@@ -33,165 +61,214 @@ def get_activity_based_metrics():
     script_dir = os.path.dirname(os.path.abspath(__file__))
     data_dir = os.path.join(script_dir, "..", "data")
     
-    # Load actual data
+    # Stream actual data (JSON arrays or NDJSON)
     comm_path = os.path.join(data_dir, "comm_mock_data.json")
     exec_path = os.path.join(data_dir, "exec_mock_data.json")
     
-    with open(comm_path, "r", encoding="utf-8") as f:
-        comm_data = json.load(f)
+    return calculate_activity_metrics(iter_json_records(comm_path), iter_json_records(exec_path))
+
+def iter_chunks(records, size):
+    """Lists of up to `size` records from an iterable"""
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, size))
+        if not chunk:
+            return
+        yield chunk
+
+class ActivityAccumulator:
+    """
+    Per (user, day) activity counts and per-user keyword counts built up chunk by
+    chunk, so memory follows the number of people and days rather than the size
+    of the exports
+    """
+    
+    def __init__(self, compact_every=16):
+        self.first_seen = {}  # user_id -> None, in order of first dated activity
+        self.user_infos = {}  # user_id -> user dict of their first message
+        self.start_date = None
+        self.end_date = None
+        self.commit_count = 0
+        self.message_count = 0
+        self.compact_every = compact_every
+        self._daily = []
+        self._keywords = []
+    
+    def add_commits(self, commits):
+        self.commit_count += len(commits)
+        self._add_activity(
+            [commit['devlens_meta']['teams_user_id'] for commit in commits],
+            parse_dates([commit['commit']['author']['date'] for commit in commits]),
+            'commits'
+        )
     
-    with open(exec_path, "r", encoding="utf-8") as f:
-        exec_data = json.load(f)
+    def add_messages(self, messages):
+        self.message_count += len(messages)
+        for message in messages:
+            self.user_infos.setdefault(message['from']['user']['id'], message['from']['user'])
+        user_ids = [message['from']['user']['id'] for message in messages]
+        self._add_activity(user_ids, parse_dates([message['createdDateTime'] for message in messages]), 'messages')
+        
+        # Keyword flags once per message, counted per user
+        content = pd.Series([message['body']['content'] for message in messages]).fillna('').str.lower()
+        flags = pd.DataFrame({
+            'user_id': user_ids,
+            'knowledge': content.str.contains('|'.join(KNOWLEDGE_WORDS), regex=True).to_numpy(),
+            'innovation': content.str.contains('|'.join(INNOVATION_WORDS), regex=True).to_numpy()
+        })
+        self._keywords.append(flags.groupby('user_id', sort=False).sum())
+        if len(self._keywords) >= self.compact_every:
+            self._keywords = [pd.concat(self._keywords).groupby(level=0, sort=False).sum()]
+    
+    def _add_activity(self, user_ids, dates, kind):
+        chunk = pd.DataFrame({'user_id': user_ids, 'date': dates}).dropna(subset=['date'])
+        if chunk.empty:
+            return
+        
+        lowest, highest = chunk['date'].min(), chunk['date'].max()
+        self.start_date = lowest if self.start_date is None else min(self.start_date, lowest)
+        self.end_date = highest if self.end_date is None else max(self.end_date, highest)
+        self.first_seen.update(dict.fromkeys(pd.unique(chunk['user_id'])))
+        
+        counts = chunk.groupby(['user_id', chunk['date'].dt.normalize().rename('day')], sort=False).size()
+        daily = pd.DataFrame({'commits': 0, 'messages': 0}, index=counts.index)
+        daily[kind] = counts
+        self._daily.append(daily)
+        if len(self._daily) >= self.compact_every:
+            self._daily = [self.daily()]
     
-    # Find actual date range from the data
-    all_dates = []
+    def daily(self):
+        """commits and messages per (user_id, day)"""
+        if not self._daily:
+            return pd.DataFrame(
+                {'commits': [], 'messages': []}, dtype='int64',
+                index=pd.MultiIndex.from_arrays([[], pd.DatetimeIndex([])], names=['user_id', 'day'])
+            )
+        return pd.concat(self._daily).groupby(level=['user_id', 'day'], sort=False).sum()
     
-    # Get dates from commits
-    for commit in exec_data:
-        commit_date = parse_date(commit['commit']['author']['date'])
-        if commit_date:
-            all_dates.append(commit_date)
+    def keywords(self):
+        """knowledge and innovation message counts per user_id"""
+        if not self._keywords:
+            return pd.DataFrame({'knowledge': [], 'innovation': []}, dtype='int64')
+        return pd.concat(self._keywords).groupby(level=0, sort=False).sum()
+
+def calculate_activity_metrics(comm_records, exec_records, chunk_size=100_000):
+    """
+    Metrics per person from Teams messages and GitHub commits
+
+    Args:
+        comm_records, exec_records: Iterables of messages and commits (for
+            example iter_json_records); each is consumed once, chunk_size
+            records at a time
+
+    Returns:
+        dict: user_id -> metrics, in order of each person's first activity
+    """
+    accumulator = ActivityAccumulator()
+    for commits in iter_chunks(exec_records, chunk_size):
+        accumulator.add_commits(commits)
+    for messages in iter_chunks(comm_records, chunk_size):
+        accumulator.add_messages(messages)
     
-    # Get dates from messages
-    for message in comm_data:
-        msg_date = parse_date(message['createdDateTime'])
-        if msg_date:
-            all_dates.append(msg_date)
+    print(f"\nProcessed {accumulator.commit_count} commits...")
+    print(f"Processed {accumulator.message_count} messages...")
     
-    if not all_dates:
+    if accumulator.start_date is None:
         print("No valid dates found in data!")
         return {}
     
     # Use actual data range
-    start_date = min(all_dates)
-    end_date = max(all_dates)
+    start_date = accumulator.start_date.to_pydatetime()
+    end_date = accumulator.end_date.to_pydatetime()
     
-    # Generate all work days (excluding weekends) in the actual data range
-    work_days = []
-    current_date = start_date
-    while current_date <= end_date:
-        if current_date.weekday() < 5:  # Monday = 0, Friday = 4
-            work_days.append(current_date.date())
-        current_date += timedelta(days=1)
+    # All work days (excluding weekends) in the actual data range
+    calendar = pd.date_range(start_date, end_date, freq='D')
+    work_days = calendar[calendar.dayofweek < 5].normalize()
+    total_work_days = len(work_days)
     
     print(f"Analyzing activity from {start_date.date()} to {end_date.date()}")
-    print(f"Total work days in period: {len(work_days)}")
-    
-    # Track daily activity per person
-    daily_activity = defaultdict(lambda: defaultdict(lambda: {
-        'commits': 0,
-        'messages': 0,
-        'has_activity': False
-    }))
-    
-    # Process Git commits
-    print(f"\nProcessing {len(exec_data)} commits...")
-    for commit in exec_data:
-        commit_date_str = commit['commit']['author']['date']
-        commit_date = parse_date(commit_date_str)
-        
-        if commit_date and start_date <= commit_date <= end_date:
-            user_id = commit['devlens_meta']['teams_user_id']
-            day = commit_date.date()
-            
-            daily_activity[user_id][day]['commits'] += 1
-            daily_activity[user_id][day]['has_activity'] = True
-    
-    # Process Communication messages
-    print(f"Processing {len(comm_data)} messages...")
-    for message in comm_data:
-        msg_date_str = message['createdDateTime']
-        msg_date = parse_date(msg_date_str)
-        
-        if msg_date and start_date <= msg_date <= end_date:
-            user_id = message['from']['user']['id']
-            day = msg_date.date()
-            
-            daily_activity[user_id][day]['messages'] += 1
-            daily_activity[user_id][day]['has_activity'] = True
-    
-    # Calculate comprehensive metrics for each person
-    user_metrics = {}
+    print(f"Total work days in period: {total_work_days}")
     
-    for user_id in daily_activity.keys():
-        # Get user info
-        user_info = None
-        for msg in comm_data:
-            if msg['from']['user']['id'] == user_id:
-                user_info = msg['from']['user']
-                break
-        
+    # One row per (user, work day) with activity
+    users = list(accumulator.first_seen)
+    daily = accumulator.daily()
+    daily = daily[daily.index.get_level_values('day').isin(work_days)]
+    
+    by_user = daily.groupby(level='user_id', sort=False)
+    totals = pd.DataFrame({
+        'active_days': by_user.size(),
+        'total_commits': by_user['commits'].sum(),
+        'total_messages': by_user['messages'].sum(),
+        'commit_days': (daily['commits'] > 0).groupby(level='user_id', sort=False).sum(),
+        'message_days': (daily['messages'] > 0).groupby(level='user_id', sort=False).sum()
+    }).reindex(users, fill_value=0)
+    
+    keywords = accumulator.keywords().reindex(users, fill_value=0)
+    knowledge_sharing_scores = keyword_scores(keywords['knowledge'])
+    innovation_scores = keyword_scores(keywords['innovation'])
+    user_infos = accumulator.user_infos
+    
+    active_days = totals['active_days'].to_numpy()
+    total_commits = totals['total_commits'].to_numpy()
+    total_messages = totals['total_messages'].to_numpy()
+    commit_days = totals['commit_days'].to_numpy()
+    message_days = totals['message_days'].to_numpy()
+    
+    # REALISTIC ATTENDANCE CALCULATION
+    # Instead of only counting days with activity, we estimate realistic attendance
+    # based on activity patterns and typical work behavior
+    
+    # 1. Base attendance from activity frequency
+    activity_frequency = active_days / total_work_days if total_work_days else np.zeros(len(users))
+    
+    # 2. Estimate realistic attendance based on activity patterns
+    # High performers typically work more days than they commit/message; the
+    # lower the contribution, the more sporadic (or part-time) the presence
+    estimated_attendance = np.select(
+        [total_commits >= 20, total_commits >= 10, total_commits >= 5],
+        [np.minimum(0.95, activity_frequency * 2.5),
+         np.minimum(0.90, activity_frequency * 3.0),
+         np.minimum(0.85, activity_frequency * 2.0)],
+        np.minimum(0.70, activity_frequency * 1.5)
+    )
+    
+    # 3. Communication boost - people who communicate more are likely more present
+    estimated_attendance = np.where(
+        total_messages >= 15, np.minimum(0.95, estimated_attendance + 0.1),
+        np.where(total_messages >= 8, np.minimum(0.90, estimated_attendance + 0.05), estimated_attendance)
+    )
+    
+    # 4. Consistency boost - people with regular activity are more reliable
+    estimated_attendance = np.where(
+        (commit_days >= 3) & (message_days >= 2), np.minimum(0.95, estimated_attendance + 0.05), estimated_attendance
+    )
+    
+    # 5. Ensure minimum realistic attendance (no one has 0% attendance if they have any activity)
+    estimated_attendance = np.where(
+        (estimated_attendance < 0.6) & ((total_commits > 0) | (total_messages > 0)),
+        0.6 + (estimated_attendance * 0.4), estimated_attendance
+    )
+    
+    # Name and team come from each person's first message; people who never
+    # sent one are left out
+    user_metrics = {}
+    rows = zip(users, active_days.tolist(), total_commits.tolist(), total_messages.tolist(), commit_days.tolist(),
+               message_days.tolist(), np.asarray(activity_frequency).tolist(), estimated_attendance.tolist(),
+               knowledge_sharing_scores.tolist(), innovation_scores.tolist())
+    for (user_id, active_days, total_commits, total_messages, commit_days, message_days,
+         activity_frequency, estimated_attendance, knowledge_sharing_score, innovation_score) in rows:
+        user_info = user_infos.get(user_id)
         if not user_info:
             continue
         
-        # Calculate activity metrics
-        active_days = 0
-        total_commits = 0
-        total_messages = 0
-        commit_days = 0
-        message_days = 0
-        
-        for work_day in work_days:
-            day_activity = daily_activity[user_id].get(work_day, {
-                'commits': 0, 'messages': 0, 'has_activity': False
-            })
-            
-            if day_activity['has_activity']:
-                active_days += 1
-            
-            total_commits += day_activity['commits']
-            total_messages += day_activity['messages']
-            
-            if day_activity['commits'] > 0:
-                commit_days += 1
-            if day_activity['messages'] > 0:
-                message_days += 1
-        
-        # REALISTIC ATTENDANCE CALCULATION
-        # Instead of only counting days with activity, we estimate realistic attendance
-        # based on activity patterns and typical work behavior
-        
-        # 1. Base attendance from activity frequency
-        activity_frequency = active_days / len(work_days) if work_days else 0
-        
-        # 2. Estimate realistic attendance based on activity patterns
-        # High performers typically work more days than they commit/message
-        if total_commits >= 20:  # High contributor
-            # Assume they work 4-5 days per week but only commit/message 2-3 days
-            estimated_attendance = min(0.95, activity_frequency * 2.5)
-        elif total_commits >= 10:  # Medium contributor  
-            # Assume they work 4-5 days per week but only commit/message 1-2 days
-            estimated_attendance = min(0.90, activity_frequency * 3.0)
-        elif total_commits >= 5:  # Low contributor
-            # More sporadic, but still present more than activity shows
-            estimated_attendance = min(0.85, activity_frequency * 2.0)
-        else:  # Very low contributor
-            # Might be part-time or having issues
-            estimated_attendance = min(0.70, activity_frequency * 1.5)
-        
-        # 3. Communication boost - people who communicate more are likely more present
-        if total_messages >= 15:
-            estimated_attendance = min(0.95, estimated_attendance + 0.1)
-        elif total_messages >= 8:
-            estimated_attendance = min(0.90, estimated_attendance + 0.05)
-        
-        # 4. Consistency boost - people with regular activity are more reliable
-        if commit_days >= 3 and message_days >= 2:
-            estimated_attendance = min(0.95, estimated_attendance + 0.05)
-        
-        # 5. Ensure minimum realistic attendance (no one has 0% attendance if they have any activity)
-        if estimated_attendance < 0.6 and (total_commits > 0 or total_messages > 0):
-            estimated_attendance = 0.6 + (estimated_attendance * 0.4)
-        
         # 6. Add some realistic variation (people aren't perfect)
-        import random
         random.seed(hash(user_id) % 1000)  # Consistent randomization per user
         attendance_variation = random.uniform(-0.05, 0.05)
         final_attendance_rate = max(0.5, min(0.98, estimated_attendance + attendance_variation))
         
         # Calculate derived metrics
-        estimated_days_present = int(final_attendance_rate * len(work_days))
-        absent_days = len(work_days) - estimated_days_present
+        estimated_days_present = int(final_attendance_rate * total_work_days)
+        absent_days = total_work_days - estimated_days_present
         
         # Activity patterns
         avg_commits_per_active_day = total_commits / active_days if active_days > 0 else 0
@@ -199,31 +276,10 @@ def get_activity_based_metrics():
         
         # Collaboration metrics (inferred from communication patterns)
         collaboration_score = min(1.0, total_messages / 15.0)  # Normalize to 0-1
-        consistency_score = min(active_days / (len(work_days) * 0.6), 1.0)  # 60% activity = full score
-        
-        # Innovation metrics (inferred from commit patterns and message content)
-        innovation_score = 0.0
-        knowledge_sharing_score = 0.0
-        
-        # Analyze message content for knowledge sharing indicators
-        for message in comm_data:
-            if message['from']['user']['id'] == user_id:
-                content = message['body']['content'].lower()
-                
-                # Knowledge sharing indicators
-                if any(word in content for word in ['help', 'explain', 'guide', 'tutorial', 'documentation']):
-                    knowledge_sharing_score += 0.1
-                
-                # Innovation indicators  
-                if any(word in content for word in ['idea', 'proposal', 'improve', 'optimize', 'refactor']):
-                    innovation_score += 0.1
-        
-        # Normalize scores
-        knowledge_sharing_score = min(knowledge_sharing_score, 1.0)
-        innovation_score = min(innovation_score, 1.0)
+        consistency_score = min(active_days / (total_work_days * 0.6), 1.0)  # 60% activity = full score
         
         # Learning score (inferred from activity diversity and growth patterns)
-        learning_score = min(1.0, (commit_days + message_days) / (len(work_days) * 0.4))
+        learning_score = min(1.0, (commit_days + message_days) / (total_work_days * 0.4))
         
         user_metrics[user_id] = {
             "user_id": user_id,
@@ -232,10 +288,10 @@ def get_activity_based_metrics():
             "analysis_period": {
                 "start_date": start_date.isoformat(),
                 "end_date": end_date.isoformat(),
-                "total_work_days": len(work_days)
+                "total_work_days": total_work_days
             },
             "attendance_metrics": {
-                "total_work_days": len(work_days),
+                "total_work_days": total_work_days,
                 "days_present": estimated_days_present,
                 "days_absent": absent_days,
                 "attendance_rate": round(final_attendance_rate, 3),
@@ -253,7 +309,7 @@ def get_activity_based_metrics():
                 "collaboration_score": round(collaboration_score, 3),
                 "consistency_score": round(consistency_score, 3),
                 "cross_team_interactions": total_messages,  # Simplified
-                "communication_frequency": round(total_messages / len(work_days), 2)
+                "communication_frequency": round(total_messages / total_work_days, 2)
             },
             "knowledge_sharing_metrics": {
                 "knowledge_sharing_score": round(knowledge_sharing_score, 3),
@@ -267,12 +323,12 @@ def get_activity_based_metrics():
             },
             "learning_metrics": {
                 "learning_score": round(learning_score, 3),
-                "activity_diversity": round((commit_days + message_days) / (2 * len(work_days)), 3)
+                "activity_diversity": round((commit_days + message_days) / (2 * total_work_days), 3)
             },
             "behavioral_summary": {
                 "overall_engagement": round((final_attendance_rate + collaboration_score + consistency_score) / 3, 3),
-                "technical_activity": round(total_commits / len(work_days), 2),
-                "communication_activity": round(total_messages / len(work_days), 2)
+                "technical_activity": round(total_commits / total_work_days, 2),
+                "communication_activity": round(total_messages / total_work_days, 2)
             }
         }
     
@@ -340,29 +396,34 @@ def analyze_attendance_patterns(user_metrics):
     
     return user_metrics
 
-if __name__ == "__main__":
+def save_activity_metrics():
+    """Calculate, analyze and save the activity-based metrics; returns the output path"""
     print("CALCULATING ATTENDANCE FROM ACTUAL ACTIVITY DATA")
     print("Analyzing Git commits and communication patterns...")
     
+    # Calculate metrics from actual activity
+    user_metrics = get_activity_based_metrics()
+    
+    # Analyze patterns
+    analyzed_metrics = analyze_attendance_patterns(user_metrics)
+    
+    # Save results
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    data_dir = os.path.join(script_dir, "..", "data")
+    output_path = os.path.join(data_dir, "activity_based_metrics.json")
+    
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(list(analyzed_metrics.values()), f, indent=2)
+    
+    print(f"\nActivity-based metrics saved to: {output_path}")
+    print(f"Processed {len(analyzed_metrics)} team members")
+    return output_path
+
+if __name__ == "__main__":
     try:
-        # Calculate metrics from actual activity
-        user_metrics = get_activity_based_metrics()
-        
-        # Analyze patterns
-        analyzed_metrics = analyze_attendance_patterns(user_metrics)
-        
-        # Save results
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        data_dir = os.path.join(script_dir, "..", "data")
-        output_path = os.path.join(data_dir, "activity_based_metrics.json")
-        
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(list(analyzed_metrics.values()), f, indent=2)
-        
-        print(f"\nActivity-based metrics saved to: {output_path}")
-        print(f"Processed {len(analyzed_metrics)} team members")
+        save_activity_metrics()
         
     except Exception as e:
         print(f"Error: {e}")
         import traceback
-        traceback.print_exc()
\ No newline at end of file
+        traceback.print_exc()
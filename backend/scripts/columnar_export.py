@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Columnar Export of DevLens Data
+Writes developers, daily activity rollups and scored snapshots as Parquet or
+Arrow IPC files, one row group (record batch) per company, and loads them back
+for offline analysis and backfills.
+"""
+
+import os
+import sys
+import json
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import DevLensDB
+
+TABLES = ["developers", "developer_activity_daily", "developer_scores"]
+FORMATS = {"parquet": ".parquet", "arrow": ".arrow"}
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as e:
+        raise RuntimeError("Columnar export requires pyarrow: pip install pyarrow") from e
+    return pyarrow
+
+
+def _schemas(pa):
+    """Explicit schemas so every company's row group has identical columns"""
+    return {
+        "developers": pa.schema([
+            ("company_id", pa.int64()),
+            ("company", pa.string()),
+            ("developer_id", pa.int64()),
+            ("name", pa.string()),
+            ("team", pa.string()),
+            ("commits", pa.int64()),
+            ("entropy", pa.float64()),
+            ("meetings", pa.int64()),
+            ("message_count", pa.int64()),
+            ("messages", pa.list_(pa.string()))
+        ]),
+        "developer_activity_daily": pa.schema([
+            ("company_id", pa.int64()),
+            ("developer_id", pa.int64()),
+            ("activity_date", pa.string()),
+            ("commits", pa.int64()),
+            ("entropy_sum", pa.float64()),
+            ("messages", pa.int64()),
+            ("meetings", pa.int64())
+        ]),
+        "developer_scores": pa.schema([
+            ("company_id", pa.int64()),
+            ("snapshot_version", pa.int64()),
+            ("created_at", pa.string()),
+            ("developer_id", pa.int64()),
+            ("name", pa.string()),
+            ("team", pa.string()),
+            ("impact_score", pa.float64()),
+            ("visibility_score", pa.float64()),
+            ("imp_z", pa.float64()),
+            ("vis_z", pa.float64()),
+            ("quadrant", pa.int64()),
+            ("is_hidden_gem", pa.bool_()),
+            ("risk_level", pa.string()),
+            ("overall_performance_score", pa.float64()),
+            ("attendance_rate", pa.float64()),
+            ("risk_factors", pa.list_(pa.string()))
+        ])
+    }
+
+
+class _TableWriter:
+    """Streams record batches of one table into a Parquet or Arrow IPC file"""
+
+    def __init__(self, pa, path, schema, fmt):
+        self.pa = pa
+        self.schema = schema
+        self.rows = 0
+        if fmt == "parquet":
+            self._writer = pa.parquet.ParquetWriter(str(path), schema, compression="zstd")
+        else:
+            self._sink = pa.OSFile(str(path), "wb")
+            self._writer = pa.ipc.new_file(self._sink, schema)
+
+    def write(self, columns):
+        batch = self.pa.RecordBatch.from_pydict(columns, schema=self.schema)
+        if batch.num_rows == 0:
+            return
+        self._writer.write_batch(batch)
+        self.rows += batch.num_rows
+
+    def close(self):
+        self._writer.close()
+        if hasattr(self, "_sink"):
+            self._sink.close()
+
+
+class ColumnarExporter:
+    def __init__(self, db=None):
+        self.db = db or DevLensDB()
+
+    def developer_columns(self, company_id, company_name):
+        """Column arrays of a company's developers"""
+        developers = self.db.get_company_developers(company_name)
+        return {
+            "company_id": [company_id] * len(developers),
+            "company": [company_name] * len(developers),
+            "developer_id": [dev["id"] for dev in developers],
+            "name": [dev["name"] for dev in developers],
+            "team": [dev["team"] for dev in developers],
+            "commits": [dev["commits"] for dev in developers],
+            "entropy": [float(dev["entropy"]) for dev in developers],
+            "meetings": [dev["meetings"] for dev in developers],
+            "message_count": [len(dev["msgs"]) for dev in developers],
+            "messages": [dev["msgs"] for dev in developers]
+        }
+
+    def activity_columns(self, company_id):
+        """Column arrays of a company's daily activity rollups"""
+        rows = self.db.get_company_daily_activity(company_id)
+        return {
+            "company_id": [row["company_id"] for row in rows],
+            "developer_id": [row["developer_id"] for row in rows],
+            "activity_date": [str(row["activity_date"]) for row in rows],
+            "commits": [row["commits"] for row in rows],
+            "entropy_sum": [float(row["entropy_sum"]) for row in rows],
+            "messages": [row["messages"] for row in rows],
+            "meetings": [row["meetings"] for row in rows]
+        }
+
+    def score_columns(self, company_id):
+        """Column arrays of every scored snapshot of a company"""
+        rows = self.db.get_company_score_history(company_id)
+        return {
+            "company_id": [row["company_id"] for row in rows],
+            "snapshot_version": [row["snapshot_version"] for row in rows],
+            "created_at": [str(row["created_at"]) for row in rows],
+            "developer_id": [row["developer_id"] for row in rows],
+            "name": [row["name"] for row in rows],
+            "team": [row["team"] for row in rows],
+            "impact_score": [row["impact_score"] for row in rows],
+            "visibility_score": [row["visibility_score"] for row in rows],
+            "imp_z": [row["imp_z"] for row in rows],
+            "vis_z": [row["vis_z"] for row in rows],
+            "quadrant": [row["quadrant"] for row in rows],
+            "is_hidden_gem": [bool(row["is_hidden_gem"]) for row in rows],
+            "risk_level": [row["risk_level"] for row in rows],
+            "overall_performance_score": [row["overall_performance_score"] for row in rows],
+            "attendance_rate": [row["attendance_rate"] for row in rows],
+            "risk_factors": [json.loads(row["risk_factors"] or "[]") for row in rows]
+        }
+
+    def export(self, output_dir, fmt="parquet", company_names=None):
+        """
+        Export all tables, streaming one row group per company
+
+        Args:
+            output_dir (str|Path): Directory for developers, developer_activity_daily
+                and developer_scores files
+            fmt (str): "parquet" or "arrow" (Arrow IPC file)
+            company_names (list, optional): Restrict the export to these companies
+
+        Returns:
+            dict: Table name -> (path, row count)
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Unsupported columnar format: {fmt}")
+
+        pa = _require_pyarrow()
+        schemas = _schemas(pa)
+
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        companies = [
+            (company["id"], company["name"]) for company in self.db.get_companies()
+            if not company_names or company["name"] in company_names
+        ]
+
+        paths = {table: output_dir / f"{table}{FORMATS[fmt]}" for table in TABLES}
+        writers = {table: _TableWriter(pa, paths[table], schemas[table], fmt) for table in TABLES}
+
+        try:
+            for company_id, company_name in companies:
+                # Only one company's rows are held in memory at a time
+                writers["developers"].write(self.developer_columns(company_id, company_name))
+                writers["developer_activity_daily"].write(self.activity_columns(company_id))
+                writers["developer_scores"].write(self.score_columns(company_id))
+                print(f"  Exported {company_name}")
+        finally:
+            for writer in writers.values():
+                writer.close()
+
+        return {table: (str(paths[table]), writers[table].rows) for table in TABLES}
+
+
+def _table_columns(columns, table, available):
+    """Columns to read from one table, or None for all of them"""
+    if not columns:
+        return None
+    if isinstance(columns, dict):
+        return list(columns[table]) if table in columns else None
+    return [column for column in columns if column in available]
+
+
+def load_columnar_export(path, tables=None, columns=None, company_ids=None):
+    """
+    Load a columnar export back into pandas DataFrames
+
+    Args:
+        path (str|Path): Export directory (or a single .parquet/.arrow file)
+        tables (list, optional): Table names to load (default: all present)
+        columns (list|dict, optional): Only read these columns; a list applies to
+            every table (tables lacking a column skip it), a dict maps table
+            name -> columns for that table (unlisted tables are read whole)
+        company_ids (list, optional): Only keep rows of these companies
+
+    Returns:
+        dict: Table name -> pandas DataFrame
+    """
+    pa = _require_pyarrow()
+    path = Path(path)
+
+    if path.is_file():
+        files = {path.stem: path}
+    else:
+        files = {}
+        for table in tables or TABLES:
+            for extension in FORMATS.values():
+                candidate = path / f"{table}{extension}"
+                if candidate.exists():
+                    files[table] = candidate
+                    break
+
+    frames = {}
+    for table, file_path in files.items():
+        if file_path.suffix == ".parquet":
+            table_columns = _table_columns(columns, table, pa.parquet.read_schema(str(file_path)).names)
+            filters = [("company_id", "in", list(company_ids))] if company_ids else None
+            frames[table] = pa.parquet.read_table(str(file_path), columns=table_columns, filters=filters).to_pandas()
+            continue
+
+        # Arrow IPC files are memory-mapped rather than copied into memory
+        with pa.memory_map(str(file_path), "r") as source:
+            data = pa.ipc.open_file(source).read_all()
+            table_columns = _table_columns(columns, table, data.schema.names)
+            if company_ids:
+                import pyarrow.compute as pc
+                data = data.filter(pc.is_in(data["company_id"], value_set=pa.array(list(company_ids))))
+            if table_columns is not None:
+                data = data.select(table_columns)
+            frames[table] = data.to_pandas()
+
+    return frames
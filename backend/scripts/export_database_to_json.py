@@ -6,7 +6,7 @@ Exports database data to JSON files compatible with existing DevLens analytics
 
 import os
 import sys
-import json
+import argparse
 import random
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -15,6 +15,9 @@ from pathlib import Path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from database import DevLensDB
+from engine.entropy import calculate_shannon_entropy
+from columnar_export import ColumnarExporter
+from json_stream import write_json_records
 
 class DatabaseToJSONExporter:
     def __init__(self):
@@ -22,10 +25,9 @@ class DatabaseToJSONExporter:
         self.start_time = datetime(2024, 5, 21, 8, 0, 0)
         
     def export_communication_data(self, company_name):
-        """Export communication data for a specific company"""
+        """Yield the communication data of a specific company one message at a time"""
         developers = self.db.get_company_developers(company_name)
         
-        messages = []
         message_id = 1
         
         for dev in developers:
@@ -57,28 +59,8 @@ class DatabaseToJSONExporter:
                     }
                 }
                 
-                messages.append(message)
+                yield message
                 message_id += 1
-        
-        return messages
-    
-    def calculate_shannon_entropy(self, file_changes):
-        """Calculate Shannon entropy for file distribution"""
-        if not file_changes:
-            return 0.0
-        
-        total_changes = sum(changes for changes in file_changes.values())
-        if total_changes == 0:
-            return 0.0
-        
-        import math
-        entropy = 0.0
-        for file_path, changes in file_changes.items():
-            if changes > 0:
-                pi = changes / total_changes
-                entropy -= pi * math.log2(pi)
-        
-        return entropy
     
     def generate_commit_files(self, team, commits_count, total_entropy):
         """Generate realistic file changes that match the entropy"""
@@ -119,10 +101,9 @@ class DatabaseToJSONExporter:
         return file_changes
     
     def export_execution_data(self, company_name):
-        """Export Git execution data for a specific company"""
+        """Yield the Git execution data of a specific company one commit at a time"""
         developers = self.db.get_company_developers(company_name)
         
-        commits = []
         commit_id = 1
         
         repos = ["core-service", "web-app", "mobile-app", "api-gateway", "data-pipeline"]
@@ -143,7 +124,7 @@ class DatabaseToJSONExporter:
                 file_changes = self.generate_commit_files(dev['team'], 1, entropy_per_commit)
                 
                 # Calculate actual entropy for this commit
-                commit_entropy = self.calculate_shannon_entropy(file_changes)
+                commit_entropy = calculate_shannon_entropy(file_changes)
                 
                 # Calculate additions and deletions
                 total_additions = 0
@@ -191,10 +172,8 @@ class DatabaseToJSONExporter:
                     }
                 }
                 
-                commits.append(commit)
+                yield commit
                 commit_id += 1
-        
-        return commits
     
     def export_hr_data(self, company_name):
         """Export HR behavioral data for a specific company"""
@@ -274,26 +253,20 @@ class DatabaseToJSONExporter:
         
         print(f"Exporting data for: {company_name}")
         
-        # Export communication data
-        comm_data = self.export_communication_data(company_name)
+        # Export communication data (streamed, one message at a time)
         comm_path = output_dir / "comm_mock_data.json"
-        with open(comm_path, "w", encoding="utf-8") as f:
-            json.dump(comm_data, f, indent=2)
-        print(f"  Communication data: {len(comm_data)} messages -> {comm_path}")
+        message_count = write_json_records(comm_path, self.export_communication_data(company_name))
+        print(f"  Communication data: {message_count} messages -> {comm_path}")
         
-        # Export execution data
-        exec_data = self.export_execution_data(company_name)
+        # Export execution data (streamed, one commit at a time)
         exec_path = output_dir / "exec_mock_data.json"
-        with open(exec_path, "w", encoding="utf-8") as f:
-            json.dump(exec_data, f, indent=2)
-        print(f"  Execution data: {len(exec_data)} commits -> {exec_path}")
+        commit_count = write_json_records(exec_path, self.export_execution_data(company_name))
+        print(f"  Execution data: {commit_count} commits -> {exec_path}")
         
         # Export HR data
-        hr_data = self.export_hr_data(company_name)
         hr_path = output_dir / "hr_behavioral_data.json"
-        with open(hr_path, "w", encoding="utf-8") as f:
-            json.dump(hr_data, f, indent=2)
-        print(f"  HR behavioral data: {len(hr_data)} team members -> {hr_path}")
+        hr_count = write_json_records(hr_path, self.export_hr_data(company_name))
+        print(f"  HR behavioral data: {hr_count} team members -> {hr_path}")
         
         return {
             "communication": str(comm_path),
@@ -315,6 +288,13 @@ class DatabaseToJSONExporter:
 
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Export DevLens database data")
+    parser.add_argument("company", nargs="?", help="Company to export (default: first company, or all for columnar formats)")
+    parser.add_argument("--format", choices=["json", "parquet", "arrow"], default="json",
+                        help="json writes the analytics mock files; parquet/arrow write columnar tables")
+    parser.add_argument("--output-dir", help="Output directory (default: backend/data, or backend/data/export for columnar formats)")
+    args = parser.parse_args()
+    
     print("DEVLENS DATABASE TO JSON EXPORTER")
     print("=" * 50)
     
@@ -329,9 +309,8 @@ def main():
         return
     
     # Export data for first company (or specify company name)
-    import sys
-    if len(sys.argv) > 1:
-        company_name = sys.argv[1]
+    if args.company:
+        company_name = args.company
         if company_name not in companies:
             print(f"\nCompany '{company_name}' not found!")
             print(f"Available: {', '.join(companies)}")
@@ -339,11 +318,25 @@ def main():
     else:
         company_name = companies[0]  # Use first company
     
+    if args.format != "json":
+        output_dir = args.output_dir or Path(__file__).parent.parent / "data" / "export"
+        print(f"\nExporting {args.format} tables to: {output_dir}")
+        print("-" * 30)
+        
+        tables = ColumnarExporter(exporter.db).export(
+            output_dir, args.format, [args.company] if args.company else None
+        )
+        
+        print(f"\nExport complete! Files created:")
+        for table, (path, rows) in tables.items():
+            print(f"  {table}: {rows} rows -> {path}")
+        return
+    
     print(f"\nExporting data for: {company_name}")
     print("-" * 30)
     
     # Export the data
-    file_paths = exporter.export_company_data(company_name)
+    file_paths = exporter.export_company_data(company_name, args.output_dir)
     
     print(f"\nExport complete! Files created:")
     for data_type, path in file_paths.items():
@@ -498,18 +498,15 @@ class CompanyDataGenerator:
         """Reset database to clean state (for testing)"""
         print("Resetting database...")
         
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        
-        # Delete all data
-        cursor.execute("DELETE FROM developers")
-        cursor.execute("DELETE FROM teams") 
-        cursor.execute("DELETE FROM settings")
-        cursor.execute("DELETE FROM managers")
-        cursor.execute("DELETE FROM companies")
-        
-        conn.commit()
-        conn.close()
+        with self.db.backend.transaction() as tx:
+            # Delete all data
+            tx.execute("DELETE FROM developer_activity_daily")
+            tx.execute("DELETE FROM developer_messages_daily")
+            tx.execute("DELETE FROM developers")
+            tx.execute("DELETE FROM teams") 
+            tx.execute("DELETE FROM settings")
+            tx.execute("DELETE FROM managers")
+            tx.execute("DELETE FROM companies")
         
         print("Database reset complete")
 
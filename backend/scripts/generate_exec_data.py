@@ -1,8 +1,14 @@
+import os
+import sys
 import json
 import random
-import math
 from datetime import datetime, timedelta
 
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine.entropy import calculate_shannon_entropy
+
 NUM_USERS = 25
 NUM_COMMITS = 1200  # Increased for better distribution
 
@@ -55,30 +61,6 @@ file_types = {
     ]
 }
 
-def calculate_shannon_entropy(file_changes):
-    """
-    Calculate Shannon entropy based on distribution of effort across files
-    H(X) = -Σ(Pi * log2(Pi))
-    where Pi = (additions + deletions for file i) / total changes
-    """
-    if not file_changes:
-        return 0.0
-    
-    # Calculate total changes across all files
-    total_changes = sum(changes for changes in file_changes.values())
-    
-    if total_changes == 0:
-        return 0.0
-    
-    # Calculate entropy
-    entropy = 0.0
-    for file_path, changes in file_changes.items():
-        if changes > 0:
-            pi = changes / total_changes
-            entropy -= pi * math.log2(pi)
-    
-    return entropy
-
 def generate_commit_files(author, repo):
     """Generate realistic file changes for a commit"""
     team_files = file_types[author["team"]]
@@ -8,7 +8,6 @@ import json
 import random
 import math
 import pandas as pd
-import numpy as np
 from datetime import datetime, timedelta
 from collections import defaultdict
 import os
@@ -17,11 +16,21 @@ import sys
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from json_stream import write_json_records
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+
+# dataset -> (file name, generator method, label, unit)
+DATASETS = {
+    "communication": ("comm_mock_data.json", "generate_communication_data", "Communication data", "messages"),
+    "execution": ("exec_mock_data.json", "generate_execution_data", "Execution data", "commits"),
+    "hr_behavioral": ("hr_behavioral_data.json", "generate_hr_data", "HR behavioral data", "team members")
+}
+
 class SyntheticDataGenerator:
     def __init__(self, seed=42):
         """Initialize with fixed seed for reproducible data"""
-        random.seed(seed)
-        np.random.seed(seed)
+        self.seed = seed
         
         # Configuration
         self.NUM_USERS = 25
@@ -116,42 +125,52 @@ class SyntheticDataGenerator:
             ]
         }
 
+    def rng(self, dataset):
+        """
+        Random generator for one dataset
+
+        Each dataset has its own stream derived from the seed, so the datasets
+        can be generated independently (and in parallel) with the same result.
+        """
+        return random.Random(f"{self.seed}:{dataset}")
+
     def generate_communication_data(self):
         """Generate realistic communication messages"""
         print("Generating communication data...")
+        rng = self.rng("communication")
         
         messages = []
         message_ids = []
         
         for i in range(1, self.NUM_MESSAGES + 1):
             msg_id = f"m_{i:04}"
-            author = random.choice(self.team_members)
+            author = rng.choice(self.team_members)
             
             # 25% chance this is a reply
-            reply_to = random.choice(message_ids) if message_ids and random.random() < 0.25 else None
+            reply_to = rng.choice(message_ids) if message_ids and rng.random() < 0.25 else None
             
             # Select message type based on team
             if author["team"] in ["Backend", "DevOps"]:
-                if random.random() < 0.5:
-                    content = random.choice(self.message_templates["high_tech"])
-                elif random.random() < 0.3:
-                    content = random.choice(self.message_templates["medium_tech"])
+                if rng.random() < 0.5:
+                    content = rng.choice(self.message_templates["high_tech"])
+                elif rng.random() < 0.3:
+                    content = rng.choice(self.message_templates["medium_tech"])
                 else:
-                    content = random.choice(self.message_templates["social"])
+                    content = rng.choice(self.message_templates["social"])
             elif author["team"] == "Frontend":
-                if random.random() < 0.4:
-                    content = random.choice(self.message_templates["medium_tech"])
-                elif random.random() < 0.3:
-                    content = random.choice(self.message_templates["low_tech"])
+                if rng.random() < 0.4:
+                    content = rng.choice(self.message_templates["medium_tech"])
+                elif rng.random() < 0.3:
+                    content = rng.choice(self.message_templates["low_tech"])
                 else:
-                    content = random.choice(self.message_templates["social"])
+                    content = rng.choice(self.message_templates["social"])
             else:  # QA
-                if random.random() < 0.3:
-                    content = random.choice(self.message_templates["medium_tech"])
-                elif random.random() < 0.4:
-                    content = random.choice(self.message_templates["low_tech"])
+                if rng.random() < 0.3:
+                    content = rng.choice(self.message_templates["medium_tech"])
+                elif rng.random() < 0.4:
+                    content = rng.choice(self.message_templates["low_tech"])
                 else:
-                    content = random.choice(self.message_templates["social"])
+                    content = rng.choice(self.message_templates["social"])
             
             msg = {
                 "id": msg_id,
@@ -192,28 +211,28 @@ class SyntheticDataGenerator:
         
         return entropy
 
-    def generate_commit_files(self, author, repo):
+    def generate_commit_files(self, author, repo, rng):
         """Generate realistic file changes for a commit"""
         team_files = self.file_types[author["team"]]
         
         # Determine number of files to change (1-5 files per commit)
-        num_files = random.choices([1, 2, 3, 4, 5], weights=[40, 30, 20, 8, 2])[0]
+        num_files = rng.choices([1, 2, 3, 4, 5], weights=[40, 30, 20, 8, 2])[0]
         
         file_changes = {}
         for _ in range(num_files):
-            f_info = random.choice(team_files)
+            f_info = rng.choice(team_files)
             
             # Generate unique file name
-            file_id = random.randint(1, 100)
+            file_id = rng.randint(1, 100)
             file_name = f"{f_info['path']}{repo}_{file_id}{f_info['ext']}"
             
             # Generate realistic changes per file
             base_productivity = {"Backend": 1.2, "Frontend": 1.0, "DevOps": 1.4, "QA": 0.8}
             productivity_multiplier = base_productivity[author["team"]]
-            individual_multiplier = random.uniform(0.7, 1.5)
+            individual_multiplier = rng.uniform(0.7, 1.5)
             
-            additions = int(random.randint(5, 80) * productivity_multiplier * individual_multiplier)
-            deletions = int(random.randint(0, 40) * productivity_multiplier * individual_multiplier)
+            additions = int(rng.randint(5, 80) * productivity_multiplier * individual_multiplier)
+            deletions = int(rng.randint(0, 40) * productivity_multiplier * individual_multiplier)
             total_changes = additions + deletions
             
             file_changes[file_name] = total_changes
@@ -223,15 +242,16 @@ class SyntheticDataGenerator:
     def generate_execution_data(self):
         """Generate realistic Git commit data"""
         print("Generating execution data...")
+        rng = self.rng("execution")
         
         commits = []
         
         for i in range(1, self.NUM_COMMITS + 1):
-            author = random.choice(self.team_members)
-            repo = random.choice(self.repos)
+            author = rng.choice(self.team_members)
+            repo = rng.choice(self.repos)
             
             # Generate file changes for this commit
-            file_changes = self.generate_commit_files(author, repo)
+            file_changes = self.generate_commit_files(author, repo, rng)
             
             # Calculate Shannon entropy based on file distribution
             entropy = self.calculate_shannon_entropy(file_changes)
@@ -243,7 +263,7 @@ class SyntheticDataGenerator:
             files_data = []
             for file_path, total_changes in file_changes.items():
                 # Distribute total changes between additions and deletions (roughly 70/30 split)
-                file_additions = int(total_changes * random.uniform(0.6, 0.8))
+                file_additions = int(total_changes * rng.uniform(0.6, 0.8))
                 file_deletions = total_changes - file_additions
                 
                 total_additions += file_additions
@@ -266,7 +286,7 @@ class SyntheticDataGenerator:
                         "date": (self.start_time + timedelta(hours=i * 0.5)).isoformat() + "Z"
                     },
                     "message": f"Update {len(file_changes)} files in {repo}",
-                    "comment_count": random.randint(0, 3)
+                    "comment_count": rng.randint(0, 3)
                 },
                 "url": f"https://api.github.com/repos/org/{repo}/commits/sha_{i}",
                 "files": files_data,
@@ -290,6 +310,7 @@ class SyntheticDataGenerator:
     def generate_hr_data(self):
         """Generate comprehensive HR and behavioral metrics"""
         print("Generating HR behavioral data...")
+        rng = self.rng("hr_behavioral")
         
         hr_data = []
         total_work_days = self.ANALYSIS_PERIOD_DAYS - 26  # Exclude weekends
@@ -297,32 +318,32 @@ class SyntheticDataGenerator:
         for member in self.team_members:
             # Base personality traits that influence other metrics
             personality_traits = {
-                "collaboration_tendency": random.uniform(0.3, 1.0),
-                "knowledge_sharing_tendency": random.uniform(0.2, 1.0),
-                "meeting_engagement": random.uniform(0.4, 1.0),
-                "proactivity_level": random.uniform(0.3, 1.0),
-                "reliability_factor": random.uniform(0.6, 1.0)
+                "collaboration_tendency": rng.uniform(0.3, 1.0),
+                "knowledge_sharing_tendency": rng.uniform(0.2, 1.0),
+                "meeting_engagement": rng.uniform(0.4, 1.0),
+                "proactivity_level": rng.uniform(0.3, 1.0),
+                "reliability_factor": rng.uniform(0.6, 1.0)
             }
             
             # Attendance & Leave Management
-            leave_days = int(random.uniform(2, 15) * (1 - personality_traits["reliability_factor"]))
-            sick_days = int(random.uniform(0, 8) * (1 - personality_traits["reliability_factor"]))
+            leave_days = int(rng.uniform(2, 15) * (1 - personality_traits["reliability_factor"]))
+            sick_days = int(rng.uniform(0, 8) * (1 - personality_traits["reliability_factor"]))
             attendance_rate = (total_work_days - leave_days - sick_days) / total_work_days
             
             # Meeting & Collaboration Metrics
-            total_meetings = random.randint(40, 120)
+            total_meetings = rng.randint(40, 120)
             meetings_attended = int(total_meetings * attendance_rate * personality_traits["meeting_engagement"])
-            meetings_organized = int(random.uniform(2, 15) * personality_traits["proactivity_level"])
+            meetings_organized = int(rng.uniform(2, 15) * personality_traits["proactivity_level"])
             
             # Knowledge Sharing & Documentation
-            wiki_contributions = int(random.uniform(5, 50) * personality_traits["knowledge_sharing_tendency"])
-            documentation_updates = int(random.uniform(3, 25) * personality_traits["knowledge_sharing_tendency"])
-            knowledge_base_articles = int(random.uniform(1, 12) * personality_traits["knowledge_sharing_tendency"])
+            wiki_contributions = int(rng.uniform(5, 50) * personality_traits["knowledge_sharing_tendency"])
+            documentation_updates = int(rng.uniform(3, 25) * personality_traits["knowledge_sharing_tendency"])
+            knowledge_base_articles = int(rng.uniform(1, 12) * personality_traits["knowledge_sharing_tendency"])
             
             # Code Review & Collaboration
-            code_reviews_given = int(random.uniform(10, 80) * personality_traits["collaboration_tendency"])
-            code_reviews_received = int(random.uniform(8, 40))
-            review_response_time_hours = random.uniform(2, 48) * (2 - personality_traits["collaboration_tendency"])
+            code_reviews_given = int(rng.uniform(10, 80) * personality_traits["collaboration_tendency"])
+            code_reviews_received = int(rng.uniform(8, 40))
+            review_response_time_hours = rng.uniform(2, 48) * (2 - personality_traits["collaboration_tendency"])
             
             # Additional metrics...
             hr_record = {
@@ -361,46 +382,53 @@ class SyntheticDataGenerator:
         
         return hr_data
 
+    def save_dataset(self, dataset, data_dir=DATA_DIR):
+        """
+        Generate one dataset and write it to data_dir
+
+        Args:
+            dataset: 'communication', 'execution' or 'hr_behavioral'
+
+        Returns:
+            str: Path of the written file
+        """
+        file_name, generate, label, unit = DATASETS[dataset]
+        os.makedirs(data_dir, exist_ok=True)
+        path = os.path.join(data_dir, file_name)
+        count = write_json_records(path, getattr(self, generate)())
+        print(f"{label} saved: {count} {unit}")
+        return path
+
     def generate_all_data(self):
         """Generate all synthetic data and save to files"""
         print("Starting synthetic data generation...")
-        
-        # Ensure data directory exists
-        data_dir = os.path.join(os.path.dirname(__file__), "..", "data")
-        os.makedirs(data_dir, exist_ok=True)
-        
-        # Generate all datasets
-        comm_data = self.generate_communication_data()
-        exec_data = self.generate_execution_data()
-        hr_data = self.generate_hr_data()
-        
-        # Save communication data
-        comm_path = os.path.join(data_dir, "comm_mock_data.json")
-        with open(comm_path, "w", encoding="utf-8") as f:
-            json.dump(comm_data, f, indent=2)
-        print(f"Communication data saved: {len(comm_data)} messages")
-        
-        # Save execution data
-        exec_path = os.path.join(data_dir, "exec_mock_data.json")
-        with open(exec_path, "w", encoding="utf-8") as f:
-            json.dump(exec_data, f, indent=2)
-        print(f"Execution data saved: {len(exec_data)} commits")
-        
-        # Save HR data
-        hr_path = os.path.join(data_dir, "hr_behavioral_data.json")
-        with open(hr_path, "w", encoding="utf-8") as f:
-            json.dump(hr_data, f, indent=2)
-        print(f"HR behavioral data saved: {len(hr_data)} team members")
-        
-        return {
-            "communication": comm_path,
-            "execution": exec_path,
-            "hr_behavioral": hr_path
-        }
+        return {dataset: self.save_dataset(dataset) for dataset in DATASETS}
 
 
 if __name__ == "__main__":
-    generator = SyntheticDataGenerator(seed=42)  # Fixed seed for reproducibility
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Generate DevLens synthetic data")
+    parser.add_argument("--scale", type=int, metavar="DEVELOPERS",
+                        help="Build a large performance-test tenant with this many developers (see scale_data.py)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed (default: 42)")
+    parser.add_argument("--days", type=int, default=90, help="Activity window in days for --scale (default: 90)")
+    parser.add_argument("--format", choices=["ndjson", "parquet"], default="ndjson", help="Output format for --scale")
+    parser.add_argument("--workers", type=int, help="Worker processes for --scale (default: CPU count)")
+    parser.add_argument("--shard-size", type=int, default=2000, help="Developers per part file for --scale")
+    parser.add_argument("--output-dir", help="Output directory for --scale (default: data/scale_<DEVELOPERS>)")
+    args = parser.parse_args()
+    
+    if args.scale:
+        from scale_data import ScaleDataGenerator
+        
+        output_dir = args.output_dir or os.path.join(DATA_DIR, f"scale_{args.scale}")
+        ScaleDataGenerator(args.scale, seed=args.seed, days=args.days, shard_size=args.shard_size).generate(
+            output_dir, file_format=args.format, workers=args.workers
+        )
+        sys.exit(0)
+    
+    generator = SyntheticDataGenerator(seed=args.seed)  # Fixed seed for reproducibility
     file_paths = generator.generate_all_data()
     
     print("\nSynthetic data generation complete!")
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Ingest Local Git Repositories
+Adds commit counts and Shannon entropy per author from local clones to the
+developers of a DevLens company. Each run only reads commits made since the
+previous run of the same repository.
+"""
+
+import os
+import sys
+import argparse
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import DevLensDB
+from integrations.git_ingestor import GitIngestor
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest local git repositories into DevLens")
+    parser.add_argument("company", help="DevLens company the authors belong to")
+    parser.add_argument("repos", nargs="+", help="Paths of local clones")
+    parser.add_argument("--ref", default="HEAD", help="Branch or ref to ingest (default: HEAD)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--map", action="append", default=[], metavar="EMAIL=DEVELOPER_ID",
+                        help="Map an author email to a developer explicitly (repeatable)")
+    args = parser.parse_args()
+
+    db = DevLensDB()
+    company = db.get_company_by_name(args.company)
+    if not company:
+        print(f"❌ Company not found: {args.company}")
+        sys.exit(1)
+
+    for mapping in args.map:
+        email, developer_id = mapping.split("=", 1)
+        db.set_developer_git_author(email, int(developer_id))
+
+    summary = GitIngestor(db, company["id"], workers=args.workers, ref=args.ref).run(args.repos)
+
+    commits = sum(result.get("commits", 0) for result in summary.values())
+    failed = [repo for repo, result in summary.items() if "error" in result]
+    unmapped = sorted({email for result in summary.values() for email in result.get("unmapped", [])})
+    print(f"Ingested {commits} commits from {len(summary) - len(failed)} repositories")
+    if unmapped:
+        print(f"Unmapped authors (use --map EMAIL=DEVELOPER_ID): {', '.join(unmapped)}")
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
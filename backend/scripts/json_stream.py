@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Streaming JSON Records
+Reads the pipeline's exports (Teams messages, GitHub commits, HR records) one
+record at a time instead of json.load-ing whole files, so memory stays flat no
+matter how large an export grows. Both a top-level JSON array (the format the
+generators write) and NDJSON (one record per line) are understood; the format
+is detected from the file's first non-whitespace character. A directory of part files (as
+written by scale_data.py) is read part by part. The writer produces the same
+layouts without building the full list first.
+"""
+
+import json
+import re
+from pathlib import Path
+
+NDJSON_SUFFIXES = {".ndjson", ".jsonl"}
+
+CHUNK_SIZE = 1 << 20
+
+# Whitespace and the commas between array elements
+_SEPARATORS = re.compile(r"[\s,]*")
+_WHITESPACE = re.compile(r"\s*")
+
+
+def iter_json_records(path, chunk_size=CHUNK_SIZE):
+    """
+    Yield the records of a JSON array or NDJSON file one at a time
+
+    Args:
+        path: File to read, or a directory whose .json/.ndjson/.jsonl part
+            files are read in name order
+        chunk_size: Characters read at a time; a record larger than this is
+            read in several chunks
+
+    Yields:
+        Each decoded record, in file order
+    """
+    if Path(path).is_dir():
+        for part in sorted(Path(path).iterdir()):
+            if part.suffix in NDJSON_SUFFIXES or part.suffix == ".json":
+                yield from iter_json_records(part, chunk_size)
+        return
+
+    with open(path, "r", encoding="utf-8") as f:
+        # The format is decided by the first non-whitespace character, which may
+        # lie beyond the first chunk
+        buffer = f.read(chunk_size)
+        start = _WHITESPACE.match(buffer).end()
+        while start == len(buffer) and buffer:
+            buffer = f.read(chunk_size)
+            start = _WHITESPACE.match(buffer).end()
+        if buffer[start:start + 1] == "[":
+            yield from _iter_array(path, f, buffer, start + 1, chunk_size)
+        else:
+            f.seek(0)
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{path}: invalid JSON on line {line_number}: {e}") from e
+
+
+def _iter_array(path, f, buffer, pos, chunk_size):
+    """Decode the elements of a top-level array, refilling the buffer as needed"""
+    decoder = json.JSONDecoder()
+    eof = False
+    while True:
+        pos = _SEPARATORS.match(buffer, pos).end()
+        if pos == len(buffer):
+            if eof:
+                raise ValueError(f"{path}: unexpected end of file inside JSON array")
+            buffer, pos, eof = _refill(f, buffer, pos, chunk_size)
+            continue
+        if buffer[pos] == "]":
+            return
+
+        try:
+            record, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as e:
+            if eof:
+                raise ValueError(f"{path}: invalid JSON array element: {e}") from e
+            buffer, pos, eof = _refill(f, buffer, pos, chunk_size)
+            continue
+
+        # An element must be followed by ',' or ']'; anything else (or the end
+        # of the buffer) means a number was cut short at the chunk edge
+        after = end if buffer[end:end + 1] in (",", "]") else _WHITESPACE.match(buffer, end).end()
+        if after == len(buffer) or buffer[after] not in ",]":
+            if eof:
+                raise ValueError(f"{path}: malformed JSON array")
+            buffer, pos, eof = _refill(f, buffer, pos, chunk_size)
+            continue
+
+        yield record
+        pos = end
+
+
+def _refill(f, buffer, pos, chunk_size):
+    """Drop what was consumed and append the next chunk; returns (buffer, pos, eof)"""
+    chunk = f.read(chunk_size)
+    return buffer[pos:] + chunk, 0, not chunk
+
+
+def write_json_records(path, records, indent=2):
+    """
+    Write records as NDJSON (.ndjson/.jsonl) or as a JSON array, one at a time
+
+    The array layout is identical to json.dump(list(records), f, indent=indent).
+
+    Returns:
+        int: Number of records written
+    """
+    count = 0
+    with open(path, "w", encoding="utf-8") as f:
+        if Path(path).suffix in NDJSON_SUFFIXES:
+            for record in records:
+                f.write(json.dumps(record))
+                f.write("\n")
+                count += 1
+            return count
+
+        pad = "\n" + " " * indent
+        for record in records:
+            f.write("," if count else "[")
+            f.write(pad)
+            f.write(json.dumps(record, indent=indent).replace("\n", pad))
+            count += 1
+        f.write("\n]" if count else "[]")
+    return count
@@ -7,13 +7,25 @@ Replaces hardcoded sample data with generated synthetic data
 import os
 import sys
 import json
-import sqlite3
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from database import DevLensDB
+from json_stream import iter_json_records
+
+# Tables holding company-, manager- or developer-keyed rows, children first.
+# github_sync_state goes too: its watermarks describe rollups deleted here.
+COMPANY_TABLES = [
+    "alert_digests", "alert_digest_state", "alert_events", "alert_diff_state",
+    "developer_scores", "score_snapshots",
+    "email_outbox", "settings",
+    "developer_activity_daily", "developer_messages_daily", "developer_github_metrics",
+    "github_sync_run_members", "github_sync_runs", "github_sync_state",
+    "developer_identities", "developer_git_authors",
+    "developers", "teams", "managers", "companies",
+]
 
 class SyntheticDataLoader:
     def __init__(self):
@@ -29,27 +41,24 @@ class SyntheticDataLoader:
         self.activity_data_path = self.data_dir / "activity_based_metrics.json"
 
     def load_synthetic_data_files(self):
-        """Load all synthetic data files"""
+        """
+        Open all synthetic data files
+
+        Messages and commits are streamed (they are only read once, while
+        aggregating); the per-person HR and activity records are loaded.
+        """
         print("Loading synthetic data files...")
         
-        # Load communication data
-        with open(self.comm_data_path, 'r', encoding='utf-8') as f:
-            comm_data = json.load(f)
-        print(f"Loaded {len(comm_data)} communication messages")
-        
-        # Load execution data
-        with open(self.exec_data_path, 'r', encoding='utf-8') as f:
-            exec_data = json.load(f)
-        print(f"Loaded {len(exec_data)} git commits")
+        # Stream communication and execution data
+        comm_data = iter_json_records(self.comm_data_path)
+        exec_data = iter_json_records(self.exec_data_path)
         
         # Load HR behavioral data
-        with open(self.hr_data_path, 'r', encoding='utf-8') as f:
-            hr_data = json.load(f)
+        hr_data = list(iter_json_records(self.hr_data_path))
         print(f"Loaded {len(hr_data)} HR records")
         
         # Load activity-based metrics
-        with open(self.activity_data_path, 'r', encoding='utf-8') as f:
-            activity_data = json.load(f)
+        activity_data = list(iter_json_records(self.activity_data_path))
         print(f"Loaded {len(activity_data)} activity metrics")
         
         return comm_data, exec_data, hr_data, activity_data
@@ -58,21 +67,17 @@ class SyntheticDataLoader:
         """Clear existing sample data from database"""
         print("Clearing existing sample data...")
         
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        
-        # Clear in reverse order due to foreign key constraints
-        cursor.execute("DELETE FROM settings")
-        cursor.execute("DELETE FROM developers")
-        cursor.execute("DELETE FROM teams")
-        cursor.execute("DELETE FROM managers")
-        cursor.execute("DELETE FROM companies")
-        
-        # Reset auto-increment counters
-        cursor.execute("DELETE FROM sqlite_sequence WHERE name IN ('companies', 'managers', 'teams', 'developers', 'settings')")
-        
-        conn.commit()
-        conn.close()
+        with self.db.backend.transaction() as tx:
+            # Clear children before the rows they reference; every table keyed
+            # by a company, manager or developer goes, so a reloaded company
+            # never inherits snapshots, alerts or identities of the old one
+            for table in COMPANY_TABLES:
+                tx.execute(f"DELETE FROM {table}")
+            
+            # Reset auto-increment counters
+            if self.db.backend.dialect == "sqlite":
+                placeholders = ", ".join("?" for _ in COMPANY_TABLES)
+                tx.execute(f"DELETE FROM sqlite_sequence WHERE name IN ({placeholders})", tuple(COMPANY_TABLES))
         
         print("Existing data cleared")
 
@@ -80,44 +85,36 @@ class SyntheticDataLoader:
         """Create company structure based on synthetic data"""
         print("Creating synthetic company structure...")
         
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        
-        # Create the synthetic company
-        company_name = "DevLens Synthetic Corp"
-        cursor.execute("INSERT INTO companies (name) VALUES (?)", (company_name,))
-        company_id = cursor.lastrowid
-        
-        # Create a manager for the synthetic company
-        manager_email = "manager@devlens.com"
-        manager_password = self.db.hash_password("demo123")
-        manager_name = "Demo Manager"
-        
-        cursor.execute('''
-            INSERT INTO managers (email, password_hash, name, role, company_id)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (manager_email, manager_password, manager_name, "Engineering Manager", company_id))
-        manager_id = cursor.lastrowid
-        
-        # Extract unique teams from HR data
-        teams = set()
-        for person in hr_data:
-            teams.add(person['team'])
-        
-        # Create teams
-        team_ids = {}
-        for team_name in teams:
-            cursor.execute("INSERT INTO teams (name, company_id) VALUES (?, ?)", (team_name, company_id))
-            team_ids[team_name] = cursor.lastrowid
-        
-        conn.commit()
-        conn.close()
+        with self.db.backend.transaction() as tx:
+            # Create the synthetic company
+            company_name = "DevLens Synthetic Corp"
+            company_id = tx.insert("INSERT INTO companies (name) VALUES (?)", (company_name,))
+            
+            # Create a manager for the synthetic company
+            manager_email = "manager@devlens.com"
+            manager_password = self.db.hash_password("demo123")
+            manager_name = "Demo Manager"
+            
+            manager_id = tx.insert('''
+                INSERT INTO managers (email, password_hash, name, role, company_id)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (manager_email, manager_password, manager_name, "Engineering Manager", company_id))
+            
+            # Extract unique teams from HR data
+            teams = set()
+            for person in hr_data:
+                teams.add(person['team'])
+            
+            # Create teams
+            team_ids = {}
+            for team_name in teams:
+                team_ids[team_name] = tx.insert("INSERT INTO teams (name, company_id) VALUES (?, ?)", (team_name, company_id))
         
         print(f"Created company '{company_name}' with {len(teams)} teams")
         return company_id, manager_id, team_ids
 
     def aggregate_user_data(self, comm_data, exec_data, hr_data, activity_data):
-        """Aggregate data by user from all sources"""
+        """Aggregate data by user from all sources (comm_data and exec_data may be one-shot iterables)"""
         print("Aggregating user data from all sources...")
         
         # Create user lookup by ID
@@ -132,12 +129,16 @@ class SyntheticDataLoader:
                 'commits': 0,
                 'entropy': 0.0,
                 'meetings': hr_record['collaboration_metrics']['meetings_attended'],
-                'messages': []
+                'messages': [],
+                'dated_messages': [],
+                'daily': {}
             }
         
         # Add commit data
         commit_stats = {}
+        commit_count = 0
         for commit in exec_data:
+            commit_count += 1
             user_id = commit['devlens_meta']['teams_user_id']
             if user_id not in commit_stats:
                 commit_stats[user_id] = {
@@ -147,6 +148,11 @@ class SyntheticDataLoader:
             
             commit_stats[user_id]['total_commits'] += 1
             commit_stats[user_id]['total_entropy'] += commit['devlens_meta']['stats']['total_entropy']
+            
+            if user_id in users:
+                day = self._get_daily_bucket(users[user_id], commit['commit']['author']['date'])
+                day['commits'] += 1
+                day['entropy_sum'] += commit['devlens_meta']['stats']['total_entropy']
         
         # Apply commit stats to users
         for user_id, stats in commit_stats.items():
@@ -154,10 +160,17 @@ class SyntheticDataLoader:
                 users[user_id]['commits'] = stats['total_commits']
                 users[user_id]['entropy'] = stats['total_entropy']
         
+        print(f"Streamed {commit_count} git commits")
+        
         # Add communication data
         user_messages = {}
+        message_count = 0
         for message in comm_data:
+            message_count += 1
             user_id = message['from']['user']['id']
+            if user_id not in users:
+                # Only people in the HR data become developers; don't hold on to the rest
+                continue
             if user_id not in user_messages:
                 user_messages[user_id] = []
             
@@ -167,50 +180,95 @@ class SyntheticDataLoader:
             import re
             clean_content = re.sub(r'<[^>]+>', '', content)
             user_messages[user_id].append(clean_content)
+            users[user_id]['dated_messages'].append((message['createdDateTime'][:10], clean_content))
+            
+            day = self._get_daily_bucket(users[user_id], message['createdDateTime'])
+            day['messages'] += 1
+        
+        print(f"Streamed {message_count} communication messages")
         
         # Apply messages to users
         for user_id, messages in user_messages.items():
             if user_id in users:
                 users[user_id]['messages'] = messages
         
+        # HR data only has a meeting total, so spread it evenly over the active days
+        for user_data in users.values():
+            active_days = sorted(user_data['daily'])
+            if not active_days:
+                continue
+            per_day, remainder = divmod(user_data['meetings'], len(active_days))
+            for index, activity_date in enumerate(active_days):
+                user_data['daily'][activity_date]['meetings'] = per_day + (1 if index < remainder else 0)
+        
         print(f"Aggregated data for {len(users)} users")
         return users
 
+    def _get_daily_bucket(self, user_data, timestamp):
+        """Return the rollup bucket for the calendar day of an ISO timestamp"""
+        activity_date = timestamp[:10]
+        if activity_date not in user_data['daily']:
+            user_data['daily'][activity_date] = {
+                'commits': 0,
+                'entropy_sum': 0.0,
+                'messages': 0,
+                'meetings': 0
+            }
+        return user_data['daily'][activity_date]
+
     def insert_synthetic_developers(self, company_id, team_ids, users):
         """Insert synthetic developers into database"""
         print("Inserting synthetic developers...")
         
-        conn = self.db.get_connection()
-        cursor = conn.cursor()
-        
         inserted_count = 0
-        for user_id, user_data in users.items():
-            team_id = team_ids.get(user_data['team'])
-            if not team_id:
-                print(f"Warning: Team '{user_data['team']}' not found for user {user_data['name']}")
-                continue
-            
-            messages_json = json.dumps(user_data['messages'])
-            
-            cursor.execute('''
-                INSERT INTO developers (name, team_id, company_id, commits, entropy, meetings, messages)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                user_data['name'],
-                team_id,
-                company_id,
-                user_data['commits'],
-                user_data['entropy'],
-                user_data['meetings'],
-                messages_json
-            ))
-            
-            inserted_count += 1
-        
-        conn.commit()
-        conn.close()
+        daily_rows = []
+        message_rows = []
+        with self.db.backend.transaction() as tx:
+            for user_id, user_data in users.items():
+                team_id = team_ids.get(user_data['team'])
+                if not team_id:
+                    print(f"Warning: Team '{user_data['team']}' not found for user {user_data['name']}")
+                    continue
+                
+                messages_json = json.dumps(user_data['messages'])
+                
+                developer_id = tx.insert('''
+                    INSERT INTO developers (name, team_id, company_id, commits, entropy, meetings, messages)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    user_data['name'],
+                    team_id,
+                    company_id,
+                    user_data['commits'],
+                    user_data['entropy'],
+                    user_data['meetings'],
+                    messages_json
+                ))
+                
+                for activity_date, day in user_data['daily'].items():
+                    daily_rows.append({
+                        'developer_id': developer_id,
+                        'company_id': company_id,
+                        'activity_date': activity_date,
+                        **day
+                    })
+                
+                for activity_date, content in user_data['dated_messages']:
+                    message_rows.append({
+                        'developer_id': developer_id,
+                        'company_id': company_id,
+                        'activity_date': activity_date,
+                        'content': content
+                    })
+                
+                inserted_count += 1
+        
+        # Fill the daily rollups used for time-windowed scoring
+        self.db.record_daily_activity(daily_rows)
+        self.db.record_daily_messages(message_rows)
         
         print(f"Inserted {inserted_count} synthetic developers")
+        print(f"Recorded {len(daily_rows)} daily activity rollups")
         return inserted_count
 
     def create_manager_settings(self, manager_id):
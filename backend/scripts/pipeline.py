@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+In-process Data Pipeline Runner
+Runs pipeline stages as Python functions instead of one interpreter per script.
+Each stage declares the files it reads and writes; the runner derives the DAG
+from them, runs stages whose dependencies are done in parallel, and skips a
+stage when the content hash of its inputs, parameters and code matches the last
+successful run and its outputs are still the files that run produced.
+"""
+
+import hashlib
+import inspect
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from datetime import datetime
+from pathlib import Path
+
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def file_hash(path):
+    """sha256 of a file's contents, or None if it does not exist"""
+    path = Path(path)
+    if not path.exists():
+        return None
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class Stage:
+    def __init__(self, name, func, inputs=(), outputs=(), after=(), params=None, code=(), description=None):
+        """
+        Args:
+            name: Unique stage name
+            func: Called with no arguments; raises on failure
+            inputs: Files the stage reads
+            outputs: Files the stage writes; a stage without outputs works on
+                the database and always runs
+            after: Names of stages that must finish first without sharing a file
+            params: JSON-serializable settings that change the result
+            code: Modules or files whose source is part of the cache key
+                (default: the module defining func)
+            description: Shown in the progress output
+        """
+        self.name = name
+        self.func = func
+        self.inputs = [Path(path) for path in inputs]
+        self.outputs = [Path(path) for path in outputs]
+        self.after = list(after)
+        self.params = params or {}
+        self.code = list(code) or [func]
+        self.description = description or name
+
+    def cache_key(self):
+        """Hash of everything that determines this stage's outputs"""
+        digest = hashlib.sha256()
+        digest.update(self.name.encode())
+        digest.update(json.dumps(self.params, sort_keys=True, default=str).encode())
+        for source in self.code:
+            path = source if isinstance(source, (str, Path)) else inspect.getsourcefile(source)
+            digest.update(str(file_hash(path)).encode())
+        for path in sorted(self.inputs):
+            digest.update(str(path.resolve()).encode())
+            digest.update(str(file_hash(path)).encode())
+        return digest.hexdigest()
+
+
+class Pipeline:
+    def __init__(self, stages, state_path, max_workers=4):
+        """
+        Args:
+            stages: Stage objects; producers of a stage's inputs and the stages
+                named in its `after` run before it
+            state_path: JSON file remembering each stage's last successful run
+            max_workers: Stages run at the same time
+        """
+        self.stages = {stage.name: stage for stage in stages}
+        self.state_path = Path(state_path)
+        self.max_workers = max_workers
+        self.dependencies = self._dependencies()
+        self.total_seconds = 0.0
+        self._lock = threading.Lock()
+
+    def _dependencies(self):
+        producers = {}
+        for stage in self.stages.values():
+            for path in stage.outputs:
+                producers[path.resolve()] = stage.name
+
+        dependencies = {}
+        for stage in self.stages.values():
+            needed = {producers[path.resolve()] for path in stage.inputs if path.resolve() in producers}
+            for name in stage.after:
+                if name not in self.stages:
+                    raise ValueError(f"Stage '{stage.name}' runs after unknown stage '{name}'")
+                needed.add(name)
+            needed.discard(stage.name)
+            dependencies[stage.name] = needed
+
+        # Reject cycles up front rather than waiting forever
+        done = set()
+        while len(done) < len(dependencies):
+            ready = [name for name, needed in dependencies.items() if name not in done and needed <= done]
+            if not ready:
+                raise ValueError(f"Pipeline has a dependency cycle among: {sorted(set(dependencies) - done)}")
+            done.update(ready)
+        return dependencies
+
+    def _load_state(self):
+        if self.state_path.exists():
+            try:
+                with open(self.state_path, "r", encoding="utf-8") as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                pass
+        return {}
+
+    def _save_state(self, state):
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.state_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2)
+
+    def _is_current(self, stage, key, state, ran):
+        """True when the last successful run had the same key and its outputs are untouched"""
+        if not stage.outputs:
+            return False
+        # A database stage upstream may have changed what this stage reads
+        if any(name in ran and not self.stages[name].outputs for name in self.dependencies[stage.name]):
+            return False
+        previous = state.get(stage.name)
+        if not previous or previous.get("key") != key:
+            return False
+        return all(previous.get("outputs", {}).get(str(path)) == file_hash(path) for path in stage.outputs)
+
+    def run(self, force=False):
+        """
+        Run every stage in dependency order
+
+        Args:
+            force: Run all stages even if their cached results are current
+
+        Returns:
+            list: {stage, description, status, seconds, error} per stage, in
+            completion order; status is 'ran', 'cached', 'failed' or 'blocked'
+        """
+        state = self._load_state()
+        results = {}
+        ran = set()
+        pending = dict(self.dependencies)
+        running = {}
+        started = time.perf_counter()
+
+        def execute(stage, key):
+            stage_started = time.perf_counter()
+            if not force and self._is_current(stage, key, state, ran):
+                return "cached", time.perf_counter() - stage_started, None
+            print(f"\n> {stage.description}")
+            print("-" * 60)
+            stage.func()
+            outputs = {str(path): file_hash(path) for path in stage.outputs}
+            with self._lock:
+                state[stage.name] = {
+                    "key": key,
+                    "outputs": outputs,
+                    "finished_at": datetime.utcnow().isoformat()
+                }
+                self._save_state(state)
+            return "ran", time.perf_counter() - stage_started, None
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or running:
+                finished = {name for name, result in results.items() if result["status"] in ("ran", "cached")}
+                failed = {name for name, result in results.items() if result["status"] in ("failed", "blocked")}
+
+                for name, needed in list(pending.items()):
+                    if needed & failed:
+                        del pending[name]
+                        results[name] = self._result(name, "blocked", 0.0, f"needs {', '.join(sorted(needed & failed))}")
+                    elif needed <= finished:
+                        del pending[name]
+                        stage = self.stages[name]
+                        running[executor.submit(execute, stage, stage.cache_key())] = name
+
+                if not running:
+                    continue
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        status, seconds, error = future.result()
+                    except Exception as e:
+                        print(f"ERROR in {self.stages[name].description}: {e}")
+                        status, seconds, error = "failed", 0.0, str(e)
+                    if status == "ran":
+                        ran.add(name)
+                    results[name] = self._result(name, status, seconds, error)
+
+        self.total_seconds = time.perf_counter() - started
+        return list(results.values())
+
+    def _result(self, name, status, seconds, error):
+        return {
+            "stage": name,
+            "description": self.stages[name].description,
+            "status": status,
+            "seconds": round(seconds, 3),
+            "error": error
+        }
+
+    def print_report(self, results):
+        """Per-stage timing table"""
+        print("\n" + "=" * 80)
+        print("PIPELINE TIMING REPORT")
+        print("=" * 80)
+        print(f"{'Stage':<24} {'Status':<10} {'Seconds':>10}")
+        print("-" * 46)
+        for result in results:
+            print(f"{result['stage']:<24} {result['status']:<10} {result['seconds']:>10.2f}")
+            if result["error"]:
+                print(f"    {result['error']}")
+        print("-" * 46)
+        stage_seconds = sum(result["seconds"] for result in results)
+        print(f"{'Total (wall clock)':<35} {self.total_seconds:>10.2f}")
+        print(f"{'Sum of stage times':<35} {stage_seconds:>10.2f}")
@@ -2,81 +2,89 @@
 """
 Complete Data Pipeline for DevLens
 Generates synthetic data and calculates all metrics in one go
+
+Stages run in-process through pipeline.py: the three datasets are generated in
+parallel and stages whose inputs have not changed since the last run are skipped
+(--force reruns everything).
 """
 
-import os
-import sys
-import subprocess
+import argparse
 from pathlib import Path
 
-def run_script(script_path, description):
-    """Run a Python script and handle errors"""
-    print(f"\n> {description}")
-    print("-" * 60)
+import generate_synthetic_data
+import calculate_attendance_from_activity
+import load_synthetic_data_to_db
+from pipeline import Pipeline, Stage
+
+def build_pipeline(data_dir, seed=42, max_workers=4):
+    """
+    Stages of the synthetic data pipeline
+
+    Communication, execution and HR data are generated independently (in
+    parallel); activity metrics need the first two and the database load needs
+    all four files.
+    """
+    generator = generate_synthetic_data.SyntheticDataGenerator(seed=seed)
+    comm_path = data_dir / "comm_mock_data.json"
+    exec_path = data_dir / "exec_mock_data.json"
+    hr_path = data_dir / "hr_behavioral_data.json"
+    activity_path = data_dir / "activity_based_metrics.json"
     
-    try:
-        result = subprocess.run([sys.executable, script_path], 
-                              capture_output=True, text=True, cwd=os.path.dirname(script_path))
-        
-        if result.returncode == 0:
-            print(result.stdout)
-            print(f"SUCCESS: {description} completed successfully")
-            return True
-        else:
-            print(f"ERROR in {description}:")
-            print(result.stderr)
-            return False
-            
-    except Exception as e:
-        print(f"FAILED to run {description}: {e}")
-        return False
+    def generate(dataset):
+        return lambda: generator.save_dataset(dataset, data_dir)
+    
+    def load_database():
+        if not load_synthetic_data_to_db.SyntheticDataLoader().load_all_synthetic_data():
+            raise RuntimeError("loading synthetic data failed")
+    
+    return Pipeline([
+        Stage("communication", generate("communication"), outputs=[comm_path], params={"seed": seed},
+              code=[generate_synthetic_data], description="Generating Communication Data"),
+        Stage("execution", generate("execution"), outputs=[exec_path], params={"seed": seed},
+              code=[generate_synthetic_data], description="Generating Execution Data"),
+        Stage("hr_behavioral", generate("hr_behavioral"), outputs=[hr_path], params={"seed": seed},
+              code=[generate_synthetic_data], description="Generating HR Behavioral Data"),
+        Stage("activity_metrics", calculate_attendance_from_activity.save_activity_metrics,
+              inputs=[comm_path, exec_path], outputs=[activity_path],
+              description="Calculating Activity-Based Metrics"),
+        Stage("load_database", load_database, inputs=[comm_path, exec_path, hr_path, activity_path],
+              description="Loading Synthetic Data into Database")
+    ], state_path=data_dir / ".pipeline_state.json", max_workers=max_workers)
 
 def main():
     """Run the complete data pipeline"""
+    parser = argparse.ArgumentParser(description="Generate synthetic data, calculate metrics and load the database")
+    parser.add_argument("--force", action="store_true", help="Rerun every stage even if its inputs are unchanged")
+    parser.add_argument("--workers", type=int, default=4, help="Stages run in parallel (default: 4)")
+    args = parser.parse_args()
+    
     print("DEVLENS COMPLETE DATA PIPELINE")
     print("=" * 80)
     
     # Get script directory
     script_dir = Path(__file__).parent
-    
-    # Define pipeline steps
-    pipeline_steps = [
-        {
-            "script": script_dir / "generate_synthetic_data.py",
-            "description": "Generating Synthetic Data (Communication, Execution, HR)"
-        },
-        {
-            "script": script_dir / "calculate_attendance_from_activity.py", 
-            "description": "Calculating Activity-Based Metrics"
-        },
-        {
-            "script": script_dir / "load_synthetic_data_to_db.py",
-            "description": "Loading Synthetic Data into Database"
-        }
-    ]
+    data_dir = script_dir.parent / "data"
     
     # Run pipeline
-    success_count = 0
-    for step in pipeline_steps:
-        if run_script(str(step["script"]), step["description"]):
-            success_count += 1
-        else:
-            print(f"\nWARNING: Pipeline stopped due to error in: {step['description']}")
-            break
+    pipeline = build_pipeline(data_dir, max_workers=args.workers)
+    results = pipeline.run(force=args.force)
+    pipeline.print_report(results)
+    success_count = sum(result["status"] in ("ran", "cached") for result in results)
     
     # Summary
     print("\n" + "=" * 80)
     print("PIPELINE SUMMARY")
     print("=" * 80)
     
-    if success_count == len(pipeline_steps):
+    if success_count == len(results):
         print("SUCCESS: All pipeline steps completed successfully!")
         
         # Show generated files
-        data_dir = script_dir.parent / "data"
         if data_dir.exists():
             print(f"\nGenerated files in {data_dir}:")
             for file in data_dir.glob("*.json"):
+                if file.name.startswith("."):
+                    continue
                 size_kb = file.stat().st_size / 1024
                 print(f"  - {file.name} ({size_kb:.1f} KB)")
         
@@ -87,7 +95,7 @@ def main():
         print("  4. Company: DevLens Synthetic Corp")
         
     else:
-        print(f"WARNING: Pipeline partially completed: {success_count}/{len(pipeline_steps)} steps")
+        print(f"WARNING: Pipeline partially completed: {success_count}/{len(results)} steps")
         print("Check the error messages above for troubleshooting.")
 
 if __name__ == "__main__":
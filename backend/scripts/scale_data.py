@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Scale-Test Data Generator for DevLens
+Builds tenants of 10k-100k+ developers with millions of messages and commits
+for performance testing. Developers are split into shards; each shard samples
+its archetype mix, activity, timestamps and message content with vectorized
+NumPy draws and is written by a worker process as NDJSON (same record layout
+as generate_synthetic_data.py) or Parquet (flat columns). Each shard's random
+stream is derived from (seed, shard), so the output is identical whatever the
+number of workers.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from generate_synthetic_data import SyntheticDataGenerator
+
+FORMATS = {"ndjson": ".ndjson", "parquet": ".parquet"}
+SHARD_SIZE = 2000
+
+# archetype -> (mix weight, commits, meetings, messages per 90 days,
+#               how widely commits spread across files 0-1,
+#               message mix over high_tech/medium_tech/low_tech/social)
+ARCHETYPES = {
+    "senior_specialist": (12, (18, 25), (1, 4), (2, 5), 0.9, (0.6, 0.2, 0.1, 0.1)),
+    "team_lead": (15, (12, 18), (8, 15), (8, 15), 0.75, (0.3, 0.3, 0.1, 0.3)),
+    "steady_contributor": (35, (10, 16), (5, 10), (4, 8), 0.6, (0.2, 0.4, 0.2, 0.2)),
+    "process_focused": (12, (5, 10), (12, 20), (10, 18), 0.4, (0.1, 0.2, 0.2, 0.5)),
+    "junior_dev": (10, (3, 8), (6, 12), (5, 10), 0.3, (0.05, 0.3, 0.35, 0.3)),
+    "full_stack_hero": (8, (25, 35), (2, 5), (3, 6), 0.95, (0.7, 0.2, 0.05, 0.05)),
+    "needs_support": (8, (0, 4), (2, 6), (0, 3), 0.2, (0.05, 0.25, 0.3, 0.4))
+}
+
+FIRST_NAMES = [
+    "Alex", "Sarah", "Mike", "Emily", "James", "Lisa", "David", "Rachel", "Tom", "Maria",
+    "Kevin", "Anna", "Chris", "Jessica", "Ryan", "Sophie", "Daniel", "Amy", "Mark", "Grace",
+    "Jason", "Olivia", "Nathan", "Emma", "Lucas", "Priya", "Omar", "Yuki", "Fatima", "Diego"
+]
+LAST_NAMES = [
+    "Chen", "Johnson", "Rodriguez", "Davis", "Wilson", "Zhang", "Kim", "Green", "Anderson", "Garcia",
+    "Lee", "Smith", "Brown", "Taylor", "Murphy", "Wang", "Clark", "Liu", "Thompson", "Park",
+    "Miller", "Patel", "Nguyen", "Silva", "Okafor", "Schmidt", "Rossi", "Sato", "Khan", "Lopez"
+]
+
+MESSAGE_TYPES = ["high_tech", "medium_tech", "low_tech", "social"]
+MAX_FILES = 5
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError as e:
+        raise RuntimeError("Parquet output requires pyarrow: pip install pyarrow") from e
+    return pyarrow
+
+
+class ScaleDataGenerator:
+    def __init__(self, developers, seed=42, days=90, shard_size=SHARD_SIZE):
+        """
+        Args:
+            developers: Number of developers in the tenant
+            seed: Base seed; the same seed gives the same files
+            days: Length of the activity window (archetype rates are per 90 days)
+            shard_size: Developers generated and written per part file
+        """
+        self.developers = developers
+        self.seed = seed
+        self.days = days
+        self.shard_size = shard_size
+
+        base = SyntheticDataGenerator(seed)
+        self.start_time = np.datetime64(base.start_time.date().isoformat(), "s")
+        self.teams = list(base.file_types)
+        self.repos = base.repos
+
+        self.archetypes = list(ARCHETYPES)
+        profiles = list(ARCHETYPES.values())
+        weights = np.array([profile[0] for profile in profiles], dtype=float)
+        self.weights = weights / weights.sum()
+        self.commit_range = np.array([profile[1] for profile in profiles])
+        self.meeting_range = np.array([profile[2] for profile in profiles])
+        self.message_range = np.array([profile[3] for profile in profiles])
+        self.spread = np.array([profile[4] for profile in profiles])
+        self.message_mix = np.cumsum([profile[5] for profile in profiles], axis=1)
+
+        # Templates flattened into one array, indexed by type offset + choice
+        templates = [base.message_templates[kind] for kind in MESSAGE_TYPES]
+        self.templates = np.array([text for kind in templates for text in kind], dtype=object)
+        self.template_counts = np.array([len(kind) for kind in templates])
+        self.template_offsets = np.concatenate([[0], np.cumsum(self.template_counts)[:-1]])
+
+        # Weekdays in the window; activity lands on these
+        offsets = np.arange(days)
+        self.workdays = offsets[np.is_busday((self.start_time + offsets * 86400).astype("datetime64[D]"))]
+
+    @property
+    def shards(self):
+        return (self.developers + self.shard_size - 1) // self.shard_size
+
+    def _timestamps(self, rng, count):
+        """Working-hours timestamps on weekdays in the window"""
+        days = self.workdays[rng.integers(0, len(self.workdays), count)]
+        seconds = np.clip(rng.normal(13.5 * 3600, 2.5 * 3600, count), 7 * 3600, 22 * 3600).astype(np.int64)
+        return self.start_time + days * 86400 + seconds
+
+    def _counts(self, rng, ranges, archetype):
+        """Per-developer activity counts from the archetype's 90-day range"""
+        factor = self.days / 90
+        low = np.floor(ranges[archetype, 0] * factor).astype(np.int64)
+        high = np.floor(ranges[archetype, 1] * factor).astype(np.int64)
+        return rng.integers(low, high + 1)
+
+    def generate_shard(self, shard):
+        """
+        Sample one shard of developers and their activity
+
+        Returns:
+            dict: dataset -> {column: numpy array} for 'communication',
+            'execution' and 'hr_behavioral'
+        """
+        rng = np.random.default_rng([self.seed, shard])
+        first = shard * self.shard_size
+        n = min(self.shard_size, self.developers - first)
+
+        # Developers
+        archetype = rng.choice(len(self.archetypes), size=n, p=self.weights)
+        user_ids = np.array([f"teams_guid_{i:07}" for i in range(first + 1, first + n + 1)], dtype=object)
+        names = (np.array(FIRST_NAMES, dtype=object)[rng.integers(0, len(FIRST_NAMES), n)] + " "
+                 + np.array(LAST_NAMES, dtype=object)[rng.integers(0, len(LAST_NAMES), n)])
+        teams = np.array(self.teams, dtype=object)[rng.integers(0, len(self.teams), n)]
+        emails = np.array([f"{name.lower().replace(' ', '.')}.{i}@company.com"
+                           for i, name in enumerate(names.tolist(), first + 1)], dtype=object)
+
+        # Commits: files touched and effort per file drive the Shannon entropy
+        commit_author = np.repeat(np.arange(n), self._counts(rng, self.commit_range, archetype))
+        commit_count = len(commit_author)
+        files_changed = 1 + rng.binomial(MAX_FILES - 1, self.spread[archetype[commit_author]])
+        changes = rng.integers(5, 120, (commit_count, MAX_FILES)) * (np.arange(MAX_FILES) < files_changed[:, None])
+        totals = changes.sum(axis=1)
+        shares = changes / totals[:, None]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            entropy = np.abs(np.where(shares > 0, shares * np.log2(shares), 0.0).sum(axis=1))
+        additions = (totals * rng.uniform(0.6, 0.8, commit_count)).astype(np.int64)
+
+        execution = {
+            "sha": np.array([f"sha_{shard:05}_{i:07}" for i in range(commit_count)], dtype=object),
+            "user_id": user_ids[commit_author],
+            "name": names[commit_author],
+            "email": emails[commit_author],
+            "team": teams[commit_author],
+            "date": self._timestamps(rng, commit_count),
+            "repo": np.array(self.repos, dtype=object)[rng.integers(0, len(self.repos), commit_count)],
+            "files_changed": files_changed,
+            "additions": additions,
+            "deletions": totals - additions,
+            "total_entropy": np.round(entropy, 6),
+            "comment_count": rng.integers(0, 4, commit_count)
+        }
+
+        # Messages: type from the archetype's mix, then a template of that type
+        message_author = np.repeat(np.arange(n), self._counts(rng, self.message_range, archetype))
+        message_count = len(message_author)
+        kind = (rng.random(message_count)[:, None] > self.message_mix[archetype[message_author]]).sum(axis=1)
+        kind = np.minimum(kind, len(MESSAGE_TYPES) - 1)
+        template = self.template_offsets[kind] + (rng.random(message_count) * self.template_counts[kind]).astype(np.int64)
+        message_ids = np.array([f"m_{shard:05}_{i:07}" for i in range(message_count)], dtype=object)
+
+        # 25% are replies to an earlier message of the shard
+        position = np.arange(message_count)
+        is_reply = (rng.random(message_count) < 0.25) & (position > 0)
+        reply_to = np.full(message_count, None, dtype=object)
+        reply_to[is_reply] = message_ids[(rng.random(message_count) * position).astype(np.int64)[is_reply]]
+
+        communication = {
+            "id": message_ids,
+            "reply_to_id": reply_to,
+            "created": self._timestamps(rng, message_count),
+            "user_id": user_ids[message_author],
+            "name": names[message_author],
+            "team": teams[message_author],
+            "content": self.templates[template]
+        }
+
+        # HR records, one per developer
+        work_days = len(self.workdays)
+        collaboration = rng.uniform(0.3, 1.0, n)
+        knowledge = rng.uniform(0.2, 1.0, n)
+        engagement = rng.uniform(0.4, 1.0, n)
+        proactivity = rng.uniform(0.3, 1.0, n)
+        reliability = rng.uniform(0.6, 1.0, n)
+        leave_days = (rng.uniform(2, 15, n) * (1 - reliability)).astype(np.int64)
+        sick_days = (rng.uniform(0, 8, n) * (1 - reliability)).astype(np.int64)
+        attendance_rate = (work_days - leave_days - sick_days) / work_days
+        total_meetings = self._counts(rng, self.meeting_range, archetype)
+        meetings_attended = (total_meetings * attendance_rate * engagement).astype(np.int64)
+
+        hr_behavioral = {
+            "user_id": user_ids,
+            "name": names,
+            "team": teams,
+            "archetype": np.array(self.archetypes, dtype=object)[archetype],
+            "total_work_days": np.full(n, work_days),
+            "days_present": work_days - leave_days - sick_days,
+            "leave_days": leave_days,
+            "sick_days": sick_days,
+            "attendance_rate": np.round(attendance_rate, 3),
+            "meetings_attended": meetings_attended,
+            "meetings_organized": (rng.uniform(2, 15, n) * proactivity).astype(np.int64),
+            "meeting_attendance_rate": np.round(meetings_attended / np.maximum(total_meetings, 1), 3),
+            "code_reviews_given": (rng.uniform(10, 80, n) * collaboration).astype(np.int64),
+            "code_reviews_received": rng.integers(8, 41, n),
+            "avg_review_response_time_hours": np.round(rng.uniform(2, 48, n) * (2 - collaboration), 1),
+            "collaboration_score": np.round(collaboration, 3),
+            "knowledge_sharing_score": np.round(knowledge, 3),
+            "proactivity_score": np.round(proactivity, 3),
+            "reliability_score": np.round(reliability, 3)
+        }
+
+        return {"communication": communication, "execution": execution, "hr_behavioral": hr_behavioral}
+
+    def _ndjson_lines(self, dataset, columns):
+        """Render a shard's columns in the record layout of generate_synthetic_data.py"""
+        if dataset == "communication":
+            dates = np.datetime_as_string(columns["created"], unit="s").tolist()
+            content = [json.dumps(f"<div>{text}</div>") for text in columns["content"].tolist()]
+            return [
+                f'{{"id": "{message_id}", "replyToId": {json.dumps(reply_to)}, "createdDateTime": "{date}Z", '
+                f'"from": {{"user": {{"id": "{user_id}", "displayName": "{name}", "team": "{team}"}}}}, '
+                f'"body": {{"contentType": "html", "content": {body}}}}}\n'
+                for message_id, reply_to, date, user_id, name, team, body in zip(
+                    columns["id"].tolist(), columns["reply_to_id"].tolist(), dates, columns["user_id"].tolist(),
+                    columns["name"].tolist(), columns["team"].tolist(), content
+                )
+            ]
+
+        if dataset == "execution":
+            dates = np.datetime_as_string(columns["date"], unit="s").tolist()
+            return [
+                f'{{"sha": "{sha}", "commit": {{"author": {{"name": "{name}", "email": "{email}", "date": "{date}Z"}}, '
+                f'"message": "Update {files} files in {repo}", "comment_count": {comments}}}, '
+                f'"url": "https://api.github.com/repos/org/{repo}/commits/{sha}", '
+                f'"devlens_meta": {{"teams_user_id": "{user_id}", "team": "{team}", "files_changed": {files}, '
+                f'"stats": {{"additions": {additions}, "deletions": {deletions}, "total_entropy": {entropy}}}}}}}\n'
+                for sha, name, email, date, repo, comments, user_id, team, files, additions, deletions, entropy in zip(
+                    columns["sha"].tolist(), columns["name"].tolist(), columns["email"].tolist(), dates,
+                    columns["repo"].tolist(), columns["comment_count"].tolist(), columns["user_id"].tolist(),
+                    columns["team"].tolist(), columns["files_changed"].tolist(), columns["additions"].tolist(),
+                    columns["deletions"].tolist(), columns["total_entropy"].tolist()
+                )
+            ]
+
+        end_date = (self.start_time + self.days * 86400).astype("datetime64[D]")
+        period = {"start_date": str(self.start_time.astype("datetime64[D]")), "end_date": str(end_date),
+                  "total_days": self.days}
+        rows = {name: values.tolist() for name, values in columns.items()}
+        return [
+            json.dumps({
+                "user_id": rows["user_id"][i],
+                "name": rows["name"][i],
+                "team": rows["team"][i],
+                "archetype": rows["archetype"][i],
+                "analysis_period": period,
+                "attendance_metrics": {
+                    name: rows[name][i]
+                    for name in ("total_work_days", "days_present", "leave_days", "sick_days", "attendance_rate")
+                },
+                "collaboration_metrics": {
+                    name: rows[name][i]
+                    for name in ("meetings_attended", "meetings_organized", "meeting_attendance_rate",
+                                 "code_reviews_given", "code_reviews_received", "avg_review_response_time_hours")
+                },
+                "personality_indicators": {
+                    name: rows[name][i]
+                    for name in ("collaboration_score", "knowledge_sharing_score", "proactivity_score",
+                                 "reliability_score")
+                }
+            }) + "\n"
+            for i in range(len(rows["user_id"]))
+        ]
+
+    def write_shard(self, shard, output_dir, file_format="ndjson"):
+        """
+        Generate one shard and write it as part-<shard> of each dataset directory
+
+        Returns:
+            dict: dataset -> records written
+        """
+        tables = self.generate_shard(shard)
+        counts = {}
+        for dataset, columns in tables.items():
+            directory = os.path.join(output_dir, dataset)
+            os.makedirs(directory, exist_ok=True)
+            path = os.path.join(directory, f"part-{shard:05}{FORMATS[file_format]}")
+            if file_format == "parquet":
+                pa = _require_pyarrow()
+                pa.parquet.write_table(pa.table(columns), path)
+            else:
+                with open(path, "w", encoding="utf-8") as f:
+                    f.writelines(self._ndjson_lines(dataset, columns))
+            counts[dataset] = len(next(iter(columns.values())))
+        return counts
+
+    def generate(self, output_dir, file_format="ndjson", workers=None):
+        """
+        Write every shard, spread over worker processes
+
+        Args:
+            output_dir: Gets communication/, execution/ and hr_behavioral/
+                directories of part files
+            file_format: 'ndjson' or 'parquet'
+            workers: Worker processes (default: CPU count)
+
+        Returns:
+            dict: dataset -> total records written
+        """
+        if file_format not in FORMATS:
+            raise ValueError(f"Unknown format '{file_format}', expected one of {sorted(FORMATS)}")
+        if file_format == "parquet":
+            _require_pyarrow()
+
+        print(f"Generating {self.developers:,} developers in {self.shards} shards ({file_format})...")
+        started = time.perf_counter()
+        totals = {"communication": 0, "execution": 0, "hr_behavioral": 0}
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            jobs = [executor.submit(self.write_shard, shard, output_dir, file_format) for shard in range(self.shards)]
+            for done, job in enumerate(jobs, 1):
+                for dataset, count in job.result().items():
+                    totals[dataset] += count
+                if done % 10 == 0 or done == len(jobs):
+                    print(f"  {done}/{len(jobs)} shards written")
+
+        print(f"Scale data written to {output_dir} in {time.perf_counter() - started:.1f}s: "
+              f"{totals['communication']:,} messages, {totals['execution']:,} commits, "
+              f"{totals['hr_behavioral']:,} HR records")
+        return totals
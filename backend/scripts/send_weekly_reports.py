@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Send Weekly Reports
+Sends the weekly report to every manager with weekly reports enabled, scoring
+each company once. Suitable for cron when the API's built-in schedule is off.
+"""
+
+import os
+import sys
+import argparse
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import DevLensDB
+from email_service import EmailService
+from weekly_reports import WeeklyReportJob
+
+def main():
+    parser = argparse.ArgumentParser(description="Send DevLens weekly reports")
+    parser.add_argument("--workers", type=int, default=4, help="Companies processed in parallel (default: 4)")
+    args = parser.parse_args()
+
+    email_service = EmailService()
+    try:
+        run = WeeklyReportJob(DevLensDB(), email_service, max_workers=args.workers).run()
+    finally:
+        email_service.close()
+
+    for timing in run["timings"]:
+        if "error" in timing:
+            print(f"❌ {timing['company']}: {timing['error']}")
+        else:
+            print(f"✅ {timing['company']}: {timing['sent']}/{timing['recipients']} sent "
+                  f"(snapshot {timing['snapshot_seconds']}s, render {timing['render_seconds']}s, "
+                  f"send {timing['send_seconds']}s)")
+    print(f"Run #{run['id']}: {run['sent']} sent, {run['failed']} failed in {run['duration_seconds']}s")
+    if run["failed"]:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -2,41 +2,50 @@
 """
 Complete DevLens Data Setup
 Sets up companies, managers, teams, and developers with proper database integration
+
+The steps run in-process through pipeline.py; the activity metrics are skipped
+when the exported files have not changed since the last run.
 """
 
-import os
-import sys
-import subprocess
+import argparse
 from pathlib import Path
 
-def run_script(script_path, description, args=None):
-    """Run a Python script and handle errors"""
-    print(f"\n> {description}")
-    print("-" * 60)
+import generate_company_data
+import export_database_to_json
+import calculate_attendance_from_activity
+from pipeline import Pipeline, Stage
+
+def build_pipeline(data_dir, max_workers=4):
+    """Company generation, JSON export for analytics, then activity metrics"""
+    comm_path = data_dir / "comm_mock_data.json"
+    exec_path = data_dir / "exec_mock_data.json"
+    hr_path = data_dir / "hr_behavioral_data.json"
     
-    try:
-        cmd = [sys.executable, script_path]
-        if args:
-            cmd.extend(args)
-            
-        result = subprocess.run(cmd, capture_output=True, text=True, 
-                              cwd=os.path.dirname(script_path))
-        
-        if result.returncode == 0:
-            print(result.stdout)
-            print(f"SUCCESS: {description} completed")
-            return True
-        else:
-            print(f"ERROR in {description}:")
-            print(result.stderr)
-            return False
-            
-    except Exception as e:
-        print(f"FAILED to run {description}: {e}")
-        return False
+    def create_companies():
+        generate_company_data.CompanyDataGenerator(seed=42).generate_all_companies()
+    
+    def export_json():
+        exporter = export_database_to_json.DatabaseToJSONExporter()
+        companies = exporter.list_available_companies()
+        if not companies:
+            raise RuntimeError("no companies found in database")
+        exporter.export_company_data(companies[0], data_dir)
+    
+    return Pipeline([
+        Stage("companies", create_companies, description="Generate Company Database Structure"),
+        Stage("export", export_json, after=["companies"], outputs=[comm_path, exec_path, hr_path],
+              code=[export_database_to_json], description="Export Database to JSON Files"),
+        Stage("activity_metrics", calculate_attendance_from_activity.save_activity_metrics,
+              inputs=[comm_path, exec_path], outputs=[data_dir / "activity_based_metrics.json"],
+              description="Calculate Activity-Based Metrics")
+    ], state_path=data_dir / ".pipeline_state.json", max_workers=max_workers)
 
 def main():
     """Main setup workflow"""
+    parser = argparse.ArgumentParser(description="Create demo companies and export their data for analytics")
+    parser.add_argument("--force", action="store_true", help="Rerun every stage even if its inputs are unchanged")
+    args = parser.parse_args()
+    
     print("DEVLENS COMPLETE DATA SETUP")
     print("=" * 50)
     print("This will create companies with managers, teams, and developers")
@@ -45,34 +54,14 @@ def main():
     # Get script directory
     script_dir = Path(__file__).parent
     
-    # Step 1: Generate company data (creates database entries)
-    print("\nSTEP 1: Creating Companies and Teams")
-    success1 = run_script(
-        str(script_dir / "generate_company_data.py"),
-        "Generate Company Database Structure"
-    )
-    
-    if not success1:
-        print("\nSetup failed at Step 1. Check errors above.")
-        return
-    
-    # Step 2: Export to JSON files for analytics
-    print("\nSTEP 2: Exporting Data for Analytics")
-    success2 = run_script(
-        str(script_dir / "export_database_to_json.py"),
-        "Export Database to JSON Files"
-    )
-    
-    if not success2:
-        print("\nWarning: JSON export failed, but database is set up.")
-        print("You can still use the application with database data.")
-    
-    # Step 3: Calculate activity metrics (optional)
-    print("\nSTEP 3: Calculating Activity Metrics")
-    success3 = run_script(
-        str(script_dir / "calculate_attendance_from_activity.py"),
-        "Calculate Activity-Based Metrics"
-    )
+    # Companies (database) -> JSON export -> activity metrics, in-process
+    pipeline = build_pipeline(script_dir.parent / "data")
+    results = pipeline.run(force=args.force)
+    pipeline.print_report(results)
+    status = {result["stage"]: result["status"] for result in results}
+    success1 = status.get("companies") == "ran"
+    success2 = status.get("export") in ("ran", "cached")
+    success3 = status.get("activity_metrics") in ("ran", "cached")
     
     # Summary
     print("\n" + "=" * 50)
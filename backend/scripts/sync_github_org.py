@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Sync GitHub Organization Metrics
+Collects commits, entropy, reviews and mentoring counts for every member of a
+GitHub organization and writes them to the developers of a DevLens company.
+An interrupted sync is resumed automatically when run again for the same period.
+"""
+
+import os
+import sys
+import argparse
+
+# Add parent directory to path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import DevLensDB
+from integrations.github_collector import GITHUB_API_URL
+from integrations.github_org_sync import OrgSyncJob
+
+def main():
+    parser = argparse.ArgumentParser(description="Sync a GitHub organization into DevLens")
+    parser.add_argument("organization", help="GitHub organization")
+    parser.add_argument("company", help="DevLens company the members belong to")
+    parser.add_argument("--start-date", default="2024-01-01", help="First day of the period (YYYY-MM-DD)")
+    parser.add_argument("--end-date", default="2024-12-31", help="Last day of the period (YYYY-MM-DD)")
+    parser.add_argument("--token", default=os.environ.get("GITHUB_TOKEN", ""),
+                        help="GitHub token (default: $GITHUB_TOKEN)")
+    parser.add_argument("--base-url", default=os.environ.get("GITHUB_API_URL", GITHUB_API_URL),
+                        help="GitHub API URL, e.g. a local mock server (default: $GITHUB_API_URL)")
+    parser.add_argument("--mode", choices=["graphql", "rest"],
+                        help="Collector mode (default: graphql, or the mode of the resumed run)")
+    parser.add_argument("--batch-size", type=int, default=25, help="Members collected and written per batch")
+    parser.add_argument("--resume", type=int, metavar="RUN_ID", help="Resume a specific sync run")
+    parser.add_argument("--map", action="append", default=[], metavar="LOGIN=DEVELOPER_ID",
+                        help="Map a GitHub login to a developer explicitly (repeatable)")
+    args = parser.parse_args()
+
+    db = DevLensDB()
+    company = db.get_company_by_name(args.company)
+    if not company:
+        print(f"❌ Company not found: {args.company}")
+        sys.exit(1)
+
+    for mapping in args.map:
+        login, developer_id = mapping.split("=", 1)
+        db.set_developer_identity(args.organization, login, int(developer_id))
+
+    mode = args.mode
+    if mode is None:
+        resumed = db.get_github_sync_run(args.resume) if args.resume else None
+        mode = resumed["mode"] if resumed else "graphql"
+
+    job = OrgSyncJob(
+        db, args.token, args.organization, company["id"], args.start_date, args.end_date,
+        base_url=args.base_url, batch_size=args.batch_size, mode=mode
+    )
+    run = job.run(args.resume)
+
+    print(f"✅ GitHub sync #{run['id']} {run['status']}: {run['synced_members']} synced, "
+          f"{run['failed_members']} failed, {run['unmapped_members']} unmapped")
+
+if __name__ == "__main__":
+    main()
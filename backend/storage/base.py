@@ -0,0 +1,76 @@
+"""
+Storage backend interface for DevLens
+SQL is written once in SQLite dialect (``?`` placeholders) and each backend
+translates it for its own driver.
+"""
+
+from typing import Any, Iterable, List, Optional, Sequence
+
+
+class Transaction:
+    """
+    A unit of work on a single connection.
+    Rows returned by fetchone/fetchall support both key and positional access.
+    """
+
+    def execute(self, sql: str, params: Sequence = ()) -> int:
+        """Run a statement and return the number of affected rows"""
+        raise NotImplementedError
+
+    def executemany(self, sql: str, seq_of_params: Iterable[Sequence]) -> None:
+        """Run a statement once per parameter tuple"""
+        raise NotImplementedError
+
+    def fetchone(self, sql: str, params: Sequence = ()) -> Optional[Any]:
+        """Run a query and return the first row (or None)"""
+        raise NotImplementedError
+
+    def fetchall(self, sql: str, params: Sequence = ()) -> List[Any]:
+        """Run a query and return every row"""
+        raise NotImplementedError
+
+    def insert(self, sql: str, params: Sequence = ()) -> int:
+        """Run an INSERT into a table with an ``id`` key and return the new id"""
+        raise NotImplementedError
+
+
+class StorageBackend:
+    """
+    Base class for DevLens storage engines.
+    Subclasses implement transaction() and table_columns(); the single-statement
+    helpers below each run in their own short transaction.
+    """
+
+    dialect = None
+    IntegrityError = Exception
+
+    def transaction(self):
+        """Context manager yielding a Transaction that commits on success"""
+        raise NotImplementedError
+
+    def table_columns(self, table: str) -> List[str]:
+        """Return the column names of a table"""
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Release pooled resources"""
+
+    def execute(self, sql: str, params: Sequence = ()) -> int:
+        with self.transaction() as tx:
+            return tx.execute(sql, params)
+
+    def executemany(self, sql: str, seq_of_params: Iterable[Sequence]) -> None:
+        with self.transaction() as tx:
+            tx.executemany(sql, seq_of_params)
+
+    def fetchone(self, sql: str, params: Sequence = ()) -> Optional[Any]:
+        with self.transaction() as tx:
+            return tx.fetchone(sql, params)
+
+    def fetchall(self, sql: str, params: Sequence = ()) -> List[Any]:
+        with self.transaction() as tx:
+            return tx.fetchall(sql, params)
+
+    def insert(self, sql: str, params: Sequence = ()) -> int:
+        with self.transaction() as tx:
+            return tx.insert(sql, params)
@@ -0,0 +1,131 @@
+"""
+PostgreSQL storage backend built on the asyncpg connection pool
+The pool lives on a dedicated event loop thread so the synchronous DevLensDB
+API (and FastAPI's threadpool endpoints) can share it across requests.
+"""
+
+import asyncio
+import re
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterable, Sequence
+
+from .base import StorageBackend, Transaction
+
+# SQLite DDL fragments and their PostgreSQL equivalents
+DDL_REPLACEMENTS = [
+    (re.compile(r"INTEGER PRIMARY KEY AUTOINCREMENT", re.IGNORECASE), "SERIAL PRIMARY KEY"),
+    (re.compile(r"BOOLEAN DEFAULT 1\b", re.IGNORECASE), "BOOLEAN DEFAULT TRUE"),
+    (re.compile(r"BOOLEAN DEFAULT 0\b", re.IGNORECASE), "BOOLEAN DEFAULT FALSE"),
+]
+
+
+@lru_cache(maxsize=512)
+def translate_sql(sql: str) -> str:
+    """Convert SQLite-dialect SQL to PostgreSQL ($n placeholders, DDL types)"""
+    for pattern, replacement in DDL_REPLACEMENTS:
+        sql = pattern.sub(replacement, sql)
+
+    # Number the ? placeholders, leaving quoted string literals untouched
+    parts = []
+    index = 0
+    in_string = False
+    for char in sql:
+        if char == "'":
+            in_string = not in_string
+        if char == "?" and not in_string:
+            index += 1
+            parts.append(f"${index}")
+        else:
+            parts.append(char)
+    return "".join(parts)
+
+
+def _rowcount(status: str) -> int:
+    """asyncpg returns command tags such as 'UPDATE 3'"""
+    try:
+        return int(status.split()[-1])
+    except (AttributeError, IndexError, ValueError):
+        return 0
+
+
+class PostgresTransaction(Transaction):
+    def __init__(self, backend: "PostgresBackend", conn):
+        self.backend = backend
+        self.conn = conn
+
+    def execute(self, sql: str, params: Sequence = ()) -> int:
+        status = self.backend.run(self.conn.execute(translate_sql(sql), *params))
+        return _rowcount(status)
+
+    def executemany(self, sql: str, seq_of_params: Iterable[Sequence]) -> None:
+        rows = [tuple(params) for params in seq_of_params]
+        if rows:
+            self.backend.run(self.conn.executemany(translate_sql(sql), rows))
+
+    def fetchone(self, sql: str, params: Sequence = ()):
+        return self.backend.run(self.conn.fetchrow(translate_sql(sql), *params))
+
+    def fetchall(self, sql: str, params: Sequence = ()):
+        return self.backend.run(self.conn.fetch(translate_sql(sql), *params))
+
+    def insert(self, sql: str, params: Sequence = ()) -> int:
+        return self.backend.run(self.conn.fetchval(translate_sql(sql) + " RETURNING id", *params))
+
+
+class PostgresBackend(StorageBackend):
+    dialect = "postgresql"
+
+    def __init__(self, dsn: str, min_size: int = 1, max_size: int = 10):
+        try:
+            import asyncpg
+        except ImportError as e:
+            raise RuntimeError("PostgreSQL backend requires asyncpg: pip install asyncpg") from e
+
+        self.IntegrityError = asyncpg.IntegrityConstraintViolationError
+        self.dsn = dsn
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="devlens-postgres", daemon=True)
+        self._thread.start()
+
+        async def create_pool():
+            return await asyncpg.create_pool(dsn, min_size=min_size, max_size=max_size)
+
+        self._pool = self.run(create_pool())
+
+    def run(self, coro):
+        """Run a coroutine on the pool's event loop and wait for the result"""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _acquire(self):
+        # pool.acquire() returns an awaitable context, not a coroutine
+        return await self._pool.acquire()
+
+    @contextmanager
+    def transaction(self):
+        conn = self.run(self._acquire())
+        tx = conn.transaction()
+        try:
+            self.run(tx.start())
+            try:
+                yield PostgresTransaction(self, conn)
+                self.run(tx.commit())
+            except Exception:
+                self.run(tx.rollback())
+                raise
+        finally:
+            self.run(self._pool.release(conn))
+
+    def table_columns(self, table: str):
+        rows = self.fetchall(
+            "SELECT column_name FROM information_schema.columns WHERE table_name = ? ORDER BY ordinal_position",
+            (table,)
+        )
+        return [row[0] for row in rows]
+
+    def close(self) -> None:
+        self.run(self._pool.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
@@ -0,0 +1,60 @@
+"""
+SQLite storage backend (default, single file, no external service)
+"""
+
+import sqlite3
+from contextlib import contextmanager
+from typing import Iterable, Sequence
+
+from .base import StorageBackend, Transaction
+
+
+class SQLiteTransaction(Transaction):
+    def __init__(self, conn: sqlite3.Connection):
+        self.conn = conn
+
+    def execute(self, sql: str, params: Sequence = ()) -> int:
+        return self.conn.execute(sql, tuple(params)).rowcount
+
+    def executemany(self, sql: str, seq_of_params: Iterable[Sequence]) -> None:
+        self.conn.executemany(sql, seq_of_params)
+
+    def fetchone(self, sql: str, params: Sequence = ()):
+        return self.conn.execute(sql, tuple(params)).fetchone()
+
+    def fetchall(self, sql: str, params: Sequence = ()):
+        return self.conn.execute(sql, tuple(params)).fetchall()
+
+    def insert(self, sql: str, params: Sequence = ()) -> int:
+        return self.conn.execute(sql, tuple(params)).lastrowid
+
+
+class SQLiteBackend(StorageBackend):
+    dialect = "sqlite"
+    IntegrityError = sqlite3.IntegrityError
+
+    def __init__(self, path: str = "devlens.db", timeout: float = 30.0):
+        self.path = path
+        self.timeout = timeout
+
+    def connect(self) -> sqlite3.Connection:
+        """Open a raw connection whose rows allow key and index access"""
+        conn = sqlite3.connect(self.path, timeout=self.timeout)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        conn = self.connect()
+        try:
+            yield SQLiteTransaction(conn)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def table_columns(self, table: str):
+        with self.transaction() as tx:
+            return [row[1] for row in tx.fetchall(f"PRAGMA table_info({table})")]
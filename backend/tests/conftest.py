@@ -0,0 +1,56 @@
+"""
+Shared fixtures for the DevLens backend tests
+
+PostgreSQL tests run against DEVLENS_TEST_DATABASE_URL when it is set, otherwise
+against a throwaway server started with pgserver (pip install pgserver); they
+are skipped when neither is available.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import uuid
+from urllib.parse import urlsplit, urlunsplit
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(scope="session")
+def postgres_server_url():
+    """URL of a PostgreSQL server the tests may create databases on"""
+    url = os.environ.get("DEVLENS_TEST_DATABASE_URL")
+    if url:
+        yield url
+        return
+
+    pgserver = pytest.importorskip("pgserver", reason="set DEVLENS_TEST_DATABASE_URL or pip install pgserver")
+    with tempfile.TemporaryDirectory() as data_dir:
+        server = pgserver.get_server(data_dir, cleanup_mode="stop")
+        try:
+            yield server.get_uri()
+        finally:
+            server.cleanup()
+
+
+@pytest.fixture
+def postgres_url(postgres_server_url):
+    """URL of a fresh, empty database that is dropped after the test"""
+    asyncpg = pytest.importorskip("asyncpg")
+    name = f"devlens_test_{uuid.uuid4().hex[:12]}"
+    parts = urlsplit(postgres_server_url)
+
+    async def admin(statement):
+        conn = await asyncpg.connect(postgres_server_url)
+        try:
+            await conn.execute(statement)
+        finally:
+            await conn.close()
+
+    asyncio.run(admin(f'CREATE DATABASE "{name}"'))
+    try:
+        yield urlunsplit(parts._replace(path=f"/{name}"))
+    finally:
+        asyncio.run(admin(f'DROP DATABASE IF EXISTS "{name}" WITH (FORCE)'))
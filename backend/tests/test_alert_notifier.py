@@ -0,0 +1,76 @@
+"""Alert digests are claimed before sending, so concurrent notifiers send each once"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from alert_notifier import AlertNotifier
+from database import DevLensDB
+
+
+class RecordingEmailService:
+    """Renders nothing and records what would have been sent"""
+
+    def __init__(self):
+        self.sent = []
+        self._lock = threading.Lock()
+        self.renderer = self
+
+    def render_alerts(self, manager_name, company_name, events, critical):
+        return f"{len(events)} alerts", "<p>alerts</p>"
+
+    def send_many(self, emails):
+        with self._lock:
+            self.sent.extend(emails)
+        return [True] * len(emails)
+
+
+def test_concurrent_flushes_send_each_digest_once(tmp_path):
+    path = str(tmp_path / "devlens.db")
+    db = DevLensDB(path)
+    manager = db.backend.fetchone("SELECT id, company_id FROM managers ORDER BY id LIMIT 1")
+    developer = db.backend.fetchone("SELECT id FROM developers WHERE company_id = ? LIMIT 1", (manager["company_id"],))
+    db.update_manager_settings(manager["id"], "manager@example.com")
+
+    email_service = RecordingEmailService()
+    # One notifier per simulated API process, each with its own database handle
+    notifiers = [AlertNotifier(DevLensDB(path), email_service, outbox=None, window=0) for _ in range(4)]
+    notifiers[0].flush()
+
+    db.record_alert_diff(manager["company_id"], 1, 2, [
+        {"developer_id": developer["id"], "alert_type": alert_type, "severity": "warning", "details": {}}
+        for alert_type in ("quadrant_change", "risk_added")
+    ])
+
+    with ThreadPoolExecutor(max_workers=len(notifiers)) as executor:
+        counts = list(executor.map(lambda notifier: notifier.flush(), notifiers))
+
+    assert sum(count["sent"] for count in counts) == 1
+    assert [email[0] for email in email_service.sent] == ["manager@example.com"]
+    digests = db.backend.fetchall("SELECT status, event_count FROM alert_digests")
+    assert [(row["status"], row["event_count"]) for row in digests] == [("sent", 2)]
+
+
+def test_digest_claim_on_postgres(postgres_url):
+    from storage import create_backend
+
+    db = DevLensDB(backend=create_backend(postgres_url))
+    try:
+        manager = db.backend.fetchone("SELECT id, company_id FROM managers ORDER BY id LIMIT 1")
+        developer = db.backend.fetchone(
+            "SELECT id FROM developers WHERE company_id = ? LIMIT 1", (manager["company_id"],)
+        )
+        db.update_manager_settings(manager["id"], "manager@example.com")
+        email_service = RecordingEmailService()
+        notifier = AlertNotifier(db, email_service, outbox=None, window=0)
+        notifier.flush()
+
+        db.record_alert_diff(manager["company_id"], 1, 2, [
+            {"developer_id": developer["id"], "alert_type": "quadrant_change", "severity": "warning", "details": {}}
+        ])
+        assert notifier.flush()["sent"] == 1
+        # A stale cursor write from an older read never moves the cursor back
+        db.advance_alert_cursors({manager["id"]: 0})
+        assert notifier.flush()["sent"] == 0
+        assert len(email_service.sent) == 1
+    finally:
+        db.backend.close()
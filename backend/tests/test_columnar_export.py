@@ -0,0 +1,38 @@
+"""Round trip of the Parquet/Arrow export with column selection"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+pytest.importorskip("pyarrow")
+
+from columnar_export import ColumnarExporter, load_columnar_export  # noqa: E402
+from database import DevLensDB  # noqa: E402
+from engine.snapshots import get_company_snapshot  # noqa: E402
+
+
+@pytest.fixture(params=["parquet", "arrow"])
+def export_dir(request, tmp_path):
+    db = DevLensDB(str(tmp_path / "devlens.db"))
+    get_company_snapshot(db, "TechCorp Inc.")
+    ColumnarExporter(db).export(str(tmp_path / "export"), fmt=request.param)
+    return tmp_path / "export"
+
+
+def test_column_list_skips_tables_without_the_column(export_dir):
+    frames = load_columnar_export(export_dir, columns=["company_id", "name"])
+
+    assert list(frames["developers"].columns) == ["company_id", "name"]
+    assert list(frames["developer_activity_daily"].columns) == ["company_id"]
+    assert list(frames["developer_scores"].columns) == ["company_id", "name"]
+
+
+def test_columns_per_table(export_dir):
+    frames = load_columnar_export(export_dir, columns={"developers": ["name", "team"]}, company_ids=[1])
+
+    assert list(frames["developers"].columns) == ["name", "team"]
+    assert len(frames["developers"]) > 0
+    assert "risk_factors" in frames["developer_scores"].columns
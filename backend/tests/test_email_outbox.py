@@ -0,0 +1,21 @@
+"""Email outbox claims and their sending lease"""
+
+from database import DevLensDB
+from email_outbox import EmailOutbox, utc_timestamp
+
+
+def test_only_expired_claims_are_requeued(tmp_path):
+    db = DevLensDB(str(tmp_path / "devlens.db"))
+    job_id = db.enqueue_email(1, "test", "manager@example.com", utc_timestamp())
+    claimed_at = utc_timestamp()
+    assert db.claim_email_job(claimed_at)["id"] == job_id
+
+    # Another process starting up while the job is being sent leaves it alone
+    assert EmailOutbox(db, email_service=None, lease_seconds=900).requeue_expired() == 0
+    assert db.get_email_job(job_id)["status"] == "sending"
+
+    # Once the lease has run out the job goes back to the queue
+    assert EmailOutbox(db, email_service=None, lease_seconds=-60).requeue_expired() == 1
+    job = db.get_email_job(job_id)
+    assert job["status"] == "queued"
+    assert job["claimed_at"] == claimed_at
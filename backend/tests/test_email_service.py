@@ -0,0 +1,87 @@
+"""Pooled SMTP sending against a local aiosmtpd server"""
+
+import asyncio
+import socket
+import time
+
+import pytest
+
+from email_service import EmailService
+
+aiosmtpd_controller = pytest.importorskip("aiosmtpd.controller", reason="pip install aiosmtpd")
+
+SLOW_RECIPIENT = "slow@example.com"
+
+
+class RecordingHandler:
+    """Accepts every message; the one to SLOW_RECIPIENT stalls past the client timeout"""
+
+    def __init__(self):
+        self.recipients = []
+
+    async def handle_DATA(self, server, session, envelope):
+        if SLOW_RECIPIENT in envelope.rcpt_tos:
+            await asyncio.sleep(2)
+        self.recipients.extend(envelope.rcpt_tos)
+        return "250 OK"
+
+
+@pytest.fixture
+def smtp_server():
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+
+    handler = RecordingHandler()
+    controller = aiosmtpd_controller.Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    try:
+        yield handler, port
+    finally:
+        controller.stop()
+
+
+def email_service(port, pool_size):
+    service = EmailService("127.0.0.1", port, "devlens@example.com", sender_password="",
+                           starttls=False, pool_size=pool_size)
+    service.pool.timeout = 0.5
+    return service
+
+
+def batch(recipients):
+    return [(recipient, "Weekly report", "<p>Report</p>", "Report") for recipient in recipients]
+
+
+def test_send_many_over_pooled_connections(smtp_server):
+    handler, port = smtp_server
+    service = email_service(port, pool_size=2)
+    recipients = [f"manager{i}@example.com" for i in range(6)]
+    try:
+        assert service.send_many(batch(recipients)) == [True] * 6
+    finally:
+        service.close()
+    assert sorted(handler.recipients) == sorted(recipients)
+
+
+def test_rest_of_share_is_sent_after_a_connection_failure(smtp_server):
+    handler, port = smtp_server
+    service = email_service(port, pool_size=1)
+    recipients = ["first@example.com", SLOW_RECIPIENT, "third@example.com", "fourth@example.com"]
+    try:
+        assert service.send_many(batch(recipients)) == [True, False, True, True]
+    finally:
+        service.close()
+    assert {"third@example.com", "fourth@example.com"} <= set(handler.recipients)
+
+
+def test_idle_connections_are_reaped(smtp_server):
+    _, port = smtp_server
+    service = email_service(port, pool_size=1)
+    service.pool.max_idle = 0.2
+    try:
+        assert service.send_email("manager@example.com", "Test", "<p>Test</p>")
+        assert len(service.pool._idle) == 1
+        time.sleep(0.6)
+        assert service.pool._idle == []
+    finally:
+        service.close()
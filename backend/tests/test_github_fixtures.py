@@ -0,0 +1,18 @@
+"""REST and GraphQL collection modes agree on a recorded fixture"""
+
+import asyncio
+import os
+
+from integrations.github_fixtures import ReplayTransport, collect_both_modes, compare_modes
+
+FIXTURE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "github_two_users.json")
+USERS = ["alice-johnson", "bob-smith"]
+
+
+def test_rest_and_graphql_modes_agree():
+    results = asyncio.run(collect_both_modes("acme", USERS, "2024-01-01", "2024-03-31", ReplayTransport(FIXTURE)))
+
+    assert compare_modes(results) == []
+    assert sorted(results["rest"]) == USERS
+    assert all(any(value for value in metrics.values()) for metrics in results["rest"].values())
+    assert results["graphql_requests"] < results["rest_requests"]
@@ -0,0 +1,155 @@
+"""Incremental GitHub sync into the daily rollups"""
+
+import asyncio
+from collections import Counter
+
+import httpx
+
+from database import DevLensDB
+from engine.scoring import apply_activity_window
+from engine.snapshots import get_company_snapshot, get_developer_profile
+from integrations.github_collector import AsyncGitHubCollector
+from integrations.github_sync import IncrementalGitHubSync
+from integrations.mock_github_server import MockGitHubData, create_app
+
+COMPANY = "TechCorp Inc."
+LOGIN = "alice-johnson"
+
+
+def first_developer(db):
+    row = db.backend.fetchone("SELECT id, company_id FROM developers ORDER BY id LIMIT 1")
+    return row["id"], row["company_id"]
+
+
+def mock_collector(data):
+    transport = httpx.ASGITransport(app=create_app(data))
+    return AsyncGitHubCollector("", data.org, base_url="http://github.test", transport=transport, mode="rest")
+
+
+def submitted_days(data, start_date, end_date):
+    return Counter(
+        review["submitted_at"][:10]
+        for reviews in data.reviews_by_pr.values() for review in reviews
+        if start_date <= review["submitted_at"][:10] <= end_date
+    )
+
+
+def test_github_commits_leave_ingested_commits_alone(tmp_path):
+    db = DevLensDB(str(tmp_path / "devlens.db"))
+    developer_id, company_id = first_developer(db)
+    db.record_daily_activity([{
+        "developer_id": developer_id, "company_id": company_id, "activity_date": "2024-05-01",
+        "commits": 5, "entropy_sum": 2.0
+    }])
+
+    for github_commits in (3, 4):
+        db.apply_github_sync("acme", LOGIN, developer_id, company_id, "commits", "2024-05-01", "2024-05-02",
+                             {"2024-05-01": github_commits}, "2024-05-02T00:00:00+00:00")
+
+    row = db.backend.fetchone(
+        "SELECT commits, github_commits FROM developer_activity_daily WHERE developer_id = ? AND activity_date = ?",
+        (developer_id, "2024-05-01")
+    )
+    assert (row["commits"], row["github_commits"]) == (5, 4)
+
+
+def test_reviews_are_dated_by_submission():
+    data = MockGitHubData("acme", [LOGIN])
+
+    async def collect():
+        async with mock_collector(data) as collector:
+            return await collector.collect_daily_counts(LOGIN, "reviews_given", "2024-03-01", "2024-06-30")
+
+    expected = submitted_days(data, "2024-03-01", "2024-06-30")
+    assert expected
+    assert asyncio.run(collect()) == dict(expected)
+
+
+def test_synced_activity_reaches_windowed_scoring(tmp_path):
+    db = DevLensDB(str(tmp_path / "devlens.db"))
+    developer_id, company_id = first_developer(db)
+    data = MockGitHubData("acme", [LOGIN])
+
+    async def sync():
+        async with mock_collector(data) as collector:
+            return await IncrementalGitHubSync(db, collector, "2024-01-01").sync_user(LOGIN, developer_id, company_id)
+
+    synced = asyncio.run(sync())
+    assert synced["reviews_given"] == sum(submitted_days(data, "2024-01-01", "9999-12-31").values())
+
+    window = ("2024-01-01", "2024-12-31")
+    developer = next(
+        dev for dev in apply_activity_window(db.get_company_developers(COMPANY, window), window)
+        if dev["id"] == developer_id
+    )
+    assert developer["reviews_given"] == synced["reviews_given"]
+    assert developer["pull_requests"] == synced["pull_requests"]
+    assert developer["commits"] == synced["commits"]
+
+
+def test_synced_collaboration_invalidates_the_snapshot(tmp_path):
+    db = DevLensDB(str(tmp_path / "devlens.db"))
+    developer_id, company_id = first_developer(db)
+    assert get_company_snapshot(db, COMPANY)["snapshot_version"] == 1
+    before = get_developer_profile(db, developer_id)["developer"]
+    assert before["reviews_given"] == 0
+
+    db.apply_github_sync("acme", LOGIN, developer_id, company_id, "reviews_given", "2024-05-01", "2024-05-02",
+                         {"2024-05-01": 4}, "2024-05-02T00:00:00+00:00")
+
+    # The single-developer path sees the new reviews before the company is rescored
+    developer = get_developer_profile(db, developer_id)["developer"]
+    assert developer["reviews_given"] == 4
+    assert developer["raw_technical_impact"] > before["raw_technical_impact"]
+    assert get_company_snapshot(db, COMPANY)["snapshot_version"] == 2
+
+
+def test_sync_runs_keep_their_mode(tmp_path):
+    db = DevLensDB(str(tmp_path / "devlens.db"))
+    _, company_id = first_developer(db)
+    run_id = db.create_github_sync_run("acme", company_id, "2024-01-01", "2024-06-30", mode="rest")
+
+    assert db.get_github_sync_run(run_id)["mode"] == "rest"
+    assert db.find_resumable_github_sync_run("acme", company_id, "2024-01-01", "2024-06-30", "rest") == run_id
+    assert db.find_resumable_github_sync_run("acme", company_id, "2024-01-01", "2024-06-30", "graphql") is None
+
+
+def test_comments_of_deleted_users_are_skipped():
+    data = MockGitHubData("acme", [LOGIN])
+    thread = data.comments[LOGIN][0]
+    data.threads[(thread["repo"], thread["number"])].append(dict(thread, login=None, body="ghost"))
+
+    async def collect():
+        async with mock_collector(data) as collector:
+            return await collector._get_user_comments_rest(LOGIN, "2024-01-01", "2024-12-31")
+
+    comments = asyncio.run(collect())
+    assert "ghost" not in [comment["body"] for comment in comments]
+    assert len(comments) == sum("2024-01-01" <= c["created_at"][:10] <= "2024-12-31" for c in data.comments[LOGIN])
+
+
+def test_git_ingest_and_github_sync_keep_separate_totals(tmp_path):
+    db = DevLensDB(str(tmp_path / "devlens.db"))
+    developer_id, company_id = first_developer(db)
+    ingested = db.backend.fetchone("SELECT commits FROM developers WHERE id = ?", (developer_id,))["commits"]
+    email = "dev@example.com"
+
+    def ingest(sha, commits):
+        db.apply_git_ingest("app", sha, commits, company_id, {(email, "2024-05-01"): (commits, 1.0)}, {email: developer_id})
+
+    ingest("a1", 5)
+    run_id = db.create_github_sync_run("acme", company_id, "2024-01-01", "2024-06-30")
+    metrics = dict.fromkeys([
+        "pull_requests_created", "code_reviews_given", "code_reviews_received", "issues_created",
+        "issues_commented", "mentoring_activities", "cross_repo_contributions",
+        "avg_review_response_time_hours", "review_response_time_p50_hours", "review_response_time_p90_hours"
+    ], 0)
+    db.record_github_sync_batch(run_id, "acme", "2024-01-01", "2024-06-30",
+                                {developer_id: dict(metrics, commits=ingested + 6, entropy=0.0)}, {})
+    assert db.get_developer(developer_id)["commits"] == ingested + 6
+
+    # Later ingests still add to the git total instead of to the GitHub window count
+    ingest("a2", 3)
+    assert db.backend.fetchone("SELECT commits FROM developers WHERE id = ?", (developer_id,))["commits"] == ingested + 8
+    assert db.get_developer(developer_id)["commits"] == ingested + 8
+    assert next(dev for dev in db.get_company_developers(COMPANY) if dev["id"] == developer_id)["commits"] == ingested + 8
@@ -0,0 +1,37 @@
+"""Hidden Gems served from the persisted snapshot"""
+
+from database import DevLensDB
+from engine.snapshots import get_company_snapshot, get_hidden_gems
+
+
+def test_hidden_gems_match_the_snapshot(tmp_path):
+    db = DevLensDB(str(tmp_path / "devlens.db"))
+    company = "TechCorp Inc."
+
+    result = get_hidden_gems(db, company)
+    snapshot = get_company_snapshot(db, company)
+
+    expected = sorted(
+        (dev for dev in snapshot["developers"] if dev["is_hidden_gem"]),
+        key=lambda dev: dev.get("raw_impact", 0), reverse=True
+    )
+    assert result["snapshot_version"] == snapshot["snapshot_version"] == 1
+    assert result["total_developers"] == len(snapshot["developers"])
+    assert [dev["id"] for dev in result["hidden_gems"]] == [dev["id"] for dev in expected]
+
+
+def test_hidden_gems_of_unknown_company(tmp_path):
+    db = DevLensDB(str(tmp_path / "devlens.db"))
+    assert get_hidden_gems(db, "No Such Company") is None
+
+
+def test_hidden_gems_follow_changed_inputs(tmp_path):
+    db = DevLensDB(str(tmp_path / "devlens.db"))
+    company = "TechCorp Inc."
+    assert get_hidden_gems(db, company)["snapshot_version"] == 1
+
+    with db.backend.transaction() as tx:
+        tx.execute("UPDATE developers SET commits = commits + 50 WHERE id = (SELECT MIN(id) FROM developers)")
+
+    result = get_hidden_gems(db, company)
+    assert result["snapshot_version"] == get_company_snapshot(db, company)["snapshot_version"] == 2
@@ -0,0 +1,32 @@
+"""Streaming JSON records across chunk boundaries"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+from json_stream import iter_json_records, write_json_records  # noqa: E402
+
+
+@pytest.mark.parametrize("content, expected", [
+    ("  [ ]", []),
+    ("\n\n   [1, 2]\n", [1, 2]),
+    ("     \n{\"a\": 1}\n{\"a\": 2}\n", [{"a": 1}, {"a": 2}]),
+    ("   ", []),
+])
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 1024])
+def test_format_is_detected_past_leading_whitespace(tmp_path, content, expected, chunk_size):
+    path = tmp_path / "records.json"
+    path.write_text(content, encoding="utf-8")
+
+    assert list(iter_json_records(path, chunk_size=chunk_size)) == expected
+
+
+@pytest.mark.parametrize("name", ["records.json", "records.ndjson"])
+def test_written_records_read_back(tmp_path, name):
+    records = [{"id": i, "body": {"content": "x" * i}} for i in range(20)]
+    write_json_records(tmp_path / name, records)
+
+    assert list(iter_json_records(tmp_path / name, chunk_size=7)) == records
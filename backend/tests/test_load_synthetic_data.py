@@ -0,0 +1,43 @@
+"""Reloading synthetic data clears everything keyed by the old company"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "scripts"))
+
+from load_synthetic_data_to_db import COMPANY_TABLES, SyntheticDataLoader
+
+
+def populate(db):
+    manager = db.backend.fetchone("SELECT id, company_id FROM managers ORDER BY id LIMIT 1")
+    developer = db.backend.fetchone("SELECT id FROM developers WHERE company_id = ? LIMIT 1", (manager["company_id"],))
+    db.update_manager_settings(manager["id"], "manager@example.com")
+    db.record_alert_diff(manager["company_id"], 1, 2, [
+        {"developer_id": developer["id"], "alert_type": "quadrant_change", "severity": "warning", "details": {}}
+    ])
+    db.record_daily_activity([{
+        "developer_id": developer["id"], "company_id": manager["company_id"], "activity_date": "2024-05-01",
+        "commits": 5, "entropy_sum": 2.0
+    }])
+
+
+def assert_cleared(loader):
+    populate(loader.db)
+    loader.clear_existing_data()
+    for table in COMPANY_TABLES:
+        assert loader.db.backend.fetchone(f"SELECT COUNT(*) AS n FROM {table}")["n"] == 0, table
+
+
+def test_clear_existing_data(tmp_path, monkeypatch):
+    monkeypatch.delenv("DEVLENS_DATABASE_URL", raising=False)
+    monkeypatch.chdir(tmp_path)
+    assert_cleared(SyntheticDataLoader())
+
+
+def test_clear_existing_data_on_postgres(postgres_url, monkeypatch):
+    monkeypatch.setenv("DEVLENS_DATABASE_URL", postgres_url)
+    loader = SyntheticDataLoader()
+    try:
+        assert_cleared(loader)
+    finally:
+        loader.db.backend.close()
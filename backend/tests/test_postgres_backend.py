@@ -0,0 +1,73 @@
+"""PostgresBackend and DevLensDB against a real PostgreSQL server"""
+
+import pytest
+
+from storage import create_backend
+from storage.postgres_backend import translate_sql
+
+
+def test_translate_sql_numbers_placeholders_outside_literals():
+    sql = "INSERT INTO t (a, b, c) VALUES (?, '?', ?)"
+    assert translate_sql(sql) == "INSERT INTO t (a, b, c) VALUES ($1, '?', $2)"
+    assert translate_sql("id INTEGER PRIMARY KEY AUTOINCREMENT") == "id SERIAL PRIMARY KEY"
+
+
+@pytest.fixture
+def backend(postgres_url):
+    backend = create_backend(postgres_url)
+    try:
+        yield backend
+    finally:
+        backend.close()
+
+
+def test_backend_round_trip(backend):
+    assert backend.dialect == "postgresql"
+    backend.execute("CREATE TABLE items (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT UNIQUE NOT NULL)")
+
+    with backend.transaction() as tx:
+        first = tx.insert("INSERT INTO items (name) VALUES (?)", ("alpha",))
+        second = tx.insert("INSERT INTO items (name) VALUES (?)", ("beta",))
+    assert second == first + 1
+
+    backend.executemany("INSERT INTO items (name) VALUES (?)", [("gamma",), ("delta",)])
+    assert backend.execute("UPDATE items SET name = name || '!' WHERE name IN (?, ?)", ("gamma", "delta")) == 2
+
+    row = backend.fetchone("SELECT id, name FROM items WHERE name = ?", ("alpha",))
+    assert row["id"] == first and row[1] == "alpha"
+    assert [row["name"] for row in backend.fetchall("SELECT name FROM items ORDER BY id")] == [
+        "alpha", "beta", "gamma!", "delta!"
+    ]
+    assert backend.table_columns("items") == ["id", "name"]
+
+
+def test_transaction_rolls_back_and_raises_integrity_error(backend):
+    backend.execute("CREATE TABLE items (id INTEGER PRIMARY KEY AUTOINCREMENT, name TEXT UNIQUE NOT NULL)")
+    backend.execute("INSERT INTO items (name) VALUES (?)", ("alpha",))
+
+    with pytest.raises(backend.IntegrityError):
+        with backend.transaction() as tx:
+            tx.execute("INSERT INTO items (name) VALUES (?)", ("beta",))
+            tx.execute("INSERT INTO items (name) VALUES (?)", ("alpha",))
+
+    assert backend.fetchone("SELECT COUNT(*) FROM items")[0] == 1
+
+
+def test_devlens_db_on_postgres(postgres_url, tmp_path):
+    from database import DevLensDB
+    from engine.snapshots import get_company_snapshot
+
+    db = DevLensDB(backend=create_backend(postgres_url))
+    try:
+        companies = [company["name"] for company in db.get_companies()]
+        assert "TechCorp Inc." in companies
+
+        developers = db.get_company_developers("TechCorp Inc.")
+        assert developers and all(isinstance(dev["msgs"], list) for dev in developers)
+
+        first = get_company_snapshot(db, "TechCorp Inc.")
+        second = get_company_snapshot(db, "TechCorp Inc.")
+        assert first["snapshot_version"] == second["snapshot_version"] == 1
+        assert len(second["developers"]) == len(developers)
+    finally:
+        db.backend.close()
@@ -0,0 +1,69 @@
+"""Scheduled weekly report slots are claimed by exactly one process"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from database import DevLensDB
+from email_outbox import utc_timestamp
+from weekly_reports import WeeklyReportJob, WeeklyReportScheduler
+
+SLOT = "2024-06-03 08:00:00"
+
+
+def test_a_slot_runs_once_across_processes(tmp_path):
+    path = str(tmp_path / "devlens.db")
+    DevLensDB(path)
+    # One job per simulated API process, each with its own database handle
+    jobs = [WeeklyReportJob(DevLensDB(path), email_service=None) for _ in range(4)]
+
+    with ThreadPoolExecutor(max_workers=len(jobs)) as executor:
+        runs = list(executor.map(lambda job: job.run(slot=SLOT), jobs))
+
+    won = [run for run in runs if run is not None]
+    assert len(won) == 1
+    assert won[0]["slot"] == SLOT and won[0]["status"] == "completed"
+    assert [run["slot"] for run in jobs[0].db.get_report_runs("weekly")] == [SLOT]
+
+
+def test_unscheduled_runs_are_not_claimed(tmp_path):
+    job = WeeklyReportJob(DevLensDB(str(tmp_path / "devlens.db")), email_service=None)
+    assert job.run() is not None
+    assert job.run() is not None
+    assert job.run(slot=SLOT) is not None
+    assert job.run(slot=SLOT) is None
+
+
+def test_abandoned_slot_is_taken_over_after_its_lease(tmp_path):
+    db = DevLensDB(str(tmp_path / "devlens.db"))
+    # A process claimed the slot and stopped before finishing it
+    run_id = db.claim_report_slot("weekly", SLOT, utc_timestamp(), utc_timestamp(-900))
+
+    assert WeeklyReportJob(db, email_service=None, lease_seconds=900).run(slot=SLOT) is None
+    assert db.get_report_run(run_id)["status"] == "running"
+
+    run = WeeklyReportJob(db, email_service=None, lease_seconds=-60).run(slot=SLOT)
+    assert run["id"] == run_id and run["status"] == "completed"
+    # A finished slot is never run again, however old its claim
+    assert WeeklyReportJob(db, email_service=None, lease_seconds=-60).run(slot=SLOT) is None
+
+
+def test_due_slot_within_catch_up(tmp_path):
+    job = WeeklyReportJob(DevLensDB(str(tmp_path / "devlens.db")), email_service=None)
+    scheduler = WeeklyReportScheduler(job, weekday=0, hour=8, minute=0)
+
+    assert scheduler.due_slot(datetime(2024, 6, 3, 9, 30)) == datetime(2024, 6, 3, 8, 0)
+    assert scheduler.due_slot(datetime(2024, 6, 4, 9, 30)) is None
+
+
+def test_slot_claim_on_postgres(postgres_url):
+    from storage import create_backend
+
+    db = DevLensDB(backend=create_backend(postgres_url))
+    try:
+        run_id = db.claim_report_slot("weekly", SLOT, utc_timestamp(), utc_timestamp(-900))
+        assert run_id is not None
+        assert db.claim_report_slot("weekly", SLOT, utc_timestamp(), utc_timestamp(-900)) is None
+        assert db.claim_report_slot("weekly", SLOT, utc_timestamp(), utc_timestamp(60)) == run_id
+        assert db.get_report_run(run_id)["slot"] == SLOT
+    finally:
+        db.backend.close()
@@ -0,0 +1,196 @@
+"""
+Weekly report fan-out for DevLens
+Finds every manager with weekly reports enabled, scores each of their companies
+once, renders every manager's report from that snapshot and sends them in one
+batch over the pooled SMTP connections. Companies are processed in parallel and
+each run's per-company timings are kept in report_runs.
+
+Every API process runs a scheduler, so a scheduled slot is claimed in report_runs
+before anything is sent: only the process whose claim wins sends that week's reports.
+A claim left 'running' past its lease by a stopped process is taken over.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from email_outbox import utc_timestamp
+from engine.snapshots import get_company_snapshot
+
+WEEKDAYS = ["mon", "tue", "wed", "thu", "fri", "sat", "sun"]
+
+
+def parse_schedule(value: str) -> Optional[tuple]:
+    """'mon 08:00' -> (weekday, hour, minute) in UTC; 'off' or empty -> None"""
+    if not value or value.strip().lower() == "off":
+        return None
+    day, clock = value.strip().lower().split()
+    hour, minute = clock.split(":")
+    return WEEKDAYS.index(day[:3]), int(hour), int(minute)
+
+
+class WeeklyReportJob:
+    def __init__(self, db, email_service, max_workers: int = 4, lease_seconds: float = 3600.0):
+        """
+        Args:
+            db: DevLensDB with the managers, their settings and report_runs
+            email_service: EmailService used to render and send (send_many)
+            max_workers: Companies processed at the same time
+            lease_seconds: Seconds a claimed slot may stay 'running' before another
+                process takes it over; must exceed the longest run
+        """
+        self.db = db
+        self.email_service = email_service
+        self.max_workers = max_workers
+        self.lease_seconds = lease_seconds
+        self._running = threading.Lock()
+
+    def run(self, slot: Optional[str] = None) -> Optional[Dict]:
+        """
+        Send this week's reports and return the finished run
+
+        Args:
+            slot: Scheduled time this run is for; the run only happens if this call
+                claims the slot first (None: run now, unscheduled)
+
+        Returns:
+            dict: The finished run, or None if a run is in progress or the slot was taken
+        """
+        if not self._running.acquire(blocking=False):
+            return None
+        try:
+            if slot is None:
+                run_id = self.db.create_report_run("weekly")
+            else:
+                run_id = self.db.claim_report_slot(
+                    "weekly", slot, utc_timestamp(), utc_timestamp(-self.lease_seconds)
+                )
+                if run_id is None:
+                    return None
+            return self._run(run_id)
+        finally:
+            self._running.release()
+
+    def _run(self, run_id: int) -> Dict:
+        started = time.perf_counter()
+
+        companies = {}
+        for recipient in self.db.get_weekly_report_recipients():
+            companies.setdefault(recipient["company_name"], []).append(recipient)
+
+        try:
+            if companies:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(companies))) as executor:
+                    timings = list(executor.map(lambda item: self._send_company(*item), companies.items()))
+            else:
+                timings = []
+        except Exception as e:
+            self.db.finish_report_run(run_id, "failed", duration_seconds=time.perf_counter() - started, error=str(e))
+            raise
+
+        sent = sum(timing["sent"] for timing in timings)
+        failed = sum(timing["failed"] for timing in timings)
+        duration = round(time.perf_counter() - started, 3)
+        self.db.finish_report_run(
+            run_id, "completed", companies=len(companies), recipients=sent + failed,
+            sent=sent, failed=failed, duration_seconds=duration, timings=timings
+        )
+        print(f"📊 Weekly reports: {sent} sent, {failed} failed for {len(companies)} companies in {duration:.1f}s")
+        return self.db.get_report_run(run_id)
+
+    def _send_company(self, company_name: str, recipients: List[Dict]) -> Dict:
+        """Score, render and send one company's reports; failures are counted, not raised"""
+        timing = {"company": company_name, "recipients": len(recipients), "sent": 0, "failed": len(recipients)}
+        try:
+            started = time.perf_counter()
+            snapshot = get_company_snapshot(self.db, company_name)
+            developers = snapshot["developers"] if snapshot else []
+            snapshot_version = snapshot["snapshot_version"] if snapshot else None
+            scored = time.perf_counter()
+
+            # The report body is rendered once and reused for every manager
+            emails = []
+            for recipient in recipients:
+                subject, html_content = self.email_service.generate_performance_alert_email(
+                    recipient["manager_name"], company_name, developers, "weekly_report", snapshot_version
+                )
+                emails.append((recipient["email_address"], subject, html_content))
+            rendered = time.perf_counter()
+
+            results = self.email_service.send_many(emails)
+            finished = time.perf_counter()
+
+            timing.update({
+                "sent": sum(results),
+                "failed": len(results) - sum(results),
+                "snapshot_seconds": round(scored - started, 3),
+                "render_seconds": round(rendered - scored, 3),
+                "send_seconds": round(finished - rendered, 3)
+            })
+        except Exception as e:
+            print(f"❌ Weekly reports for {company_name} failed: {e}")
+            timing["error"] = str(e)
+        return timing
+
+
+class WeeklyReportScheduler:
+    def __init__(self, job: WeeklyReportJob, weekday: int = 0, hour: int = 8, minute: int = 0,
+                 check_interval: float = 60.0, catch_up: timedelta = timedelta(hours=12)):
+        """
+        Runs the job once per week at weekday/hour/minute (UTC)
+
+        Args:
+            catch_up: How late a missed slot (server down at the time) is still sent
+        """
+        self.job = job
+        self.weekday = weekday
+        self.hour = hour
+        self.minute = minute
+        self.check_interval = check_interval
+        self.catch_up = catch_up
+        self._stop = threading.Event()
+        self._thread = None
+
+    def last_slot(self, now: datetime) -> datetime:
+        """Most recent scheduled time at or before now"""
+        slot = now.replace(hour=self.hour, minute=self.minute, second=0, microsecond=0)
+        slot -= timedelta(days=(now.weekday() - self.weekday) % 7)
+        if slot > now:
+            slot -= timedelta(days=7)
+        return slot
+
+    def due_slot(self, now: datetime) -> Optional[datetime]:
+        """This week's slot while it is recent enough to send, else None
+
+        Whether it was already sent (here or by another process) is decided by
+        the job's atomic slot claim.
+        """
+        slot = self.last_slot(now)
+        if now - slot > self.catch_up:
+            return None
+        return slot
+
+    def start(self):
+        if self._thread:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="weekly-reports", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(5)
+            self._thread = None
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                slot = self.due_slot(datetime.utcnow())
+                if slot is not None:
+                    self.job.run(slot=slot.isoformat(sep=" "))
+            except Exception as e:
+                print(f"❌ Weekly report run failed: {e}")
+            self._stop.wait(self.check_interval)
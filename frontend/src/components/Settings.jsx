@@ -174,7 +174,7 @@ const Settings = () => {
 
       if (response.ok) {
         const data = await response.json();
-        alert(`✅ ${emailType === 'test' ? 'Test email' : emailType + ' email'} sent successfully to ${emailSettings.email_address}`);
+        alert(`✅ ${emailType === 'test' ? 'Test email' : emailType + ' email'} queued for ${emailSettings.email_address}`);
       } else {
         const error = await response.json();
         alert(`❌ Failed to send email: ${error.detail}`);